@@ -0,0 +1,17 @@
+# Generated by Django 5.1.6 on 2026-10-19 02:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api_security', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='apikeyusagelog',
+            index=models.Index(fields=['timestamp'], name='api_usage_timestamp_idx'),
+        ),
+    ]
@@ -120,6 +120,7 @@ class APIKeyUsageLog(models.Model):
         indexes = [
             models.Index(fields=['api_key', 'timestamp']),
             models.Index(fields=['ip_address', 'timestamp']),
+            models.Index(fields=['timestamp'], name='api_usage_timestamp_idx'),  # 월 단위 보관 범위 조회
         ]
     
     def __str__(self):
@@ -18,6 +18,7 @@ from .serializers import (
     APIKeyRegenerateSerializer, APIKeyStatsSerializer
 )
 from core.permissions import IsAdminUser, IsAuthenticatedUser, IsOwnerOrAdmin
+from system.performance import increment
 
 
 # IsOwnerOrAdmin 클래스 제거 - core.permissions에서 import
@@ -27,6 +28,8 @@ class TOTPAPIKeyViewSet(viewsets.ModelViewSet):
     """TOTP API 키 관리 뷰셋"""
     
     # permission_classes 제거 - 기본 권한 클래스 사용
+    # 기본 권한 클래스가 앱 이름을 감지하는 용도 (실제 조회 범위는 get_queryset)
+    queryset = TOTPAPIKey.objects.all()
     
     def get_queryset(self):
         if self.request.user.is_staff:
@@ -316,6 +319,7 @@ class RateLimitMiddleware:
                 minute_count = cache.get(minute_key, 0)
                 
                 if minute_count >= totp_api_key.max_requests_per_minute:
+                    increment('rate_limit_rejections', window='minute')
                     return False
                 
                 # 시간당 요청 제한 확인
@@ -323,6 +327,7 @@ class RateLimitMiddleware:
                 hour_count = cache.get(hour_key, 0)
                 
                 if hour_count >= totp_api_key.max_requests_per_hour:
+                    increment('rate_limit_rejections', window='hour')
                     return False
                 
                 # 카운터 증가
@@ -331,4 +336,5 @@ class RateLimitMiddleware:
                 
                 return True
         
+        increment('rate_limit_rejections', window='invalid_key')
         return False
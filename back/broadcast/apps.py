@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class BroadcastConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'broadcast'
+
+    def ready(self):
+        import broadcast.signals  # noqa: F401 - 장치 매트릭스 동기화 해시 무효화 시그널 등록
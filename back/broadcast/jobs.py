@@ -0,0 +1,21 @@
+"""
+방송 관련 주기 작업 (core.scheduler에서 실행)
+"""
+import logging
+
+from django.utils import timezone
+
+from .models import BroadcastPreview
+
+logger = logging.getLogger(__name__)
+
+
+def expire_previews():
+    """만료 시각이 지난 대기/준비 상태 프리뷰를 만료(expired)로 일괄 변경"""
+    expired = BroadcastPreview.objects.filter(
+        status__in=['pending', 'ready'],
+        expires_at__lt=timezone.now()
+    ).update(status='expired')
+    if expired:
+        logger.info(f"만료된 방송 프리뷰 {expired}건 처리 완료")
+    return expired
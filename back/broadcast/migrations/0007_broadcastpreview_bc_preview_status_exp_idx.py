@@ -0,0 +1,19 @@
+# Generated by Django 5.1.6 on 2026-10-19 01:40
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('broadcast', '0006_remove_broadcasthistory_audio_file_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='broadcastpreview',
+            index=models.Index(fields=['status', 'expires_at'], name='bc_preview_status_exp_idx'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.1.6 on 2026-10-19 02:09
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('broadcast', '0007_broadcastpreview_bc_preview_status_exp_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='broadcasthistory',
+            index=models.Index(fields=['created_at'], name='bc_history_created_idx'),
+        ),
+    ]
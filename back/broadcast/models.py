@@ -91,6 +91,9 @@ class BroadcastHistory(models.Model):
         verbose_name = "방송 이력"
         verbose_name_plural = "방송 이력"
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['created_at'], name='bc_history_created_idx'),  # 월 단위 보관 범위 조회
+        ]
 
     def __str__(self):
         return f"{self.get_broadcast_type_display()} - {self.broadcasted_by.username} ({self.created_at.strftime('%Y-%m-%d %H:%M')})"
@@ -160,6 +163,10 @@ class BroadcastPreview(models.Model):
         verbose_name = "방송 프리뷰"
         verbose_name_plural = "방송 프리뷰"
         ordering = ['-created_at']
+        indexes = [
+            # 프리뷰 만료 작업 (status IN ('pending', 'ready'), expires_at < now)
+            models.Index(fields=['status', 'expires_at'], name='bc_preview_status_exp_idx'),
+        ]
 
     def __str__(self):
         return f"프리뷰 {self.preview_id} - {self.get_broadcast_type_display()}"
@@ -1,10 +1,17 @@
 import requests
 import json
+import hashlib
 import logging
+import threading
+import time
 from typing import List, Dict, Optional, Union
 from django.conf import settings
+from django.core.cache import cache
 from django.core.files import File
+from django.db import transaction
 from django.utils import timezone
+from core.response_cache import mark_changed
+from system.performance import observe, track_external
 from .models import DeviceMatrix, BroadcastHistory, AudioFile
 
 logger = logging.getLogger(__name__)
@@ -24,6 +31,89 @@ def get_broadcast_api_headers(extra_headers: Optional[Dict[str, str]] = None) ->
     return headers
 
 
+DEVICE_MATRIX_HASH_CACHE_KEY = 'broadcast:device_matrix:hash'
+DEVICE_MATRIX_HASH_TTL = 60 * 60  # 초 단위, 관리자 화면 등으로 DB를 직접 고쳐도 이 시간 안에는 다시 동기화
+DEVICE_MATRIX_FIELDS = ('device_name', 'position_row', 'position_col', 'matrix_row', 'matrix_col', 'is_active')
+
+
+def compute_matrix_hash(matrix_data) -> str:
+    """방송 서버 매트릭스 데이터의 해시값 계산 (변경 감지용)"""
+    encoded = json.dumps(matrix_data, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+
+def flatten_matrix(matrix_data) -> Dict[int, Dict]:
+    """2차원 매트릭스를 room_id 기준 딕셔너리로 변환 (빈 칸은 제외)"""
+    devices = {}
+    for row in matrix_data:
+        for device in row:
+            if not device:
+                continue
+            devices[device['room_id']] = {
+                'device_name': device['device_name'],
+                'position_row': device['position']['row'],
+                'position_col': device['position']['col'],
+                'matrix_row': device['matrix_position']['row'],
+                'matrix_col': device['matrix_position']['col'],
+                'is_active': True,
+            }
+    return devices
+
+
+class DeviceMatrixCache:
+    """장치 매트릭스 인메모리 캐시 (워커 프로세스 단위)
+
+    방송 서버 응답(payload)은 TTL 동안 재사용합니다. 동기화한 워커는 커밋 후 바로 비우고,
+    다른 워커도 TTL이 지나면 새로 조회하므로 오래된 매트릭스를 TTL 이상 보여주지 않습니다.
+    장치 목록은 캐시된 payload에서 만들어 payload와 함께 교체됩니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._payload = None
+        self._payload_at = 0.0
+        self._devices = None
+
+    @property
+    def ttl(self) -> int:
+        return settings.BROADCAST_API_CONFIG.get('DEVICE_MATRIX_CACHE_TTL', 60)
+
+    def get_payload(self) -> Optional[Dict]:
+        with self._lock:
+            if self._payload is not None and time.monotonic() - self._payload_at < self.ttl:
+                return self._payload
+        return None
+
+    def set_payload(self, payload: Dict) -> None:
+        with self._lock:
+            self._payload = payload
+            self._payload_at = time.monotonic()
+            self._devices = None
+
+    def get_devices(self) -> Optional[List[DeviceMatrix]]:
+        """캐시된 payload의 장치 목록 (matrix_row, matrix_col 순, payload가 없거나 만료되면 None)"""
+        with self._lock:
+            if self._payload is None or time.monotonic() - self._payload_at >= self.ttl:
+                return None
+            if self._devices is None:
+                self._devices = sorted(
+                    (
+                        DeviceMatrix(room_id=room_id, **values)
+                        for room_id, values in flatten_matrix(self._payload.get('matrix', [])).items()
+                    ),
+                    key=lambda device: (device.matrix_row, device.matrix_col)
+                )
+            return self._devices
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._payload = None
+            self._devices = None
+
+
+device_matrix_cache = DeviceMatrixCache()
+
+
 class BroadcastAPIService:
     """FastAPI 방송 서비스와 연동하는 클래스"""
     
@@ -43,12 +133,13 @@ class BroadcastAPIService:
         
         for attempt in range(self.retry_attempts):
             try:
-                response = self.session.request(
-                    method=method,
-                    url=url,
-                    timeout=self.timeout,
-                    **kwargs
-                )
+                with track_external('broadcast'):
+                    response = self.session.request(
+                        method=method,
+                        url=url,
+                        timeout=self.timeout,
+                        **kwargs
+                    )
                 response.raise_for_status()
                 return response.json()
             except requests.exceptions.RequestException as e:
@@ -66,8 +157,31 @@ class BroadcastAPIService:
             logger.error(f"장치 매트릭스 조회 실패: {e}")
             raise
     
+    def get_cached_devices(self) -> List[DeviceMatrix]:
+        """장치 목록 조회 (인메모리 캐시, 만료 시 방송 서버에서 다시 조회)
+
+        방송 서버에 연결할 수 없으면 마지막으로 동기화한 DB의 활성 장치를 반환합니다.
+        """
+        devices = device_matrix_cache.get_devices()
+        if devices is not None:
+            return devices
+        try:
+            api_response = self.get_device_matrix()
+        except Exception:
+            api_response = None
+        if not api_response or not api_response.get('success'):
+            logger.warning("방송 서버 장치 매트릭스를 가져오지 못해 DB의 장치 목록을 사용합니다.")
+            return list(DeviceMatrix.objects.filter(is_active=True).order_by('matrix_row', 'matrix_col'))
+        device_matrix_cache.set_payload(api_response)
+        return device_matrix_cache.get_devices() or []
+    
     def sync_device_matrix(self) -> bool:
-        """FastAPI에서 장치 매트릭스를 가져와서 Django DB에 동기화"""
+        """FastAPI에서 장치 매트릭스를 가져와서 Django DB에 동기화
+
+        room_id 기준으로 변경분만 계산하여 하나의 트랜잭션에서
+        bulk_create / bulk_update / delete 로 반영합니다.
+        방송 서버 매트릭스의 해시가 이전 동기화와 같으면 DB 쓰기를 생략합니다.
+        """
         try:
             api_response = self.get_device_matrix()
             
@@ -76,25 +190,54 @@ class BroadcastAPIService:
                 return False
             
             matrix_data = api_response.get('matrix', [])
+            matrix_hash = compute_matrix_hash(matrix_data)
             
-            # 기존 데이터 삭제
-            DeviceMatrix.objects.all().delete()
+            if cache.get(DEVICE_MATRIX_HASH_CACHE_KEY) == matrix_hash:
+                logger.info("장치 매트릭스 변경 없음 - 동기화 생략")
+                return True
             
-            # 새 데이터 생성
-            devices_created = 0
-            for row_idx, row in enumerate(matrix_data):
-                for col_idx, device in enumerate(row):
-                    DeviceMatrix.objects.create(
-                        device_name=device['device_name'],
-                        room_id=device['room_id'],
-                        position_row=device['position']['row'],
-                        position_col=device['position']['col'],
-                        matrix_row=device['matrix_position']['row'],
-                        matrix_col=device['matrix_position']['col']
-                    )
-                    devices_created += 1
+            incoming = flatten_matrix(matrix_data)
             
-            logger.info(f"장치 매트릭스 동기화 완료: {devices_created}개 장치")
+            with transaction.atomic():
+                existing = {
+                    device.room_id: device
+                    for device in DeviceMatrix.objects.select_for_update()
+                }
+                
+                to_create = []
+                to_update = []
+                for room_id, values in incoming.items():
+                    device = existing.get(room_id)
+                    if device is None:
+                        to_create.append(DeviceMatrix(room_id=room_id, **values))
+                        continue
+                    changed = False
+                    for field, value in values.items():
+                        if getattr(device, field) != value:
+                            setattr(device, field, value)
+                            changed = True
+                    if changed:
+                        device.updated_at = timezone.now()
+                        to_update.append(device)
+                
+                removed_room_ids = existing.keys() - incoming.keys()
+                
+                if removed_room_ids:
+                    DeviceMatrix.objects.filter(room_id__in=removed_room_ids).delete()
+                if to_update:
+                    DeviceMatrix.objects.bulk_update(to_update, DEVICE_MATRIX_FIELDS + ('updated_at',))
+                if to_create:
+                    DeviceMatrix.objects.bulk_create(to_create)
+                
+                transaction.on_commit(device_matrix_cache.invalidate)
+                mark_changed('device_matrix')
+            
+            cache.set(DEVICE_MATRIX_HASH_CACHE_KEY, matrix_hash, DEVICE_MATRIX_HASH_TTL)
+            
+            logger.info(
+                f"장치 매트릭스 동기화 완료: 추가 {len(to_create)}개, "
+                f"수정 {len(to_update)}개, 삭제 {len(removed_room_ids)}개"
+            )
             return True
             
         except Exception as e:
@@ -148,15 +291,16 @@ class BroadcastService:
         self.api_service = BroadcastAPIService()
     
     def get_all_devices(self) -> List[DeviceMatrix]:
-        """모든 장치 조회"""
-        return DeviceMatrix.objects.filter(is_active=True).order_by('matrix_row', 'matrix_col')
+        """모든 장치 조회 (인메모리 캐시)"""
+        return list(self.api_service.get_cached_devices())
     
     def get_devices_by_rooms(self, room_ids: List[int]) -> List[DeviceMatrix]:
-        """특정 방들의 장치 조회"""
-        return DeviceMatrix.objects.filter(
-            room_id__in=room_ids, 
-            is_active=True
-        ).order_by('matrix_row', 'matrix_col')
+        """특정 방들의 장치 조회 (인메모리 캐시)"""
+        room_ids = {int(room_id) for room_id in room_ids}
+        return [
+            device for device in self.api_service.get_cached_devices()
+            if device.room_id in room_ids
+        ]
     
     def execute_text_broadcast(self, text: str, target_rooms: Optional[List[str]] = None,
                               language: str = 'ko', auto_off: bool = False, 
@@ -173,6 +317,8 @@ class BroadcastService:
             broadcasted_by=user
         )
         
+        started = time.perf_counter()
+        job_status = 'failed'
         try:
             # API 호출
             api_response = self.api_service.broadcast_text(
@@ -181,6 +327,7 @@ class BroadcastService:
                 language=language,
                 auto_off=auto_off
             )
+            job_status = 'completed'
             
             # 성공 시 상태 업데이트
             broadcast_history.status = 'completed'
@@ -197,6 +344,8 @@ class BroadcastService:
             
             logger.error(f"텍스트 방송 실패: {e}")
             raise
+        finally:
+            observe('broadcast_job', time.perf_counter() - started, type='text', status=job_status)
         
         return broadcast_history
     
@@ -214,6 +363,8 @@ class BroadcastService:
             broadcasted_by=user
         )
         
+        started = time.perf_counter()
+        job_status = 'failed'
         try:
             # API 호출
             api_response = self.api_service.broadcast_audio(
@@ -221,6 +372,7 @@ class BroadcastService:
                 target_rooms=target_rooms,
                 auto_off=auto_off
             )
+            job_status = 'completed'
             
             # FastAPI 응답 로깅 및 처리
             logger.info(f"FastAPI 오디오 방송 응답: {api_response}")
@@ -249,6 +401,8 @@ class BroadcastService:
             
             logger.error(f"오디오 방송 실패: {e}")
             raise
+        finally:
+            observe('broadcast_job', time.perf_counter() - started, type='audio', status=job_status)
         
         return broadcast_history
     
@@ -0,0 +1,16 @@
+"""
+방송 관련 시그널
+- 장치 매트릭스를 관리자 화면 등으로 직접 고치면 동기화 해시를 지워 다음 동기화가 DB를 다시 맞추게 함
+"""
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import DeviceMatrix
+from .services import DEVICE_MATRIX_HASH_CACHE_KEY
+
+
+@receiver(post_save, sender=DeviceMatrix)
+@receiver(post_delete, sender=DeviceMatrix)
+def device_matrix_changed(sender, instance, **kwargs):
+    cache.delete(DEVICE_MATRIX_HASH_CACHE_KEY)
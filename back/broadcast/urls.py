@@ -4,7 +4,7 @@ from .views import (
     DeviceMatrixView, TextBroadcastView, AudioBroadcastView, 
     AudioPreviewView, TextPreviewView, PreviewListView, 
     PreviewDetailView, PreviewApprovalView, PreviewRejectView,
-    TestExternalPreviewView, broadcast_status, preview_audio_file, download_audio_file, download_history_audio,
+    TestExternalPreviewView, broadcast_status, PreviewAudioFileView, download_audio_file, HistoryAudioDownloadView,
     AdminBroadcastHistoryView, AdminPreviewListView, BroadcastHistoryDetailView, ReuseHistoryAudioView
 )
 
@@ -24,7 +24,7 @@ urlpatterns = [
     path('history/<int:history_id>/', BroadcastHistoryView.as_view(), name='broadcast_history_delete'),
     path('history/<int:history_id>/detail/', BroadcastHistoryDetailView.as_view(), name='broadcast_history_detail'),
     path('history/<int:history_id>/reuse/', ReuseHistoryAudioView.as_view(), name='reuse_history_audio'),
-    path('history/audio/<int:history_id>/download/', download_history_audio, name='history_audio_download'),
+    path('history/audio/<int:history_id>/download/', HistoryAudioDownloadView.as_view(), name='history_audio_download'),
     
     # 어드민 전용 API
     path('admin/history/', AdminBroadcastHistoryView.as_view(), name='admin_broadcast_history'),
@@ -44,7 +44,7 @@ urlpatterns = [
     path('preview/<str:preview_id>/reject/', PreviewRejectView.as_view(), name='preview_reject'),
     
     # 프리뷰 오디오 파일 (외부 API와 호환되는 경로)
-    path('preview/<str:preview_id>.mp3', preview_audio_file, name='preview_audio_file'),
+    path('preview/<str:preview_id>.mp3', PreviewAudioFileView.as_view(), name='preview_audio_file'),
     
     # 시스템 상태
     path('status/', broadcast_status, name='broadcast_status'),
@@ -9,21 +9,25 @@ from django.shortcuts import get_object_or_404
 from django.core.exceptions import ValidationError
 from django.conf import settings
 from django.utils import timezone
-from django.http import FileResponse, Http404
+from django.http import FileResponse, Http404, HttpResponse
+from django.shortcuts import aget_object_or_404
+from asgiref.sync import sync_to_async
 import logging
 import os
 import uuid
 import requests
+import httpx
 import io
 import wave
 import struct
 import math
 import base64
 import json
+import time
 from datetime import datetime, timedelta
 
 from .models import DeviceMatrix, BroadcastHistory, AudioFile, BroadcastSchedule, BroadcastPreview
-from .services import BroadcastService, get_broadcast_api_headers, get_broadcast_api_url
+from .services import BroadcastService, device_matrix_cache, get_broadcast_api_headers, get_broadcast_api_url
 from .serializers import (
     DeviceMatrixSerializer, 
     BroadcastHistorySerializer, 
@@ -36,16 +40,31 @@ from .serializers import (
     PreviewApprovalSerializer,
     AudioPreviewSerializer
 )
+from core import async_http
+from core.async_views import AsyncAPIView
 from core.permissions import IsTeacherUser
+from core.response_cache import cached_response
+from system.performance import observe, track_external
 
 logger = logging.getLogger(__name__)
 
 
-def broadcast_api_request(method, url, **kwargs):
+def broadcast_api_request(method, url, job=None, **kwargs):
+    """방송 서버 요청 (job을 지정하면 방송 작업 소요 시간 메트릭에 기록)"""
     if not url.startswith(("http://", "https://")):
         url = get_broadcast_api_url(url)
     headers = get_broadcast_api_headers(kwargs.pop("headers", None))
-    return requests.request(method, url, headers=headers, **kwargs)
+    started = time.perf_counter()
+    job_status = "failed"
+    try:
+        with track_external("broadcast"):
+            response = requests.request(method, url, headers=headers, **kwargs)
+        if response.status_code < 400:
+            job_status = "completed"
+        return response
+    finally:
+        if job:
+            observe("broadcast_job", time.perf_counter() - started, type=job, status=job_status)
 
 
 def broadcast_api_get(url, **kwargs):
@@ -56,6 +75,31 @@ def broadcast_api_post(url, **kwargs):
     return broadcast_api_request("POST", url, **kwargs)
 
 
+async def abroadcast_api_request(method, url, job=None, **kwargs):
+    """방송 서버 비동기 요청 (AsyncAPIView용, 동시 요청 수는 ASYNC_HTTP['LIMITS']['broadcast']로 제한)"""
+    if not url.startswith(("http://", "https://")):
+        url = get_broadcast_api_url(url)
+    headers = get_broadcast_api_headers(kwargs.pop("headers", None))
+    started = time.perf_counter()
+    job_status = "failed"
+    try:
+        response = await async_http.request("broadcast", method, url, headers=headers, **kwargs)
+        if response.status_code < 400:
+            job_status = "completed"
+        return response
+    finally:
+        if job:
+            observe("broadcast_job", time.perf_counter() - started, type=job, status=job_status)
+
+
+async def abroadcast_api_get(url, **kwargs):
+    return await abroadcast_api_request("GET", url, **kwargs)
+
+
+async def abroadcast_api_post(url, **kwargs):
+    return await abroadcast_api_request("POST", url, **kwargs)
+
+
 def parse_target_rooms_from_formdata(target_rooms_data):
     """FormData에서 target_rooms를 안전하게 배열로 변환"""
     if not target_rooms_data:
@@ -76,32 +120,37 @@ class DeviceMatrixView(APIView):
     """장치 매트릭스 관련 뷰 - 4행 16열 매트릭스 반환"""
     permission_classes = []  # 인증 제거
     
+    # 방송 서버 데이터는 시그널이 없으므로 기존 매트릭스 캐시 TTL 동안만 재사용
+    @cached_response('device_matrix', timeout=lambda: device_matrix_cache.ttl)
     def get(self, request):
         """4행 16열 장치 매트릭스 조회 - 방송 서버에서 실시간 데이터 가져오기"""
         try:
-            # 방송 서버에서 실시간 장치 매트릭스 가져오기
-            broadcast_server_url = "http://10.129.55.251:10200/api/device-matrix/"
+            # 최근 조회한 매트릭스가 캐시에 있으면 방송 서버 호출 생략
+            broadcast_data = device_matrix_cache.get_payload()
             
-            import requests
-            response = broadcast_api_get(broadcast_server_url, timeout=10)
-            
-            if response.status_code != 200:
-                logger.error(f"방송 서버 장치 매트릭스 조회 실패: {response.status_code}")
-                return Response({
-                    'success': False,
-                    'message': '방송 서버에서 장치 정보를 가져올 수 없습니다.',
-                    'error': f'방송 서버 오류: {response.status_code}'
-                }, status=status.HTTP_503_SERVICE_UNAVAILABLE)
-            
-            broadcast_data = response.json()
-            
-            if not broadcast_data.get('success'):
-                logger.error(f"방송 서버 응답 오류: {broadcast_data.get('message')}")
-                return Response({
-                    'success': False,
-                    'message': '방송 서버에서 장치 정보를 가져올 수 없습니다.',
-                    'error': broadcast_data.get('message', '알 수 없는 오류')
-                }, status=status.HTTP_503_SERVICE_UNAVAILABLE)
+            if broadcast_data is None:
+                # 방송 서버에서 실시간 장치 매트릭스 가져오기
+                response = broadcast_api_get('/api/device-matrix/', timeout=10)
+                
+                if response.status_code != 200:
+                    logger.error(f"방송 서버 장치 매트릭스 조회 실패: {response.status_code}")
+                    return Response({
+                        'success': False,
+                        'message': '방송 서버에서 장치 정보를 가져올 수 없습니다.',
+                        'error': f'방송 서버 오류: {response.status_code}'
+                    }, status=status.HTTP_503_SERVICE_UNAVAILABLE)
+                
+                broadcast_data = response.json()
+                
+                if not broadcast_data.get('success'):
+                    logger.error(f"방송 서버 응답 오류: {broadcast_data.get('message')}")
+                    return Response({
+                        'success': False,
+                        'message': '방송 서버에서 장치 정보를 가져올 수 없습니다.',
+                        'error': broadcast_data.get('message', '알 수 없는 오류')
+                    }, status=status.HTTP_503_SERVICE_UNAVAILABLE)
+                
+                device_matrix_cache.set_payload(broadcast_data)
             
             # 방송 서버에서 받은 매트릭스 데이터를 그대로 사용
             matrix = broadcast_data.get('matrix', [])
@@ -177,11 +226,11 @@ class DeviceMatrixView(APIView):
                 'error': str(e)
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
-class TextBroadcastView(APIView):
+class TextBroadcastView(AsyncAPIView):
     """텍스트 방송 뷰 - 방송서버로 요청하여 프리뷰 생성"""
     # permission_classes 제거 - 기본 권한 클래스 사용
     
-    def post(self, request):
+    async def post(self, request):
         """방송서버로 텍스트 방송 요청하여 프리뷰 생성"""
         serializer = TextBroadcastSerializer(data=request.data)
         if not serializer.is_valid():
@@ -192,19 +241,19 @@ class TextBroadcastView(APIView):
             }, status=status.HTTP_400_BAD_REQUEST)
         
         try:
-            # 방송서버 URL (실제 방송서버 주소)
-            broadcast_server_url = "http://10.129.55.251:10200/api/broadcast/text"
+            # 방송서버 URL (BROADCAST_API_CONFIG['BASE_URL'] 기준)
+            broadcast_server_url = "/api/broadcast/text"
             
             # 방송서버로 전송할 데이터 (form-data 형식)
             broadcast_data = {
                 'text': serializer.validated_data['text'],
                 'target_rooms': ','.join(map(str, serializer.validated_data.get('target_rooms', []))),
                 'language': serializer.validated_data.get('language', 'ko'),
-                'auto_off': serializer.validated_data.get('auto_off', False)
+                'auto_off': str(serializer.validated_data.get('auto_off', False))
             }
             
             # 방송서버에 요청 (form-data 형식으로 전송)
-            broadcast_response = broadcast_api_post(broadcast_server_url, data=broadcast_data, timeout=30)
+            broadcast_response = await abroadcast_api_post(broadcast_server_url, job='text_preview', data=broadcast_data, timeout=30)
             
             if broadcast_response.status_code != 200:
                 # 방송서버 응답 내용 로깅
@@ -247,7 +296,7 @@ class TextBroadcastView(APIView):
             # 방송서버에서 받은 프리뷰 정보로 Django 프리뷰 생성
             preview_info = broadcast_data.get('preview_info', {})
             
-            preview = BroadcastPreview.objects.create(
+            preview = await BroadcastPreview.objects.acreate(
                 preview_id=preview_info.get('preview_id'),
                 broadcast_type='text',
                 content=serializer.validated_data['text'],
@@ -261,8 +310,8 @@ class TextBroadcastView(APIView):
             # 방송서버에서 오디오 파일을 가져와서 base64로 인코딩
             audio_base64 = None
             try:
-                audio_url = f"http://10.129.55.251:10200/api/broadcast/preview/audio/{preview_info.get('preview_id')}"
-                audio_response = broadcast_api_get(audio_url, timeout=30)
+                audio_url = f"/api/broadcast/preview/audio/{preview_info.get('preview_id')}"
+                audio_response = await abroadcast_api_get(audio_url, timeout=30)
                 if audio_response.status_code == 200:
                     audio_base64 = base64.b64encode(audio_response.content).decode('utf-8')
                     logger.info(f"오디오 파일 base64 인코딩 완료: {len(audio_base64)} characters")
@@ -288,7 +337,7 @@ class TextBroadcastView(APIView):
                 'timestamp': timezone.now().isoformat()
             })
             
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"방송서버 연결 실패: {e}")
             return Response({
                 'success': False,
@@ -303,12 +352,12 @@ class TextBroadcastView(APIView):
                 'error': str(e)
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
-class AudioBroadcastView(APIView):
+class AudioBroadcastView(AsyncAPIView):
     """오디오 방송 뷰 - 방송서버로 요청하여 프리뷰 생성"""
     # permission_classes 제거 - 기본 권한 클래스 사용
     parser_classes = [MultiPartParser, FormParser]
     
-    def post(self, request):
+    async def post(self, request):
         """방송서버로 오디오 방송 요청하여 프리뷰 생성"""
         serializer = AudioBroadcastSerializer(data=request.data)
         if not serializer.is_valid():
@@ -334,8 +383,8 @@ class AudioBroadcastView(APIView):
                     'message': f'파일 크기가 너무 큽니다. 최대 {settings.BROADCAST_CONFIG["MAX_AUDIO_SIZE"]}MB까지 허용됩니다.'
                 }, status=status.HTTP_400_BAD_REQUEST)
             
-            # 방송서버 URL (실제 방송서버 주소)
-            broadcast_server_url = "http://10.129.55.251:10200/api/broadcast/audio"
+            # 방송서버 URL (BROADCAST_API_CONFIG['BASE_URL'] 기준)
+            broadcast_server_url = "/api/broadcast/audio"
             
             # 방송서버로 전송할 데이터 준비
             broadcast_data = {
@@ -347,9 +396,9 @@ class AudioBroadcastView(APIView):
                 use_original_value = request.data.get('use_original')
                 # 문자열을 boolean으로 변환
                 if isinstance(use_original_value, str):
-                    broadcast_data['use_original'] = use_original_value.lower() == 'true'
+                    broadcast_data['use_original'] = str(use_original_value.lower() == 'true')
                 else:
-                    broadcast_data['use_original'] = bool(use_original_value)
+                    broadcast_data['use_original'] = str(bool(use_original_value))
             
             # target_rooms를 안전하게 배열로 변환
             target_rooms = parse_target_rooms_from_formdata(request.data.get('target_rooms', []))
@@ -362,7 +411,7 @@ class AudioBroadcastView(APIView):
             files = {'audio_file': (audio_file.name, audio_file, 'audio/mpeg')}
             
             # 방송서버에 요청 (form-data 형식으로 전송)
-            broadcast_response = broadcast_api_post(broadcast_server_url, data=broadcast_data, files=files, timeout=30)
+            broadcast_response = await abroadcast_api_post(broadcast_server_url, job='audio_preview', data=broadcast_data, files=files, timeout=30)
             
             if broadcast_response.status_code != 200:
                 # 방송서버 응답 내용 로깅
@@ -400,7 +449,7 @@ class AudioBroadcastView(APIView):
                 preview_info = broadcast_data['preview_info']
                 
                 # 프리뷰 정보를 데이터베이스에 저장
-                preview = BroadcastPreview.objects.create(
+                preview = await BroadcastPreview.objects.acreate(
                     preview_id=preview_info['preview_id'],
                     broadcast_type='audio',
                     content=f"오디오 프리뷰: {preview_info.get('preview_id', 'Unknown')}",
@@ -677,7 +726,7 @@ class ReuseHistoryAudioView(APIView):
                     broadcast_data['target_rooms'] = ','.join(map(str, target_rooms))
 
                 # 방송서버에 요청
-                broadcast_response = broadcast_api_post(broadcast_server_url, data=broadcast_data, files=files, timeout=30)
+                broadcast_response = broadcast_api_post(broadcast_server_url, job='audio_preview', data=broadcast_data, files=files, timeout=30)
                 
                 if broadcast_response.status_code != 200:
                     return Response({
@@ -1010,17 +1059,17 @@ class AudioPreviewView(APIView):
                 'error': str(e)
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
-class PreviewApprovalView(APIView):
+class PreviewApprovalView(AsyncAPIView):
     """프리뷰 승인/거부 뷰"""
     # permission_classes 제거 - 기본 권한 클래스 사용
     
-    def post(self, request, preview_id):
+    async def post(self, request, preview_id):
         """프리뷰 승인 또는 거부"""
         try:
-            preview = get_object_or_404(BroadcastPreview, preview_id=preview_id)
+            preview = await aget_object_or_404(BroadcastPreview, preview_id=preview_id)
             
             # 사용자가 자신이 생성한 프리뷰만 접근할 수 있도록 권한 확인
-            if preview.created_by != request.user:
+            if preview.created_by_id != request.user.pk:
                 return Response({
                     'success': False,
                     'message': '자신이 생성한 프리뷰만 처리할 수 있습니다.'
@@ -1029,7 +1078,7 @@ class PreviewApprovalView(APIView):
             # 만료된 프리뷰인지 확인
             if preview.is_expired():
                 preview.status = 'expired'
-                preview.save()
+                await preview.asave()
                 return Response({
                     'success': False,
                     'message': '프리뷰가 만료되었습니다.'
@@ -1058,8 +1107,7 @@ class PreviewApprovalView(APIView):
                     # 외부 API에 프리뷰 승인 요청
                     external_api_url = f"{settings.BROADCAST_API_CONFIG['BASE_URL']}/api/broadcast/preview/approve/{preview_id}"
                     
-                    import requests
-                    approval_response = broadcast_api_post(external_api_url, timeout=30)
+                    approval_response = await abroadcast_api_post(external_api_url, job='approve', timeout=30)
                     logger.info(f"외부 API 승인 요청 상태: {approval_response.status_code}")
                     
                     if approval_response.status_code == 200:
@@ -1070,17 +1118,17 @@ class PreviewApprovalView(APIView):
                         preview.status = 'approved'
                         preview.approved_by = request.user
                         preview.approved_at = timezone.now()
-                        preview.save()
+                        await preview.asave()
                         
                         # 방송 이력 생성
-                        broadcast_history = BroadcastHistory.objects.create(
+                        broadcast_history = await BroadcastHistory.objects.acreate(
                             broadcast_type=preview.broadcast_type,
                             content=preview.content,
                             target_rooms=preview.target_rooms,
                             language=preview.language,
                             auto_off=preview.auto_off,
                             status='completed',
-                            broadcasted_by=preview.created_by,  # 프리뷰 생성자가 방송자
+                            broadcasted_by_id=preview.created_by_id,  # 프리뷰 생성자가 방송자
                             completed_at=timezone.now(),
                             preview=preview  # 프리뷰 연결
                         )
@@ -1110,7 +1158,7 @@ class PreviewApprovalView(APIView):
                             'external_response': approval_response.text
                         }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
                     
-                except requests.exceptions.RequestException as e:
+                except httpx.HTTPError as e:
                     logger.error(f"외부 API 승인 요청 실패: {e}")
                     return Response({
                         'success': False,
@@ -1129,10 +1177,10 @@ class PreviewApprovalView(APIView):
                 # 프리뷰 거부
                 preview.status = 'rejected'
                 preview.rejection_reason = serializer.validated_data.get('rejection_reason', '')
-                preview.save()
+                await preview.asave()
                 
                 # 거부된 방송 이력 생성
-                broadcast_history = BroadcastHistory.objects.create(
+                broadcast_history = await BroadcastHistory.objects.acreate(
                     broadcast_type=preview.broadcast_type,
                     content=preview.content,
                     target_rooms=preview.target_rooms,
@@ -1140,7 +1188,7 @@ class PreviewApprovalView(APIView):
                     auto_off=preview.auto_off,
                     status='failed',
                     error_message=f"프리뷰 거부됨: {preview.rejection_reason}",
-                    broadcasted_by=preview.created_by,  # 프리뷰 생성자가 방송자
+                    broadcasted_by_id=preview.created_by_id,  # 프리뷰 생성자가 방송자
                     completed_at=timezone.now(),
                     preview=preview  # 프리뷰 연결
                 )
@@ -1161,119 +1209,124 @@ class PreviewApprovalView(APIView):
                 'error': str(e)
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
-@api_view(['GET'])
-@permission_classes([IsTeacherUser])  # 중앙화된 권한 관리 사용
-def preview_audio_file(request, preview_id):
-    """프리뷰 오디오 파일 다운로드 - 외부 API에서 파일을 받아서 그대로 응답"""
+def _stored_audio_response(audio_file):
+    """저장된 내부 오디오 파일 응답 (파일 읽기는 동기 I/O라 비동기 뷰에서는 sync_to_async로 호출)"""
+    import mimetypes
+
+    # 파일 타입 확인
+    content_type, _ = mimetypes.guess_type(audio_file.original_filename)
+    if not content_type:
+        content_type = 'audio/mpeg'
+
+    # 파일 응답 생성
+    response = HttpResponse(audio_file.file, content_type=content_type)
+    response['Content-Disposition'] = f'inline; filename="{audio_file.original_filename}"'
+    # CORS 헤더 추가
+    response['Access-Control-Allow-Origin'] = '*'
+    response['Access-Control-Allow-Methods'] = 'GET, OPTIONS'
+    response['Access-Control-Allow-Headers'] = 'Content-Type, Authorization, Accept'
+    return response
+
+
+async def _proxy_preview_audio(preview_id, filename):
+    """방송서버에서 프리뷰 오디오 파일을 받아 그대로 응답 (방송서버 URL: /api/broadcast/preview/audio/{preview_id})"""
+    external_api_url = get_broadcast_api_url(f"/api/broadcast/preview/audio/{preview_id}")
+
     try:
-        preview = get_object_or_404(BroadcastPreview, preview_id=preview_id)
-        
-        # 사용자가 자신이 생성한 프리뷰의 오디오 파일만 다운로드할 수 있도록 권한 확인
-        if preview.created_by != request.user and not request.user.is_superuser:
-            return Response({
-                'success': False,
-                'message': '자신이 생성한 프리뷰의 오디오 파일만 다운로드할 수 있습니다.'
-            }, status=status.HTTP_403_FORBIDDEN)
-        
-        # 만료된 프리뷰인지 확인
-        if preview.is_expired():
+        # 방송서버에 요청해서 파일을 가져오기
+        response = await abroadcast_api_get(external_api_url, timeout=30)
+        logger.info(f"방송서버 응답 상태: {response.status_code}")
+        logger.info(f"방송서버 응답 헤더: {dict(response.headers)}")
+
+        if response.status_code == 200:
+            # 응답 내용 확인
+            content = response.content
+            logger.info(f"방송서버 응답 크기: {len(content)} bytes")
+
+            # Content-Type이 application/json인 경우에만 JSON 응답으로 처리
+            content_type = response.headers.get('content-type', '')
+            if 'application/json' in content_type:
+                try:
+                    json_content = json.loads(content)
+                    logger.error(f"방송서버가 JSON 응답을 반환함: {json_content}")
+                    return Response({
+                        'success': False,
+                        'message': '방송서버에서 오디오 파일 대신 JSON 응답을 반환했습니다.',
+                        'external_response': json_content
+                    }, status=status.HTTP_400_BAD_REQUEST)
+                except json.JSONDecodeError:
+                    pass
+
+            # 방송서버에서 파일을 성공적으로 가져온 경우 - 그대로 응답
+            http_response = HttpResponse(content, content_type='audio/mpeg')
+            http_response['Content-Disposition'] = f'inline; filename="{filename}"'
+            # CORS 헤더 추가
+            http_response['Access-Control-Allow-Origin'] = '*'
+            http_response['Access-Control-Allow-Methods'] = 'GET, OPTIONS'
+            http_response['Access-Control-Allow-Headers'] = 'Content-Type, Authorization, Accept'
+            logger.info(f"방송서버 오디오 파일 응답 완료: {len(content)} bytes")
+            return http_response
+        else:
+            # 방송서버에서 파일을 찾을 수 없는 경우
+            logger.error(f"방송서버에서 파일을 찾을 수 없음: {response.status_code}")
+            logger.error(f"방송서버 응답 내용: {response.text}")
             return Response({
                 'success': False,
-                'message': '프리뷰가 만료되었습니다.'
-            }, status=status.HTTP_400_BAD_REQUEST)
-        
-        # 프리뷰에 연결된 오디오 파일이 있는지 확인
-        if preview.audio_file and preview.audio_file.file:
-            # 이미 저장된 내부 오디오 파일 제공
-            from django.http import HttpResponse
-            import mimetypes
-            
-            # 파일 타입 확인
-            content_type, _ = mimetypes.guess_type(preview.audio_file.original_filename)
-            if not content_type:
-                content_type = 'audio/mpeg'
+                'message': f'방송서버에서 프리뷰 오디오 파일을 찾을 수 없습니다. (상태 코드: {response.status_code})',
+                'external_url': external_api_url,
+                'response_text': response.text
+            }, status=status.HTTP_404_NOT_FOUND)
+
+    except httpx.HTTPError as e:
+        # 방송서버 연결 실패
+        logger.error(f"방송서버 연결 실패: {e}")
+        return Response({
+            'success': False,
+            'message': '방송서버에 연결할 수 없습니다.'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+class PreviewAudioFileView(AsyncAPIView):
+    """프리뷰 오디오 파일 다운로드 - 외부 API에서 파일을 받아서 그대로 응답"""
+    permission_classes = [IsTeacherUser]  # 중앙화된 권한 관리 사용
+
+    async def get(self, request, preview_id):
+        try:
+            preview = await aget_object_or_404(
+                BroadcastPreview.objects.select_related('audio_file'), preview_id=preview_id
+            )
             
-            # 파일 응답 생성
-            response = HttpResponse(preview.audio_file.file, content_type=content_type)
-            response['Content-Disposition'] = f'inline; filename="{preview.audio_file.original_filename}"'
-            # CORS 헤더 추가
-            response['Access-Control-Allow-Origin'] = '*'
-            response['Access-Control-Allow-Methods'] = 'GET, OPTIONS'
-            response['Access-Control-Allow-Headers'] = 'Content-Type, Authorization, Accept'
-            return response
-        else:
-            # 방송서버에서 프리뷰 오디오 파일을 가져와서 그대로 응답
-            # 방송서버 URL: http://10.129.55.251:10200/api/broadcast/preview/audio/{preview_id}.mp3
-            external_api_url = f"http://10.129.55.251:10200/api/broadcast/preview/audio/{preview_id}"
+            # 사용자가 자신이 생성한 프리뷰의 오디오 파일만 다운로드할 수 있도록 권한 확인
+            if preview.created_by_id != request.user.pk and not request.user.is_superuser:
+                return Response({
+                    'success': False,
+                    'message': '자신이 생성한 프리뷰의 오디오 파일만 다운로드할 수 있습니다.'
+                }, status=status.HTTP_403_FORBIDDEN)
             
-            try:
-                # 방송서버에 요청해서 파일을 가져오기
-                import requests
-                response = broadcast_api_get(external_api_url, stream=True, timeout=30)
-                logger.info(f"방송서버 응답 상태: {response.status_code}")
-                logger.info(f"방송서버 응답 헤더: {dict(response.headers)}")
-                
-                if response.status_code == 200:
-                    # 응답 내용 확인
-                    content = response.content
-                    logger.info(f"방송서버 응답 크기: {len(content)} bytes")
-                    
-                    # Content-Type이 application/json인 경우에만 JSON 응답으로 처리
-                    content_type = response.headers.get('content-type', '')
-                    if 'application/json' in content_type:
-                        try:
-                            import json
-                            json_content = json.loads(content)
-                            logger.error(f"방송서버가 JSON 응답을 반환함: {json_content}")
-                            return Response({
-                                'success': False,
-                                'message': '방송서버에서 오디오 파일 대신 JSON 응답을 반환했습니다.',
-                                'external_response': json_content
-                            }, status=status.HTTP_400_BAD_REQUEST)
-                        except json.JSONDecodeError:
-                            pass
-                    
-                    # 방송서버에서 파일을 성공적으로 가져온 경우 - 그대로 응답
-                    from django.http import HttpResponse
-                    http_response = HttpResponse(content, content_type='audio/mpeg')
-                    http_response['Content-Disposition'] = f'inline; filename="{preview_id}"'
-                    # CORS 헤더 추가
-                    http_response['Access-Control-Allow-Origin'] = '*'
-                    http_response['Access-Control-Allow-Methods'] = 'GET, OPTIONS'
-                    http_response['Access-Control-Allow-Headers'] = 'Content-Type, Authorization, Accept'
-                    logger.info(f"방송서버 오디오 파일 응답 완료: {len(content)} bytes")
-                    return http_response
-                else:
-                    # 방송서버에서 파일을 찾을 수 없는 경우
-                    logger.error(f"방송서버에서 파일을 찾을 수 없음: {response.status_code}")
-                    logger.error(f"방송서버 응답 내용: {response.text}")
-                    return Response({
-                        'success': False,
-                        'message': f'방송서버에서 프리뷰 오디오 파일을 찾을 수 없습니다. (상태 코드: {response.status_code})',
-                        'external_url': external_api_url,
-                        'response_text': response.text
-                    }, status=status.HTTP_404_NOT_FOUND)
-                    
-            except requests.exceptions.RequestException as e:
-                # 방송서버 연결 실패
-                logger.error(f"방송서버 연결 실패: {e}")
+            # 만료된 프리뷰인지 확인
+            if preview.is_expired():
                 return Response({
                     'success': False,
-                    'message': '방송서버에 연결할 수 없습니다.'
-                }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-        
-    except Http404:
-        return Response({
-            'success': False,
-            'message': '프리뷰를 찾을 수 없습니다.'
-        }, status=status.HTTP_404_NOT_FOUND)
-    except Exception as e:
-        logger.error(f"프리뷰 오디오 파일 다운로드 실패: {e}")
-        return Response({
-            'success': False,
-            'message': '오디오 파일 다운로드에 실패했습니다.',
-            'error': str(e)
-        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+                    'message': '프리뷰가 만료되었습니다.'
+                }, status=status.HTTP_400_BAD_REQUEST)
+            
+            # 프리뷰에 연결된 오디오 파일이 있으면 이미 저장된 내부 오디오 파일 제공
+            if preview.audio_file and preview.audio_file.file:
+                return await sync_to_async(_stored_audio_response)(preview.audio_file)
+            return await _proxy_preview_audio(preview_id, preview_id)
+            
+        except Http404:
+            return Response({
+                'success': False,
+                'message': '프리뷰를 찾을 수 없습니다.'
+            }, status=status.HTTP_404_NOT_FOUND)
+        except Exception as e:
+            logger.error(f"프리뷰 오디오 파일 다운로드 실패: {e}")
+            return Response({
+                'success': False,
+                'message': '오디오 파일 다운로드에 실패했습니다.',
+                'error': str(e)
+            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 class PreviewListView(APIView):
     """프리뷰 목록 뷰"""
@@ -1282,16 +1335,11 @@ class PreviewListView(APIView):
     def get(self, request):
         """프리뷰 목록 조회"""
         try:
-            # 만료된 프리뷰들 자동으로 만료 상태로 변경
-            expired_previews = BroadcastPreview.objects.filter(
-                status__in=['pending', 'ready'],
-                expires_at__lt=timezone.now()
-            )
-            expired_previews.update(status='expired')
-            
             # 프리뷰 목록 조회 - 모든 사용자는 자신이 생성한 프리뷰만 조회
+            # (만료 상태 변경은 broadcast.jobs.expire_previews 주기 작업이 처리하므로 조회 시에는 제외만 함)
             previews = BroadcastPreview.objects.filter(
                 status__in=['pending', 'ready'],
+                expires_at__gte=timezone.now(),
                 created_by=request.user  # 사용자가 생성한 프리뷰만 필터링
             ).order_by('-created_at')
             
@@ -1334,24 +1382,22 @@ class AdminPreviewListView(APIView):
                     'message': '어드민 권한이 필요합니다.'
                 }, status=status.HTTP_403_FORBIDDEN)
             
-            # 만료된 프리뷰들 자동으로 만료 상태로 변경
-            expired_previews = BroadcastPreview.objects.filter(
-                status__in=['pending', 'ready'],
-                expires_at__lt=timezone.now()
-            )
-            expired_previews.update(status='expired')
-            
             # 전체 프리뷰 목록 조회 (어드민은 모든 프리뷰 조회 가능)
-            previews = BroadcastPreview.objects.all().order_by('-created_at')
+            previews = BroadcastPreview.objects.select_related('created_by').order_by('-created_at')
+            now = timezone.now()
             
             preview_list = []
             for preview in previews:
+                # 주기 작업이 아직 만료 처리하지 않은 프리뷰도 만료로 표시
+                preview_status = preview.status
+                if preview_status in ('pending', 'ready') and preview.expires_at < now:
+                    preview_status = 'expired'
                 preview_list.append({
                     'preview_id': preview.preview_id,
                     'job_type': preview.broadcast_type,
                     'estimated_duration': 0,  # 외부 API에서 제공하는 값 사용
                     'created_at': preview.created_at.isoformat(),
-                    'status': preview.status,
+                    'status': preview_status,
                     'created_by_username': preview.created_by.username if preview.created_by else 'Unknown'
                 })
             
@@ -1668,90 +1714,38 @@ def download_audio_file(request, file_id):
             'error': str(e)
         }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
-@api_view(['GET'])
-@permission_classes([IsTeacherUser])  # 중앙화된 권한 관리 사용
-def download_history_audio(request, history_id):
+class HistoryAudioDownloadView(AsyncAPIView):
     """방송 이력의 오디오 파일 다운로드"""
-    try:
-        history_item = get_object_or_404(BroadcastHistory, id=history_id)
-        
-        # 사용자가 자신의 방송 이력만 다운로드할 수 있도록 권한 확인
-        if history_item.broadcasted_by != request.user and not request.user.is_staff:
-            return Response({
-                'success': False,
-                'message': '자신의 방송 이력만 다운로드할 수 있습니다.'
-            }, status=status.HTTP_403_FORBIDDEN)
-        
-        # 프리뷰가 있는지 확인
-        if not history_item.preview or not history_item.preview.preview_id:
-            return Response({
-                'success': False,
-                'message': '이 방송 이력에는 오디오 파일이 없습니다.'
-            }, status=status.HTTP_404_NOT_FOUND)
-        
-        # 방송서버에서 오디오 파일 가져오기
-        external_api_url = f"http://10.129.55.251:10200/api/broadcast/preview/audio/{history_item.preview.preview_id}"
-        
+    permission_classes = [IsTeacherUser]  # 중앙화된 권한 관리 사용
+
+    async def get(self, request, history_id):
         try:
-            # 방송서버에 요청해서 파일을 가져오기
-            import requests
-            response = broadcast_api_get(external_api_url, timeout=30)
-            logger.info(f"방송서버 응답 상태: {response.status_code}")
-            logger.info(f"방송서버 응답 헤더: {dict(response.headers)}")
-            
-            if response.status_code == 200:
-                # 응답 내용 확인
-                content = response.content
-                logger.info(f"방송서버 응답 크기: {len(content)} bytes")
-                
-                # Content-Type이 application/json인 경우에만 JSON 응답으로 처리
-                content_type = response.headers.get('content-type', '')
-                if 'application/json' in content_type:
-                    try:
-                        import json
-                        json_content = json.loads(content)
-                        logger.error(f"방송서버가 JSON 응답을 반환함: {json_content}")
-                        return Response({
-                            'success': False,
-                            'message': '방송서버에서 오디오 파일 대신 JSON 응답을 반환했습니다.',
-                            'external_response': json_content
-                        }, status=status.HTTP_400_BAD_REQUEST)
-                    except json.JSONDecodeError:
-                        pass
-                
-                # 방송서버에서 파일을 성공적으로 가져온 경우 - 그대로 응답
-                from django.http import HttpResponse
-                http_response = HttpResponse(content, content_type='audio/mpeg')
-                http_response['Content-Disposition'] = f'inline; filename="{history_item.preview.preview_id}"'
-                # CORS 헤더 추가
-                http_response['Access-Control-Allow-Origin'] = '*'
-                http_response['Access-Control-Allow-Methods'] = 'GET, OPTIONS'
-                http_response['Access-Control-Allow-Headers'] = 'Content-Type, Authorization, Accept'
-                logger.info(f"방송서버 오디오 파일 응답 완료: {len(content)} bytes")
-                return http_response
-            else:
-                # 방송서버에서 파일을 찾을 수 없는 경우
-                logger.error(f"방송서버에서 파일을 찾을 수 없음: {response.status_code}")
-                logger.error(f"방송서버 응답 내용: {response.text}")
+            history_item = await aget_object_or_404(
+                BroadcastHistory.objects.select_related('preview'), id=history_id
+            )
+            
+            # 사용자가 자신의 방송 이력만 다운로드할 수 있도록 권한 확인
+            if history_item.broadcasted_by_id != request.user.pk and not request.user.is_staff:
                 return Response({
                     'success': False,
-                    'message': f'방송서버에서 프리뷰 오디오 파일을 찾을 수 없습니다. (상태 코드: {response.status_code})',
-                    'external_url': external_api_url,
-                    'response_text': response.text
+                    'message': '자신의 방송 이력만 다운로드할 수 있습니다.'
+                }, status=status.HTTP_403_FORBIDDEN)
+            
+            # 프리뷰가 있는지 확인
+            if not history_item.preview or not history_item.preview.preview_id:
+                return Response({
+                    'success': False,
+                    'message': '이 방송 이력에는 오디오 파일이 없습니다.'
                 }, status=status.HTTP_404_NOT_FOUND)
-                
-        except requests.exceptions.RequestException as e:
-            # 방송서버 연결 실패
-            logger.error(f"방송서버 연결 실패: {e}")
+            
+            # 방송서버에서 오디오 파일 가져오기
+            preview_id = history_item.preview.preview_id
+            return await _proxy_preview_audio(preview_id, preview_id)
+            
+        except Exception as e:
+            logger.error(f"방송 이력 오디오 파일 다운로드 실패: {e}")
             return Response({
                 'success': False,
-                'message': '방송서버에 연결할 수 없습니다.'
+                'message': '오디오 파일을 다운로드할 수 없습니다.',
+                'error': str(e)
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-        
-    except Exception as e:
-        logger.error(f"방송 이력 오디오 파일 다운로드 실패: {e}")
-        return Response({
-            'success': False,
-            'message': '오디오 파일을 다운로드할 수 없습니다.',
-            'error': str(e)
-        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
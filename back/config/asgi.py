@@ -9,17 +9,27 @@ https://docs.djangoproject.com/en/5.0/howto/deployment/asgi/
 
 import os
 from django.core.asgi import get_asgi_application
-from channels.routing import ProtocolTypeRouter, URLRouter
-from channels.auth import AuthMiddlewareStack
-from system.routing import websocket_urlpatterns
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
 
+# 앱 레지스트리를 먼저 초기화해야 consumer(모델 import)를 불러올 수 있음
+django_asgi_app = get_asgi_application()
+
+from channels.routing import ProtocolTypeRouter, URLRouter  # noqa: E402
+from channels.auth import AuthMiddlewareStack  # noqa: E402
+from system.routing import websocket_urlpatterns  # noqa: E402
+
 application = ProtocolTypeRouter({
-    "http": get_asgi_application(),
+    "http": django_asgi_app,
     "websocket": AuthMiddlewareStack(
         URLRouter(
             websocket_urlpatterns
         )
     ),
-}) 
\ No newline at end of file
+})
+
+# 백그라운드 스레드 (헬스체크 캐시 갱신, 주기 작업 스케줄러)
+# gunicorn에서는 post_worker_init 훅이 워커마다 시작하므로 그 밖의 서버에서만 여기서 시작
+from core.startup import start_background_services_unless_hooked  # noqa: E402
+
+start_background_services_unless_hooked()
@@ -1,5 +1,6 @@
 from pathlib import Path
 import os
+import tempfile
 from datetime import timedelta
 from dotenv import load_dotenv
 
@@ -63,6 +64,7 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'system.performance.PerformanceMiddleware',  # 요청별 성능 계측
 ]
 
 # Next.js 프론트엔드를 위한 CORS 설정
@@ -109,6 +111,8 @@ DATABASES = {
         'PASSWORD': os.environ.get('BSSM_DATABASE_PASSWORD', 'Kea@Pass123!'),
         'HOST': os.environ.get('BSSM_DATABASE_HOST', '127.0.0.1'),
         'PORT': os.environ.get('BSSM_DATABASE_PORT', '3306'),
+        'CONN_MAX_AGE': int(os.environ.get('BSSM_DATABASE_CONN_MAX_AGE', '60')),  # 초 단위, 0이면 요청마다 재연결
+        'CONN_HEALTH_CHECKS': True,
     },
     'kea': {
         'ENGINE': 'django.db.backends.mysql',
@@ -117,9 +121,16 @@ DATABASES = {
         'PASSWORD': os.environ.get('KEA_DATABASE_PASSWORD', 'Kea@Pass123!'),
         'HOST': os.environ.get('KEA_DATABASE_HOST', '127.0.0.1'),
         'PORT': os.environ.get('KEA_DATABASE_PORT', '3306'),
+        'CONN_MAX_AGE': int(os.environ.get('KEA_DATABASE_CONN_MAX_AGE', '60')),
+        'CONN_HEALTH_CHECKS': True,
+        # KEA lease4.expire는 서버 로컬 시간(TIMESTAMP)으로 기록되어 왔으므로 같은 시간대로 읽고 씀
+        'TIME_ZONE': os.environ.get('KEA_DATABASE_TIME_ZONE', 'Asia/Seoul'),
     }
 }
 
+# KEA 테이블(hosts, dhcp4_options, lease4) 모델은 kea DB로 라우팅
+DATABASE_ROUTERS = ['core.db_routers.KeaRouter']
+
 # KEA DHCP 설정
 KEA_CONFIG = {
     'SUBNET_ID': int(os.environ.get('KEA_SUBNET_ID', '3')),
@@ -153,6 +164,17 @@ WSGI_APPLICATION = 'config.wsgi.application'
 # ASGI 애플리케이션 설정 추가 (Channels용)
 ASGI_APPLICATION = 'config.asgi.application'
 
+# 캐시 설정 - REDIS_CACHE_URL이 있으면 워커 간 공유 캐시(Redis) 사용
+# 운영(gunicorn 여러 워커)에서는 필수: 없으면 LocMem(워커별 캐시)이 되어 검색 색인, 응답 캐시,
+# 캡티브 등록 장치, 블랙리스트 변경이 다른 워커에 늦게 반영됨 (core.checks 경고 core.W001)
+if os.environ.get('REDIS_CACHE_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.environ['REDIS_CACHE_URL'],
+        }
+    }
+
 # Channels 레이어 설정
 CHANNEL_LAYERS = {
     'default': {
@@ -186,15 +208,20 @@ AUTH_USER_MODEL = 'users.User'
 # 기존 설정 아래에 추가
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'users.authentication.CachedJWTAuthentication',  # 사용자 스냅샷 캐시 (users.tokens)
     ),
     'DEFAULT_PERMISSION_CLASSES': (
         'core.permissions.DefaultAppPermissions',  # 중앙화된 권한 관리 사용 (자동 감지)
     ),
-    # 퍼포먼스 향상을 위한 설정
+    # 퍼포먼스 향상을 위한 설정 (orjson 렌더러/파서, 브라우저용 API 화면은 DEBUG에서만)
     'DEFAULT_RENDERER_CLASSES': (
-        'rest_framework.renderers.JSONRenderer',
-        'rest_framework.renderers.BrowsableAPIRenderer',
+        'core.renderers.ORJSONRenderer',
+        *(('rest_framework.renderers.BrowsableAPIRenderer',) if DEBUG else ()),
+    ),
+    'DEFAULT_PARSER_CLASSES': (
+        'core.renderers.ORJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
     ),
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 100,  # 페이지당 항목 수 증가
@@ -215,6 +242,11 @@ SIMPLE_JWT = {
     'AUTH_HEADER_TYPES': ('Bearer',),
 }
 
+# JWT 인증 사용자 스냅샷 캐시 (users.tokens)
+AUTH_USER_CACHE = {
+    'TIMEOUT': int(os.environ.get('AUTH_USER_CACHE_TIMEOUT', '300')),  # 초 단위
+}
+
 PASSWORD_HASHERS = [
     'django.contrib.auth.hashers.BCryptPasswordHasher',
 ]
@@ -291,6 +323,8 @@ SSL_CA_VALIDITY_DAYS = int(os.environ.get('SSL_CA_VALIDITY_DAYS', '36500'))
 
 # OCSP 서버 URL 설정
 OCSP_URL = os.environ.get('OCSP_URL', 'http://localhost:8000/dns/ocsp/')
+# OCSP 응답 캐시 유효 시간 (초, 0이면 캐시하지 않음)
+OCSP_RESPONSE_CACHE_TTL = int(os.environ.get('OCSP_RESPONSE_CACHE_TTL', '300'))
 
 # FastAPI 방송 서비스 설정
 BROADCAST_API_CONFIG = {
@@ -298,6 +332,7 @@ BROADCAST_API_CONFIG = {
     'API_KEY': os.environ.get('BROADCAST_API_KEY', ''),
     'TIMEOUT': int(os.environ.get('BROADCAST_API_TIMEOUT', '30')),  # 초 단위
     'RETRY_ATTEMPTS': int(os.environ.get('BROADCAST_API_RETRY_ATTEMPTS', '3')),
+    'DEVICE_MATRIX_CACHE_TTL': int(os.environ.get('BROADCAST_DEVICE_MATRIX_CACHE_TTL', '60')),  # 초 단위
 }
 
 # 스피커 방송 관련 설정
@@ -307,4 +342,123 @@ BROADCAST_CONFIG = {
     'AUDIO_UPLOAD_PATH': os.environ.get('BROADCAST_AUDIO_UPLOAD_PATH', '/var/broadcast/audio'),
     'ALLOWED_AUDIO_FORMATS': ['mp3', 'wav', 'ogg', 'm4a'],
     'MAX_AUDIO_SIZE': int(os.environ.get('BROADCAST_MAX_AUDIO_SIZE', '50')),  # MB 단위
-}
\ No newline at end of file
+}
+
+# 요청 성능 계측 설정 (system.performance)
+PERFORMANCE_MONITOR = {
+    'ENABLED': os.environ.get('PERFORMANCE_MONITOR_ENABLED', 'True') == 'True',
+    # 워커별 집계 파일 디렉터리 (gunicorn 워커끼리 공유, 서버 시작 시 비움) - 소스 트리 밖의 로컬 경로 사용
+    'DIRECTORY': os.environ.get('PERFORMANCE_MONITOR_DIR', os.path.join(tempfile.gettempdir(), 'bssm_captive_metrics')),
+    'FLUSH_INTERVAL': int(os.environ.get('PERFORMANCE_MONITOR_FLUSH_INTERVAL', '10')),  # 초 단위
+    'SLOW_SAMPLE_SIZE': int(os.environ.get('PERFORMANCE_MONITOR_SLOW_SAMPLE_SIZE', '20')),
+    'SLOW_THRESHOLD_MS': int(os.environ.get('PERFORMANCE_MONITOR_SLOW_THRESHOLD_MS', '200')),
+}
+
+# Prometheus 메트릭 설정 (system.metrics, GET /metrics)
+METRICS = {
+    'TOKEN': os.environ.get('METRICS_TOKEN', ''),  # 설정 시 Bearer 토큰 인증, 미설정 시 허용 네트워크만 접근
+    'ALLOWED_NETWORKS': [
+        network.strip()
+        for network in os.environ.get('METRICS_ALLOWED_NETWORKS', '127.0.0.1/32,::1/128').split(',')
+        if network.strip()
+    ],
+    'POOL_SNAPSHOT_INTERVAL': int(os.environ.get('METRICS_POOL_SNAPSHOT_INTERVAL', '30')),  # 초 단위
+}
+
+# KEA 리스 활동 적재 (Device.last_access, 접속 기록)
+LEASE_ACTIVITY = {
+    'ONLINE_WINDOW': int(os.environ.get('LEASE_ACTIVITY_ONLINE_WINDOW', '900')),  # 초 단위, 이 시간 안에 리스 갱신이 있으면 온라인
+    'RETENTION_DAYS': int(os.environ.get('LEASE_ACTIVITY_RETENTION_DAYS', '90')),  # 접속 기록 보관 기간
+}
+
+# 캡티브 포털 등록 여부 판정 (devices.captive, nginx auth_request)
+CAPTIVE_CHECK = {
+    'TRUSTED_PROXIES': [
+        network.strip()
+        for network in os.environ.get('CAPTIVE_CHECK_TRUSTED_PROXIES', '127.0.0.1/32,::1/128').split(',')
+        if network.strip()
+    ],
+    'VERSION_CHECK_INTERVAL': int(os.environ.get('CAPTIVE_CHECK_VERSION_INTERVAL', '1')),  # 초 단위
+    'REFRESH_INTERVAL': int(os.environ.get('CAPTIVE_CHECK_REFRESH_INTERVAL', '60')),  # 초 단위, KEA 리스 변화 반영 주기
+}
+
+# 사용자/장치/장비 n-gram 검색 인덱스 (core.search, 워커 메모리)
+SEARCH_INDEX = {
+    'VERSION_CHECK_INTERVAL': int(os.environ.get('SEARCH_INDEX_VERSION_INTERVAL', '1')),  # 초 단위
+    'REFRESH_INTERVAL': int(os.environ.get('SEARCH_INDEX_REFRESH_INTERVAL', '600')),  # 초 단위, 전체 재생성 주기
+    'CHANGE_LOG_TIMEOUT': int(os.environ.get('SEARCH_INDEX_CHANGE_LOG_TIMEOUT', '3600')),  # 초 단위
+    'MAX_REPLAY': int(os.environ.get('SEARCH_INDEX_MAX_REPLAY', '200')),
+}
+
+# 이력 테이블 월 단위 보관 (system.archive)
+HISTORY_ARCHIVE = {
+    # 소스 트리(./back:/app) 밖의 전용 볼륨 (docker-compose의 ./archive, backup 서비스가 함께 백업)
+    'DIRECTORY': os.environ.get('HISTORY_ARCHIVE_DIR', '/var/lib/bssm_captive/archive'),
+    'RETENTION_DAYS': {  # 테이블별 DB 보관 기간 (일), 지난 달의 행은 보관 파일로 이동
+        'device_history': int(os.environ.get('HISTORY_ARCHIVE_DEVICE_DAYS', '365')),
+        'equipment_history': int(os.environ.get('HISTORY_ARCHIVE_EQUIPMENT_DAYS', '730')),
+        'api_key_usage': int(os.environ.get('HISTORY_ARCHIVE_API_USAGE_DAYS', '90')),
+        'broadcast_history': int(os.environ.get('HISTORY_ARCHIVE_BROADCAST_DAYS', '365')),
+    },
+    'BATCH_SIZE': int(os.environ.get('HISTORY_ARCHIVE_BATCH_SIZE', '5000')),
+}
+
+# 조회 전용 엔드포인트 응답 캐시 / 조건부 GET (core.response_cache)
+RESPONSE_CACHE = {
+    'ENABLED': os.environ.get('RESPONSE_CACHE_ENABLED', 'True') == 'True',
+    'TIMEOUT': int(os.environ.get('RESPONSE_CACHE_TIMEOUT', '300')),  # 초 단위, 시그널 없이 바뀐 값의 최대 반영 지연
+}
+
+# 비동기 뷰의 외부 서비스 HTTP 호출 (core.async_http, ASGI 모드)
+# 서비스별 워커당 동시 요청 수 - 느린 방송 서버/Pi-hole이 워커를 모두 차지하지 않도록 제한
+ASYNC_HTTP = {
+    'LIMITS': {
+        'broadcast': int(os.environ.get('ASYNC_HTTP_BROADCAST_LIMIT', '16')),
+        'pihole': int(os.environ.get('ASYNC_HTTP_PIHOLE_LIMIT', '4')),
+    },
+    'DEFAULT_LIMIT': int(os.environ.get('ASYNC_HTTP_DEFAULT_LIMIT', '8')),
+    'QUEUE_TIMEOUT': int(os.environ.get('ASYNC_HTTP_QUEUE_TIMEOUT', '10')),  # 초 단위, 한도 초과 시 대기 시간
+}
+
+# 오래 사용하지 않은 IP 예약 회수 정책 (devices.reclamation)
+IP_RECLAMATION = {
+    'INACTIVE_DAYS': int(os.environ.get('IP_RECLAMATION_INACTIVE_DAYS', '180')),  # 마지막 접속 후 이 기간이 지나면 회수
+    'NEVER_SEEN_DAYS': int(os.environ.get('IP_RECLAMATION_NEVER_SEEN_DAYS', '60')),  # 접속 기록 없이 등록 후 이 기간이 지나면 회수
+    'INACTIVE_USER_DAYS': int(os.environ.get('IP_RECLAMATION_INACTIVE_USER_DAYS', '7')),  # 비활성 사용자(졸업 등) 장치 유예 기간
+    'EXEMPT_STAFF': os.environ.get('IP_RECLAMATION_EXEMPT_STAFF', 'True') == 'True',  # 교사/관리자 장치 제외
+    'MIN_BAND_UTILIZATION': float(os.environ.get('IP_RECLAMATION_MIN_BAND_UTILIZATION', '0')),  # 사용률이 이 값 이상인 대역만 회수 (0~1)
+    'MAX_PER_RUN': int(os.environ.get('IP_RECLAMATION_MAX_PER_RUN', '200')),
+}
+
+# 프로세스 내 주기 작업 스케줄러 (core.scheduler, 리더 잠금을 잡은 워커 하나에서만 실행)
+SCHEDULER = {
+    'ENABLED': os.environ.get('SCHEDULER_ENABLED', 'True') == 'True',
+    'TICK': int(os.environ.get('SCHEDULER_TICK', '5')),  # 초 단위
+    'LEADER_TTL': int(os.environ.get('SCHEDULER_LEADER_TTL', '30')),  # 초 단위
+    'JOBS': {
+        'mark_overdue_rentals': {'TASK': 'rentals.jobs.mark_overdue_rentals', 'INTERVAL': 300},
+        'expire_broadcast_previews': {'TASK': 'broadcast.jobs.expire_previews', 'INTERVAL': 60},
+        'cleanup_temporary_leases': {'TASK': 'devices.jobs.cleanup_temporary_leases', 'INTERVAL': 60},
+        'ingest_lease_activity': {'TASK': 'devices.lease_activity.ingest_lease_activity', 'INTERVAL': 120},
+        'reconcile_kea': {
+            'TASK': 'devices.reconciliation.run_reconciliation',
+            'INTERVAL': 900,
+            'KWARGS': {
+                'incremental': True,
+                'apply': os.environ.get('KEA_RECONCILE_AUTO_APPLY', 'False') == 'True',
+            },
+        },
+        'archive_history': {
+            'TASK': 'system.archive.run_archival',
+            'INTERVAL': 86400,
+            'ENABLED': os.environ.get('HISTORY_ARCHIVE_AUTO_APPLY', 'False') == 'True',
+            'KWARGS': {'apply': True},
+        },
+        'reclaim_ips': {
+            'TASK': 'devices.reclamation.run_reclamation',
+            'INTERVAL': 86400,
+            'ENABLED': os.environ.get('IP_RECLAMATION_AUTO_APPLY', 'False') == 'True',
+            'KWARGS': {'apply': True},
+        },
+    },
+}
@@ -4,10 +4,12 @@ from django.conf import settings
 from django.conf.urls.static import static
 from rest_framework.routers import DefaultRouter
 from users.views import UserViewSet, PasswordViewSet
-from devices.views import DeviceViewSet, DeviceHistoryViewSet, get_ip_rentals, get_device_rentals
+from devices.views import DeviceViewSet, DeviceHistoryViewSet, CurrentDeviceMacView, get_ip_rentals, get_device_rentals
 from rentals.views import EquipmentViewSet, RentalViewSet, RentalRequestViewSet
 from rentals.public_views import PublicEquipmentView, PublicEquipmentStatusView
 from users import auth, views as user_views
+from system.metrics import metrics_view
+from devices.captive import captive_check
 
 # 일반 API 라우터 설정 (사용자용)
 router = DefaultRouter()
@@ -33,6 +35,7 @@ admin_custom_patterns = [
     path('ip/statistics/', DeviceViewSet.as_view({'get': 'statistics'}), name='ip-statistics'),
     path('ip/<int:pk>/reassign/', DeviceViewSet.as_view({'post': 'reassign_ip'}), name='reassign-ip'),
     path('ip/<int:pk>/toggle-active/', DeviceViewSet.as_view({'post': 'toggle_active'}), name='toggle-active'),
+    path('ip/<int:pk>/presence/', DeviceViewSet.as_view({'get': 'presence'}), name='device-presence'),
     
     # 대여 관리 특수 기능
     path('ip-rentals/', get_ip_rentals, name='ip-rentals'),
@@ -41,11 +44,16 @@ admin_custom_patterns = [
 
 urlpatterns = [
     path('admin/', admin.site.urls),
+    path('metrics', metrics_view, name='metrics'),  # Prometheus 스크레이프 엔드포인트
+    path('api/captive/check/', captive_check, name='captive-check'),  # nginx auth_request 등록 여부 판정
     
     # 공개 API 엔드포인트 (인증 불필요) - nginx /api/ 프록시와 호환
     path('api/public/equipment/<str:serial_number>/', PublicEquipmentView.as_view(), name='public-equipment-detail'),
     path('api/public/equipment/<str:serial_number>/status/', PublicEquipmentStatusView.as_view(), name='public-equipment-status'),
     
+    # 캡티브 포털 MAC 조회 (비동기 뷰) - 라우터의 ip/<pk>/ 패턴보다 먼저
+    path('api/ip/current-mac/', CurrentDeviceMacView.as_view(), name='current-mac'),
+    
     path('api/admin/', include(admin_router.urls)),  # 관리자 API 엔드포인트를 먼저
     path('api/admin/', include(admin_custom_patterns)),  # 관리자 커스텀 패턴
     path('api/', include(router.urls)),  # 일반 API 엔드포인트를 나중에
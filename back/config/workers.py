@@ -0,0 +1,12 @@
+"""
+gunicorn 워커 클래스 (SERVER_MODE=asgi, gunicorn.conf.py 참고)
+"""
+from uvicorn.workers import UvicornWorker
+
+
+class AsgiWorker(UvicornWorker):
+    """
+    uvicorn 워커 - Django/Channels ASGI 앱은 lifespan 이벤트를 지원하지 않으므로 끔
+    (백그라운드 스레드는 lifespan 대신 post_worker_init 훅에서 시작)
+    """
+    CONFIG_KWARGS = {**UvicornWorker.CONFIG_KWARGS, 'lifespan': 'off'}
@@ -13,4 +13,10 @@ from django.core.wsgi import get_wsgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
 
-application = get_wsgi_application() 
\ No newline at end of file
+application = get_wsgi_application()
+
+# 백그라운드 스레드 (헬스체크 캐시 갱신, 주기 작업 스케줄러)
+# gunicorn에서는 post_worker_init 훅이 워커마다 시작하므로 그 밖의 서버에서만 여기서 시작
+from core.startup import start_background_services_unless_hooked  # noqa: E402
+
+start_background_services_unless_hooked()
@@ -0,0 +1,62 @@
+"""
+비동기 뷰용 외부 서비스 HTTP 클라이언트 (httpx)
+
+- 서비스(broadcast, pihole)별 동시 요청 수를 이벤트 루프마다 세마포어로 제한합니다.
+  느린 외부 서버 하나가 워커의 연결과 메모리를 모두 차지하지 않도록 한도를 넘는 요청은
+  QUEUE_TIMEOUT 동안 기다린 뒤 httpx.PoolTimeout으로 실패합니다 (호출 측에서 503 등으로 처리).
+- 호출 시간은 system.performance의 외부 HTTP 시간(track_external)에 기록합니다.
+- ASGI(uvicorn 워커)에서는 워커 이벤트 루프 하나에서 모든 요청이 한도를 공유하고,
+  WSGI에서 비동기 뷰를 실행하면 요청마다 새 루프가 만들어지므로 사실상 요청별 한도가 됩니다.
+"""
+import asyncio
+import weakref
+
+import httpx
+from django.conf import settings
+
+from system.performance import track_external
+
+DEFAULT_CONFIG = {
+    'LIMITS': {},          # 서비스별 동시 요청 수 (워커당)
+    'DEFAULT_LIMIT': 8,    # LIMITS에 없는 서비스
+    'QUEUE_TIMEOUT': 10,   # 한도 초과 시 대기 시간 (초)
+}
+
+# 이벤트 루프 -> {서비스: 세마포어}
+_semaphores = weakref.WeakKeyDictionary()
+
+
+def get_config():
+    return {**DEFAULT_CONFIG, **getattr(settings, 'ASYNC_HTTP', {})}
+
+
+def _semaphore(service, config):
+    loop = asyncio.get_running_loop()
+    semaphores = _semaphores.get(loop)
+    if semaphores is None:
+        semaphores = _semaphores[loop] = {}
+    semaphore = semaphores.get(service)
+    if semaphore is None:
+        limit = config['LIMITS'].get(service, config['DEFAULT_LIMIT'])
+        semaphore = semaphores[service] = asyncio.Semaphore(limit)
+    return semaphore
+
+
+async def request(service, method, url, timeout=30, **kwargs):
+    """
+    외부 서비스에 비동기 요청 (응답 본문까지 읽은 httpx.Response 반환)
+
+    kwargs는 httpx.AsyncClient.request 인자 (headers, data, files, json, params 등)
+    """
+    config = get_config()
+    semaphore = _semaphore(service, config)
+    try:
+        await asyncio.wait_for(semaphore.acquire(), config['QUEUE_TIMEOUT'])
+    except asyncio.TimeoutError:
+        raise httpx.PoolTimeout(f"{service} 동시 요청 한도 초과 (대기 {config['QUEUE_TIMEOUT']}초)")
+    try:
+        with track_external(service):
+            async with httpx.AsyncClient(timeout=timeout) as client:
+                return await client.request(method, url, **kwargs)
+    finally:
+        semaphore.release()
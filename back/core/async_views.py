@@ -0,0 +1,46 @@
+"""
+비동기 DRF 뷰 (ASGI 모드의 I/O 대기 위주 엔드포인트용)
+
+AsyncAPIView는 APIView와 같은 인증/권한/예외 처리/렌더링을 거치면서 핸들러(get, post 등)를
+코루틴으로 실행합니다. uvicorn 워커에서는 방송 서버·Pi-hole·KEA 응답을 기다리는 동안
+같은 워커가 다른 요청을 계속 처리합니다.
+
+- 인증·권한 확인(initial)은 DB를 조회할 수 있으므로 sync_to_async로 실행합니다.
+- 핸들러 안에서 ORM은 비동기 API(aget, acreate, asave, afirst 등)나 sync_to_async로 호출하고,
+  지연 로딩되는 FK 대신 select_related 또는 *_id 필드를 사용합니다.
+- 외부 HTTP 호출은 core.async_http.request를 사용합니다 (서비스별 동시 요청 한도).
+- WSGI(sync 워커)에서도 동작하며, 이때는 Django가 요청마다 이벤트 루프를 만들어 실행합니다.
+"""
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from rest_framework.views import APIView
+
+
+class AsyncAPIView(APIView):
+    """핸들러가 모두 async def인 APIView (권한 클래스, Response, request.data는 APIView와 동일)"""
+
+    async def dispatch(self, request, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(self, request.method.lower(), self.http_method_not_allowed)
+            else:
+                handler = self.http_method_not_allowed
+
+            if iscoroutinefunction(handler):
+                response = await handler(request, *args, **kwargs)
+            else:
+                # options, http_method_not_allowed
+                response = handler(request, *args, **kwargs)
+
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
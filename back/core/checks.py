@@ -0,0 +1,45 @@
+"""
+공유 캐시 점검
+
+다음 모듈은 공유 캐시의 버전 값으로 다른 워커에 변경을 알립니다.
+CACHES가 LocMem(Django 기본값)처럼 프로세스마다 따로이면 변경한 워커만 바로 반영되고,
+나머지 gunicorn 워커는 각 모듈의 확인 주기/TTL이 지나야 새 값을 읽습니다.
+
+- core.search: 검색 색인 (새로 등록/이름이 바뀐 사용자, 장치, 장비)
+- core.response_cache: 조회 API 응답 캐시와 ETag
+- devices.captive: 캡티브 포털 등록 장치 판정
+- devices.blacklist: IP 블랙리스트 구간 인덱스
+
+운영(DEBUG=False)에서는 REDIS_CACHE_URL을 반드시 설정해야 하며, 설정하지 않으면
+manage.py check(runserver, migrate 포함)와 gunicorn 시작 시 경고를 남깁니다.
+"""
+import logging
+
+from django.conf import settings
+from django.core.checks import Warning, register
+
+from core.locks import is_shared_cache
+
+logger = logging.getLogger(__name__)
+
+SHARED_CACHE_MESSAGE = "워커 간 공유 캐시가 설정되지 않았습니다 (CACHES['default']가 프로세스별 캐시)."
+SHARED_CACHE_HINT = (
+    "REDIS_CACHE_URL을 설정하세요. 설정하지 않으면 검색 색인, API 응답 캐시, 캡티브 등록 장치, "
+    "IP 블랙리스트 변경이 다른 워커에는 확인 주기/TTL이 지나야 반영됩니다."
+)
+
+
+@register('caches')
+def check_shared_cache(app_configs=None, **kwargs):
+    """운영 환경에서 공유 캐시가 없으면 경고 (core.W001)"""
+    if settings.DEBUG or is_shared_cache():
+        return []
+    return [Warning(SHARED_CACHE_MESSAGE, hint=SHARED_CACHE_HINT, id='core.W001')]
+
+
+def warn_if_cache_not_shared(workers):
+    """여러 워커로 시작할 때 공유 캐시가 없으면 오류 로그 (gunicorn when_ready 훅)"""
+    if workers > 1 and not is_shared_cache():
+        logger.error(f"{SHARED_CACHE_MESSAGE} 워커 {workers}개가 서로의 변경을 바로 보지 못합니다. {SHARED_CACHE_HINT}")
+        return False
+    return True
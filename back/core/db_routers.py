@@ -0,0 +1,39 @@
+"""
+데이터베이스 라우터
+
+KEA DHCP 테이블(hosts, dhcp4_options, lease4) 모델은 'kea' alias로,
+나머지 모델은 기본 DB로 보냅니다.
+"""
+
+KEA_DATABASE = 'kea'
+KEA_TABLES = frozenset({'hosts', 'dhcp4_options', 'lease4'})
+
+
+def is_kea_model(model):
+    return model is not None and model._meta.db_table in KEA_TABLES
+
+
+class KeaRouter:
+    """KEA 테이블 모델을 kea DB로 라우팅"""
+
+    def db_for_read(self, model, **hints):
+        if is_kea_model(model):
+            return KEA_DATABASE
+        return None
+
+    def db_for_write(self, model, **hints):
+        if is_kea_model(model):
+            return KEA_DATABASE
+        return None
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # KEA 모델끼리만 관계 허용 (DB를 넘나드는 관계 방지)
+        if is_kea_model(type(obj1)) or is_kea_model(type(obj2)):
+            return is_kea_model(type(obj1)) and is_kea_model(type(obj2))
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # KEA 스키마는 KEA가 관리하므로 kea DB에는 Django 마이그레이션을 적용하지 않음
+        if db == KEA_DATABASE:
+            return False
+        return None
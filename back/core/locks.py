@@ -0,0 +1,111 @@
+"""
+워커(프로세스) 간 잠금
+
+- MySQL: GET_LOCK 명명 잠금을 사용합니다. 잠금마다 전용 DB 연결을 따로 열어 두므로
+  요청/작업 중 close_old_connections()로 일반 연결이 닫혀도 잠금이 유지되고,
+  프로세스가 죽으면 연결이 끊기면서 잠금도 함께 풀립니다.
+- 그 외 DB(SQLite 개발 환경 등): 공유 캐시의 cache.add를 사용합니다.
+  LocMem처럼 프로세스마다 따로인 캐시에서는 잠금이 프로세스 안에서만 유효하므로
+  is_shared_cache()로 먼저 확인해야 합니다.
+"""
+import logging
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DatabaseError, connections
+
+logger = logging.getLogger(__name__)
+
+# 프로세스마다 따로인 캐시 백엔드
+LOCAL_CACHE_BACKENDS = (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+)
+
+
+def is_shared_cache(alias='default'):
+    """캐시가 워커(프로세스) 간에 공유되는지 (CACHES 미설정 시 Django 기본값 LocMem)"""
+    caches = getattr(settings, 'CACHES', None) or {}
+    backend = caches.get(alias, {}).get('BACKEND', LOCAL_CACHE_BACKENDS[0])
+    return backend not in LOCAL_CACHE_BACKENDS
+
+
+def database_locks_available(alias='default'):
+    return connections[alias].vendor == 'mysql'
+
+
+class DatabaseLock:
+    """MySQL GET_LOCK 명명 잠금 (잠금 전용 연결 사용)"""
+
+    def __init__(self, name, alias='default'):
+        database = settings.DATABASES[alias].get('NAME') or ''
+        # MySQL 잠금 이름은 최대 64자, 같은 서버의 다른 DB와 겹치지 않도록 DB 이름을 붙임
+        self.name = f"{database}:{name}"[:64]
+        self.alias = alias
+        self._connection = None
+
+    def _cursor(self):
+        if self._connection is None:
+            self._connection = connections.create_connection(self.alias)
+        return self._connection.cursor()
+
+    def acquire(self, timeout=0):
+        """잠금 획득 (이미 이 연결이 잡고 있으면 True)"""
+        try:
+            with self._cursor() as cursor:
+                cursor.execute("SELECT IS_USED_LOCK(%s) = CONNECTION_ID()", [self.name])
+                if cursor.fetchone()[0] == 1:
+                    return True
+                cursor.execute("SELECT GET_LOCK(%s, %s)", [self.name, timeout])
+                return cursor.fetchone()[0] == 1
+        except DatabaseError as e:
+            # 연결이 끊긴 경우 다음 시도에서 새로 연결 (끊긴 연결의 잠금은 서버가 이미 해제함)
+            logger.warning(f"DB 잠금 {self.name} 확인 실패: {e}")
+            self.close()
+            return False
+
+    def release(self):
+        if self._connection is None:
+            return
+        try:
+            with self._cursor() as cursor:
+                cursor.execute("SELECT RELEASE_LOCK(%s)", [self.name])
+        except DatabaseError as e:
+            logger.warning(f"DB 잠금 {self.name} 해제 실패: {e}")
+            self.close()
+
+    def close(self):
+        """전용 연결 종료 (잡고 있던 잠금도 풀림)"""
+        if self._connection is not None:
+            try:
+                self._connection.close()
+            except DatabaseError:
+                pass
+            self._connection = None
+
+
+@contextmanager
+def exclusive(name, ttl, owner=True):
+    """
+    워커 간 배타 실행 - 잠금을 잡으면 True, 다른 워커가 잡고 있으면 False를 yield
+
+    ttl은 캐시 잠금에만 쓰이는 만료 시간입니다 (DB 잠금은 블록을 벗어나거나 연결이 끊기면 풀림).
+    """
+    if database_locks_available():
+        lock = DatabaseLock(name)
+        acquired = lock.acquire()
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                lock.release()
+            lock.close()
+        return
+
+    acquired = cache.add(f'lock:{name}', owner, ttl)
+    try:
+        yield acquired
+    finally:
+        if acquired:
+            cache.delete(f'lock:{name}')
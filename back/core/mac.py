@@ -0,0 +1,55 @@
+"""
+MAC 주소 정규화
+
+장치(Device), 장비 MAC(EquipmentMacAddress), KEA 바이너리 식별자가 모두 같은 표준 형식
+(소문자, 콜론 구분 'aa:bb:cc:dd:ee:ff')을 쓰도록 변환 함수를 한곳에 둡니다.
+입력은 대소문자와 구분자(':', '-', '.', 공백, 구분자 없음)에 관계없이 받습니다.
+"""
+import re
+
+_SEPARATORS = re.compile(r'[\s:.\-]')
+_HEX_DIGITS = re.compile(r'^[0-9a-f]{12}$')
+
+
+def mac_digits(mac_address):
+    """구분자를 뺀 소문자 16진수 12자리 (MAC 형식이 아니면 None)"""
+    if mac_address is None:
+        return None
+    digits = _SEPARATORS.sub('', str(mac_address)).lower()
+    return digits if _HEX_DIGITS.match(digits) else None
+
+
+def is_valid_mac(mac_address):
+    return mac_digits(mac_address) is not None
+
+
+def normalize_mac(mac_address):
+    """
+    표준 형식 'aa:bb:cc:dd:ee:ff'로 변환
+
+    MAC 형식이 아닌 값은 앞뒤 공백만 제거한 소문자로 돌려줘
+    기존에 잘못 저장된 값도 같은 규칙으로 비교할 수 있게 합니다.
+    """
+    digits = mac_digits(mac_address)
+    if digits is None:
+        return str(mac_address).strip().lower()
+    return ':'.join(digits[i:i + 2] for i in range(0, 12, 2))
+
+
+def normalize_macs(mac_addresses):
+    """입력 순서를 유지하며 중복을 제거한 표준 형식 목록 (빈 값은 건너뜀)"""
+    return list(dict.fromkeys(normalize_mac(mac) for mac in mac_addresses if mac))
+
+
+def mac_to_int(mac_address):
+    """48비트 정수로 변환"""
+    digits = mac_digits(mac_address)
+    if digits is None:
+        raise ValueError(f"유효하지 않은 MAC 주소: {mac_address}")
+    return int(digits, 16)
+
+
+def int_to_mac(value):
+    """48비트 정수를 표준 형식으로 변환"""
+    digits = f'{value:012x}'
+    return ':'.join(digits[i:i + 2] for i in range(0, 12, 2))
@@ -0,0 +1,42 @@
+import json
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.scheduler import get_config, run_job, scheduler, summarize_result
+
+
+class Command(BaseCommand):
+    help = '주기 작업 스케줄러를 포그라운드로 실행하거나 작업 하나를 즉시 실행'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--job',
+            help='지정한 작업만 즉시 한 번 실행 (settings.SCHEDULER["JOBS"]의 이름)'
+        )
+
+    def handle(self, *args, **options):
+        config = get_config()
+        job_name = options['job']
+
+        if job_name:
+            if job_name not in config['JOBS']:
+                raise CommandError(f"알 수 없는 작업: {job_name} (가능한 작업: {', '.join(config['JOBS'])})")
+            started = time.perf_counter()
+            result = run_job(job_name)
+            self.stdout.write(self.style.SUCCESS(
+                f'{job_name} 완료 ({(time.perf_counter() - started) * 1000:.0f}ms): '
+                f'{json.dumps(summarize_result(result), ensure_ascii=False, default=str)}'
+            ))
+            return
+
+        # 웹 워커에서 SCHEDULER_ENABLED=False로 두고 별도 프로세스로 실행하는 경우
+        self.stdout.write(f"스케줄러 실행 (작업 {len(config['JOBS'])}개, Ctrl+C로 종료)")
+        try:
+            while True:
+                for name in scheduler.tick():
+                    self.stdout.write(f'실행: {name}')
+                time.sleep(config['TICK'])
+        except KeyboardInterrupt:
+            scheduler.stop()
+            self.stdout.write(self.style.SUCCESS('스케줄러 종료'))
@@ -0,0 +1,122 @@
+"""
+이력(audit) 테이블용 페이지네이션
+
+- 커서(keyset) 모드: ?pagination=cursor
+  (created_at, id) 인덱스를 따라 다음 페이지를 조회하므로 COUNT(*)와 깊은 OFFSET이 없습니다.
+- 근사 개수 모드: ?approximate_count=true
+  필터가 없으면 테이블 통계(information_schema)를, 필터가 있으면 상한을 둔 COUNT를 사용합니다.
+"""
+from django.core.paginator import EmptyPage, Page, PageNotAnInteger, Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+from django.utils.translation import gettext_lazy as _
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+
+TRUE_VALUES = ('1', 'true', 'True', 'yes')
+
+
+def approximate_count(queryset, cap=10000):
+    """
+    전체 스캔 없이 쿼리셋의 대략적인 행 수 반환
+
+    - 필터가 없는 MySQL 테이블: information_schema.TABLES.TABLE_ROWS
+    - 그 외: 최대 cap + 1 행까지만 센 값 (cap을 넘으면 cap + 1 반환)
+    """
+    connection = connections[queryset.db]
+    if not queryset.query.where and connection.vendor == 'mysql':
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT TABLE_ROWS FROM information_schema.TABLES "
+                "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s",
+                [queryset.model._meta.db_table]
+            )
+            row = cursor.fetchone()
+        if row and row[0] is not None:
+            return int(row[0])
+    return queryset.order_by()[:cap + 1].count()
+
+
+class ApproximatePage(Page):
+    """다음 페이지 여부를 개수 추정치가 아니라 실제로 한 행 더 읽어 판단하는 Page"""
+
+    def __init__(self, object_list, number, paginator, has_next):
+        super().__init__(object_list, number, paginator)
+        self._has_next = has_next
+
+    def has_next(self):
+        return self._has_next
+
+
+class ApproximateCountPaginator(Paginator):
+    """
+    COUNT(*) 대신 approximate_count를 사용하는 Paginator
+
+    개수가 상한(count_cap + 1)으로 잘리거나 InnoDB 통계가 실제보다 작을 수 있으므로
+    페이지 번호를 추정 페이지 수로 검증하지 않고, 해당 페이지에 행이 없을 때만 EmptyPage를 냅니다.
+    """
+    count_cap = 10000
+
+    @cached_property
+    def count(self):
+        return approximate_count(self.object_list, cap=self.count_cap)
+
+    def validate_number(self, number):
+        """양의 정수인지만 확인 (추정 페이지 수를 넘는 번호도 허용)"""
+        try:
+            if isinstance(number, float) and not number.is_integer():
+                raise ValueError
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger(_("That page number is not an integer"))
+        if number < 1:
+            raise EmptyPage(_("That page number is less than 1"))
+        return number
+
+    def page(self, number):
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        rows = list(self.object_list[bottom:bottom + self.per_page + 1])
+        if not rows and number > 1:
+            raise EmptyPage(_("That page contains no results"))
+        has_next = len(rows) > self.per_page
+        rows = rows[:self.per_page]
+        # 추정치보다 뒤의 행을 읽은 경우 응답의 count가 실제로 확인한 행 수보다 작지 않도록 보정
+        self.count = max(self.count, bottom + len(rows) + int(has_next))
+        self.__dict__.pop('num_pages', None)
+        return ApproximatePage(rows, number, self, has_next)
+
+
+class HistoryPageNumberPagination(PageNumberPagination):
+    """이력 목록용 페이지 번호 페이지네이션 (?approximate_count=true 지원)"""
+    page_size_query_param = 'page_size'
+    max_page_size = 500
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if request.query_params.get('approximate_count') in TRUE_VALUES:
+            self.django_paginator_class = ApproximateCountPaginator
+        return super().paginate_queryset(queryset, request, view)
+
+
+class HistoryCursorPagination(CursorPagination):
+    """이력 목록용 커서(keyset) 페이지네이션 - 최신순 (created_at, id)"""
+    ordering = ('-created_at', '-id')
+    page_size_query_param = 'page_size'
+    max_page_size = 500
+
+
+def get_history_paginator(request, page_size=None):
+    """요청 파라미터에 맞는 이력 페이지네이터 생성 (?pagination=cursor 이면 커서 모드)"""
+    if request.query_params.get('pagination') == 'cursor':
+        paginator = HistoryCursorPagination()
+    else:
+        paginator = HistoryPageNumberPagination()
+    if page_size is not None:
+        paginator.page_size = page_size
+    return paginator
+
+
+class ReportPageNumberPagination(PageNumberPagination):
+    """집계 보고서용 페이지 번호 페이지네이션 (페이지 수를 알 수 있어 여러 페이지를 동시에 조회 가능)"""
+    page_size = 200
+    page_size_query_param = 'page_size'
+    max_page_size = 500
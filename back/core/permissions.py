@@ -1,6 +1,10 @@
+import threading
+from types import MappingProxyType
+
 from rest_framework import permissions
 from rest_framework.permissions import BasePermission
 from django.contrib.auth import get_user_model
+from django.urls import URLResolver, get_resolver
 
 User = get_user_model()
 
@@ -157,9 +161,168 @@ class PermissionMatrix:
         return app_permissions
 
 
+CRUD_ACTIONS = ('create', 'list', 'retrieve', 'update', 'destroy')
+
+# 권한 우선순위: any < authenticated < teacher < admin
+ANONYMOUS_PERMISSIONS = frozenset({'any'})
+USER_PERMISSIONS = frozenset({'any', 'authenticated'})
+TEACHER_PERMISSIONS = USER_PERMISSIONS | {'teacher'}
+ADMIN_PERMISSIONS = TEACHER_PERMISSIONS | {'admin'}
+
+
+def resolve_action(action, method, url_name=None, path='', has_lookup=False):
+    """
+    권한 매트릭스에서 찾을 액션 이름 결정
+
+    ViewSet의 action을 우선 사용하되 URL 이름과 경로로 특수 액션(장비 등록, 상태 보고, MAC 조회)을 덮어쓰고,
+    액션이 없으면 HTTP 메서드로 추정합니다.
+    """
+    # URL 이름에서 액션 추출
+    if url_name and '-' in url_name:
+        # admin-equipment-register-maintenance 형태에서 마지막 부분 추출
+        parts = url_name.split('-')
+        if len(parts) >= 3 and 'register' in parts:
+            if 'maintenance' in parts:
+                action = 'register_maintenance'
+            else:
+                action = 'register'
+        elif 'report' in parts and 'status' in parts:
+            action = 'report_status'
+        elif 'by-mac' in url_name or 'mac' in parts:
+            action = 'by_mac'
+
+    # URL 경로에서 직접 추출 (fallback)
+    if not action or action in CRUD_ACTIONS:
+        if 'register_maintenance' in path:
+            action = 'register_maintenance'
+        elif 'register' in path and 'register_maintenance' not in path:
+            action = 'register'
+        elif 'report-status' in path or 'report_status' in path:
+            action = 'report_status'
+        elif 'by_mac' in path:
+            action = 'by_mac'
+
+    # 커스텀 액션이 설정되지 않은 경우 HTTP 메서드로 추정
+    if not action:
+        if method == 'GET':
+            # lookup_url_kwarg가 URL 인자에 있는 경우에만 상세 조회
+            action = 'retrieve' if has_lookup else 'list'
+        elif method == 'POST':
+            action = 'create'
+        elif method in ['PUT', 'PATCH']:
+            action = 'update'
+        elif method == 'DELETE':
+            action = 'destroy'
+    return action
+
+
+def _route_kwargs(pattern):
+    return set(pattern.pattern.regex.groupindex)
+
+
+def _join_route(route1, route2):
+    """django.urls.resolvers.URLResolver._join_route와 같은 방식으로 URL 패턴 연결"""
+    if not route1:
+        return route2
+    return route1 + route2.removeprefix('^')
+
+
+class PermissionTable:
+    """
+    (권한 클래스 설정, 뷰 함수, URL 패턴, HTTP 메서드) -> 필요한 권한 (frozenset)
+
+    처음 권한을 검사할 때 URLconf 전체를 한 번 훑어 기본 권한 클래스(DefaultAppPermissions)의
+    고정 테이블을 만들고, 이후 요청은 딕셔너리 조회 한 번으로 필요한 권한을 찾습니다.
+    테이블에 없는 조합(OPTIONS 요청, 앱 이름을 직접 지정한 권한 클래스 등)은 처음 한 번만 계산해 따로 보관합니다.
+    """
+
+    def __init__(self):
+        self._table = None
+        self._resolved = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(permission, func, route, method):
+        return (type(permission), permission.app_name, permission.model_name, permission.action, func, route, method)
+
+    def _walk(self, patterns, prefix='', kwargs=frozenset()):
+        for pattern in patterns:
+            route = _join_route(prefix, str(pattern.pattern))
+            names = kwargs | _route_kwargs(pattern)
+            if isinstance(pattern, URLResolver):
+                yield from self._walk(pattern.url_patterns, route, names)
+            else:
+                yield pattern, route, names
+
+    def build(self):
+        """URLconf의 모든 DRF 뷰에 대해 기본 권한 클래스의 필요 권한 계산"""
+        with self._lock:
+            if self._table is not None:
+                return self._table
+            permission = DefaultAppPermissions()
+            table = {}
+            for pattern, route, kwargs in self._walk(get_resolver().url_patterns):
+                func = pattern.callback
+                # DRF as_view()만 cls 속성을 남김 (일반 Django 뷰는 제외)
+                view_cls = getattr(func, 'cls', None)
+                if view_cls is None:
+                    continue
+                actions = getattr(func, 'actions', None)
+                if actions is not None:
+                    actions = dict(actions)
+                    if 'get' in actions and 'head' not in actions:
+                        actions['head'] = actions['get']
+                    methods = actions
+                else:
+                    view_action = getattr(view_cls, 'action', None)
+                    methods = {
+                        method: view_action for method in view_cls.http_method_names
+                        if hasattr(view_cls, method)
+                    }
+                has_lookup = getattr(view_cls, 'lookup_url_kwarg', None) in kwargs
+                for method, view_action in methods.items():
+                    method = method.upper()
+                    try:
+                        table[self._key(permission, func, route, method)] = permission.required_permissions(
+                            view_cls, view_action, method, pattern.name, route, has_lookup
+                        )
+                    except Exception:
+                        continue  # 요청 시점에 다시 계산
+            self._table = MappingProxyType(table)
+            return self._table
+
+    def lookup(self, permission, request, view):
+        match = getattr(request, 'resolver_match', None)
+        if match is None:
+            # URL 해석 없이 호출된 뷰 (테스트용 RequestFactory 등)
+            return self._resolve(permission, request, view, None, request.path)
+
+        key = self._key(permission, match.func, match.route, request.method)
+        table = self._table if self._table is not None else self.build()
+        required = table.get(key)
+        if required is None:
+            required = self._resolved.get(key)
+            if required is None:
+                required = self._resolve(permission, request, view, match.url_name, match.route)
+                self._resolved[key] = required
+        return required
+
+    def _resolve(self, permission, request, view, url_name, path):
+        lookup_url_kwarg = getattr(view, 'lookup_url_kwarg', None)
+        has_lookup = bool(lookup_url_kwarg) and lookup_url_kwarg in getattr(view, 'kwargs', {})
+        return permission.required_permissions(
+            type(view), getattr(view, 'action', None), request.method, url_name, path, has_lookup
+        )
+
+
+permission_table = PermissionTable()
+
+
 class RoleBasedPermission(BasePermission):
     """
     역할 기반 권한 클래스
+
+    필요한 권한은 PermissionTable에서 (뷰 함수, URL 패턴, HTTP 메서드)별로 한 번만 계산합니다.
     """
     
     def __init__(self, app_name, model_name=None, action=None):
@@ -167,63 +330,20 @@ class RoleBasedPermission(BasePermission):
         self.model_name = model_name
         self.action = action
         super().__init__()
+
+    def get_names(self, view_cls):
+        """권한 매트릭스에서 찾을 (앱 이름, 모델 이름)"""
+        return self.app_name, self.model_name
+
+    def required_permissions(self, view_cls, view_action, method, url_name=None, path='', has_lookup=False):
+        """요청과 무관하게 뷰 클래스, 액션, URL 정보만으로 필요한 권한 계산"""
+        app_name, model_name = self.get_names(view_cls)
+        action = resolve_action(self.action or view_action, method, url_name, path, has_lookup)
+        # 액션이 없으면 앱/모델 권한 딕셔너리 전체가 반환되므로 키 집합으로 보관 (in 검사 결과 동일)
+        return frozenset(PermissionMatrix.get_required_permissions(app_name, model_name, action))
     
     def has_permission(self, request, view):
-        # 액션 이름 결정 - ViewSet의 action 속성을 우선 사용
-        action = self.action or getattr(view, 'action', None)
-        
-        # URL resolver에서 액션 추출
-        if hasattr(request, 'resolver_match') and request.resolver_match:
-            url_name = request.resolver_match.url_name
-            if url_name and '-' in url_name:
-                # admin-equipment-register-maintenance 형태에서 마지막 부분 추출
-                parts = url_name.split('-')
-                if len(parts) >= 3 and 'register' in parts:
-                    if 'maintenance' in parts:
-                        action = 'register_maintenance'
-                    else:
-                        action = 'register'
-                elif 'report' in parts and 'status' in parts:
-                    action = 'report_status'
-                elif 'by-mac' in url_name or 'mac' in parts:
-                    action = 'by_mac'
-        
-        # URL 경로에서 직접 추출 (fallback)
-        if not action or action in ['create', 'list', 'retrieve', 'update', 'destroy']:
-            path = request.path
-            if 'register_maintenance' in path:
-                action = 'register_maintenance'
-            elif 'register' in path and 'register_maintenance' not in path:
-                action = 'register'  
-            elif 'report-status' in path or 'report_status' in path:
-                action = 'report_status'
-            elif 'by_mac' in path:
-                action = 'by_mac'
-        
-        # 커스텀 액션이 설정되지 않은 경우 HTTP 메서드로 추정
-        if not action:
-            # HTTP 메서드 기반으로 액션 추정
-            if request.method == 'GET':
-                # lookup_url_kwarg가 있는 ViewSet의 경우에만 확인
-                lookup_url_kwarg = getattr(view, 'lookup_url_kwarg', None)
-                if lookup_url_kwarg and hasattr(view, 'kwargs') and lookup_url_kwarg in view.kwargs:
-                    action = 'retrieve'
-                else:
-                    action = 'list'
-            elif request.method == 'POST':
-                action = 'create'
-            elif request.method in ['PUT', 'PATCH']:
-                action = 'update'
-            elif request.method == 'DELETE':
-                action = 'destroy'
-        
-        # 필요한 권한 조회
-        required_permissions = PermissionMatrix.get_required_permissions(
-            self.app_name, self.model_name, action
-        )
-        
-        # 권한 체크
-        return self._check_permissions(request, required_permissions)
+        return self._check_permissions(request, permission_table.lookup(self, request, view))
     
     def _check_permissions(self, request, required_permissions):
         """
@@ -231,28 +351,17 @@ class RoleBasedPermission(BasePermission):
         """
         if not request.user.is_authenticated:
             return 'any' in required_permissions
-        
-        # 권한 우선순위: any < authenticated < teacher < admin
-        user_permissions = self._get_user_permissions(request.user)
-        
-        for required_perm in required_permissions:
-            if required_perm in user_permissions:
-                return True
-        
-        return False
+        return not self._get_user_permissions(request.user).isdisjoint(required_permissions)
     
     def _get_user_permissions(self, user):
         """
         사용자의 권한 레벨을 반환
         """
-        permissions = ['any', 'authenticated']
-        
         if user.is_superuser:
-            permissions.extend(['admin', 'teacher'])
-        elif user.is_staff:
-            permissions.append('teacher')
-        
-        return permissions
+            return ADMIN_PERMISSIONS
+        if user.is_staff:
+            return TEACHER_PERMISSIONS
+        return USER_PERMISSIONS
 
 
 # 편의를 위한 권한 클래스들
@@ -292,6 +401,79 @@ class IsOwnerOrAdmin(BasePermission):
         return False
 
 
+def view_model(view_cls):
+    """
+    뷰 클래스가 다루는 모델
+
+    요청마다 get_queryset()을 호출하지 않도록 queryset 또는 serializer_class.Meta.model 속성으로 판단합니다.
+    """
+    if not hasattr(view_cls, 'get_queryset'):
+        return None
+    queryset = getattr(view_cls, 'queryset', None)
+    if queryset is not None:
+        return queryset.model
+    meta = getattr(getattr(view_cls, 'serializer_class', None), 'Meta', None)
+    return getattr(meta, 'model', None)
+
+
+def detect_app_name(view_cls):
+    """뷰 클래스에서 앱 이름을 자동으로 감지"""
+    model = view_model(view_cls)
+    if model is not None:
+        return model._meta.app_label
+    # APIView의 경우 클래스 이름에서 추정
+    class_name = view_cls.__name__.lower()
+    if 'user' in class_name:
+        return 'users'
+    elif 'device' in class_name:
+        return 'devices'
+    elif 'equipment' in class_name or 'rental' in class_name:
+        return 'rentals'
+    elif 'broadcast' in class_name:
+        return 'broadcast'
+    elif 'dns' in class_name:
+        return 'dns'
+    elif 'api' in class_name and 'security' in class_name:
+        return 'api_security'
+    elif 'system' in class_name:
+        return 'system'
+    # 기본값
+    return 'users'
+
+
+def detect_model_name(view_cls):
+    """뷰 클래스에서 모델 이름을 자동으로 감지"""
+    model = view_model(view_cls)
+    if model is not None:
+        return model._meta.model_name
+
+    # 클래스 이름에서 추정
+    class_name = view_cls.__name__.lower()
+    if 'equipment' in class_name:
+        return 'equipment'
+    elif 'rentalrequest' in class_name:
+        return 'rentalrequest'
+    elif 'rental' in class_name:
+        return 'rental'
+    elif 'equipmentmac' in class_name:
+        return 'equipment_mac'
+    elif 'user' in class_name:
+        return 'user'
+    elif 'device' in class_name:
+        return 'device'
+    elif 'broadcast' in class_name:
+        return 'broadcast'
+    elif 'dns' in class_name:
+        return 'dns'
+    elif 'apisecurity' in class_name:
+        return 'api_security'
+    elif 'system' in class_name:
+        return 'system'
+
+    # 기본값
+    return None
+
+
 # 기본 권한 클래스 - 앱 이름을 자동으로 감지
 class DefaultAppPermissions(RoleBasedPermission):
     """
@@ -300,83 +482,13 @@ class DefaultAppPermissions(RoleBasedPermission):
     """
     def __init__(self, app_name=None, model_name=None, action=None):
         super().__init__(app_name, model_name, action)
-    
-    def has_permission(self, request, view):
-        # 앱 이름이 지정되지 않은 경우 뷰에서 자동 감지
-        if not self.app_name:
-            self.app_name = self._detect_app_name(view)
-        # 모델 이름이 지정되지 않은 경우 뷰에서 자동 감지
-        if not self.model_name:
-            self.model_name = self._detect_model_name(view)
-        return super().has_permission(request, view)
-    
-    def _detect_app_name(self, view):
-        """뷰에서 앱 이름을 자동으로 감지"""
-        # ViewSet의 경우
-        if hasattr(view, 'get_queryset'):
-            try:
-                queryset = view.get_queryset()
-                if queryset is not None:
-                    model = queryset.model
-                    return model._meta.app_label
-            except Exception:
-                pass  # get_queryset에서 예외 발생 시 무시하고 아래로 진행
-        # APIView의 경우 클래스 이름에서 추정
-        class_name = view.__class__.__name__.lower()
-        if 'user' in class_name:
-            return 'users'
-        elif 'device' in class_name:
-            return 'devices'
-        elif 'equipment' in class_name or 'rental' in class_name:
-            return 'rentals'
-        elif 'broadcast' in class_name:
-            return 'broadcast'
-        elif 'dns' in class_name:
-            return 'dns'
-        elif 'api' in class_name and 'security' in class_name:
-            return 'api_security'
-        elif 'system' in class_name:
-            return 'system'
-        # 기본값
-        return 'users'
-    
-    def _detect_model_name(self, view):
-        """뷰에서 모델 이름을 자동으로 감지"""
-        # ViewSet의 경우
-        if hasattr(view, 'get_queryset'):
-            try:
-                queryset = view.get_queryset()
-                if queryset is not None:
-                    model = queryset.model
-                    return model._meta.model_name
-            except Exception:
-                pass  # get_queryset에서 예외 발생 시 무시하고 아래로 진행
-        
-        # 클래스 이름에서 추정
-        class_name = view.__class__.__name__.lower()
-        if 'equipment' in class_name:
-            return 'equipment'
-        elif 'rentalrequest' in class_name:
-            return 'rentalrequest'
-        elif 'rental' in class_name:
-            return 'rental'
-        elif 'equipmentmac' in class_name:
-            return 'equipment_mac'
-        elif 'user' in class_name:
-            return 'user'
-        elif 'device' in class_name:
-            return 'device'
-        elif 'broadcast' in class_name:
-            return 'broadcast'
-        elif 'dns' in class_name:
-            return 'dns'
-        elif 'apisecurity' in class_name:
-            return 'api_security'
-        elif 'system' in class_name:
-            return 'system'
-        
-        # 기본값
-        return None
+
+    def get_names(self, view_cls):
+        # 앱/모델 이름이 지정되지 않은 경우 뷰 클래스에서 자동 감지
+        return (
+            self.app_name or detect_app_name(view_cls),
+            self.model_name or detect_model_name(view_cls),
+        )
 
 
 # 범용 권한 클래스 - 명시적으로 앱 이름 지정
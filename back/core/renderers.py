@@ -0,0 +1,84 @@
+"""
+orjson 기반 JSON 렌더러/파서
+
+DRF 기본 JSONRenderer/JSONParser와 같은 JSON을 만들고 읽되 직렬화를 C 구현(orjson)으로 처리합니다.
+REST_FRAMEWORK 설정의 COMPACT_JSON=True, UNICODE_JSON=True 출력과 같게 맞춥니다.
+
+- datetime: ISO 8601, UTC는 'Z' 접미사 (rest_framework.utils.encoders.JSONEncoder와 같음)
+- Decimal: 숫자(float) (시리얼라이저 DecimalField는 이미 문자열로 변환됨)
+- timedelta: 초 단위 문자열, 지연 번역 문자열/QuerySet/제너레이터 등은 JSONEncoder와 같은 규칙
+"""
+import datetime
+import decimal
+
+import orjson
+from django.db.models.query import QuerySet
+from django.utils.encoding import force_str
+from django.utils.functional import Promise
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+from rest_framework.renderers import BaseRenderer
+
+OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+# JavaScript 문자열 안에서 줄바꿈으로 해석되는 문자 (JSONRenderer와 같이 이스케이프)
+LINE_SEPARATOR = '\u2028'.encode()
+PARAGRAPH_SEPARATOR = '\u2029'.encode()
+
+
+def default(obj):
+    """orjson이 기본으로 처리하지 않는 타입 변환"""
+    if isinstance(obj, Promise):
+        return force_str(obj)
+    if isinstance(obj, decimal.Decimal):
+        return float(obj)
+    if isinstance(obj, datetime.timedelta):
+        return str(obj.total_seconds())
+    if isinstance(obj, QuerySet):
+        return tuple(obj)
+    if isinstance(obj, bytes):
+        return obj.decode()
+    if hasattr(obj, 'tolist'):
+        return obj.tolist()
+    if hasattr(obj, '__getitem__') and hasattr(obj, 'keys'):
+        return dict(obj)
+    if hasattr(obj, '__iter__'):
+        return tuple(obj)
+    raise TypeError(f"JSON으로 변환할 수 없는 타입: {type(obj).__name__}")
+
+
+def dumps(data, indent=False):
+    option = OPTIONS | orjson.OPT_INDENT_2 if indent else OPTIONS
+    content = orjson.dumps(data, default=default, option=option)
+    if LINE_SEPARATOR in content or PARAGRAPH_SEPARATOR in content:
+        content = content.replace(LINE_SEPARATOR, b'\\u2028').replace(PARAGRAPH_SEPARATOR, b'\\u2029')
+    return content
+
+
+class ORJSONRenderer(BaseRenderer):
+    media_type = 'application/json'
+    format = 'json'
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        # Accept: application/json; indent=4 요청 시 들여쓰기 (orjson은 2칸만 지원)
+        indent = False
+        if accepted_media_type:
+            params = dict(
+                param.strip().split('=', 1) for param in accepted_media_type.split(';')[1:] if '=' in param
+            )
+            indent = bool(params.get('indent'))
+        return dumps(data, indent=indent or bool((renderer_context or {}).get('indent')))
+
+
+class ORJSONParser(BaseParser):
+    media_type = 'application/json'
+    renderer_class = ORJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError(f'JSON parse error - {exc}')
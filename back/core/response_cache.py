@@ -0,0 +1,164 @@
+"""
+버전 기반 응답 캐시와 조건부 GET (ETag / Last-Modified)
+
+조회가 잦고 변경이 드문 GET 엔드포인트의 응답 데이터를 공유 캐시에 보관합니다.
+
+- 리소스 묶음(family)마다 공유 캐시에 버전 카운터를 두고, 모델 시그널이 커밋 후 mark_changed()로 올립니다.
+- 응답은 (엔드포인트, 사용자 역할, 경로, 쿼리 파라미터)별로 한 항목에 저장하며,
+  항목에 기록된 ETag가 현재 버전으로 계산한 ETag와 같을 때만 사용합니다.
+- If-None-Match / If-Modified-Since가 현재 항목과 맞으면 뷰와 DB 조회 없이 304를 반환합니다.
+- 항목은 TIMEOUT 뒤 만료되므로 시그널 없이 바뀐 값(queryset.update() 등)도 이 시간 안에 반영됩니다.
+- 적중/실패/304 횟수는 /metrics의 response_cache_requests_total로 확인합니다.
+"""
+import functools
+import hashlib
+import logging
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils.cache import patch_cache_control
+from django.utils.http import http_date, parse_etags, parse_http_date_safe
+from rest_framework import status
+from rest_framework.response import Response
+
+from system.performance import increment
+
+logger = logging.getLogger(__name__)
+
+VERSION_CACHE_KEY = 'response_cache:version:{}'
+RESPONSE_CACHE_KEY = 'response_cache:{}:{}'
+
+DEFAULT_CONFIG = {
+    'ENABLED': True,
+    'TIMEOUT': 300,  # 응답 항목 보관 시간 (초)
+}
+
+
+def get_config():
+    return {**DEFAULT_CONFIG, **getattr(settings, 'RESPONSE_CACHE', {})}
+
+
+def user_role(user):
+    """권한 매트릭스와 같은 역할 구분 (관리자/교사/사용자/비로그인)"""
+    if user is None or not user.is_authenticated:
+        return 'anonymous'
+    if user.is_superuser:
+        return 'admin'
+    if user.is_staff:
+        return 'teacher'
+    return 'user'
+
+
+def get_versions(families):
+    """리소스 묶음별 현재 버전 (없으면 시각 기반 값으로 초기화)"""
+    keys = [VERSION_CACHE_KEY.format(family) for family in families]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            # 캐시가 비워진 뒤 예전 ETag와 같은 버전이 다시 나오지 않도록 밀리초 시각에서 시작
+            cache.add(key, int(time.time() * 1000), None)
+            versions[key] = cache.get(key, 0)
+    return tuple(versions[key] for key in keys)
+
+
+def _bump(families):
+    for family in families:
+        key = VERSION_CACHE_KEY.format(family)
+        try:
+            try:
+                cache.incr(key)
+            except ValueError:
+                cache.add(key, int(time.time() * 1000), None)
+                cache.incr(key)
+        except Exception as e:
+            # 응답 항목은 TIMEOUT 안에 만료되어 반영됨
+            logger.warning(f"응답 캐시 {family} 버전 갱신 실패: {e}")
+
+
+def mark_changed(*families):
+    """시그널에서 호출 - 트랜잭션 커밋 후 리소스 묶음 버전을 올려 캐시된 응답 무효화"""
+    transaction.on_commit(lambda: _bump(families))
+
+
+def _vary_key(request, kwargs):
+    params = sorted((key, value) for key in request.query_params for value in request.query_params.getlist(key))
+    raw = repr((user_role(request.user), request.path, sorted(kwargs.items()), params))
+    return hashlib.sha1(raw.encode()).hexdigest()
+
+
+def _not_modified(request, entry):
+    """조건부 요청 헤더가 캐시된 응답과 일치하는지 (If-None-Match가 있으면 그것만 비교)"""
+    if_none_match = request.META.get('HTTP_IF_NONE_MATCH')
+    if if_none_match:
+        etags = parse_etags(if_none_match)
+        return '*' in etags or any(etag.removeprefix('W/') == entry['etag'].removeprefix('W/') for etag in etags)
+    if_modified_since = parse_http_date_safe(request.META.get('HTTP_IF_MODIFIED_SINCE', ''))
+    return if_modified_since is not None and entry['modified'] <= if_modified_since
+
+
+def _finalize(response, entry, authenticated):
+    response['ETag'] = entry['etag']
+    response['Last-Modified'] = http_date(entry['modified'])
+    # 브라우저가 임의로 재사용하지 않고 항상 조건부 요청으로 확인하도록 지정
+    if authenticated:
+        patch_cache_control(response, no_cache=True, private=True)
+    else:
+        patch_cache_control(response, no_cache=True)
+    return response
+
+
+def cached_response(*families, timeout=None):
+    """
+    GET 뷰 메서드 데코레이터 (APIView.get, ViewSet 액션)
+
+    families: 응답 내용이 의존하는 리소스 묶음 이름 (mark_changed와 같은 이름)
+    timeout: 응답 항목 보관 시간 (초, 또는 초를 반환하는 함수). 없으면 RESPONSE_CACHE['TIMEOUT']
+    인증/권한 확인 뒤 호출되므로 304 응답도 권한 검사를 거칩니다. 200 응답만 저장합니다.
+    """
+    def decorator(view_method):
+        name = view_method.__qualname__
+
+        @functools.wraps(view_method)
+        def wrapper(view, request, *args, **kwargs):
+            config = get_config()
+            if not config['ENABLED'] or request.method not in ('GET', 'HEAD'):
+                return view_method(view, request, *args, **kwargs)
+
+            authenticated = request.user.is_authenticated
+            try:
+                vary_key = _vary_key(request, kwargs)
+                etag = 'W/"{}"'.format(hashlib.sha1(
+                    repr((name, get_versions(families), vary_key)).encode()
+                ).hexdigest()[:32])
+                cache_key = RESPONSE_CACHE_KEY.format(name, vary_key)
+                entry = cache.get(cache_key)
+            except Exception as e:
+                logger.warning(f"응답 캐시 {name} 조회 실패, 캐시 없이 처리: {e}")
+                return view_method(view, request, *args, **kwargs)
+
+            if entry is not None and entry['etag'] == etag:
+                if _not_modified(request, entry):
+                    increment('response_cache', view=name, result='not_modified')
+                    return _finalize(Response(status=status.HTTP_304_NOT_MODIFIED), entry, authenticated)
+                increment('response_cache', view=name, result='hit')
+                return _finalize(Response(entry['data']), entry, authenticated)
+
+            increment('response_cache', view=name, result='miss')
+            response = view_method(view, request, *args, **kwargs)
+            if response.status_code != status.HTTP_200_OK or getattr(response, 'data', None) is None:
+                return response
+
+            entry = {'etag': etag, 'modified': int(time.time()), 'data': response.data}
+            seconds = timeout() if callable(timeout) else timeout
+            try:
+                cache.set(cache_key, entry, config['TIMEOUT'] if seconds is None else seconds)
+            except Exception as e:
+                logger.warning(f"응답 캐시 {name} 저장 실패: {e}")
+            if _not_modified(request, entry):
+                return _finalize(Response(status=status.HTTP_304_NOT_MODIFIED), entry, authenticated)
+            return _finalize(response, entry, authenticated)
+
+        return wrapper
+    return decorator
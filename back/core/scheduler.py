@@ -0,0 +1,236 @@
+"""
+프로세스 내 주기 작업 스케줄러
+
+gunicorn 워커마다 스케줄러 스레드가 뜨지만 리더 잠금을 잡은 워커 하나만 작업을 실행합니다.
+- MySQL: GET_LOCK 잠금 (core.locks), 리더 워커가 종료되면 잠금 연결이 끊기면서 바로 다른 워커가 이어받음
+- 그 외 DB: 공유 캐시의 리더 잠금, 리더 워커가 종료되면 LEADER_TTL 뒤 만료
+  캐시가 워커마다 따로(LocMem)이면 모든 워커가 리더가 되므로 스케줄러를 시작하지 않습니다.
+작업별 마지막 실행 시각은 캐시에 두므로 리더가 바뀌어도 실행 주기가 유지됩니다.
+
+작업은 settings.SCHEDULER['JOBS']에 점 경로(TASK)와 주기(INTERVAL, 초)로 등록합니다.
+"""
+import logging
+import os
+import socket
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import close_old_connections
+from django.utils.module_loading import import_string
+
+from core.locks import DatabaseLock, database_locks_available, exclusive, is_shared_cache
+
+logger = logging.getLogger(__name__)
+
+LEADER_CACHE_KEY = 'scheduler:leader'
+LEADER_LOCK_NAME = 'scheduler:leader'
+LAST_RUN_CACHE_KEY = 'scheduler:last_run:{}'
+JOB_LOCK_NAME = 'scheduler:job:{}'
+STATUS_CACHE_KEY = 'scheduler:status'
+
+DEFAULT_CONFIG = {
+    'ENABLED': True,
+    'TICK': 5,            # 실행할 작업을 확인하는 주기 (초)
+    'LEADER_TTL': 30,     # 리더 잠금 유지 시간 (초), TICK보다 충분히 길어야 함
+    'JOB_TIMEOUT': 600,   # 작업별 중복 실행 방지 잠금 시간 (초)
+    'JOBS': {},
+}
+
+
+def get_config():
+    return {**DEFAULT_CONFIG, **getattr(settings, 'SCHEDULER', {})}
+
+
+def summarize_result(result):
+    """작업 결과를 상태 캐시에 넣을 수 있는 형태로 변환"""
+    if hasattr(result, 'to_dict'):
+        return result.to_dict(include_items=False)
+    if result is None or isinstance(result, (bool, int, float, str, dict, list)):
+        return result
+    return str(result)
+
+
+def _record_status(name, status, started, duration, result=None, error=None):
+    statuses = cache.get(STATUS_CACHE_KEY) or {}
+    entry = statuses.get(name, {})
+    entry.update({
+        'status': status,
+        'last_run': started,
+        'duration_ms': round(duration * 1000, 1),
+        'result': result,
+        'error': error,
+    })
+    if status == 'success':
+        entry['last_success'] = started
+    statuses[name] = entry
+    cache.set(STATUS_CACHE_KEY, statuses, None)
+
+
+def run_job(name, job=None):
+    """
+    작업 한 번 실행 (소요 시간을 scheduler_job 히스토그램에 기록)
+
+    Returns:
+        작업 결과, 다른 워커가 같은 작업을 실행 중이면 None
+    """
+    from system.performance import registry
+
+    job = job or get_config()['JOBS'][name]
+    timeout = job.get('TIMEOUT', get_config()['JOB_TIMEOUT'])
+    with exclusive(JOB_LOCK_NAME.format(name), timeout, owner=registry.worker_id) as acquired:
+        if not acquired:
+            logger.info(f"작업 {name}이(가) 다른 워커에서 실행 중입니다.")
+            return None
+        return _run_locked(name, job)
+
+
+def _run_locked(name, job):
+    from system.performance import observe, registry
+
+    started_at = time.time()
+    started = time.perf_counter()
+    status = 'failed'
+    try:
+        close_old_connections()
+        result = import_string(job['TASK'])(**job.get('KWARGS', {}))
+        status = 'success'
+        _record_status(name, status, started_at, time.perf_counter() - started, result=summarize_result(result))
+        return result
+    except Exception as e:
+        logger.error(f"주기 작업 {name} 실패: {e}")
+        _record_status(name, status, started_at, time.perf_counter() - started, error=str(e))
+        raise
+    finally:
+        observe('scheduler_job', time.perf_counter() - started, job=name, status=status)
+        registry.flush()
+        close_old_connections()
+
+
+class Scheduler:
+    """리더 잠금을 잡은 워커에서만 작업을 실행하는 백그라운드 스레드"""
+
+    def __init__(self):
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self.thread = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._leader_lock = None
+
+    def is_leader(self, ttl):
+        if database_locks_available():
+            if self._leader_lock is None:
+                self._leader_lock = DatabaseLock(LEADER_LOCK_NAME)
+            was_leader = cache.get(LEADER_CACHE_KEY) == self.worker_id
+            if not self._leader_lock.acquire():
+                return False
+            if not was_leader:
+                logger.info(f"스케줄러 리더 획득: {self.worker_id}")
+            # 상태 조회(get_status)용 표시
+            cache.set(LEADER_CACHE_KEY, self.worker_id, ttl)
+            return True
+
+        if cache.add(LEADER_CACHE_KEY, self.worker_id, ttl):
+            logger.info(f"스케줄러 리더 획득: {self.worker_id}")
+            return True
+        if cache.get(LEADER_CACHE_KEY) == self.worker_id:
+            cache.touch(LEADER_CACHE_KEY, ttl)
+            return True
+        return False
+
+    def due_jobs(self, jobs):
+        now = time.time()
+        for name, job in jobs.items():
+            if not job.get('ENABLED', True):
+                continue
+            last_run = cache.get(LAST_RUN_CACHE_KEY.format(name))
+            if last_run is None or now - last_run >= job['INTERVAL']:
+                yield name, job
+
+    def tick(self):
+        """실행 시각이 된 작업 실행 (리더가 아니면 아무것도 하지 않음)"""
+        config = get_config()
+        ran = []
+        for name, job in self.due_jobs(config['JOBS']):
+            # 작업마다 리더 잠금을 갱신해 긴 작업 중에도 리더가 바뀌지 않게 함
+            if not self.is_leader(config['LEADER_TTL']):
+                break
+            cache.set(LAST_RUN_CACHE_KEY.format(name), time.time(), None)
+            try:
+                run_job(name, job)
+            except Exception:
+                pass  # run_job에서 기록함, 다른 작업은 계속 실행
+            ran.append(name)
+        return ran
+
+    def _loop(self):
+        while not self._stop.is_set():
+            try:
+                self.tick()
+            except Exception as e:
+                logger.error(f"스케줄러 루프 오류: {e}")
+            self._stop.wait(get_config()['TICK'])
+
+    def start(self):
+        if not get_config()['ENABLED']:
+            return False
+        if not database_locks_available() and not is_shared_cache():
+            logger.error(
+                "스케줄러를 시작하지 않습니다: 워커 간 리더 잠금에 MySQL 또는 공유 캐시(REDIS_CACHE_URL)가 필요합니다."
+            )
+            return False
+        with self._lock:
+            if self.thread is None or not self.thread.is_alive():
+                self._stop.clear()
+                self.thread = threading.Thread(target=self._loop, name='scheduler', daemon=True)
+                self.thread.start()
+                logger.info("주기 작업 스케줄러 시작됨")
+        return True
+
+    def after_fork(self):
+        """fork된 자식 프로세스에서 호출 - 부모의 스레드 상태와 워커 ID를 물려받지 않도록 초기화"""
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self.thread = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        # 부모의 잠금 연결은 물려받지 않음 (fork 전에 잡은 잠금은 부모 연결에 남음)
+        self._leader_lock = None
+
+    def stop(self):
+        self._stop.set()
+        if self.thread and self.thread.is_alive():
+            self.thread.join(timeout=1)
+        if self._leader_lock is not None:
+            self._leader_lock.close()
+            self._leader_lock = None
+        if cache.get(LEADER_CACHE_KEY) == self.worker_id:
+            cache.delete(LEADER_CACHE_KEY)
+
+
+scheduler = Scheduler()
+# gunicorn preload_app: 마스터에서 만든 인스턴스를 워커가 그대로 물려받음
+os.register_at_fork(after_in_child=scheduler.after_fork)
+
+
+def start_scheduler():
+    """워커 프로세스 시작 시 core.startup에서 호출 (migrate 등 관리 명령에서는 스케줄러가 뜨지 않음)"""
+    return scheduler.start()
+
+
+def get_status():
+    config = get_config()
+    statuses = cache.get(STATUS_CACHE_KEY) or {}
+    return {
+        'enabled': config['ENABLED'],
+        'leader': cache.get(LEADER_CACHE_KEY),
+        'jobs': {
+            name: {
+                'task': job['TASK'],
+                'interval': job['INTERVAL'],
+                'enabled': job.get('ENABLED', True),
+                **statuses.get(name, {}),
+            }
+            for name, job in config['JOBS'].items()
+        },
+    }
@@ -0,0 +1,276 @@
+"""
+n-gram 검색 인덱스 (워커 메모리)
+
+이름/아이디/시리얼/MAC/IP처럼 부분 문자열로 찾는 필드를 바이그램(2-gram) 역색인으로 두고,
+검색어의 바이그램 교집합으로 후보를 좁힌 뒤 실제 포함 여부를 확인해 순위가 매겨진 PK 목록을 반환합니다.
+한국어 이름은 앞부분 일치 인덱스를 쓸 수 없으므로 icontains OR 조회(전체 스캔) 대신 사용합니다.
+
+변경 반영
+- 모델 시그널이 mark_changed(ids)를 호출하면 커밋 후 공유 캐시의 버전을 올리고 바뀐 PK 목록을 기록합니다.
+- 각 워커는 검색 시 VERSION_CHECK_INTERVAL마다 버전을 확인해 밀린 변경분의 문서만 다시 읽습니다.
+- 변경 기록이 없거나 너무 많이 밀렸거나 REFRESH_INTERVAL이 지나면 전체를 다시 만듭니다.
+  (queryset.update()처럼 시그널 없이 바뀐 값도 이 주기로 반영됨)
+"""
+import heapq
+import logging
+import threading
+import time
+import unicodedata
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from rest_framework.filters import SearchFilter
+
+logger = logging.getLogger(__name__)
+
+VERSION_CACHE_KEY = 'search:{}:version'
+CHANGE_CACHE_KEY = 'search:{}:change:{}'
+FIELD_SEPARATOR = '\x00'
+
+DEFAULT_CONFIG = {
+    'VERSION_CHECK_INTERVAL': 1,  # 공유 캐시 버전 확인 주기 (초)
+    'REFRESH_INTERVAL': 600,      # 변경이 없어도 전체를 다시 만드는 주기 (초)
+    'CHANGE_LOG_TIMEOUT': 3600,   # 변경 기록 보관 시간 (초)
+    'MAX_REPLAY': 200,            # 이보다 많이 밀리면 변경분 대신 전체 재생성
+}
+
+# 일치 종류별 점수 (필드 가중치와 곱함)
+EXACT_SCORE = 3
+PREFIX_SCORE = 2
+CONTAINS_SCORE = 1
+
+
+def get_config():
+    return {**DEFAULT_CONFIG, **getattr(settings, 'SEARCH_INDEX', {})}
+
+
+def normalize_text(value):
+    """NFKC 정규화 후 소문자 (macOS 입력의 분리된 한글 자모도 합쳐서 비교)"""
+    if value is None:
+        return ''
+    return unicodedata.normalize('NFKC', str(value)).strip().lower()
+
+
+def bigrams(text):
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+class SearchIndex:
+    """
+    모델 하나에 대한 바이그램 검색 인덱스
+
+    load(ids)는 (pk, 정렬 키, 필드 값 튜플)을 반환하며 ids가 None이면 전체 문서를 읽습니다.
+    weights는 필드 순서대로의 가중치입니다.
+    """
+
+    def __init__(self, name, load, weights):
+        self.name = name
+        self.load = load
+        self.weights = tuple(weights)
+        self._docs = {}       # pk -> (정렬 키, (가중치, 필드) 튜플, 필드를 이은 문자열)
+        self._postings = {}   # 바이그램 -> pk 집합
+        self._version = None
+        self._built_at = None
+        self._checked_at = 0.0
+        self._lock = threading.RLock()
+
+    # 문서/역색인 관리 (self._lock 안에서 호출)
+
+    def _add(self, pk, sort_key, fields):
+        fields = tuple(normalize_text(value) for value in fields)
+        self._docs[pk] = (sort_key, tuple(zip(self.weights, fields)), FIELD_SEPARATOR.join(fields))
+        for field in fields:
+            for gram in bigrams(field):
+                self._postings.setdefault(gram, set()).add(pk)
+
+    def _remove(self, pk):
+        doc = self._docs.pop(pk, None)
+        if doc is None:
+            return
+        for _, field in doc[1]:
+            for gram in bigrams(field):
+                posting = self._postings.get(gram)
+                if posting is not None:
+                    posting.discard(pk)
+                    if not posting:
+                        del self._postings[gram]
+
+    def rebuild(self, version=None):
+        """전체 문서를 다시 읽어 인덱스 교체"""
+        with self._lock:
+            if version is None:
+                version = cache.get(VERSION_CACHE_KEY.format(self.name), 0)
+            self._docs, self._postings = {}, {}
+            for pk, sort_key, fields in self.load(None):
+                self._add(pk, sort_key, fields)
+            self._version = version
+            self._built_at = self._checked_at = time.monotonic()
+            logger.debug(f"검색 인덱스 {self.name} 생성: 문서 {len(self._docs)}개, 바이그램 {len(self._postings)}개")
+
+    def _apply_changes(self, ids):
+        ids = set(ids)
+        loaded = {pk: (sort_key, fields) for pk, sort_key, fields in self.load(ids)}
+        for pk in ids:
+            self._remove(pk)
+            if pk in loaded:
+                self._add(pk, *loaded[pk])
+
+    def _sync(self, now, config):
+        """공유 캐시 버전을 확인하고 밀린 변경분을 반영"""
+        self._checked_at = now
+        version = cache.get(VERSION_CACHE_KEY.format(self.name), 0)
+        if self._built_at is None or now - self._built_at >= config['REFRESH_INTERVAL']:
+            self.rebuild(version)
+            return
+        if version == self._version:
+            return
+        # 캐시가 비워져 버전이 되돌아갔거나 너무 많이 밀린 경우 전체 재생성
+        if version < self._version or version - self._version > config['MAX_REPLAY']:
+            self.rebuild(version)
+            return
+        keys = [CHANGE_CACHE_KEY.format(self.name, v) for v in range(self._version + 1, version + 1)]
+        changes = cache.get_many(keys)
+        if len(changes) != len(keys):
+            self.rebuild(version)
+            return
+        self._apply_changes(pk for key in keys for pk in changes[key])
+        self._version = version
+
+    def ensure_current(self):
+        now = time.monotonic()
+        config = get_config()
+        if self._built_at is None or now - self._checked_at >= config['VERSION_CHECK_INTERVAL']:
+            with self._lock:
+                if self._built_at is None or now - self._checked_at >= config['VERSION_CHECK_INTERVAL']:
+                    self._sync(now, config)
+
+    # 검색
+
+    def _candidates(self, term):
+        """
+        단어를 포함할 수 있는 문서 PK 집합
+
+        두 글자 이상이면 바이그램 교집합(실제 포함 여부는 _score에서 확인),
+        한 글자면 문서 문자열을 직접 확인합니다.
+        """
+        if len(term) < 2:
+            return {pk for pk, doc in self._docs.items() if term in doc[2]}
+        postings = []
+        for gram in bigrams(term):
+            posting = self._postings.get(gram)
+            if not posting:
+                return set()
+            postings.append(posting)
+        postings.sort(key=len)
+        return postings[0].intersection(*postings[1:])
+
+    @staticmethod
+    def _score(weighted_fields, terms):
+        """단어마다 가장 잘 맞는 필드의 (가중치 x 일치 종류) 합 (포함하지 않는 단어가 있으면 0)"""
+        score = 0
+        for term in terms:
+            best = 0
+            for weight, field in weighted_fields:
+                position = field.find(term)
+                if position < 0:
+                    continue
+                if position:
+                    points = weight * CONTAINS_SCORE
+                elif len(field) == len(term):
+                    points = weight * EXACT_SCORE
+                else:
+                    points = weight * PREFIX_SCORE
+                if points > best:
+                    best = points
+            if not best:
+                return 0
+            score += best
+        return score
+
+    def search(self, query, limit=None):
+        """
+        검색어의 모든 단어(공백 구분)를 포함하는 문서의 PK를 점수순으로 반환
+
+        점수가 같으면 정렬 키 순이며, limit이 있으면 상위 limit개만 반환합니다.
+        """
+        terms = list(dict.fromkeys(normalize_text(query).split()))
+        if not terms:
+            return []
+        self.ensure_current()
+        with self._lock:
+            # 선택도가 높은(긴) 단어부터 좁힘
+            terms.sort(key=len, reverse=True)
+            matched = None
+            for term in terms:
+                candidates = self._candidates(term)
+                matched = candidates if matched is None else matched & candidates
+                if not matched:
+                    return []
+            docs = self._docs
+            ranked = []
+            for pk in matched:
+                sort_key, weighted_fields, _ = docs[pk]
+                score = self._score(weighted_fields, terms)
+                if score:
+                    ranked.append((-score, sort_key, pk))
+            ranked = heapq.nsmallest(limit, ranked) if limit else sorted(ranked)
+        return [pk for _, _, pk in ranked]
+
+    # 변경 알림
+
+    def mark_changed(self, ids):
+        """시그널에서 호출 - 트랜잭션 커밋 후 변경된 PK를 모든 워커에 알림"""
+        ids = sorted(set(ids))
+        if ids:
+            transaction.on_commit(lambda: self._publish(ids))
+
+    def _publish(self, ids):
+        key = VERSION_CACHE_KEY.format(self.name)
+        try:
+            try:
+                version = cache.incr(key)
+            except ValueError:
+                cache.add(key, 0, None)
+                version = cache.incr(key)
+            cache.set(CHANGE_CACHE_KEY.format(self.name, version), ids, get_config()['CHANGE_LOG_TIMEOUT'])
+        except Exception as e:
+            # 다른 워커는 REFRESH_INTERVAL 안에 전체 재생성으로 반영
+            logger.warning(f"검색 인덱스 {self.name} 변경 알림 실패: {e}")
+        self._checked_at = 0.0
+
+    def stats(self):
+        return {
+            'name': self.name,
+            'documents': len(self._docs),
+            'bigrams': len(self._postings),
+            'version': self._version,
+        }
+
+
+def in_rank_order(queryset, ids):
+    """PK 목록 순서대로 객체 목록 반환 (queryset에 없는 PK는 제외)"""
+    objects = queryset.in_bulk(ids)
+    return [objects[pk] for pk in ids if pk in objects]
+
+
+class IndexedSearchFilter(SearchFilter):
+    """
+    뷰의 search_index로 ?search=를 처리하는 SearchFilter
+
+    조인/OR icontains 대신 인덱스에서 찾은 PK로만 거르므로 중복 행이 생기지 않습니다.
+    순서는 기존처럼 OrderingFilter/쿼리셋 정렬을 따릅니다.
+    인덱스를 쓸 수 없으면 search_fields로 기존 검색을 수행합니다.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        index = getattr(view, 'search_index', None)
+        query = request.query_params.get(self.search_param, '')
+        if index is None or not query.strip():
+            return super().filter_queryset(request, queryset, view)
+        try:
+            ids = index.search(query)
+        except Exception as e:
+            logger.warning(f"검색 인덱스 {index.name} 조회 실패, 기본 검색 사용: {e}")
+            return super().filter_queryset(request, queryset, view)
+        return queryset.filter(pk__in=ids)
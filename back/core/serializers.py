@@ -0,0 +1,87 @@
+"""
+읽기 전용 목록용 values-mode 직렬화
+
+대량 목록 응답에서 모델 인스턴스와 ModelSerializer 필드 객체를 만들지 않고
+.values_list() 튜플로 바로 응답 행(dict)을 만듭니다.
+하위 클래스는 같은 목록의 기존 시리얼라이저와 같은 키/값을 내도록 to_representation을 작성합니다.
+
+- columns: 조회할 ORM 경로 (관계는 'user__username'처럼 지정)
+- DateTimeField 열은 DRF DateTimeField처럼 현재 시간대로 변환하고, DecimalField 열은 문자열로 바꿉니다.
+  (직렬화 전 값이 그대로 나가던 필드는 raw_columns에 두어 변환하지 않음)
+- 여러 행에 걸친 계산 값(개수, 관계 목록 등)은 prepare(rows)에서 쿼리 한 번으로 채웁니다.
+"""
+from django.db import models
+from django.utils import timezone
+from django.utils.encoding import force_str
+
+
+def resolve_field(model, path):
+    """'user__username' 같은 ORM 경로의 마지막 필드"""
+    field = None
+    for name in path.split('__'):
+        field = model._meta.get_field(name)
+        if field.is_relation and field.related_model is not None:
+            model = field.related_model
+    return field
+
+
+def choice_labels(model, path):
+    """필드 선택지 값 -> 라벨 (get_FOO_display()와 같은 문자열)"""
+    return {value: force_str(label) for value, label in resolve_field(model, path).flatchoices}
+
+
+def localtime(value):
+    return timezone.localtime(value) if value is not None and timezone.is_aware(value) else value
+
+
+def decimal_string(value):
+    return None if value is None else str(value)
+
+
+class ValuesSerializer:
+    model = None
+    columns = ()
+    raw_columns = ()
+
+    def __init__(self, queryset, context=None):
+        self.queryset = queryset
+        self.context = context or {}
+        self.converters = []
+        self.choices = {}
+        for index, path in enumerate(self.columns):
+            field = resolve_field(self.model, path)
+            if field.choices:
+                self.choices[path] = choice_labels(self.model, path)
+            if path in self.raw_columns:
+                continue
+            if isinstance(field, models.DateTimeField):
+                self.converters.append((index, localtime))
+            elif isinstance(field, models.DecimalField):
+                self.converters.append((index, decimal_string))
+
+    def display(self, path, value):
+        """get_FOO_display()와 같은 선택지 라벨"""
+        return self.choices[path].get(value, value)
+
+    def rows(self):
+        converters = self.converters
+        rows = []
+        for values in self.queryset.values_list(*self.columns):
+            if converters:
+                values = list(values)
+                for index, convert in converters:
+                    values[index] = convert(values[index])
+            rows.append(dict(zip(self.columns, values)))
+        return rows
+
+    def prepare(self, rows):
+        """여러 행에 필요한 값을 한 번에 조회 (하위 클래스에서 구현)"""
+
+    def to_representation(self, row):
+        return row
+
+    @property
+    def data(self):
+        rows = self.rows()
+        self.prepare(rows)
+        return [self.to_representation(row) for row in rows]
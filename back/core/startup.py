@@ -0,0 +1,76 @@
+"""
+워커 프로세스 초기화
+
+백그라운드 스레드(헬스체크 캐시 갱신, 주기 작업 스케줄러)는 모듈 import 시점이 아니라
+요청을 처리할 워커 프로세스가 만들어진 뒤 start_background_services()로 시작합니다.
+
+- gunicorn: gunicorn.conf.py의 post_worker_init 훅에서 워커마다 호출
+  (preload_app으로 마스터가 앱을 미리 불러와도 스레드는 fork된 워커에서만 뜸)
+- 그 밖의 서버(runserver, daphne, uvicorn 단독 실행): WSGI/ASGI 진입점에서 바로 호출
+- 관리 명령(migrate 등)과 테스트는 진입점을 거치지 않으므로 스레드가 뜨지 않음
+
+preload_app을 쓰면 마스터에서 preload_application()으로 뷰 모듈까지 불러온 뒤 fork하여
+워커끼리 import된 코드와 객체를 copy-on-write로 공유합니다.
+"""
+import gc
+import logging
+import os
+import threading
+
+logger = logging.getLogger(__name__)
+
+# gunicorn.conf.py가 설정 - 워커 시작은 훅에 맡기고 진입점에서는 시작하지 않음
+POST_FORK_ENV = 'BACKGROUND_SERVICES_POST_FORK'
+
+_started_pid = None
+_lock = threading.Lock()
+
+
+def managed_by_server_hook():
+    return os.environ.get(POST_FORK_ENV) == 'True'
+
+
+def start_background_services():
+    """현재 프로세스에서 백그라운드 스레드 시작 (프로세스마다 한 번)"""
+    global _started_pid
+
+    with _lock:
+        if _started_pid == os.getpid():
+            return False
+        _started_pid = os.getpid()
+
+    from core.scheduler import start_scheduler
+    from system.views import health_updater
+
+    health_updater.start()
+    start_scheduler()
+    logger.info(f"백그라운드 서비스 시작됨 (pid {os.getpid()})")
+    return True
+
+
+def start_background_services_unless_hooked():
+    """WSGI/ASGI 진입점에서 호출 - 서버 훅이 워커마다 시작하는 경우에는 건너뜀"""
+    if managed_by_server_hook():
+        return False
+    # 단독 실행 서버는 프로세스 하나이므로 이전 실행의 성능 집계를 여기서 정리
+    from system.performance import clear_snapshots
+    clear_snapshots()
+    return start_background_services()
+
+
+def preload_application():
+    """
+    gunicorn 마스터에서 fork 직전에 호출 (preload_app)
+
+    - URLconf를 해석해 모든 뷰 모듈을 마스터에서 불러옴 (워커는 첫 요청 때 import하지 않음)
+    - 마스터가 연 DB 연결을 닫음 (워커가 같은 소켓을 나눠 쓰지 않도록)
+    - 지금까지 만든 객체를 GC 추적에서 제외 (워커의 GC가 공유 페이지를 건드려 복사되는 것 방지)
+    """
+    from django.db import connections
+    from django.urls import get_resolver
+
+    get_resolver().url_patterns
+    connections.close_all()
+    gc.collect()
+    gc.freeze()
+    logger.info(f"앱 미리 불러오기 완료 (GC 고정 객체 {gc.get_freeze_count()}개)")
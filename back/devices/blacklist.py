@@ -0,0 +1,288 @@
+"""
+IP 블랙리스트 (단일 IP, CIDR, 범위)
+
+BlacklistedIP 행 하나는 정수 구간 [start_int, end_int] 하나입니다.
+- 단일 IP: 10.129.57.30
+- CIDR: 10.129.57.32/28
+- 범위: 10.129.57.40-10.129.57.60
+
+할당기(find_available_ip)와 KEA 등록(register_ip_to_kea)은 DB를 조회하지 않고 워커 메모리의
+구간 인덱스(정렬·병합된 구간)를 이진 탐색으로 확인합니다 (O(log n)).
+블랙리스트가 바뀌면 공유 캐시의 버전 값이 올라가고, 같은 워커는 바로, 다른 워커는
+VERSION_CHECK_INTERVAL 안에 인덱스를 다시 만듭니다.
+"""
+import bisect
+import ipaddress
+import logging
+import threading
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+
+from .models import BlacklistedIP
+
+logger = logging.getLogger(__name__)
+
+VERSION_CACHE_KEY = 'devices:blacklist_version'
+VERSION_CHECK_INTERVAL = 1  # 공유 캐시 버전 확인 주기 (초)
+MAX_RANGE_SIZE = 65536      # 항목 하나가 막을 수 있는 최대 주소 수 (/16)
+
+
+def parse_ip_range(value):
+    """
+    블랙리스트 항목 문자열을 정수 구간 (start, end)으로 변환
+
+    Raises:
+        ValueError: IPv4 주소/CIDR/범위 형식이 아니거나 구간이 MAX_RANGE_SIZE보다 큰 경우
+    """
+    value = str(value or '').strip()
+    try:
+        if '/' in value:
+            network = ipaddress.IPv4Network(value, strict=False)
+            start, end = int(network.network_address), int(network.broadcast_address)
+        elif '-' in value:
+            first, last = (part.strip() for part in value.split('-', 1))
+            start, end = int(ipaddress.IPv4Address(first)), int(ipaddress.IPv4Address(last))
+        else:
+            start = end = int(ipaddress.IPv4Address(value))
+    except ValueError:
+        raise ValueError(f"유효하지 않은 IP 주소/CIDR/범위 형식입니다: {value}")
+    if start > end:
+        raise ValueError(f"범위의 시작 주소가 끝 주소보다 큽니다: {value}")
+    if end - start + 1 > MAX_RANGE_SIZE:
+        raise ValueError(f"한 번에 차단할 수 있는 주소는 최대 {MAX_RANGE_SIZE}개입니다: {value}")
+    return start, end
+
+
+def format_ip_range(start, end):
+    """정수 구간을 표시용 문자열로 (단일 IP, 정렬된 CIDR, 그 외 범위)"""
+    first = ipaddress.IPv4Address(start)
+    if start == end:
+        return str(first)
+    networks = list(ipaddress.summarize_address_range(first, ipaddress.IPv4Address(end)))
+    if len(networks) == 1:
+        return str(networks[0])
+    return f"{first}-{ipaddress.IPv4Address(end)}"
+
+
+def _to_int(ip_address):
+    if isinstance(ip_address, int):
+        return ip_address
+    try:
+        return int(ipaddress.IPv4Address(ip_address))
+    except ValueError:
+        return None
+
+
+class BlacklistIndex:
+    """겹치거나 맞닿은 구간을 병합해 시작 주소 순으로 정렬한 구간 인덱스"""
+
+    def __init__(self, intervals=()):
+        merged = []
+        for start, end in sorted(intervals):
+            if merged and start <= merged[-1][1] + 1:
+                merged[-1][1] = max(merged[-1][1], end)
+            else:
+                merged.append([start, end])
+        self._starts = [start for start, _ in merged]
+        self._ends = [end for _, end in merged]
+
+    def contains(self, ip_address):
+        """IP(문자열 또는 정수)가 차단 구간 안에 있는지"""
+        address = _to_int(ip_address)
+        if address is None:
+            return False
+        position = bisect.bisect_right(self._starts, address) - 1
+        return position >= 0 and address <= self._ends[position]
+
+    __contains__ = contains
+
+    def overlaps(self, start, end):
+        """[start, end]와 겹치는 차단 구간이 있는지"""
+        position = bisect.bisect_right(self._starts, end) - 1
+        return position >= 0 and self._ends[position] >= start
+
+    def intervals(self):
+        return list(zip(self._starts, self._ends))
+
+    def address_count(self):
+        return sum(end - start + 1 for start, end in zip(self._starts, self._ends))
+
+    def __len__(self):
+        return len(self._starts)
+
+
+def build_index():
+    return BlacklistIndex(BlacklistedIP.objects.values_list('start_int', 'end_int'))
+
+
+class BlacklistCache:
+    """워커별 블랙리스트 인덱스 (조회는 잠금 없이 현재 인덱스 참조만 읽음)"""
+
+    def __init__(self):
+        self._index = BlacklistIndex()
+        self._version = None
+        self._built = False
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def invalidate(self):
+        """다음 조회 때 인덱스를 다시 만들도록 함"""
+        self._built = False
+        self._checked_at = 0.0
+
+    def _refresh(self, now):
+        # 처음 만들거나 무효화된 경우에만 기다리고, 버전 확인 중이면 기존 인덱스로 응답
+        if not self._lock.acquire(blocking=not self._built):
+            return
+        try:
+            if self._built and now - self._checked_at < VERSION_CHECK_INTERVAL:
+                return
+            self._checked_at = now
+            version = cache.get(VERSION_CACHE_KEY, 0)
+            if not self._built or version != self._version:
+                # 버전을 먼저 읽고 인덱스를 만들어 읽는 도중의 변경을 놓치지 않음
+                self._index = build_index()
+                self._version = version
+                self._built = True
+        finally:
+            self._lock.release()
+
+    def get(self):
+        now = time.monotonic()
+        if not self._built or now - self._checked_at >= VERSION_CHECK_INTERVAL:
+            self._refresh(now)
+        return self._index
+
+    def stats(self):
+        return {'intervals': len(self._index), 'addresses': self._index.address_count(), 'version': self._version}
+
+
+blacklist_cache = BlacklistCache()
+
+
+def blacklist_index():
+    """현재 블랙리스트 구간 인덱스"""
+    return blacklist_cache.get()
+
+
+def _bump_version():
+    try:
+        cache.incr(VERSION_CACHE_KEY)
+    except ValueError:
+        cache.set(VERSION_CACHE_KEY, 1, None)
+    blacklist_cache.invalidate()
+
+
+def notify_blacklist_changed():
+    """
+    블랙리스트 추가/삭제 후 호출
+
+    이 워커는 바로 다시 읽고 (같은 트랜잭션의 변경 포함), 다른 워커는 커밋 후
+    VERSION_CHECK_INTERVAL 안에 다시 읽습니다.
+    """
+    blacklist_cache.invalidate()
+    transaction.on_commit(_bump_version)
+
+
+def blacklist_ranges(values, reason=None, user=None, batch_size=500):
+    """
+    블랙리스트 항목 여러 개를 한 번에 추가하고 차단된 IP를 쓰던 장치를 재할당
+
+    장치/KEA 사용 IP를 한 번씩 읽어 한 번의 배정으로 새 IP를 정하고, Device 갱신과 이력은
+    bulk_update/bulk_create로, KEA 예약은 register_many_to_kea로 묶어서 씁니다.
+    이미 있는 항목도 그 구간의 장치는 다시 확인해 재할당합니다.
+
+    Args:
+        values: IP 주소, CIDR, 범위(시작-끝) 문자열 목록
+        reason: 새 항목의 차단 사유
+        user: 이력에 남길 작업자 (없으면 장치 소유자)
+
+    Returns:
+        {'added', 'existing', 'reassigned', 'failed', 'kea_synced'}
+
+    Raises:
+        ValueError: 형식이 잘못된 항목이 있는 경우 (아무것도 쓰지 않음)
+    """
+    from .captive import notify_devices_changed
+    from .models import Device, DeviceHistory
+    from .utils.kea_client import KeaClient
+    from core.response_cache import mark_changed
+
+    ranges = list(dict.fromkeys(parse_ip_range(value) for value in values))
+    if not ranges:
+        raise ValueError("차단할 IP 주소가 없습니다.")
+    requested = BlacklistIndex(ranges)
+
+    with transaction.atomic():
+        existing = set(
+            BlacklistedIP.objects.filter(start_int__in=[start for start, _ in ranges])
+            .values_list('start_int', 'end_int')
+        )
+        created = [
+            BlacklistedIP(ip_address=format_ip_range(start, start), start_int=start, end_int=end, reason=reason)
+            for start, end in ranges if (start, end) not in existing
+        ]
+        BlacklistedIP.objects.bulk_create(created, batch_size=batch_size)
+        if created:
+            # bulk_create는 post_save 시그널을 보내지 않음
+            mark_changed('blacklist')
+            notify_blacklist_changed()
+
+        used = set(KeaClient.get_kea_used_ips())
+        affected_ids = []
+        for device_id, assigned_ip in Device.objects.exclude(assigned_ip=None).values_list('id', 'assigned_ip'):
+            used.add(assigned_ip)
+            if requested.contains(assigned_ip):
+                affected_ids.append(device_id)
+
+        # 새 항목이 반영된 인덱스로 학생/교사 대역을 한 번씩만 훑으며 배정
+        pools = {
+            is_student: KeaClient.iter_available_ips(used, is_student=is_student)
+            for is_student in (True, False)
+        }
+        devices = Device.objects.filter(id__in=affected_ids).select_related('user').order_by('id')
+        updated, histories, reassigned, failed = [], [], [], []
+        now = timezone.now()
+        for device in devices:
+            old_ip = device.assigned_ip
+            new_ip = next(pools[not device.user.is_staff], None)
+            if new_ip is None:
+                logger.error(f"블랙리스트 IP 재할당 실패 (사용 가능한 IP 없음): {device.mac_address}")
+                failed.append({'mac_address': device.mac_address, 'old_ip': old_ip})
+                continue
+            histories.append(DeviceHistory(
+                user=user or device.user, mac_address=device.mac_address, device_name=device.device_name,
+                assigned_ip=new_ip, action=DeviceHistory.Action.REASSIGN_IP_BLACKLIST,
+                old_value={'ip': old_ip}, new_value={'ip': new_ip},
+            ))
+            device.assigned_ip = new_ip
+            # updated_at(auto_now)은 bulk_update에서 갱신되지 않으므로 명시적으로 지정
+            device.updated_at = now
+            updated.append(device)
+            reassigned.append({'mac_address': device.mac_address, 'old_ip': old_ip, 'new_ip': new_ip})
+
+        Device.objects.bulk_update(updated, ['assigned_ip', 'updated_at'], batch_size=batch_size)
+        DeviceHistory.objects.bulk_create(histories, batch_size=batch_size)
+    if updated:
+        # bulk_update는 post_save 시그널을 보내지 않음
+        notify_devices_changed()
+
+    kea_synced = KeaClient.register_many_to_kea(
+        [(device.mac_address, device.assigned_ip, device.device_name) for device in updated],
+        batch_size=batch_size,
+    )
+    if not kea_synced:
+        logger.error(f"블랙리스트 재할당 장치 {len(updated)}개의 KEA 등록 실패 (정합성 점검으로 복구 필요)")
+    for item in reassigned:
+        logger.info(f"블랙리스트로 인해 장치 {item['mac_address']}의 IP가 {item['old_ip']}에서 {item['new_ip']}로 변경되었습니다.")
+
+    return {
+        'added': [format_ip_range(entry.start_int, entry.end_int) for entry in created],
+        'existing': [format_ip_range(start, end) for start, end in ranges if (start, end) in existing],
+        'reassigned': reassigned,
+        'failed': failed,
+        'kea_synced': kea_synced,
+    }
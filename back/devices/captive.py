@@ -0,0 +1,153 @@
+"""
+캡티브 포털 등록 여부 빠른 판정 (nginx auth_request)
+
+OS의 connectivity check 요청마다 nginx가 /api/captive/check/로 서브요청을 보내
+응답 코드(204: 등록됨, 401: 미등록)에 따라 정상 응답 또는 포털 리디렉트를 돌려줍니다.
+
+판정은 워커 메모리의 등록 IP 집합만 보고, DB는 다음 경우에만 다시 읽습니다.
+- Device가 바뀌어 공유 캐시의 버전 값이 올라간 경우 (VERSION_CHECK_INTERVAL마다 확인)
+- 마지막으로 읽은 지 REFRESH_INTERVAL이 지난 경우 (KEA 리스 변화 반영)
+"""
+import ipaddress
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.utils import timezone
+
+from core.mac import normalize_mac
+from .models import Device, KeaLease4
+from .utils.kea_client import KeaClient
+
+logger = logging.getLogger(__name__)
+
+VERSION_CACHE_KEY = 'captive:registered_version'
+
+DEFAULT_CONFIG = {
+    'TRUSTED_PROXIES': ['127.0.0.1/32', '::1/128'],  # X-Real-IP를 믿을 프록시 주소
+    'VERSION_CHECK_INTERVAL': 1,   # 공유 캐시 버전 확인 주기 (초)
+    'REFRESH_INTERVAL': 60,        # 변경이 없어도 다시 읽는 주기 (초)
+}
+
+
+def get_config():
+    return {**DEFAULT_CONFIG, **getattr(settings, 'CAPTIVE_CHECK', {})}
+
+
+def build_registered_ips():
+    """
+    등록된 클라이언트 IP 집합
+
+    활성 장치의 할당 IP와, 활성 장치 MAC이 현재 갖고 있는 관리 대역 리스 주소를 합칩니다.
+    임시 대역(10.250.x.x)은 미등록 장치용이므로 포함하지 않습니다.
+    """
+    temp_start, temp_end = KeaClient.temporary_range()
+    ips = set()
+    macs = set()
+    for mac_address, assigned_ip in (
+        Device.objects.filter(is_active=True).exclude(assigned_ip=None).values_list('mac_address', 'assigned_ip')
+    ):
+        macs.add(normalize_mac(mac_address))
+        if not temp_start <= KeaClient.ip_to_int(assigned_ip) <= temp_end:
+            ips.add(assigned_ip)
+
+    try:
+        leases = KeaLease4.objects.filter(
+            state=0, expire__gt=timezone.now(), subnet_id__in=KeaClient.MANAGED_SUBNET_IDS
+        ).values_list('address', 'hwaddr')
+        for address, hwaddr in leases.iterator(chunk_size=2000):
+            if hwaddr and not temp_start <= address <= temp_end and KeaClient.bytes_to_mac(hwaddr) in macs:
+                ips.add(KeaClient.int_to_ip(address))
+    except Exception as e:
+        # KEA DB 장애 시 장치 할당 IP만으로 판정
+        logger.warning(f"캡티브 판정용 KEA 리스 조회 실패: {e}")
+    return frozenset(ips)
+
+
+class RegisteredClientMap:
+    """워커별 등록 IP 집합 (조회는 잠금 없이 집합 참조만 읽음)"""
+
+    def __init__(self):
+        self._ips = frozenset()
+        self._version = None
+        self._built_at = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def invalidate(self):
+        """다음 조회 때 공유 캐시 버전을 바로 확인하도록 함"""
+        self._checked_at = 0.0
+
+    def _refresh(self, now, config):
+        # 처음 만들 때만 기다리고, 이후에는 다른 스레드가 갱신 중이면 기존 집합으로 응답
+        if not self._lock.acquire(blocking=self._built_at is None):
+            return
+        try:
+            if self._built_at is not None and now - self._checked_at < config['VERSION_CHECK_INTERVAL']:
+                return
+            self._checked_at = now
+            version = cache.get(VERSION_CACHE_KEY, 0)
+            if (
+                self._built_at is None
+                or version != self._version
+                or now - self._built_at >= config['REFRESH_INTERVAL']
+            ):
+                # 버전을 먼저 읽고 집합을 만들어 읽는 도중의 변경을 놓치지 않음
+                self._ips = build_registered_ips()
+                self._version = version
+                self._built_at = now
+        finally:
+            self._lock.release()
+
+    def contains(self, ip_address):
+        now = time.monotonic()
+        config = get_config()
+        if self._built_at is None or now - self._checked_at >= config['VERSION_CHECK_INTERVAL']:
+            self._refresh(now, config)
+        return ip_address in self._ips
+
+    def stats(self):
+        return {'size': len(self._ips), 'version': self._version}
+
+
+registered_clients = RegisteredClientMap()
+
+
+def notify_devices_changed():
+    """장치 등록/변경/삭제 후 호출 (모든 워커가 VERSION_CHECK_INTERVAL 안에 다시 읽음)"""
+    try:
+        cache.incr(VERSION_CACHE_KEY)
+    except ValueError:
+        cache.set(VERSION_CACHE_KEY, 1, None)
+    registered_clients.invalidate()
+
+
+def _client_ip(request, config):
+    remote_addr = request.META.get('REMOTE_ADDR', '')
+    forwarded = request.META.get('HTTP_X_REAL_IP')
+    if forwarded:
+        try:
+            address = ipaddress.ip_address(remote_addr)
+        except ValueError:
+            return remote_addr
+        if any(address in ipaddress.ip_network(network) for network in config['TRUSTED_PROXIES']):
+            return forwarded.strip()
+    return remote_addr
+
+
+def captive_check(request):
+    """
+    GET /api/captive/check/ - nginx auth_request 전용
+
+    DRF 인증/직렬화를 거치지 않는 일반 Django 뷰이며 본문 없이 상태 코드만 반환합니다.
+    """
+    ip_address = _client_ip(request, get_config())
+    try:
+        registered = registered_clients.contains(ip_address)
+    except Exception as e:
+        logger.error(f"캡티브 등록 여부 판정 실패: {e}")
+        registered = False
+    return HttpResponse(status=204 if registered else 401)
@@ -0,0 +1,9 @@
+"""
+장치/KEA 관련 주기 작업 (core.scheduler에서 실행)
+"""
+from .utils.kea_client import KeaClient
+
+
+def cleanup_temporary_leases():
+    """만료된 임시 IP(10.250.0.0/16) 리스 삭제"""
+    return KeaClient.cleanup_expired_temporary_leases()
@@ -0,0 +1,181 @@
+"""
+KEA 리스 활동 적재
+
+lease4의 expire는 클라이언트가 리스를 갱신할 때마다 (갱신 시각 + valid_lifetime)으로 바뀝니다.
+서브넷별로 마지막으로 읽은 갱신 시각(cltt = expire - valid_lifetime, 워터마크) 이후 행만 읽어
+MAC 기준으로 장치에 묶고, Device.last_access와 일 단위 접속 기록(DevicePresence)을 묶음 쓰기로 갱신합니다.
+
+한 번 실행할 때 장치별로 가장 최근 갱신 시각 하나만 기록하므로
+실행 주기는 리스 갱신 주기(보통 valid_lifetime의 절반)보다 짧게 잡는 것이 좋습니다.
+"""
+import logging
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import DateTimeField, DurationField, ExpressionWrapper, F, Q
+from django.db.models.functions import Cast, Coalesce
+from django.utils import timezone
+
+from core.locks import exclusive
+from core.mac import normalize_mac
+from .models import Device, DevicePresence, KeaLease4
+from .utils.kea_client import KeaClient
+
+logger = logging.getLogger(__name__)
+
+# 서브넷별 마지막으로 읽은 cltt (이전의 expire 기준 워터마크와 섞이지 않도록 키를 분리)
+WATERMARK_CACHE_KEY = 'lease_activity:watermark:cltt'
+LOCK_NAME = 'lease_activity'
+LOCK_TIMEOUT = 300  # 캐시 잠금 만료 시간 (초, MySQL에서는 DB 명명 잠금 사용)
+BATCH_SIZE = 500
+
+
+# 리스 갱신 시각 (KEA의 cltt) - DurationField는 MySQL/SQLite 모두 마이크로초 정수로 다룸
+RENEWED_AT = ExpressionWrapper(
+    F('expire') - Cast(Coalesce('valid_lifetime', 0) * 1000000, DurationField()),
+    output_field=DateTimeField(),
+)
+
+
+def _changed_leases(watermarks):
+    """
+    워터마크 이후 갱신된 lease4 행 (hwaddr, expire, valid_lifetime, subnet_id)
+
+    한 서브넷에 유효 시간이 다른 리스가 섞일 수 있으므로 expire가 아니라 갱신 시각(cltt)으로 비교합니다.
+    처음 보는 서브넷은 현재 유효한 리스 전체를 읽습니다.
+    """
+    temp_start, temp_end = KeaClient.temporary_range()
+    condition = Q(expire__gt=timezone.now()) & ~Q(subnet_id__in=list(watermarks))
+    for subnet_id, renewed_at in watermarks.items():
+        # expire >= cltt이므로 expire 조건으로 인덱스 범위를 좁힌 뒤 cltt로 거름
+        # 같은 초에 갱신된 행을 놓치지 않도록 경계값을 포함 (다시 읽어도 결과는 같음)
+        condition |= Q(subnet_id=subnet_id, expire__gte=renewed_at, renewed_at__gte=renewed_at)
+    return (
+        KeaLease4.objects.filter(state=0)
+        .annotate(renewed_at=RENEWED_AT)
+        .filter(condition)
+        # 등록/임시 IP 배정 시 백엔드가 직접 기록한 리스와 임시 대역 리스는 실제 접속이 아님
+        .exclude(valid_lifetime__in=(KeaClient.RESERVATION_LEASE_LIFETIME, KeaClient.TEMPORARY_LEASE_LIFETIME))
+        .exclude(address__gte=temp_start, address__lte=temp_end)
+        .values_list('hwaddr', 'expire', 'valid_lifetime', 'subnet_id')
+        .iterator(chunk_size=2000)
+    )
+
+
+def _load_devices(macs):
+    """정규화된 MAC 목록으로 장치 조회 ({mac: Device})"""
+    devices = {}
+    macs = list(macs)
+    for start in range(0, len(macs), BATCH_SIZE):
+        chunk = macs[start:start + BATCH_SIZE]
+        # 장치 MAC은 입력 경로에 따라 대문자로 저장된 경우가 있음
+        candidates = chunk + [mac.upper() for mac in chunk]
+        for device in Device.objects.filter(mac_address__in=candidates).only('id', 'mac_address', 'last_access'):
+            devices[normalize_mac(device.mac_address)] = device
+    return devices
+
+
+def _update_presence(activity_by_device):
+    """장치별 접속 시각을 일 단위 기록에 반영 ({device_id: datetime})"""
+    entries = {}
+    for device_id, seen_at in activity_by_device.items():
+        local = timezone.localtime(seen_at)
+        entries[(device_id, local.date())] = (seen_at, 1 << local.hour)
+
+    existing = {}
+    device_ids = list(activity_by_device)
+    dates = {date for _, date in entries}
+    for start in range(0, len(device_ids), BATCH_SIZE):
+        rows = DevicePresence.objects.filter(
+            device_id__in=device_ids[start:start + BATCH_SIZE], date__in=dates
+        )
+        existing.update({(row.device_id, row.date): row for row in rows})
+
+    created, updated = [], []
+    for (device_id, date), (seen_at, bit) in entries.items():
+        row = existing.get((device_id, date))
+        if row is None:
+            created.append(DevicePresence(
+                device_id=device_id, date=date, hour_mask=bit, first_seen=seen_at, last_seen=seen_at,
+            ))
+            continue
+        row.hour_mask |= bit
+        row.first_seen = min(row.first_seen, seen_at)
+        row.last_seen = max(row.last_seen, seen_at)
+        updated.append(row)
+
+    DevicePresence.objects.bulk_create(created, batch_size=BATCH_SIZE)
+    DevicePresence.objects.bulk_update(updated, ['hour_mask', 'first_seen', 'last_seen'], batch_size=BATCH_SIZE)
+    return len(created), len(updated)
+
+
+def prune_presence(retention_days=None):
+    """보관 기간이 지난 접속 기록 삭제"""
+    retention_days = retention_days or settings.LEASE_ACTIVITY['RETENTION_DAYS']
+    cutoff = timezone.localdate() - timedelta(days=retention_days)
+    deleted, _ = DevicePresence.objects.filter(date__lt=cutoff).delete()
+    return deleted
+
+
+def ingest_lease_activity(full=False):
+    """
+    리스 활동 적재 실행 (명령어, 스케줄러 공용)
+
+    여러 프로세스(워커, 관리 명령어)가 동시에 실행하지 않도록 워커 간 잠금(core.locks)을
+    잡은 경우에만 실행하며, 잠금을 얻지 못하면 None을 반환합니다.
+    """
+    with exclusive(LOCK_NAME, LOCK_TIMEOUT) as acquired:
+        if not acquired:
+            logger.info("다른 프로세스에서 리스 활동 적재가 진행 중입니다.")
+            return None
+
+        started = time.monotonic()
+        watermarks = {} if full else (cache.get(WATERMARK_CACHE_KEY) or {})
+        new_watermarks = dict(watermarks)
+        activity_by_mac = {}
+        lease_count = 0
+
+        for hwaddr, expire, valid_lifetime, subnet_id in _changed_leases(watermarks):
+            lease_count += 1
+            # 리스 갱신 시각 = expire - valid_lifetime (KEA의 cltt)
+            seen_at = expire - timedelta(seconds=valid_lifetime or 0)
+            if subnet_id not in new_watermarks or seen_at > new_watermarks[subnet_id]:
+                new_watermarks[subnet_id] = seen_at
+            if not hwaddr:
+                continue
+            mac = KeaClient.bytes_to_mac(hwaddr)
+            if mac not in activity_by_mac or seen_at > activity_by_mac[mac]:
+                activity_by_mac[mac] = seen_at
+
+        devices = _load_devices(activity_by_mac)
+        activity_by_device = {}
+        updated = []
+        for mac, device in devices.items():
+            seen_at = activity_by_mac[mac]
+            activity_by_device[device.id] = seen_at
+            if device.last_access is None or seen_at > device.last_access:
+                device.last_access = seen_at
+                updated.append(device)
+
+        with transaction.atomic():
+            # bulk_update는 updated_at(auto_now)을 건드리지 않으므로 정합성 증분 점검 대상이 되지 않음
+            Device.objects.bulk_update(updated, ['last_access'], batch_size=BATCH_SIZE)
+            presence_created, presence_updated = _update_presence(activity_by_device)
+        pruned = prune_presence()
+
+        cache.set(WATERMARK_CACHE_KEY, new_watermarks, None)
+        result = {
+            'leases': lease_count,
+            'matched_devices': len(devices),
+            'unmatched_macs': len(activity_by_mac) - len(devices),
+            'last_access_updated': len(updated),
+            'presence_created': presence_created,
+            'presence_updated': presence_updated,
+            'presence_pruned': pruned,
+            'duration_ms': round((time.monotonic() - started) * 1000, 1),
+        }
+        logger.info(f"리스 활동 적재 완료: {result}")
+        return result
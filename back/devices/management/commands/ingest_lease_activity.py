@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand
+
+from devices.lease_activity import ingest_lease_activity
+
+
+class Command(BaseCommand):
+    help = 'KEA 리스 갱신 기록으로 장치 last_access와 접속 기록 갱신'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--full',
+            action='store_true',
+            help='워터마크를 무시하고 현재 유효한 리스 전체를 다시 적재'
+        )
+
+    def handle(self, *args, **options):
+        result = ingest_lease_activity(full=options['full'])
+        if result is None:
+            self.stdout.write(self.style.WARNING('다른 프로세스에서 적재가 진행 중이어서 건너뜁니다.'))
+            return
+
+        self.stdout.write(
+            f"리스 {result['leases']}건, 장치 {result['matched_devices']}개 "
+            f"(미등록 MAC {result['unmatched_macs']}개, {result['duration_ms']:.0f}ms)"
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f"last_access 갱신 {result['last_access_updated']}개, "
+            f"접속 기록 생성 {result['presence_created']}건 / 갱신 {result['presence_updated']}건 / "
+            f"삭제 {result['presence_pruned']}건"
+        ))
@@ -0,0 +1,80 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from devices.reclamation import run_reclamation
+
+
+class Command(BaseCommand):
+    help = '장기간 사용하지 않은 장치의 IP 예약 회수'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--apply',
+            action='store_true',
+            help='실제로 회수 (기본값: 드라이런)'
+        )
+        parser.add_argument(
+            '--inactive-days',
+            type=int,
+            help='마지막 접속 후 회수까지의 기간 (기본값: IP_RECLAMATION 설정)'
+        )
+        parser.add_argument(
+            '--never-seen-days',
+            type=int,
+            help='접속 기록 없는 장치의 회수 기간'
+        )
+        parser.add_argument(
+            '--min-band-utilization',
+            type=float,
+            help='사용률이 이 값 이상인 대역만 회수 (0~1)'
+        )
+        parser.add_argument(
+            '--limit',
+            type=int,
+            help='한 번에 회수할 최대 장치 수'
+        )
+        parser.add_argument(
+            '--report',
+            help='회수 보고서 저장 경로 (.json 또는 .csv)'
+        )
+
+    def handle(self, *args, **options):
+        report_path = options['report']
+        if report_path and not report_path.endswith(('.json', '.csv')):
+            raise CommandError('--report 파일은 .json 또는 .csv 확장자여야 합니다.')
+
+        report = run_reclamation(
+            apply=options['apply'],
+            INACTIVE_DAYS=options['inactive_days'],
+            NEVER_SEEN_DAYS=options['never_seen_days'],
+            MIN_BAND_UTILIZATION=options['min_band_utilization'],
+            MAX_PER_RUN=options['limit'],
+        )
+
+        self.stdout.write('대역별 사용량 (현재 → 회수 후):')
+        projected = report.projected_bands()
+        for band, usage in report.bands.items():
+            self.stdout.write(
+                f"  {band} ({usage['role']}): {usage['used']}/{usage['size']} → "
+                f"{projected[band]['used']}/{usage['size']}"
+            )
+        self.stdout.write(
+            f'점검 장치 {report.scanned}개, 접속 중 보호 {report.protected}개, '
+            f'회수 대상 {len(report.candidates)}개 (다음 실행으로 미룬 {report.deferred}개)'
+        )
+        for reason, count in report.summary().items():
+            self.stdout.write(f'  {reason}: {count}')
+
+        if report_path:
+            with open(report_path, 'w', encoding='utf-8') as f:
+                if report_path.endswith('.csv'):
+                    f.write(report.to_csv())
+                else:
+                    json.dump(report.to_dict(), f, ensure_ascii=False, indent=2, default=str)
+            self.stdout.write(f'보고서 저장: {report_path}')
+
+        if options['apply']:
+            self.stdout.write(self.style.SUCCESS(f'회수 완료: {report.applied}'))
+        elif report.candidates:
+            self.stdout.write(self.style.WARNING('회수하려면 --apply 옵션을 사용하세요.'))
@@ -0,0 +1,80 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from devices.reconciliation import CATEGORIES, run_reconciliation
+
+
+class Command(BaseCommand):
+    help = 'Device 테이블과 KEA 예약(hosts/dhcp4_options/lease4) 정합성 점검 및 수정'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--apply',
+            action='store_true',
+            help='차이를 실제로 수정 (기본값: 드라이런)'
+        )
+        parser.add_argument(
+            '--incremental',
+            action='store_true',
+            help='마지막 수정 실행 이후 변경된 장치만 점검'
+        )
+        parser.add_argument(
+            '--since',
+            help='증분 점검 기준 시각 (ISO 8601, 지정 시 --incremental 적용)'
+        )
+        parser.add_argument(
+            '--category',
+            action='append',
+            choices=CATEGORIES,
+            help='수정할 차이 유형 (여러 번 지정 가능, 기본값: 전체)'
+        )
+        parser.add_argument(
+            '--report',
+            help='드리프트 보고서 저장 경로 (.json 또는 .csv)'
+        )
+
+    def handle(self, *args, **options):
+        since = None
+        if options['since']:
+            since = parse_datetime(options['since'])
+            if since is None:
+                raise CommandError('--since는 ISO 8601 형식이어야 합니다.')
+            if timezone.is_naive(since):
+                since = timezone.make_aware(since)
+
+        report_path = options['report']
+        if report_path and not report_path.endswith(('.json', '.csv')):
+            raise CommandError('--report 파일은 .json 또는 .csv 확장자여야 합니다.')
+
+        report = run_reconciliation(
+            apply=options['apply'],
+            incremental=options['incremental'] or since is not None,
+            categories=options['category'],
+            since=since,
+        )
+
+        self.stdout.write(
+            f'점검 모드: {report.mode}, 장치 {report.device_count}개, KEA 예약 {report.host_count}개 '
+            f'({report.duration_ms:.0f}ms)'
+        )
+        for category, count in report.summary().items():
+            line = f'  {category}: {count}'
+            self.stdout.write(self.style.WARNING(line) if count else line)
+
+        if report_path:
+            with open(report_path, 'w', encoding='utf-8') as f:
+                if report_path.endswith('.csv'):
+                    f.write(report.to_csv())
+                else:
+                    json.dump(report.to_dict(), f, ensure_ascii=False, indent=2, default=str)
+            self.stdout.write(f'보고서 저장: {report_path}')
+
+        if not report.total:
+            self.stdout.write(self.style.SUCCESS('Device 테이블과 KEA 예약이 일치합니다.'))
+        elif options['apply']:
+            self.stdout.write(self.style.SUCCESS(f'수정 완료: {report.applied}'))
+        else:
+            self.stdout.write(self.style.WARNING(f'차이 {report.total}건 발견 (수정하려면 --apply 옵션을 사용하세요)'))
@@ -0,0 +1,31 @@
+# Generated by Django 5.1.6 on 2026-10-19 01:20
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('devices', '0006_delete_customdnsrecord_delete_customdnsrequest'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='devicehistory',
+            index=models.Index(fields=['created_at'], name='device_hist_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='devicehistory',
+            index=models.Index(fields=['user', 'created_at'], name='device_hist_user_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='devicehistory',
+            index=models.Index(fields=['mac_address'], name='device_hist_mac_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='devicehistory',
+            index=models.Index(fields=['assigned_ip'], name='device_hist_ip_idx'),
+        ),
+    ]
@@ -0,0 +1,62 @@
+# Generated by Django 5.1.6 on 2026-10-19 01:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('devices', '0007_history_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='KeaDhcp4Option',
+            fields=[
+                ('option_id', models.AutoField(primary_key=True, serialize=False)),
+                ('code', models.PositiveSmallIntegerField()),
+                ('value', models.BinaryField(null=True)),
+                ('formatted_value', models.TextField(null=True)),
+                ('space', models.CharField(max_length=128, null=True)),
+                ('persistent', models.BooleanField(default=True)),
+                ('scope_id', models.PositiveSmallIntegerField(default=3)),
+            ],
+            options={
+                'db_table': 'dhcp4_options',
+                'managed': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='KeaHost',
+            fields=[
+                ('host_id', models.AutoField(primary_key=True, serialize=False)),
+                ('dhcp_identifier', models.BinaryField(max_length=255)),
+                ('dhcp_identifier_type', models.PositiveSmallIntegerField(default=0)),
+                ('dhcp4_subnet_id', models.PositiveIntegerField(null=True)),
+                ('ipv4_address', models.PositiveIntegerField(null=True)),
+                ('hostname', models.CharField(max_length=255, null=True)),
+            ],
+            options={
+                'db_table': 'hosts',
+                'managed': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='KeaLease4',
+            fields=[
+                ('address', models.PositiveIntegerField(primary_key=True, serialize=False)),
+                ('hwaddr', models.BinaryField(max_length=20, null=True)),
+                ('client_id', models.BinaryField(max_length=255, null=True)),
+                ('valid_lifetime', models.PositiveIntegerField(null=True)),
+                ('expire', models.DateTimeField()),
+                ('subnet_id', models.PositiveIntegerField(null=True)),
+                ('hostname', models.CharField(max_length=255, null=True)),
+                ('state', models.PositiveIntegerField(default=0)),
+                ('user_context', models.TextField(null=True)),
+            ],
+            options={
+                'db_table': 'lease4',
+                'managed': False,
+            },
+        ),
+    ]
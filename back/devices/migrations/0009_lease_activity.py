@@ -0,0 +1,49 @@
+# Generated by Django 5.1.6 on 2026-10-19 01:36
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def move_last_access_to_updated_at(apps, schema_editor):
+    # 기존 last_access(auto_now)는 수정 시각이었으므로 updated_at으로 옮기고 비움
+    # (리스 활동 적재가 실제 접속 시각을 채우기 전까지는 접속 기록이 없는 장치로 봄)
+    Device = apps.get_model('devices', 'Device')
+    Device.objects.update(updated_at=models.F('last_access'))
+    Device.objects.update(last_access=None)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('devices', '0008_kea_tables'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='device',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, db_index=True),
+        ),
+        migrations.AlterField(
+            model_name='device',
+            name='last_access',
+            field=models.DateTimeField(blank=True, db_index=True, null=True),
+        ),
+        migrations.RunPython(move_last_access_to_updated_at, migrations.RunPython.noop),
+        migrations.CreateModel(
+            name='DevicePresence',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('hour_mask', models.PositiveIntegerField(default=0)),
+                ('first_seen', models.DateTimeField()),
+                ('last_seen', models.DateTimeField()),
+                ('device', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='presence', to='devices.device')),
+            ],
+            options={
+                'db_table': 'device_presence',
+                'indexes': [models.Index(fields=['date'], name='device_presence_date_idx')],
+                'unique_together': {('device', 'date')},
+            },
+        ),
+    ]
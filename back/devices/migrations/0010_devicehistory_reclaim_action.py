@@ -0,0 +1,18 @@
+# Generated by Django 5.1.6 on 2026-10-19 01:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('devices', '0009_lease_activity'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='devicehistory',
+            name='action',
+            field=models.CharField(choices=[('REGISTER', 'Register'), ('UNREGISTER', 'Unregister'), ('REASSIGN_IP_BLACKLIST', 'Reassign Ip Blacklist'), ('RECLAIM_IP', 'Reclaim Ip')], max_length=30),
+        ),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 5.1.6 on 2026-10-19 01:55
+
+from collections import defaultdict
+
+from django.db import migrations
+
+from core.mac import normalize_mac
+
+
+def normalize_device_macs(apps, schema_editor):
+    """
+    기존 장치 MAC을 표준 형식으로 변환
+
+    표준 형식이 같은 장치가 여러 개면 어느 장치를 남길지 정할 수 없으므로 겹치는 장치 목록을
+    보여주고 중단합니다 (중복 장치를 정리한 뒤 다시 migrate).
+    """
+    Device = apps.get_model('devices', 'Device')
+    groups = defaultdict(list)
+    for device in Device.objects.only('id', 'mac_address', 'user_id').order_by('id'):
+        groups[normalize_mac(device.mac_address)].append(device)
+
+    conflicts = {canonical: devices for canonical, devices in groups.items() if len(devices) > 1}
+    if conflicts:
+        lines = [
+            f"  {canonical}: " + ', '.join(
+                f"id={device.id} mac_address={device.mac_address!r} user_id={device.user_id}" for device in devices
+            )
+            for canonical, devices in sorted(conflicts.items())
+        ]
+        raise RuntimeError(
+            "표준 형식 MAC이 겹치는 장치가 있어 변환을 중단합니다. 장치마다 하나만 남기고 정리한 뒤 다시 실행하세요.\n"
+            + '\n'.join(lines)
+        )
+
+    changed = []
+    for canonical, (device,) in groups.items():
+        if device.mac_address != canonical:
+            device.mac_address = canonical
+            changed.append(device)
+    Device.objects.bulk_update(changed, ['mac_address'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('devices', '0010_devicehistory_reclaim_action'),
+    ]
+
+    operations = [
+        migrations.RunPython(normalize_device_macs, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,65 @@
+# Generated by Django 5.1.6 on 2026-10-19 02:33
+
+import ipaddress
+
+from django.db import migrations, models
+
+
+def fill_ranges(apps, schema_editor):
+    """기존 단일 IP 행을 [ip, ip] 구간으로 변환 (IPv4가 아닌 행은 할당에 쓰인 적이 없으므로 삭제)"""
+    BlacklistedIP = apps.get_model('devices', 'BlacklistedIP')
+    changed, invalid = [], []
+    for entry in BlacklistedIP.objects.only('id', 'ip_address'):
+        try:
+            address = int(ipaddress.IPv4Address(entry.ip_address))
+        except ValueError:
+            invalid.append(entry.id)
+            continue
+        entry.start_int = entry.end_int = address
+        changed.append(entry)
+    BlacklistedIP.objects.filter(id__in=invalid).delete()
+    BlacklistedIP.objects.bulk_update(changed, ['start_int', 'end_int'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('devices', '0011_normalize_device_mac'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='blacklistedip',
+            options={'ordering': ['start_int'], 'verbose_name': '블랙리스트 IP', 'verbose_name_plural': '블랙리스트 IP 목록'},
+        ),
+        migrations.AddField(
+            model_name='blacklistedip',
+            name='start_int',
+            field=models.PositiveIntegerField(null=True),
+        ),
+        migrations.AddField(
+            model_name='blacklistedip',
+            name='end_int',
+            field=models.PositiveIntegerField(null=True),
+        ),
+        migrations.RunPython(fill_ranges, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='blacklistedip',
+            name='start_int',
+            field=models.PositiveIntegerField(),
+        ),
+        migrations.AlterField(
+            model_name='blacklistedip',
+            name='end_int',
+            field=models.PositiveIntegerField(),
+        ),
+        migrations.AlterField(
+            model_name='blacklistedip',
+            name='ip_address',
+            field=models.GenericIPAddressField(),
+        ),
+        migrations.AddConstraint(
+            model_name='blacklistedip',
+            constraint=models.UniqueConstraint(fields=('start_int', 'end_int'), name='blacklisted_ip_range_unique'),
+        ),
+    ]
@@ -1,5 +1,11 @@
+from datetime import timedelta
+
+from django.core.exceptions import ValidationError
 from django.db import models
 from django.conf import settings
+from django.utils import timezone
+
+from core.mac import normalize_mac
 
 class Device(models.Model):
     mac_address = models.CharField(max_length=17, unique=True)
@@ -7,17 +13,68 @@ class Device(models.Model):
     assigned_ip = models.GenericIPAddressField(null=True)
     is_active = models.BooleanField(default=True)
     created_at = models.DateTimeField(auto_now_add=True)
-    last_access = models.DateTimeField(auto_now=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
+    # 마지막 실제 접속 시각 (KEA lease4 갱신 시각에서 적재, devices.lease_activity 참고)
+    last_access = models.DateTimeField(null=True, blank=True, db_index=True)
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='devices')
 
     class Meta:
         db_table = 'devices'
 
+    def validate_unique_mac(self):
+        """표준 형식 MAC이 다른 장치와 겹치면 ValidationError (DB의 IntegrityError 대신)"""
+        mac_address = normalize_mac(self.mac_address)
+        if Device.objects.filter(mac_address=mac_address).exclude(pk=self.pk).exists():
+            raise ValidationError({'mac_address': f"이미 등록된 MAC 주소입니다: {mac_address}"})
+
+    def clean(self):
+        super().clean()
+        if self.mac_address:
+            self.validate_unique_mac()
+            self.mac_address = normalize_mac(self.mac_address)
+
+    def save(self, *args, **kwargs):
+        # KEA 식별자와 같은 표준 형식으로 저장 (core.mac 참고)
+        if self.mac_address:
+            update_fields = kwargs.get('update_fields')
+            if update_fields is None or 'mac_address' in update_fields:
+                self.validate_unique_mac()
+            self.mac_address = normalize_mac(self.mac_address)
+        super().save(*args, **kwargs)
+
+    @property
+    def is_online(self):
+        """최근 ONLINE_WINDOW 초 안에 리스 갱신이 있었는지 여부"""
+        if self.last_access is None:
+            return False
+        window = settings.LEASE_ACTIVITY['ONLINE_WINDOW']
+        return self.last_access >= timezone.now() - timedelta(seconds=window)
+
+class DevicePresence(models.Model):
+    """장치별 일 단위 접속 기록 (시간대는 24비트 마스크로 저장)"""
+    device = models.ForeignKey(Device, on_delete=models.CASCADE, related_name='presence')
+    date = models.DateField()
+    hour_mask = models.PositiveIntegerField(default=0)  # bit n = n시에 접속
+    first_seen = models.DateTimeField()
+    last_seen = models.DateTimeField()
+
+    class Meta:
+        db_table = 'device_presence'
+        unique_together = ('device', 'date')
+        indexes = [
+            models.Index(fields=['date'], name='device_presence_date_idx'),
+        ]
+
+    @property
+    def hours(self):
+        return [hour for hour in range(24) if self.hour_mask & (1 << hour)]
+
 class DeviceHistory(models.Model):
     class Action(models.TextChoices):
         REGISTER = 'REGISTER'
         UNREGISTER = 'UNREGISTER'
         REASSIGN_IP_BLACKLIST = 'REASSIGN_IP_BLACKLIST'
+        RECLAIM_IP = 'RECLAIM_IP'
 
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, null=True)
     mac_address = models.CharField(max_length=255)
@@ -30,6 +87,12 @@ class DeviceHistory(models.Model):
 
     class Meta:
         db_table = 'device_histories'
+        indexes = [
+            models.Index(fields=['created_at'], name='device_hist_created_idx'),
+            models.Index(fields=['user', 'created_at'], name='device_hist_user_created_idx'),
+            models.Index(fields=['mac_address'], name='device_hist_mac_idx'),
+            models.Index(fields=['assigned_ip'], name='device_hist_ip_idx'),
+        ]
 
 # DeviceLease 모델은 사용하지 않으므로 주석 처리합니다.
 # class DeviceLease(models.Model):
@@ -44,7 +107,10 @@ class DeviceHistory(models.Model):
 #         db_table = 'device_leases'
 
 class BlacklistedIP(models.Model):
-    ip_address = models.GenericIPAddressField(unique=True)
+    """차단할 IPv4 구간 (단일 IP, CIDR, 범위 - devices.blacklist 참고)"""
+    ip_address = models.GenericIPAddressField()  # 구간의 첫 주소
+    start_int = models.PositiveIntegerField()  # INET_ATON 정수 (포함)
+    end_int = models.PositiveIntegerField()  # INET_ATON 정수 (포함)
     reason = models.CharField(max_length=255, null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -53,4 +119,69 @@ class BlacklistedIP(models.Model):
         db_table = 'blacklisted_ips'
         verbose_name = '블랙리스트 IP'
         verbose_name_plural = '블랙리스트 IP 목록'
+        ordering = ['start_int']
+        constraints = [
+            models.UniqueConstraint(fields=['start_int', 'end_int'], name='blacklisted_ip_range_unique'),
+        ]
+
+    @property
+    def label(self):
+        from .blacklist import format_ip_range
+        return format_ip_range(self.start_int, self.end_int)
+
 
+
+# ---------------------------------------------------------------------------
+# KEA DHCP 테이블 (kea DB, Django가 스키마를 관리하지 않음)
+# core.db_routers.KeaRouter가 이 모델들의 조회/쓰기를 'kea' alias로 보냅니다.
+# 여기서 사용하는 컬럼만 정의하며, 나머지 컬럼은 KEA 스키마 기본값을 따릅니다.
+# ---------------------------------------------------------------------------
+
+class KeaHost(models.Model):
+    """KEA hosts - MAC 기반 고정 IP 예약"""
+    host_id = models.AutoField(primary_key=True)
+    dhcp_identifier = models.BinaryField(max_length=255)
+    dhcp_identifier_type = models.PositiveSmallIntegerField(default=0)  # 0 = hw-address
+    dhcp4_subnet_id = models.PositiveIntegerField(null=True)
+    ipv4_address = models.PositiveIntegerField(null=True)  # INET_ATON 정수
+    hostname = models.CharField(max_length=255, null=True)
+
+    class Meta:
+        managed = False
+        db_table = 'hosts'
+
+
+class KeaDhcp4Option(models.Model):
+    """KEA dhcp4_options - 호스트별 DHCP 옵션 (게이트웨이, DNS, DHCP 서버)"""
+    option_id = models.AutoField(primary_key=True)
+    code = models.PositiveSmallIntegerField()
+    value = models.BinaryField(null=True)
+    formatted_value = models.TextField(null=True)
+    space = models.CharField(max_length=128, null=True)
+    persistent = models.BooleanField(default=True)
+    host = models.ForeignKey(
+        KeaHost, on_delete=models.DO_NOTHING, db_column='host_id',
+        db_constraint=False, null=True, related_name='options'
+    )
+    scope_id = models.PositiveSmallIntegerField(default=3)  # 3 = host
+
+    class Meta:
+        managed = False
+        db_table = 'dhcp4_options'
+
+
+class KeaLease4(models.Model):
+    """KEA lease4 - IPv4 리스"""
+    address = models.PositiveIntegerField(primary_key=True)  # INET_ATON 정수
+    hwaddr = models.BinaryField(max_length=20, null=True)
+    client_id = models.BinaryField(max_length=255, null=True)
+    valid_lifetime = models.PositiveIntegerField(null=True)
+    expire = models.DateTimeField()
+    subnet_id = models.PositiveIntegerField(null=True)
+    hostname = models.CharField(max_length=255, null=True)
+    state = models.PositiveIntegerField(default=0)  # 0 = default, 1 = declined, 2 = expired-reclaimed
+    user_context = models.TextField(null=True)
+
+    class Meta:
+        managed = False
+        db_table = 'lease4'
@@ -0,0 +1,268 @@
+"""
+장기 미사용 IP 예약 회수
+
+대역마다 할당 가능한 IP가 .20~.250뿐이라 졸업생이나 방치된 장치가 예약을 계속 잡고 있으면
+find_available_ip가 None을 반환합니다. 장치별 마지막 활동 시각을 다음 중 가장 최근 값으로 보고
+오래된 순서로 회수 대상을 고릅니다.
+
+- Device.last_access (KEA 리스 갱신 시각, devices.lease_activity)
+- 현재 유효한 lease4의 갱신 시각 (적재 주기 사이의 접속 보호)
+- DeviceHistory 마지막 기록 (등록, 재할당 등)
+- 장치 등록 시각
+
+회수하면 KEA 예약/옵션/리스를 묶음 삭제하고 장치를 IP 없는 비활성 상태로 바꿉니다.
+사용자가 장치를 다시 활성화하면 toggle_active가 새 IP를 배정합니다.
+"""
+import csv
+import io
+import logging
+import time
+from collections import Counter
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Max
+from django.utils import timezone
+
+from core.mac import normalize_mac
+from .captive import notify_devices_changed
+from .models import Device, DeviceHistory, KeaLease4
+from .utils.kea_client import KeaClient
+
+logger = logging.getLogger(__name__)
+
+REASONS = ('inactive_user', 'never_seen', 'inactive')
+BATCH_SIZE = 500
+
+
+def get_policy(**overrides):
+    """설정(IP_RECLAMATION)에 호출별 값을 덮어쓴 회수 정책"""
+    policy = dict(settings.IP_RECLAMATION)
+    policy.update({key: value for key, value in overrides.items() if value is not None})
+    return policy
+
+
+def pool_utilization():
+    """대역별 풀 사용량 (KEA 예약, 장치 할당, 블랙리스트 기준)"""
+    return KeaClient.band_usage(KeaClient.get_used_ips())
+
+
+class ReclamationReport:
+    """회수 대상 점검 결과"""
+
+    def __init__(self, policy, bands):
+        self.policy = policy
+        self.bands = bands
+        self.generated_at = timezone.now()
+        self.candidates = []
+        self.deferred = 0
+        self.protected = 0
+        self.scanned = 0
+        self.duration_ms = 0.0
+        self.applied = None
+
+    def projected_bands(self):
+        """회수 후 예상 대역별 사용량"""
+        released = Counter(candidate['band'] for candidate in self.candidates)
+        projected = {}
+        for band, usage in self.bands.items():
+            used = usage['used'] - released.get(band, 0)
+            projected[band] = {
+                **usage,
+                'used': used,
+                'free': usage['size'] - used,
+                'utilization': round(used / usage['size'], 4),
+            }
+        return projected
+
+    def summary(self):
+        counts = Counter(candidate['reason'] for candidate in self.candidates)
+        return {reason: counts.get(reason, 0) for reason in REASONS}
+
+    def to_dict(self, include_items=True):
+        data = {
+            'generated_at': self.generated_at.isoformat(),
+            'duration_ms': round(self.duration_ms, 1),
+            'policy': self.policy,
+            'scanned': self.scanned,
+            'protected': self.protected,
+            'total': len(self.candidates),
+            'deferred': self.deferred,
+            'summary': self.summary(),
+            'bands': self.bands,
+            'projected_bands': self.projected_bands(),
+            'applied': self.applied,
+        }
+        if include_items:
+            data['candidates'] = self.candidates
+        return data
+
+    def to_csv(self):
+        output = io.StringIO()
+        writer = csv.writer(output)
+        columns = ['reason', 'idle_days', 'device_id', 'mac_address', 'device_name', 'ip', 'band', 'username', 'last_activity']
+        writer.writerow(columns)
+        for candidate in self.candidates:
+            writer.writerow([candidate.get(column) for column in columns])
+        return output.getvalue()
+
+
+class IpReclaimer:
+    """활동 신호를 모아 회수 대상을 고르고 묶음으로 회수"""
+
+    def __init__(self, policy=None):
+        self.policy = policy or get_policy()
+
+    def _live_lease_activity(self):
+        """현재 유효한 실제 리스의 주소별 갱신 시각"""
+        rows = (
+            KeaLease4.objects.filter(state=0, expire__gt=timezone.now())
+            .exclude(valid_lifetime=KeaClient.RESERVATION_LEASE_LIFETIME)
+            .values_list('address', 'expire', 'valid_lifetime')
+        )
+        return {
+            KeaClient.int_to_ip(address): expire - timedelta(seconds=valid_lifetime or 0)
+            for address, expire, valid_lifetime in rows
+        }
+
+    def _last_history(self, macs):
+        """MAC별 마지막 DeviceHistory 시각"""
+        latest = {}
+        macs = list(macs)
+        for start in range(0, len(macs), BATCH_SIZE):
+            chunk = macs[start:start + BATCH_SIZE]
+            rows = (
+                DeviceHistory.objects.filter(mac_address__in=chunk + [mac.upper() for mac in chunk])
+                .values('mac_address').annotate(last=Max('created_at')).order_by()
+            )
+            for row in rows:
+                mac = normalize_mac(row['mac_address'])
+                if mac not in latest or row['last'] > latest[mac]:
+                    latest[mac] = row['last']
+        return latest
+
+    def _classify(self, device, idle_days):
+        policy = self.policy
+        if not device['user__is_active']:
+            return 'inactive_user' if idle_days >= policy['INACTIVE_USER_DAYS'] else None
+        if policy['EXEMPT_STAFF'] and (device['user__is_staff'] or device['user__is_superuser']):
+            return None
+        if device['last_access'] is None:
+            return 'never_seen' if idle_days >= policy['NEVER_SEEN_DAYS'] else None
+        return 'inactive' if idle_days >= policy['INACTIVE_DAYS'] else None
+
+    def check(self):
+        started = time.monotonic()
+        now = timezone.now()
+        bands = pool_utilization()
+        report = ReclamationReport(self.policy, bands)
+        pressured = {
+            band for band, usage in bands.items()
+            if usage['utilization'] >= self.policy['MIN_BAND_UTILIZATION']
+        }
+
+        devices = [
+            device for device in Device.objects.filter(is_active=True).exclude(assigned_ip=None).values(
+                'id', 'mac_address', 'device_name', 'assigned_ip', 'created_at', 'last_access', 'user_id',
+                'user__username', 'user__is_active', 'user__is_staff', 'user__is_superuser',
+            )
+            if KeaClient.band_of(device['assigned_ip']) in pressured
+        ]
+        report.scanned = len(devices)
+        live_leases = self._live_lease_activity()
+        last_history = self._last_history(normalize_mac(device['mac_address']) for device in devices)
+
+        candidates = []
+        for device in devices:
+            ip = device['assigned_ip']
+            if ip in live_leases:
+                # 지금 리스를 갖고 있는 장치는 회수하지 않음
+                report.protected += 1
+                continue
+            mac = normalize_mac(device['mac_address'])
+            signals = [device['created_at'], device['last_access'], last_history.get(mac)]
+            last_activity = max(signal for signal in signals if signal is not None)
+            idle_days = (now - last_activity).days
+            reason = self._classify(device, idle_days)
+            if reason is None:
+                continue
+            candidates.append({
+                'reason': reason,
+                'idle_days': idle_days,
+                'device_id': device['id'],
+                'mac_address': mac,
+                'device_name': device['device_name'],
+                'ip': ip,
+                'band': KeaClient.band_of(ip),
+                'user_id': device['user_id'],
+                'username': device['user__username'],
+                'last_access': device['last_access'].isoformat() if device['last_access'] else None,
+                'last_activity': last_activity.isoformat(),
+            })
+
+        # 비활성 사용자 장치를 먼저, 그다음 오래 쉰 순서
+        candidates.sort(key=lambda candidate: (candidate['reason'] != 'inactive_user', -candidate['idle_days']))
+        limit = self.policy['MAX_PER_RUN']
+        report.candidates = candidates[:limit]
+        report.deferred = max(len(candidates) - limit, 0)
+        report.duration_ms = (time.monotonic() - started) * 1000
+        return report
+
+    def apply(self, report):
+        """점검 결과의 대상 회수 (점검 이후 활동이 생긴 장치는 제외)"""
+        by_id = {candidate['device_id']: candidate for candidate in report.candidates}
+        confirmed = []
+        ids = list(by_id)
+        for start in range(0, len(ids), BATCH_SIZE):
+            rows = Device.objects.filter(
+                id__in=ids[start:start + BATCH_SIZE], is_active=True
+            ).values_list('id', 'assigned_ip', 'last_access')
+            for device_id, assigned_ip, last_access in rows:
+                candidate = by_id[device_id]
+                last_access = last_access.isoformat() if last_access else None
+                if assigned_ip == candidate['ip'] and last_access == candidate['last_access']:
+                    confirmed.append(candidate)
+
+        if not confirmed:
+            report.applied = {'reclaimed': 0, 'skipped': len(by_id)}
+            return report.applied
+
+        KeaClient.remove_many_from_kea(
+            [candidate['mac_address'] for candidate in confirmed],
+            [candidate['ip'] for candidate in confirmed],
+            batch_size=BATCH_SIZE,
+        )
+        now = timezone.now()
+        with transaction.atomic():
+            confirmed_ids = [candidate['device_id'] for candidate in confirmed]
+            for start in range(0, len(confirmed_ids), BATCH_SIZE):
+                Device.objects.filter(id__in=confirmed_ids[start:start + BATCH_SIZE]).update(
+                    is_active=False, assigned_ip=None, updated_at=now
+                )
+            DeviceHistory.objects.bulk_create([
+                DeviceHistory(
+                    user_id=candidate['user_id'],
+                    mac_address=candidate['mac_address'],
+                    device_name=candidate['device_name'],
+                    assigned_ip=candidate['ip'],
+                    action=DeviceHistory.Action.RECLAIM_IP,
+                    old_value={'ip': candidate['ip']},
+                    new_value={'reason': candidate['reason'], 'idle_days': candidate['idle_days']},
+                )
+                for candidate in confirmed
+            ], batch_size=BATCH_SIZE)
+        notify_devices_changed()
+
+        report.applied = {'reclaimed': len(confirmed), 'skipped': len(by_id) - len(confirmed)}
+        logger.info(f"IP 예약 회수 완료: {report.applied}")
+        return report.applied
+
+
+def run_reclamation(apply=False, **overrides):
+    """회수 점검 실행 (명령어, API, 스케줄러 공용)"""
+    reclaimer = IpReclaimer(get_policy(**overrides))
+    report = reclaimer.check()
+    if apply and report.candidates:
+        reclaimer.apply(report)
+    return report
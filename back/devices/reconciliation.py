@@ -0,0 +1,398 @@
+"""
+Device ↔ KEA 정합성 점검(reconciliation)
+
+양쪽 데이터를 한 번씩 메모리로 읽어 MAC/IP 기준 딕셔너리로 비교하므로
+장치 수에 비례하는 시간(O(n))으로 차이를 계산하고, 수정은 묶음(batch) 쓰기로 처리합니다.
+
+차이 유형
+- missing: IP가 할당된 장치인데 KEA 예약(hosts)이 없음
+- orphaned: 장치가 없거나(삭제됨) IP가 없는 MAC의 KEA 예약, 같은 MAC의 중복 예약
+- wrong_subnet: 예약 IP는 맞지만 서브넷 ID가 대역과 다름
+- wrong_ip: KEA 예약 IP가 장치의 assigned_ip와 다름
+- missing_options: 예약에 게이트웨이/DNS/DHCP 서버 옵션(3, 6, 54)이 없음
+- blacklisted: 블랙리스트 IP가 장치에 할당되어 있음 (수정 시 새 IP로 재할당)
+
+증분 모드는 마지막 실행 이후 변경/삭제된 장치의 MAC만 점검합니다.
+"""
+import csv
+import io
+import logging
+import time
+from collections import defaultdict
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from core.db_routers import KEA_DATABASE
+from core.mac import normalize_mac
+from .blacklist import blacklist_index
+from .captive import notify_devices_changed
+from .models import Device, DeviceHistory, KeaDhcp4Option, KeaHost, KeaLease4
+from .utils.kea_client import KeaClient
+
+logger = logging.getLogger(__name__)
+
+CATEGORIES = ('missing', 'orphaned', 'wrong_subnet', 'wrong_ip', 'missing_options', 'blacklisted')
+REQUIRED_OPTION_CODES = frozenset({3, 6, 54})
+# 증분 점검 기준 시각 - 점검만 하는 실행과 수정까지 하는 실행을 따로 관리
+WATERMARK_CACHE_KEYS = {
+    'check': 'kea_reconcile:watermark:check',
+    'apply': 'kea_reconcile:watermark',
+}
+LAST_REPORT_CACHE_KEY = 'kea_reconcile:last_report'
+BATCH_SIZE = 500
+
+
+def _chunks(items, size=BATCH_SIZE):
+    items = list(items)
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+class DriftReport:
+    """정합성 점검 결과"""
+
+    def __init__(self, mode, scope_size=None):
+        self.mode = mode
+        self.scope_size = scope_size
+        self.generated_at = timezone.now()
+        self.items = {category: [] for category in CATEGORIES}
+        self.device_count = 0
+        self.host_count = 0
+        self.duration_ms = 0.0
+        self.applied = None
+
+    def add(self, category, **item):
+        self.items[category].append(item)
+
+    @property
+    def total(self):
+        return sum(len(items) for items in self.items.values())
+
+    def summary(self):
+        return {category: len(items) for category, items in self.items.items()}
+
+    def to_dict(self, include_items=True):
+        data = {
+            'mode': self.mode,
+            'generated_at': self.generated_at.isoformat(),
+            'duration_ms': round(self.duration_ms, 1),
+            'devices': self.device_count,
+            'kea_hosts': self.host_count,
+            'scope': self.scope_size,
+            'total': self.total,
+            'summary': self.summary(),
+            'applied': self.applied,
+        }
+        if include_items:
+            data['items'] = self.items
+        return data
+
+    def to_csv(self):
+        output = io.StringIO()
+        writer = csv.writer(output)
+        writer.writerow(['category', 'mac_address', 'device_id', 'device_ip', 'kea_ip', 'kea_subnet_id', 'expected_subnet_id', 'host_id'])
+        for category, items in self.items.items():
+            for item in items:
+                writer.writerow([
+                    category, item.get('mac_address'), item.get('device_id'), item.get('device_ip'),
+                    item.get('kea_ip'), item.get('kea_subnet_id'), item.get('expected_subnet_id'), item.get('host_id'),
+                ])
+        return output.getvalue()
+
+
+class KeaReconciler:
+    """Device 테이블과 KEA hosts/dhcp4_options/lease4 비교 및 수정"""
+
+    def __init__(self, incremental=False, since=None):
+        self.incremental = incremental
+        self.since = since
+
+    # ------------------------------------------------------------------
+    # 적재
+    # ------------------------------------------------------------------
+
+    def _scope_macs(self):
+        """증분 모드: since 이후 수정된 장치와 등록 해제 이력의 MAC"""
+        changed = Device.objects.filter(updated_at__gte=self.since).values_list('mac_address', flat=True)
+        removed = DeviceHistory.objects.filter(
+            created_at__gte=self.since, action=DeviceHistory.Action.UNREGISTER
+        ).values_list('mac_address', flat=True)
+        return {normalize_mac(mac) for mac in list(changed) + list(removed)}
+
+    def _load_devices(self, scope):
+        queryset = Device.objects.values_list('id', 'mac_address', 'assigned_ip', 'user__is_staff')
+        if scope is not None:
+            # MAC 대소문자 표기가 섞여 있을 수 있으므로 원본 표기 그대로도 함께 조회
+            queryset = queryset.filter(mac_address__in=scope | {mac.upper() for mac in scope})
+        return {
+            normalize_mac(mac): {'id': device_id, 'ip': ip, 'is_staff': is_staff}
+            for device_id, mac, ip, is_staff in queryset.iterator(chunk_size=2000)
+        }
+
+    def _load_hosts(self, scope):
+        temp_start, temp_end = KeaClient.temporary_range()
+        queryset = KeaHost.objects.filter(dhcp_identifier_type=0).filter(
+            Q(dhcp4_subnet_id__in=KeaClient.MANAGED_SUBNET_IDS)
+            | Q(ipv4_address__gte=temp_start, ipv4_address__lte=temp_end)
+        ).values_list('host_id', 'dhcp_identifier', 'dhcp4_subnet_id', 'ipv4_address')
+
+        if scope is None:
+            rows = queryset.iterator(chunk_size=2000)
+        else:
+            rows = []
+            for chunk in _chunks(scope):
+                rows.extend(queryset.filter(dhcp_identifier__in=[KeaClient.mac_to_bytes(mac) for mac in chunk]))
+
+        hosts = defaultdict(list)
+        for host_id, identifier, subnet_id, address in rows:
+            hosts[KeaClient.bytes_to_mac(identifier)].append({
+                'host_id': host_id,
+                'subnet_id': subnet_id,
+                'ip': KeaClient.int_to_ip(address) if address is not None else None,
+            })
+        return hosts
+
+    def _load_option_codes(self, host_ids, scope):
+        codes = defaultdict(set)
+        if scope is None:
+            rows = KeaDhcp4Option.objects.filter(host_id__isnull=False).values_list('host_id', 'code').iterator(chunk_size=5000)
+        else:
+            rows = []
+            for chunk in _chunks(host_ids):
+                rows.extend(KeaDhcp4Option.objects.filter(host_id__in=chunk).values_list('host_id', 'code'))
+        for host_id, code in rows:
+            codes[host_id].add(code)
+        return codes
+
+    # ------------------------------------------------------------------
+    # 비교
+    # ------------------------------------------------------------------
+
+    def check(self):
+        """차이 계산 (DB 쓰기 없음)"""
+        started = time.perf_counter()
+        scope = None
+        if self.incremental and self.since is not None:
+            scope = self._scope_macs()
+        report = DriftReport('incremental' if scope is not None else 'full', len(scope) if scope is not None else None)
+
+        devices = self._load_devices(scope)
+        hosts = self._load_hosts(scope)
+        option_codes = self._load_option_codes(
+            [host['host_id'] for entries in hosts.values() for host in entries], scope
+        )
+        blacklist = blacklist_index()
+        report.device_count = len(devices)
+        report.host_count = sum(len(entries) for entries in hosts.values())
+
+        for mac, device in devices.items():
+            ip = device['ip']
+            if not ip:
+                continue
+            expected_subnet = KeaClient.subnet_id_for_ip(ip)
+            base = {'mac_address': mac, 'device_id': device['id'], 'device_ip': ip, 'expected_subnet_id': expected_subnet}
+
+            if blacklist.contains(ip):
+                report.add('blacklisted', **base, is_staff=device['is_staff'])
+
+            entries = hosts.get(mac)
+            if not entries:
+                report.add('missing', **base)
+                continue
+
+            primary = next((host for host in entries if host['ip'] == ip), entries[0])
+            for host in entries:
+                if host is not primary:
+                    report.add('orphaned', **base, kea_ip=host['ip'], kea_subnet_id=host['subnet_id'],
+                               host_id=host['host_id'], reason='duplicate')
+
+            found = {**base, 'kea_ip': primary['ip'], 'kea_subnet_id': primary['subnet_id'], 'host_id': primary['host_id']}
+            if primary['ip'] != ip:
+                report.add('wrong_ip', **found)
+                continue
+            if primary['subnet_id'] != expected_subnet:
+                report.add('wrong_subnet', **found)
+            if not REQUIRED_OPTION_CODES <= option_codes.get(primary['host_id'], set()):
+                report.add('missing_options', **found)
+
+        for mac, entries in hosts.items():
+            device = devices.get(mac)
+            if device is not None and device['ip']:
+                continue
+            for host in entries:
+                report.add('orphaned', mac_address=mac, device_id=device['id'] if device else None,
+                           kea_ip=host['ip'], kea_subnet_id=host['subnet_id'], host_id=host['host_id'],
+                           reason='no_device' if device is None else 'device_without_ip')
+
+        report.duration_ms = (time.perf_counter() - started) * 1000
+        return report
+
+    # ------------------------------------------------------------------
+    # 수정
+    # ------------------------------------------------------------------
+
+    def _reassign_blacklisted(self, items):
+        """블랙리스트 IP를 가진 장치에 새 IP를 배정 (Device 갱신 + 이력, apply()의 트랜잭션 안에서 호출)"""
+        if not items:
+            return []
+        used = set(Device.objects.exclude(assigned_ip=None).values_list('assigned_ip', flat=True))
+        used.update(KeaClient.get_kea_used_ips())
+
+        candidates = {
+            is_student: KeaClient.iter_available_ips(used, is_student=is_student)
+            for is_student in (True, False)
+        }
+        devices = Device.objects.in_bulk([item['device_id'] for item in items])
+        updated, histories, reassigned = [], [], []
+        for item in items:
+            device = devices.get(item['device_id'])
+            if device is None:
+                continue
+            new_ip = next(candidates[not item.get('is_staff')], None)
+            if new_ip is None:
+                logger.error(f"블랙리스트 IP 재할당 실패 (사용 가능한 IP 없음): {device.mac_address}")
+                continue
+            used.add(new_ip)
+            histories.append(DeviceHistory(
+                user_id=device.user_id, mac_address=device.mac_address, device_name=device.device_name,
+                assigned_ip=new_ip, action=DeviceHistory.Action.REASSIGN_IP_BLACKLIST,
+                old_value={'ip': device.assigned_ip}, new_value={'ip': new_ip},
+            ))
+            device.assigned_ip = new_ip
+            updated.append(device)
+            reassigned.append({**item, 'device_ip': new_ip, 'expected_subnet_id': KeaClient.subnet_id_for_ip(new_ip)})
+
+        # updated_at(auto_now)은 bulk_update에서 갱신되지 않으므로 명시적으로 지정
+        now = timezone.now()
+        for device in updated:
+            device.updated_at = now
+        Device.objects.bulk_update(updated, ['assigned_ip', 'updated_at'], batch_size=BATCH_SIZE)
+        DeviceHistory.objects.bulk_create(histories, batch_size=BATCH_SIZE)
+        if updated:
+            # bulk_update는 post_save 시그널을 보내지 않음
+            transaction.on_commit(notify_devices_changed)
+        return reassigned
+
+    def _create_reservations(self, items, device_names):
+        """hosts, dhcp4_options, lease4 묶음 생성"""
+        KeaClient.bulk_create_reservations(
+            [(item['mac_address'], item['device_ip'], device_names.get(item['device_id'])) for item in items],
+            batch_size=BATCH_SIZE,
+        )
+
+    def apply(self, report, categories=None):
+        """
+        점검 결과를 KEA에 반영
+
+        Args:
+            report: check()의 결과
+            categories: 수정할 유형 목록 (None이면 전체)
+
+        Returns:
+            유형별 수정 건수
+        """
+        categories = set(categories or CATEGORIES)
+        items = {category: (report.items[category] if category in categories else []) for category in CATEGORIES}
+
+        # Device 재할당과 KEA 수정을 한 실패 경로로 묶음: KEA 쓰기가 실패하면 Device 변경도 롤백
+        with transaction.atomic():
+            # 블랙리스트 IP 장치는 Device에 새 IP를 배정한 뒤 IP 불일치와 같은 방식으로 다시 예약
+            reassigned = self._reassign_blacklisted(items['blacklisted'])
+            reassigned_macs = {item['mac_address'] for item in reassigned}
+
+            recreate = [item for item in items['missing'] if item['mac_address'] not in reassigned_macs]
+            recreate += [item for item in items['wrong_ip'] if item['mac_address'] not in reassigned_macs]
+            recreate += reassigned
+
+            remove_host_ids = {item['host_id'] for item in items['orphaned']}
+            remove_host_ids |= {item['host_id'] for item in items['wrong_ip']}
+            remove_addresses = {
+                KeaClient.ip_to_int(item['kea_ip'])
+                for item in items['orphaned'] + items['wrong_ip'] if item.get('kea_ip')
+            }
+            # 재할당된 장치의 기존(블랙리스트 IP) 예약과 리스도 제거
+            for chunk in _chunks(reassigned_macs):
+                remove_host_ids |= set(KeaHost.objects.filter(
+                    dhcp_identifier__in=[KeaClient.mac_to_bytes(mac) for mac in chunk],
+                    dhcp4_subnet_id__in=KeaClient.MANAGED_SUBNET_IDS
+                ).values_list('host_id', flat=True))
+            remove_addresses |= {
+                KeaClient.ip_to_int(item['device_ip'])
+                for item in items['blacklisted'] if item['mac_address'] in reassigned_macs
+            }
+            recreate_macs = {item['mac_address'] for item in recreate}
+
+            wrong_subnet = [item for item in items['wrong_subnet'] if item['mac_address'] not in reassigned_macs]
+            missing_options = [item for item in items['missing_options'] if item['mac_address'] not in reassigned_macs]
+            device_names = dict(Device.objects.filter(
+                id__in=[item['device_id'] for item in recreate]
+            ).values_list('id', 'device_name'))
+
+            with transaction.atomic(using=KEA_DATABASE):
+                for chunk in _chunks(remove_host_ids):
+                    KeaDhcp4Option.objects.filter(host_id__in=chunk).delete()
+                    KeaHost.objects.filter(host_id__in=chunk).delete()
+                for chunk in _chunks(remove_addresses):
+                    KeaLease4.objects.filter(address__in=chunk).delete()
+                for chunk in _chunks(recreate_macs):
+                    KeaLease4.objects.filter(
+                        hwaddr__in=[KeaClient.mac_to_bytes(mac) for mac in chunk],
+                        subnet_id__in=KeaClient.MANAGED_SUBNET_IDS
+                    ).delete()
+
+                self._create_reservations(recreate, device_names)
+
+                by_subnet = defaultdict(list)
+                for item in wrong_subnet:
+                    by_subnet[item['expected_subnet_id']].append(item)
+                for subnet_id, subnet_items in by_subnet.items():
+                    for chunk in _chunks(subnet_items):
+                        KeaHost.objects.filter(host_id__in=[item['host_id'] for item in chunk]).update(dhcp4_subnet_id=subnet_id)
+                        KeaLease4.objects.filter(
+                            address__in=[KeaClient.ip_to_int(item['device_ip']) for item in chunk]
+                        ).update(subnet_id=subnet_id)
+
+                for chunk in _chunks(missing_options):
+                    KeaDhcp4Option.objects.filter(host_id__in=[item['host_id'] for item in chunk]).delete()
+                    options = []
+                    for item in chunk:
+                        for option in KeaClient.build_host_options(item['device_ip']):
+                            option.host_id = item['host_id']
+                            options.append(option)
+                    KeaDhcp4Option.objects.bulk_create(options, batch_size=BATCH_SIZE)
+
+        applied = {
+            'missing': len([item for item in items['missing'] if item['mac_address'] not in reassigned_macs]),
+            'orphaned': len(items['orphaned']),
+            'wrong_subnet': len(wrong_subnet),
+            'wrong_ip': len([item for item in items['wrong_ip'] if item['mac_address'] not in reassigned_macs]),
+            'missing_options': len(missing_options),
+            'blacklisted': len(reassigned),
+        }
+        report.applied = applied
+        logger.info(f"KEA 정합성 수정 완료: {applied}")
+        return applied
+
+
+def run_reconciliation(apply=False, incremental=False, categories=None, since=None):
+    """
+    정합성 점검 실행 (명령어, API, 스케줄러 공용)
+
+    증분 모드에서 since가 없으면 같은 종류(점검만/수정까지)의 마지막 실행 시각(캐시)을 사용하고,
+    기록이 없으면 전체 점검합니다. 점검만 하는 실행은 점검을 마치면, 수정까지 하는 실행은
+    수정을 마쳐야 기준 시각을 앞으로 옮기므로 수정 실패 시 다음 수정 실행이 같은 범위를 다시 봅니다.
+    """
+    started_at = timezone.now()
+    watermark_key = WATERMARK_CACHE_KEYS['apply' if apply else 'check']
+    if incremental and since is None:
+        since = cache.get(watermark_key)
+    reconciler = KeaReconciler(incremental=incremental, since=since)
+    report = reconciler.check()
+    if apply and report.total:
+        reconciler.apply(report, categories)
+    cache.set(watermark_key, started_at, None)
+    cache.set(LAST_REPORT_CACHE_KEY, report.to_dict(include_items=False), None)
+    return report
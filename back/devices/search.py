@@ -0,0 +1,24 @@
+"""
+장치 검색 인덱스 (core.search)
+
+MAC 주소(콜론 포함/제외), 장치 이름, 할당 IP, 소유자 아이디/이름에서 부분 문자열로 찾습니다.
+"""
+from core.mac import mac_digits
+from core.search import SearchIndex
+
+from .models import Device
+
+
+def load_devices(ids):
+    queryset = Device.objects.all() if ids is None else Device.objects.filter(pk__in=ids)
+    rows = queryset.values_list(
+        'id', 'mac_address', 'device_name', 'assigned_ip', 'user__username', 'user__first_name', 'user__last_name',
+    )
+    for pk, mac_address, device_name, assigned_ip, username, first_name, last_name in rows.iterator(chunk_size=2000):
+        yield pk, pk, (
+            mac_address, mac_digits(mac_address), device_name, assigned_ip,
+            username, f"{last_name}{first_name}", last_name, first_name,
+        )
+
+
+device_search_index = SearchIndex('devices', load_devices, weights=(3, 3, 2, 3, 2, 2, 1, 1))
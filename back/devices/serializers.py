@@ -1,6 +1,8 @@
 from rest_framework import serializers
-from .models import Device, DeviceHistory
+from .models import Device, DeviceHistory, DevicePresence
 from django.contrib.auth import get_user_model
+from core.mac import normalize_mac
+from core.serializers import ValuesSerializer
 
 User = get_user_model()
 
@@ -53,16 +55,19 @@ class DeviceHistorySerializer(serializers.ModelSerializer):
             return f"{obj.device_name} 기기가 삭제되었습니다."
         elif obj.action == 'REASSIGN_IP_BLACKLIST':
             return f"{obj.device_name} 기기의 IP가 블랙리스트로 인해 {obj.assigned_ip}로 변경되었습니다."
+        elif obj.action == 'RECLAIM_IP':
+            return f"{obj.device_name} 기기가 장기간 사용되지 않아 IP {obj.assigned_ip}가 회수되었습니다."
         return f"{obj.device_name} 기기가 업데이트되었습니다."
 
 class DeviceDetailSerializer(serializers.ModelSerializer):
     history = DeviceHistorySerializer(many=True, read_only=True)
     username = serializers.SerializerMethodField()
+    is_online = serializers.ReadOnlyField()
     
     class Meta:
         model = Device
         fields = ['id', 'mac_address', 'device_name', 'assigned_ip', 
-                 'is_active', 'last_access', 'created_at', 'history',
+                 'is_active', 'is_online', 'last_access', 'created_at', 'history',
                  'user', 'username']
                  
     def get_username(self, obj):
@@ -72,10 +77,11 @@ class DeviceSerializer(serializers.ModelSerializer):
     username = serializers.SerializerMethodField()
     user_full_name = serializers.SerializerMethodField()
     dns_info = serializers.SerializerMethodField()
+    is_online = serializers.ReadOnlyField()
     
     class Meta:
         model = Device
-        fields = ['id', 'mac_address', 'device_name', 'assigned_ip', 'is_active', 'created_at', 'last_access', 'user', 'username', 'user_full_name', 'dns_info']
+        fields = ['id', 'mac_address', 'device_name', 'assigned_ip', 'is_active', 'is_online', 'created_at', 'last_access', 'user', 'username', 'user_full_name', 'dns_info']
         read_only_fields = ['user', 'username', 'user_full_name', 'last_access', 'is_active', 'created_at', 'dns_info']
         extra_kwargs = {
             'assigned_ip': {'required': False},  # IP 주소를 선택적으로 설정
@@ -88,6 +94,16 @@ class DeviceSerializer(serializers.ModelSerializer):
         logger = logging.getLogger(__name__)
         logger.info(f"DeviceSerializer validate 호출됨: 데이터={data}")
         return data
+
+    def validate_mac_address(self, value):
+        # 대소문자/구분자만 다른 MAC도 같은 장치로 보고 중복 검사 (Device.save의 표준 형식과 같음)
+        mac_address = normalize_mac(value)
+        devices = Device.objects.filter(mac_address=mac_address)
+        if self.instance is not None:
+            devices = devices.exclude(pk=self.instance.pk)
+        if devices.exists():
+            raise serializers.ValidationError("이미 등록된 MAC 주소입니다.")
+        return mac_address
         
     def get_username(self, obj):
         return obj.user.username if obj.user else None
@@ -102,4 +118,31 @@ class DeviceSerializer(serializers.ModelSerializer):
     def get_dns_info(self, obj):
         """해당 IP의 DNS 정보를 반환"""
         from dns.utils import get_dns_info_for_device
-        return get_dns_info_for_device(obj) 
\ No newline at end of file
+        return get_dns_info_for_device(obj) 
+
+class DevicePresenceSerializer(serializers.ModelSerializer):
+    hours = serializers.ReadOnlyField()
+
+    class Meta:
+        model = DevicePresence
+        fields = ['date', 'hours', 'first_seen', 'last_seen']
+
+
+class DeviceRentalValuesSerializer(ValuesSerializer):
+    """IP 대여 내역 목록 (get_ip_rentals) values-mode 직렬화"""
+    model = Device
+    columns = ('id', 'device_name', 'mac_address', 'assigned_ip', 'user__username', 'created_at', 'last_access', 'is_active')
+    # 기존 응답은 시리얼라이저 없이 DB 값을 그대로 반환했으므로 시간대 변환 없음
+    raw_columns = ('created_at', 'last_access')
+
+    def to_representation(self, row):
+        return {
+            'id': row['id'],
+            'device_name': row['device_name'],
+            'mac_address': row['mac_address'],
+            'assigned_ip': row['assigned_ip'],
+            'username': row['user__username'],
+            'created_at': row['created_at'],
+            'last_access': row['last_access'],
+            'is_active': row['is_active'],
+        }
@@ -0,0 +1,37 @@
+"""
+장치 관련 시그널
+- 장치 저장/삭제 시 캡티브 판정용 등록 IP 집합 갱신 알림
+- 장치나 소유자 정보가 바뀌면 장치 검색 인덱스 갱신
+- 블랙리스트 IP 변경 시 블랙리스트 응답 캐시와 구간 인덱스 무효화
+"""
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from core.response_cache import mark_changed
+from users.search import indexed_fields_updated
+from .blacklist import notify_blacklist_changed
+from .captive import notify_devices_changed
+from .models import BlacklistedIP, Device
+from .search import device_search_index
+
+
+@receiver(post_save, sender=Device)
+@receiver(post_delete, sender=Device)
+def device_changed(sender, instance, **kwargs):
+    notify_devices_changed()
+    device_search_index.mark_changed([instance.pk])
+
+
+@receiver(post_save, sender=get_user_model())
+def device_owner_changed(sender, instance, created, update_fields=None, **kwargs):
+    if created or not indexed_fields_updated(update_fields):
+        return
+    device_search_index.mark_changed(Device.objects.filter(user_id=instance.pk).values_list('id', flat=True))
+
+
+@receiver(post_save, sender=BlacklistedIP)
+@receiver(post_delete, sender=BlacklistedIP)
+def blacklist_changed(sender, instance, **kwargs):
+    mark_changed('blacklist')
+    notify_blacklist_changed()
@@ -1,11 +1,10 @@
 from django.urls import path
-from .views import DeviceViewSet
+from .views import DeviceViewSet, ip_pool_utilization, reclaim_ips, reconcile_kea
 
 # URL 패턴 (일반 사용자 기능만)
 urlpatterns = [
     # 특정 액션들을 먼저 정의 (더 구체적인 패턴)
     path('register-manual/', DeviceViewSet.as_view({'post': 'register_manual'}), name='register-manual'),
-    path('current-mac/', DeviceViewSet.as_view({'get': 'get_current_mac'}), name='current-mac'),
     path('my/', DeviceViewSet.as_view({'get': 'my'}), name='my-devices'),
     path('user/rentals/', DeviceViewSet.as_view({'get': 'user_rentals'}), name='user-rentals'),
     path('user/equipment-rentals/', DeviceViewSet.as_view({'get': 'user_equipment_rentals'}), name='user-equipment-rentals'),
@@ -13,6 +12,13 @@ urlpatterns = [
     # 블랙리스트 관련 URL 패턴 (관리자 전용)
     path('admin/ip/blacklist/', DeviceViewSet.as_view({'post': 'blacklist_ip', 'get': 'blacklisted_ips'}), name='blacklist-ip'),
     path('admin/ip/unblacklist/', DeviceViewSet.as_view({'post': 'unblacklist_ip'}), name='unblacklist-ip'),
+
+    # Device ↔ KEA 정합성 점검 (관리자 전용)
+    path('admin/kea/reconcile/', reconcile_kea, name='kea-reconcile'),
+
+    # IP 풀 사용량 및 장기 미사용 예약 회수 (관리자 전용)
+    path('admin/pool/', ip_pool_utilization, name='ip-pool-utilization'),
+    path('admin/reclaim/', reclaim_ips, name='ip-reclaim'),
     
     # 기본 CRUD 작업용 URL 패턴 (마지막에 배치)
     path('', DeviceViewSet.as_view({'get': 'list', 'post': 'create'}), name='device-list'),
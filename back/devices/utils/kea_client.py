@@ -1,9 +1,13 @@
 import re
 import logging
-import mysql.connector
-from django.conf import settings
-from datetime import datetime, timedelta
-from devices.models import BlacklistedIP
+from datetime import timedelta
+from django.db import DatabaseError, transaction
+from django.db.models import Count, Q
+from django.utils import timezone
+from core.db_routers import KEA_DATABASE
+from core.mac import mac_digits
+from devices.blacklist import blacklist_index, format_ip_range, parse_ip_range
+from devices.models import BlacklistedIP, KeaDhcp4Option, KeaHost, KeaLease4
 
 logger = logging.getLogger(__name__)
 
@@ -13,16 +17,21 @@ class KeaClient:
     # 대역 설정
     STUDENT_BANDS = ["10.129.57.", "10.129.58.", "10.129.59."]  # 학생 대역 리스트
     TEACHER_BANDS = ["10.129.50."]  # 교사 대역 리스트
+    BAND_HOST_START = 20  # 대역별 할당 범위 (20 ~ 250)
+    BAND_HOST_END = 250
     
-    @staticmethod
-    def get_kea_db_config():
-        """KEA 데이터베이스 설정 가져오기"""
-        return {
-            "host": settings.DATABASES['kea']['HOST'],
-            "user": settings.DATABASES['kea']['USER'],
-            "password": settings.DATABASES['kea']['PASSWORD'],
-            "database": settings.DATABASES['kea']['NAME']
-        }
+    # KEA 서브넷 ID (교사 3, 학생 4)
+    TEACHER_SUBNET_ID = 3
+    STUDENT_SUBNET_ID = 4
+    MANAGED_SUBNET_IDS = (TEACHER_SUBNET_ID, STUDENT_SUBNET_ID)
+    
+    # 임시 IP 대역 (인터넷 접속 불가, 10.250.0.0/16)
+    TEMPORARY_NETWORK_START = "10.250.0.0"
+    TEMPORARY_NETWORK_END = "10.250.255.255"
+    
+    # 직접 기록하는 lease4 유효 시간 (초, KEA가 갱신하면 서브넷 설정값으로 바뀜)
+    RESERVATION_LEASE_LIFETIME = 8640000  # 100일
+    TEMPORARY_LEASE_LIFETIME = 300  # 5분
     
     @staticmethod
     def ip_to_int(ip_address):
@@ -30,442 +39,451 @@ class KeaClient:
         ip_parts = ip_address.split('.')
         return (int(ip_parts[0]) << 24) + (int(ip_parts[1]) << 16) + (int(ip_parts[2]) << 8) + int(ip_parts[3])
     
+    @staticmethod
+    def int_to_ip(value):
+        """정수를 IP 주소로 변환 (INET_NTOA)"""
+        return f"{(value >> 24) & 0xff}.{(value >> 16) & 0xff}.{(value >> 8) & 0xff}.{value & 0xff}"
+    
     @staticmethod
     def mac_without_colons(mac_address):
-        """MAC 주소 형식 변환 (콜론 제거)"""
-        return mac_address.replace(':', '')
+        """MAC 주소 형식 변환 (구분자 제거, 소문자 16진수 12자리)"""
+        digits = mac_digits(mac_address)
+        if digits is None:
+            raise ValueError(f"유효하지 않은 MAC 주소: {mac_address}")
+        return digits
+    
+    @classmethod
+    def mac_to_bytes(cls, mac_address):
+        """MAC 주소를 KEA 바이너리 식별자로 변환 (UNHEX)"""
+        return bytes.fromhex(cls.mac_without_colons(mac_address))
+    
+    @staticmethod
+    def bytes_to_mac(value):
+        """KEA 바이너리 식별자를 표준 형식(소문자 콜론 구분) MAC 주소로 변환"""
+        return ':'.join(f'{byte:02x}' for byte in bytes(value))
+    
+    @classmethod
+    def subnet_id_for_ip(cls, ip_address):
+        """IP 대역에 맞는 KEA 서브넷 ID (학생 4, 그 외 3)"""
+        if any(ip_address.startswith(band) for band in cls.STUDENT_BANDS):
+            return cls.STUDENT_SUBNET_ID
+        return cls.TEACHER_SUBNET_ID
+    
+    @classmethod
+    def temporary_range(cls):
+        return cls.ip_to_int(cls.TEMPORARY_NETWORK_START), cls.ip_to_int(cls.TEMPORARY_NETWORK_END)
     
     @classmethod
     def get_kea_used_ips(cls):
         """KEA DHCP 서버에서 사용 중인 IP 주소 가져오기"""
         kea_used_ips = []
         try:
-            # KEA 데이터베이스 연결
-            conn = mysql.connector.connect(**cls.get_kea_db_config())
-            cursor = conn.cursor(dictionary=True)
-            
             # hosts 테이블에서 할당된 IP 주소 조회 (subnet_id = 3, 4)
-            query = """
-                SELECT INET_NTOA(ipv4_address) as ip_address
-                FROM hosts
-                WHERE dhcp4_subnet_id IN (3, 4)
-            """
-            
-            cursor.execute(query)
-            results = cursor.fetchall()
-            
-            for result in results:
-                if result['ip_address']:
-                    kea_used_ips.append(result['ip_address'])
-                    
-            cursor.close()
-            conn.close()
-            
+            addresses = KeaHost.objects.filter(
+                dhcp4_subnet_id__in=cls.MANAGED_SUBNET_IDS, ipv4_address__isnull=False
+            ).values_list('ipv4_address', flat=True)
+            kea_used_ips = [cls.int_to_ip(address) for address in addresses]
         except Exception as e:
             logger.error(f"KEA 데이터베이스 조회 중 오류 발생: {e}")
         
         return kea_used_ips
     
+    @classmethod
+    def iter_pool_ips(cls, is_student=False):
+        """학생/교사 대역의 할당 가능 주소를 대역 순서대로 (20 ~ 250)"""
+        for base_ip in (cls.STUDENT_BANDS if is_student else cls.TEACHER_BANDS):
+            for i in range(cls.BAND_HOST_START, cls.BAND_HOST_END + 1):
+                yield f"{base_ip}{i}"
+    
+    @classmethod
+    def iter_available_ips(cls, used_ips, is_student=False):
+        """
+        사용 가능한 IP를 차례로 반환 (used_ips와 블랙리스트 구간 제외)
+
+        여러 장치에 한 번에 배정할 때는 반환된 IP를 호출 측에서 used_ips에 추가하지 않아도
+        같은 생성기에서 다시 나오지 않습니다.
+        """
+        index = blacklist_index()
+        for candidate_ip in cls.iter_pool_ips(is_student):
+            if candidate_ip not in used_ips and not index.contains(candidate_ip):
+                yield candidate_ip
+    
     @classmethod
     def find_available_ip(cls, existing_ips=None, exclude_device_id=None, is_student=False):
         """사용 가능한 IP 주소 찾기"""
         if existing_ips is None:
             existing_ips = []
-        kea_used_ips = cls.get_kea_used_ips()
-        blacklisted_ips = list(BlacklistedIP.objects.values_list('ip_address', flat=True))
-        logger.info(f"블랙리스트된 IP 주소 수: {len(blacklisted_ips)}")
-        all_used_ips = set(existing_ips + kea_used_ips + blacklisted_ips)
+        all_used_ips = set(existing_ips)
+        all_used_ips.update(cls.get_kea_used_ips())
+        logger.info(f"블랙리스트 구간 수: {len(blacklist_index())}")
         logger.info(f"전체 사용 중인 IP 주소 수: {len(all_used_ips)}")
         
-        if is_student:
-            # 학생 계정용 IP 범위 설정 (20 ~ 250)
-            ip_start = 20
-            ip_end = 250
-            
-            # 학생용 대역 리스트 사용
-            base_ips = cls.STUDENT_BANDS
-            
-            # 대역을 번갈아가며 사용 가능한 IP 찾기
-            for base_ip in base_ips:
-                for i in range(ip_start, ip_end + 1):
-                    candidate_ip = f"{base_ip}{i}"
-                    if candidate_ip not in all_used_ips:
-                        return candidate_ip
+        candidate_ip = next(cls.iter_available_ips(all_used_ips, is_student), None)
+        if candidate_ip is None:
+            logger.error(f"사용 가능한 IP 주소가 없음: 사용 중인 IP 주소 수={len(all_used_ips)}")
+        return candidate_ip
+    
+    @classmethod
+    def build_host_options(cls, ip_address):
+        """
+        호스트 예약에 붙일 DHCP 옵션 (저장 전 KeaDhcp4Option 목록, host 미지정)
+
+        - 3: 라우터 - 학생/교사 대역은 해당 대역의 .1, 그 외는 10.129.50.1
+        - 6: DNS 서버
+        - 54: DHCP 서버 - 학생 대역 10.129.55.253, 그 외 10.129.50.253
+        """
+        ip_parts = ip_address.split('.')
+        if any(ip_address.startswith(band) for band in cls.STUDENT_BANDS + cls.TEACHER_BANDS):
+            # 학생/교사 대역의 게이트웨이는 해당 대역의 .1 주소
+            router_hex = f"0A81{int(ip_parts[2]):02x}01"
+            router_ip = f"{ip_parts[0]}.{ip_parts[1]}.{ip_parts[2]}.1"
         else:
-            # 교사 계정용 IP 범위 설정 (20 ~ 250)
-            ip_start = 20
-            ip_end = 250
-            
-            # 교사용 대역 리스트 사용
-            base_ips = cls.TEACHER_BANDS
-            
-            # 대역을 번갈아가며 사용 가능한 IP 찾기
-            for base_ip in base_ips:
-                for i in range(ip_start, ip_end + 1):
-                    candidate_ip = f"{base_ip}{i}"
-                    if candidate_ip not in all_used_ips:
-                        return candidate_ip
-                    
-        logger.error(f"사용 가능한 IP 주소가 없음: 사용 중인 IP 주소 수={len(all_used_ips)}")
-        return None
+            # 기타 대역의 게이트웨이는 10.129.50.1
+            router_hex = "0A813201"
+            router_ip = "10.129.50.1"
+        
+        if any(ip_address.startswith(band) for band in cls.STUDENT_BANDS):
+            # 학생용 DHCP 서버 주소 (10.129.55.253)
+            dhcp_server_hex = "0A8137FD"
+            dhcp_server_ip = "10.129.55.253"
+        else:
+            # 교사/기타 대역의 DHCP 서버 주소 (10.129.50.253)
+            dhcp_server_hex = "0A8132FD"
+            dhcp_server_ip = "10.129.50.253"
+        
+        return [
+            KeaDhcp4Option(code=3, value=bytes.fromhex(router_hex), formatted_value=router_ip,
+                           space='dhcp4', persistent=True, scope_id=3),
+            KeaDhcp4Option(code=6, value=bytes.fromhex('D3B6E902A87E3F01'), formatted_value='10.129.55.252',
+                           space='dhcp4', persistent=True, scope_id=3),
+            KeaDhcp4Option(code=54, value=bytes.fromhex(dhcp_server_hex), formatted_value=dhcp_server_ip,
+                           space='dhcp4', persistent=True, scope_id=3),
+        ]
+    
+    @classmethod
+    def build_lease(cls, mac_address, ip_address, subnet_id):
+        """고정 할당용 lease4 행 (임시 대역은 5분, 그 외 100일)"""
+        is_temporary = ip_address.startswith("10.250.")
+        valid_lifetime = cls.TEMPORARY_LEASE_LIFETIME if is_temporary else cls.RESERVATION_LEASE_LIFETIME
+        return KeaLease4(
+            address=cls.ip_to_int(ip_address),
+            hwaddr=cls.mac_to_bytes(mac_address),
+            client_id=None,
+            valid_lifetime=valid_lifetime,
+            expire=timezone.now() + timedelta(seconds=valid_lifetime),
+            subnet_id=subnet_id,
+            state=0,
+            user_context='{"state":"TEMPORARY"}' if is_temporary else '{"state":"DEFAULT"}',
+        )
     
     @classmethod
     def register_ip_to_kea(cls, mac_address, ip_address, device_name):
-        """KEA DHCP 서버에 IP 할당 등록"""
-        host_id = None
-        hosts_success = False
-        options_success = False
-        lease_success = False
-        
+        """KEA DHCP 서버에 IP 할당 등록 (hosts, dhcp4_options, lease4를 한 트랜잭션으로)"""
         try:
             # IP 주소가 블랙리스트에 있는지 확인
-            if BlacklistedIP.objects.filter(ip_address=ip_address).exists():
+            if blacklist_index().contains(ip_address):
                 logger.error(f"IP 주소 {ip_address}는 블랙리스트에 있어 할당할 수 없습니다.")
                 return False
-                
-            # 기존 IP 할당(임시 IP 포함) 모두 삭제
-            logger.info(f"장치 {mac_address}의 기존 IP 할당 제거 시도")
-            cls.remove_ip_from_kea(mac_address)
             
-            # MAC 주소 형식 변환 (콜론 제거)
-            mac_without_colons = cls.mac_without_colons(mac_address)
-
             # IP 주소 유효성 검사
             if not ip_address or not re.match(r'^(\d{1,3}\.){3}\d{1,3}$', ip_address):
                 logger.error(f"유효하지 않은 IP 주소 형식: {ip_address}")
                 return False
-
-            # IP 주소를 정수로 변환
-            ip_int = cls.ip_to_int(ip_address)
-            
-            logger.info(f"IP 주소 변환: {ip_address} -> {ip_int}")
             
             # 서브넷 ID 결정 (학생인지 교사인지에 따라)
-            is_student_ip = any(ip_address.startswith(band) for band in cls.STUDENT_BANDS)
-            is_teacher_ip = any(ip_address.startswith(band) for band in cls.TEACHER_BANDS)
-            subnet_id = 4 if is_student_ip else (3 if is_teacher_ip else 3)  # 기본값은 3
+            subnet_id = cls.subnet_id_for_ip(ip_address)
             logger.info(f"IP {ip_address}에 서브넷 ID {subnet_id} 할당")
             
-            # hosts 테이블에 등록 (별도 트랜잭션으로 처리)
-            try:
-                conn = mysql.connector.connect(**cls.get_kea_db_config())
-                cursor = conn.cursor()
+            with transaction.atomic(using=KEA_DATABASE):
+                # 기존 IP 할당(임시 IP 포함) 모두 삭제
+                logger.info(f"장치 {mac_address}의 기존 IP 할당 제거 시도")
+                cls._delete_assignments(mac_address)
                 
-                cursor.execute("""
-                    INSERT INTO hosts (dhcp_identifier, dhcp_identifier_type, dhcp4_subnet_id, ipv4_address, hostname)
-                    VALUES (UNHEX(%s), 0, %s, %s, %s)
-                """, (mac_without_colons, subnet_id, ip_int, device_name))
+                host = KeaHost.objects.create(
+                    dhcp_identifier=cls.mac_to_bytes(mac_address),
+                    dhcp_identifier_type=0,
+                    dhcp4_subnet_id=subnet_id,
+                    ipv4_address=cls.ip_to_int(ip_address),
+                    hostname=device_name,
+                )
                 
-                # 생성된 host_id 가져오기
-                host_id = cursor.lastrowid
-                logger.info(f"KEA hosts 테이블에 {mac_address} 정보 등록 완료 (host_id: {host_id}, subnet_id: {subnet_id})")
-                
-                conn.commit()
-                cursor.close()
-                conn.close()
-                hosts_success = True
-            except Exception as e:
-                logger.error(f"KEA hosts 테이블 등록 중 오류 발생: {e}")
-                if 'conn' in locals() and conn.is_connected():
-                    conn.rollback()
-                    cursor.close()
-                    conn.close()
-                return False
-            
-            # dhcp4_options 테이블에 옵션 추가 (별도 트랜잭션으로 처리)
-            try:
-                if host_id:
-                    conn = mysql.connector.connect(**cls.get_kea_db_config())
-                    cursor = conn.cursor()
-                    
-                    # 옵션 3: 라우터(게이트웨이) - IP 대역에 따라 다르게 설정
-                    if any(ip_address.startswith(band) for band in cls.STUDENT_BANDS):
-                        # 학생 대역의 게이트웨이는 해당 대역의 .1 주소
-                        ip_parts = ip_address.split('.')
-                        router_hex = f"0A81{int(ip_parts[2]):02x}01"  # 16진수로 변환
-                        router_ip = f"{ip_parts[0]}.{ip_parts[1]}.{ip_parts[2]}.1"
-                        logger.info(f"{ip_parts[0]}.{ip_parts[1]}.{ip_parts[2]}.x 대역 IP {ip_address}에 게이트웨이 {router_ip} 설정")
-                    elif any(ip_address.startswith(band) for band in cls.TEACHER_BANDS):
-                        # 교사 대역의 게이트웨이는 해당 대역의 .1 주소
-                        ip_parts = ip_address.split('.')
-                        router_hex = f"0A81{int(ip_parts[2]):02x}01"  # 16진수로 변환
-                        router_ip = f"{ip_parts[0]}.{ip_parts[1]}.{ip_parts[2]}.1"
-                        logger.info(f"{ip_parts[0]}.{ip_parts[1]}.{ip_parts[2]}.x 대역 IP {ip_address}에 게이트웨이 {router_ip} 설정")
-                    else:
-                        # 기타 대역의 게이트웨이는 10.129.50.1
-                        router_hex = "0A813201"  # 10.129.50.1의 16진수 표현
-                        router_ip = "10.129.50.1"
-                        logger.info(f"기타 대역 IP {ip_address}에 게이트웨이 {router_ip} 설정")
-                        
-                    cursor.execute("""
-                        INSERT INTO dhcp4_options (code, value, formatted_value, space, persistent, host_id, scope_id)
-                        VALUES (3, UNHEX(%s), %s, 'dhcp4', 1, %s, 3)
-                    """, (router_hex, router_ip, host_id))
-                    
-                    # 옵션 6: DNS 서버
-                    cursor.execute("""
-                        INSERT INTO dhcp4_options (code, value, formatted_value, space, persistent, host_id, scope_id)
-                        VALUES (6, UNHEX('D3B6E902A87E3F01'), '10.129.55.252', 'dhcp4', 1, %s, 3)
-                    """, (host_id,))
-                    
-                    # IP 주소에 따라 다른 DHCP 서버 주소 설정
-                    is_student_ip = any(ip_address.startswith(band) for band in cls.STUDENT_BANDS)
-                    is_teacher_ip = any(ip_address.startswith(band) for band in cls.TEACHER_BANDS)
-                    if is_student_ip:
-                        # 학생용 DHCP 서버 주소 (10.129.55.253)
-                        dhcp_server_hex = "0A8137FD"  # 10.129.55.253의 16진수 표현
-                        dhcp_server_ip = "10.129.55.253"
-                        logger.info(f"학생 대역 IP {ip_address}에 대해 DHCP 서버 {dhcp_server_ip} 설정")
-                    elif is_teacher_ip:
-                        # 교사용 DHCP 서버 주소 (10.129.50.253)
-                        dhcp_server_hex = "0A8132FD"  # 10.129.50.253의 16진수 표현
-                        dhcp_server_ip = "10.129.50.253"
-                        logger.info(f"교사 대역 IP {ip_address}에 대해 DHCP 서버 {dhcp_server_ip} 설정")
-                    else:
-                        # 기타 대역의 DHCP 서버 주소 (10.129.50.253)
-                        dhcp_server_hex = "0A8132FD"  # 10.129.50.253의 16진수 표현
-                        dhcp_server_ip = "10.129.50.253"
-                        logger.info(f"기타 대역 IP {ip_address}에 대해 DHCP 서버 {dhcp_server_ip} 설정")
-                    
-                    # 옵션 54: DHCP 서버 주소
-                    cursor.execute("""
-                        INSERT INTO dhcp4_options (code, value, formatted_value, space, persistent, host_id, scope_id)
-                        VALUES (54, UNHEX(%s), %s, 'dhcp4', 1, %s, 3)
-                    """, (dhcp_server_hex, dhcp_server_ip, host_id))
-                    
-                    conn.commit()
-                    cursor.close()
-                    conn.close()
-                    logger.info(f"KEA dhcp4_options 테이블에 {mac_address} 옵션 등록 완료")
-                    options_success = True
-                else:
-                    logger.error("host_id가 없어 dhcp4_options 등록 불가")
-                    return False
-            except Exception as e:
-                logger.error(f"KEA dhcp4_options 테이블 등록 중 오류 발생: {e}")
-                # dhcp4_options 오류는 치명적이므로 실패 반환
-                return False
-            
-            # lease4 테이블에 등록 (별도 트랜잭션으로 처리)
-            try:
-                conn = mysql.connector.connect(**cls.get_kea_db_config())
-                cursor = conn.cursor()
+                options = cls.build_host_options(ip_address)
+                for option in options:
+                    option.host = host
+                KeaDhcp4Option.objects.bulk_create(options)
                 
-                # IP 주소가 임시 대역(10.250.0.*)인지 확인
-                is_temporary = ip_address.startswith("10.250.")
-                
-                # 임시 IP는 짧은 유효기간(5분), 일반 IP는 긴 유효기간(100일)
-                valid_lifetime = 300 if is_temporary else 8640000  # 5분 또는 100일
-                if is_temporary:
-                    expire_time = datetime.now() + timedelta(minutes=5)
-                else:
-                    expire_time = datetime.now() + timedelta(days=100)
-                expire_str = expire_time.strftime('%Y-%m-%d %H:%M:%S')
-                user_context = '{"state":"TEMPORARY"}' if is_temporary else '{"state":"DEFAULT"}'
-                
-                # client_id를 생략하고 INSERT 시도
+                lease = cls.build_lease(mac_address, ip_address, subnet_id)
                 try:
-                    # client_id 없이 INSERT
-                    cursor.execute("""
-                        INSERT INTO lease4 (address, hwaddr, valid_lifetime, expire, subnet_id, state, user_context)
-                        VALUES (%s, UNHEX(%s), %s, %s, %s, 0, %s)
-                    """, (ip_int, mac_without_colons, valid_lifetime, expire_str, subnet_id, user_context))
-                    logger.info(f"KEA lease4 테이블에 {mac_address} 등록 완료 (client_id 생략)")
-                    lease_success = True
-                except Exception as e1:
-                    logger.error(f"client_id 생략하고 lease4 등록 실패: {e1}")
-                    
-                    # client_id를 NULL로 설정하여 INSERT 시도
-                    try:
-                        cursor.execute("""
-                            INSERT INTO lease4 (address, hwaddr, client_id, valid_lifetime, expire, subnet_id, state, user_context)
-                            VALUES (%s, UNHEX(%s), NULL, %s, %s, %s, 0, %s)
-                        """, (ip_int, mac_without_colons, valid_lifetime, expire_str, subnet_id, user_context))
-                        logger.info(f"KEA lease4 테이블에 {mac_address} 등록 완료 (client_id NULL)")
-                        lease_success = True
-                    except Exception as e2:
-                        logger.error(f"client_id NULL로 lease4 등록 실패: {e2}")
-                        
-                        # 마지막 시도: client_id를 명시적으로 지정
-                        try:
-                            client_id = "01" + mac_without_colons
-                            cursor.execute("""
-                                INSERT INTO lease4 (address, hwaddr, client_id, valid_lifetime, expire, subnet_id, state, user_context)
-                                VALUES (%s, UNHEX(%s), UNHEX(%s), %s, %s, %s, 0, %s)
-                            """, (ip_int, mac_without_colons, client_id, valid_lifetime, expire_str, subnet_id, user_context))
-                            logger.info(f"KEA lease4 테이블에 {mac_address} 등록 완료 (client_id 지정)")
-                            lease_success = True
-                        except Exception as e3:
-                            logger.error(f"client_id 지정하여 lease4 등록 실패: {e3}")
-                            # 모든 시도가 실패한 경우 False 반환
-                            return False
-                
-                conn.commit()
-                cursor.close()
-                conn.close()
-            except Exception as e:
-                logger.error(f"KEA lease4 테이블 등록 중 오류 발생: {e}")
-                # lease4 등록 실패는 치명적이므로 실패 반환
-                return False
+                    with transaction.atomic(using=KEA_DATABASE):
+                        lease.save(force_insert=True)
+                except DatabaseError as e:
+                    # client_id NULL을 허용하지 않는 스키마에서는 MAC 기반 client_id 지정
+                    logger.warning(f"client_id NULL로 lease4 등록 실패, client_id 지정 후 재시도: {e}")
+                    lease.client_id = bytes.fromhex("01" + cls.mac_without_colons(mac_address))
+                    lease.save(force_insert=True)
             
-            # 모든 단계가 성공했는지 확인
-            if hosts_success and options_success and lease_success:
-                logger.info(f"KEA DB에 장치 {mac_address} 정보 등록 완료 (IP: {ip_address})")
-                return True
-            else:
-                logger.error(f"KEA DB 등록 일부 실패: hosts={hosts_success}, options={options_success}, lease={lease_success}")
-                return False
+            logger.info(f"KEA DB에 장치 {mac_address} 정보 등록 완료 (host_id: {host.host_id}, IP: {ip_address})")
+            return True
         
         except Exception as e:
             logger.error(f"KEA 데이터베이스 처리 중 전체 오류 발생: {e}")
             return False
     
+    @classmethod
+    def _delete_assignments(cls, mac_address, ip_address=None):
+        """MAC(및 IP)의 예약, 옵션, 리스 삭제 (호출 측 트랜잭션 안에서 실행)"""
+        hwaddr = cls.mac_to_bytes(mac_address)
+        hosts = list(KeaHost.objects.filter(
+            dhcp_identifier=hwaddr, dhcp4_subnet_id__in=cls.MANAGED_SUBNET_IDS
+        ).values_list('host_id', 'ipv4_address'))
+        host_ids = [host_id for host_id, _ in hosts]
+        addresses = {address for _, address in hosts if address is not None}
+        if ip_address:
+            addresses.add(cls.ip_to_int(ip_address))
+        
+        if host_ids:
+            KeaDhcp4Option.objects.filter(host_id__in=host_ids).delete()
+            KeaHost.objects.filter(host_id__in=host_ids).delete()
+            logger.info(f"KEA hosts/dhcp4_options에서 host_id {host_ids} 삭제 완료")
+        
+        temp_start, temp_end = cls.temporary_range()
+        # 예약 IP의 모든 리스(declined 포함), MAC의 관리 서브넷 리스, MAC의 임시 대역 리스
+        lease_filter = (
+            Q(hwaddr=hwaddr, subnet_id__in=cls.MANAGED_SUBNET_IDS)
+            | Q(hwaddr=hwaddr, address__gte=temp_start, address__lte=temp_end)
+        )
+        if addresses:
+            lease_filter |= Q(address__in=addresses)
+        deleted, _ = KeaLease4.objects.filter(lease_filter).delete()
+        logger.info(f"KEA lease4에서 MAC {mac_address} 관련 리스 {deleted}개 삭제 완료")
+        return bool(host_ids) or bool(deleted)
+    
     @classmethod
     def remove_ip_from_kea(cls, mac_address, ip_address=None):
         """KEA DHCP 서버에서 IP 할당 제거"""
-        hosts_success = False
-        lease_success = False
-        
         try:
-            # KEA 데이터베이스 연결
-            conn = mysql.connector.connect(**cls.get_kea_db_config())
-            cursor = conn.cursor(dictionary=True)
-
-            # MAC 주소 형식 변환 (콜론 제거)
-            mac_without_colons = cls.mac_without_colons(mac_address)
             logger.info(f"KEA에서 MAC 주소 {mac_address} 제거 시작")
-
-            # hosts 테이블 트랜잭션
-            try:
-                # 1. hosts 테이블에서 기존 예약 정보 가져오기
-                cursor.execute("""
-                    SELECT host_id, INET_NTOA(ipv4_address) as ip_address, dhcp4_subnet_id 
-                    FROM hosts 
-                    WHERE dhcp_identifier = UNHEX(%s)
-                    AND dhcp4_subnet_id IN (3, 4)
-                """, (mac_without_colons,))
-                result = cursor.fetchone()
-                
-                if result:
-                    logger.info(f"KEA hosts 테이블에서 MAC {mac_address}에 대한 항목 발견: {result}")
-                    # 2. DHCP 옵션 삭제
-                    cursor.execute("""
-                        DELETE FROM dhcp4_options WHERE host_id = %s
-                    """, (result['host_id'],))
-                    logger.info(f"KEA dhcp4_options 테이블에서 host_id {result['host_id']} 삭제 완료")
-                    
-                    # 3. 호스트 예약 삭제
-                    cursor.execute("""
-                        DELETE FROM hosts WHERE host_id = %s
-                    """, (result['host_id'],))
-                    logger.info(f"KEA hosts 테이블에서 host_id {result['host_id']} 삭제 완료")
-                    
-                    hosts_success = True
-                    
-                    # hosts 트랜잭션 커밋
-                    conn.commit()
-                else:
-                    logger.info(f"KEA hosts 테이블에서 MAC {mac_address}에 대한 항목 없음")
-                    hosts_success = True
-            except Exception as e:
-                logger.error(f"hosts 테이블 트랜잭션 중 오류 발생: {e}")
-                conn.rollback()
-            
-            # lease4 테이블 트랜잭션
-            try:
-                # 4. 해당 IP의 모든 lease 삭제 (declined 포함)
-                if result and 'ip_address' in result:
-                    cursor.execute("""
-                        DELETE FROM lease4 
-                        WHERE address = INET_ATON(%s)
-                    """, (result['ip_address'],))
-                    logger.info(f"KEA lease4 테이블에서 IP {result['ip_address']} 삭제 완료")
-                
-                # 5. MAC 주소의 모든 lease 삭제
-                cursor.execute("""
-                    DELETE FROM lease4 
-                    WHERE hwaddr = UNHEX(%s)
-                    AND subnet_id IN (3, 4)
-                """, (mac_without_colons,))
-                logger.info(f"KEA lease4 테이블에서 MAC {mac_address} 삭제 완료")
-                
-                # 6. 임시 IP 대역(10.250.0.*)에 대한 리스 명시적 삭제
-                cursor.execute("""
-                    DELETE FROM lease4 
-                    WHERE hwaddr = UNHEX(%s)
-                    AND address >= INET_ATON('10.250.0.0')
-                    AND address <= INET_ATON('10.250.255.255')
-                """, (mac_without_colons,))
-                logger.info(f"KEA lease4 테이블에서 임시 IP 대역의 MAC {mac_address} 삭제 완료")
-                
-                lease_success = True
-                
-                # lease4 트랜잭션 커밋
-                conn.commit()
-            except Exception as e:
-                logger.error(f"lease4 테이블 트랜잭션 중 오류 발생: {e}")
-                conn.rollback()
-            
-            cursor.close()
-            conn.close()
-            
-            # 두 트랜잭션 중 하나라도 성공했으면 계속 진행할 수 있음
-            if hosts_success or lease_success:
-                logger.info(f"KEA DB에서 장치 {mac_address} 정보 삭제 완료 (hosts: {hosts_success}, lease: {lease_success})")
-                return True
-            else:
-                logger.error(f"KEA DB에서 장치 {mac_address} 정보 삭제 실패 (모든 트랜잭션 실패)")
-                return False
-                
+            with transaction.atomic(using=KEA_DATABASE):
+                cls._delete_assignments(mac_address, ip_address)
+            logger.info(f"KEA DB에서 장치 {mac_address} 정보 삭제 완료")
+            return True
         except Exception as e:
             logger.error(f"KEA 데이터베이스 처리 중 오류 발생: {e}")
             return False
     
+    @classmethod
+    def remove_many_from_kea(cls, mac_addresses, ip_addresses=(), batch_size=500):
+        """여러 MAC의 예약, 옵션, 리스를 묶음 삭제 (한 트랜잭션, 삭제한 호스트 수 반환)"""
+        macs = list(mac_addresses)
+        addresses = [cls.ip_to_int(ip) for ip in ip_addresses if ip]
+        temp_start, temp_end = cls.temporary_range()
+        removed_hosts = 0
+        with transaction.atomic(using=KEA_DATABASE):
+            for start in range(0, len(macs), batch_size):
+                hwaddrs = [cls.mac_to_bytes(mac) for mac in macs[start:start + batch_size]]
+                host_ids = list(KeaHost.objects.filter(
+                    dhcp_identifier__in=hwaddrs, dhcp4_subnet_id__in=cls.MANAGED_SUBNET_IDS
+                ).values_list('host_id', flat=True))
+                if host_ids:
+                    KeaDhcp4Option.objects.filter(host_id__in=host_ids).delete()
+                    removed_hosts += KeaHost.objects.filter(host_id__in=host_ids).delete()[0]
+                KeaLease4.objects.filter(
+                    Q(hwaddr__in=hwaddrs, subnet_id__in=cls.MANAGED_SUBNET_IDS)
+                    | Q(hwaddr__in=hwaddrs, address__gte=temp_start, address__lte=temp_end)
+                ).delete()
+            for start in range(0, len(addresses), batch_size):
+                KeaLease4.objects.filter(address__in=addresses[start:start + batch_size]).delete()
+        logger.info(f"KEA에서 장치 {len(macs)}개의 예약 {removed_hosts}개 일괄 삭제 완료")
+        return removed_hosts
+    
+    @classmethod
+    def get_used_ips(cls):
+        """KEA 예약, 장치 할당, 블랙리스트를 합친 사용 중 IP 집합"""
+        from devices.models import Device
+        used = set(cls.get_kea_used_ips())
+        used.update(Device.objects.exclude(assigned_ip=None).values_list('assigned_ip', flat=True))
+        used.update(cls.blacklisted_pool_ips())
+        return used
+    
+    @classmethod
+    def blacklisted_pool_ips(cls):
+        """학생/교사 대역 할당 범위 안의 블랙리스트 IP 집합 (CIDR/범위 항목을 주소로 펼침)"""
+        index = blacklist_index()
+        return {
+            ip for is_student in (True, False) for ip in cls.iter_pool_ips(is_student)
+            if index.contains(ip)
+        }
+    
+    @classmethod
+    def bulk_create_reservations(cls, assignments, batch_size=500):
+        """
+        hosts, dhcp4_options, lease4 묶음 생성 (호출 측 KEA 트랜잭션 안에서 실행)
+
+        assignments: (MAC, IP, hostname) 목록. 같은 MAC의 기존 예약은 미리 지워져 있어야 합니다.
+        """
+        assignments = list(assignments)
+        if not assignments:
+            return
+        KeaHost.objects.bulk_create([
+            KeaHost(
+                dhcp_identifier=cls.mac_to_bytes(mac_address), dhcp_identifier_type=0,
+                dhcp4_subnet_id=cls.subnet_id_for_ip(ip_address), ipv4_address=cls.ip_to_int(ip_address),
+                hostname=hostname,
+            )
+            for mac_address, ip_address, hostname in assignments
+        ], batch_size=batch_size)
+
+        # MySQL bulk_create는 PK를 돌려주지 않으므로 (MAC, IP)로 host_id 재조회
+        host_ids = {}
+        for start in range(0, len(assignments), batch_size):
+            rows = KeaHost.objects.filter(dhcp_identifier__in=[
+                cls.mac_to_bytes(mac_address) for mac_address, _, _ in assignments[start:start + batch_size]
+            ]).values_list('host_id', 'dhcp_identifier', 'ipv4_address')
+            for host_id, identifier, address in rows:
+                host_ids[(bytes(identifier), address)] = host_id
+
+        options = []
+        for mac_address, ip_address, _ in assignments:
+            host_id = host_ids.get((cls.mac_to_bytes(mac_address), cls.ip_to_int(ip_address)))
+            for option in cls.build_host_options(ip_address):
+                option.host_id = host_id
+                options.append(option)
+        KeaDhcp4Option.objects.bulk_create(options, batch_size=batch_size)
+
+        KeaLease4.objects.bulk_create([
+            cls.build_lease(mac_address, ip_address, cls.subnet_id_for_ip(ip_address))
+            for mac_address, ip_address, _ in assignments
+        ], batch_size=batch_size, ignore_conflicts=True)
+    
+    @classmethod
+    def register_many_to_kea(cls, assignments, batch_size=500):
+        """
+        여러 장치의 IP 할당을 한 트랜잭션으로 묶음 등록 (register_ip_to_kea의 일괄 버전)
+
+        assignments: (MAC, IP, hostname) 목록. 각 MAC의 기존 예약/리스와 새 IP의 남은 리스를 지운 뒤 다시 만듭니다.
+        블랙리스트 IP가 포함되어 있으면 아무것도 쓰지 않고 False를 반환합니다.
+        """
+        assignments = list(assignments)
+        if not assignments:
+            return True
+        index = blacklist_index()
+        blocked = [ip_address for _, ip_address, _ in assignments if index.contains(ip_address)]
+        if blocked:
+            logger.error(f"블랙리스트 IP는 할당할 수 없습니다: {blocked[:10]}")
+            return False
+        try:
+            with transaction.atomic(using=KEA_DATABASE):
+                cls.remove_many_from_kea(
+                    [mac_address for mac_address, _, _ in assignments],
+                    [ip_address for _, ip_address, _ in assignments],
+                    batch_size=batch_size,
+                )
+                cls.bulk_create_reservations(assignments, batch_size=batch_size)
+            logger.info(f"KEA DB에 장치 {len(assignments)}개 IP 할당 일괄 등록 완료")
+            return True
+        except Exception as e:
+            logger.error(f"KEA 일괄 등록 중 오류 발생: {e}")
+            return False
+    
+    @classmethod
+    def band_usage(cls, used_ips):
+        """대역별 풀 사용량 ({'10.129.57': {'role', 'size', 'used', 'free', 'utilization'}})"""
+        size = cls.BAND_HOST_END - cls.BAND_HOST_START + 1
+        bands = {}
+        for band in cls.STUDENT_BANDS + cls.TEACHER_BANDS:
+            in_use = sum(
+                1 for host in range(cls.BAND_HOST_START, cls.BAND_HOST_END + 1)
+                if f'{band}{host}' in used_ips
+            )
+            bands[band.rstrip('.')] = {
+                'role': 'student' if band in cls.STUDENT_BANDS else 'teacher',
+                'size': size,
+                'used': in_use,
+                'free': size - in_use,
+                'utilization': round(in_use / size, 4),
+            }
+        return bands
+    
+    @classmethod
+    def band_of(cls, ip_address):
+        """IP가 속한 관리 대역 ('10.129.57'), 관리 대역이 아니면 None"""
+        for band in cls.STUDENT_BANDS + cls.TEACHER_BANDS:
+            if ip_address and ip_address.startswith(band):
+                host = int(ip_address[len(band):])
+                if cls.BAND_HOST_START <= host <= cls.BAND_HOST_END:
+                    return band.rstrip('.')
+        return None
+    
+    @classmethod
+    def count_active_leases(cls):
+        """KEA lease4 테이블의 서브넷별 유효 리스 수 ({subnet_id: 개수})"""
+        counts = {}
+        try:
+            rows = (
+                KeaLease4.objects.filter(state=0, expire__gt=timezone.now())
+                .values('subnet_id').annotate(count=Count('address')).order_by()
+            )
+            counts = {row['subnet_id']: row['count'] for row in rows}
+        except Exception as e:
+            logger.error(f"KEA 리스 수 조회 중 오류 발생: {e}")
+        return counts
+    
     @classmethod
     def get_mac_from_ip(cls, ip_address):
         """KEA DHCP 서버에서 IP 주소에 해당하는 MAC 주소 가져오기"""
         try:
-            # KEA 데이터베이스 연결
-            conn = mysql.connector.connect(**cls.get_kea_db_config())
-            cursor = conn.cursor(dictionary=True)
+            address = cls.ip_to_int(ip_address)
             
             # lease4 테이블에서 MAC 주소 조회
-            query = """
-                SELECT HEX(hwaddr) as mac_address
-                FROM lease4 
-                WHERE address = INET_ATON(%s)
-                  AND state = 0
-                ORDER BY expire DESC
-                LIMIT 1
-            """
+            hwaddr = (
+                KeaLease4.objects.filter(address=address, state=0)
+                .order_by('-expire').values_list('hwaddr', flat=True).first()
+            )
+            if hwaddr:
+                mac_address = cls.bytes_to_mac(hwaddr)
+                logger.info("Found MAC in KEA lease4: %s", mac_address)
+                return mac_address
             
-            cursor.execute(query, (ip_address,))
-            result = cursor.fetchone()
-            logger.info("KEA lease4 query result: %s", result)
+            # hosts 테이블에서 MAC 주소 조회 (백업)
+            identifier = (
+                KeaHost.objects.filter(ipv4_address=address, dhcp_identifier_type=0)
+                .values_list('dhcp_identifier', flat=True).first()
+            )
+            if identifier:
+                mac_address = cls.bytes_to_mac(identifier)
+                logger.info("Found MAC in KEA hosts: %s", mac_address)
+                return mac_address
+            
+            return None
+        except Exception as e:
+            logger.error("Error querying KEA database: %s", str(e))
+            return None
+    
+    @classmethod
+    async def aget_mac_from_ip(cls, ip_address):
+        """get_mac_from_ip의 비동기 버전 (비동기 뷰에서 사용)"""
+        try:
+            address = cls.ip_to_int(ip_address)
             
-            if result and result['mac_address']:
-                # MAC 주소 형식 변환 (콜론 추가)
-                mac_address = ':'.join(result['mac_address'][i:i+2].lower() for i in range(0, 12, 2))
+            # lease4 테이블에서 MAC 주소 조회
+            hwaddr = await (
+                KeaLease4.objects.filter(address=address, state=0)
+                .order_by('-expire').values_list('hwaddr', flat=True).afirst()
+            )
+            if hwaddr:
+                mac_address = cls.bytes_to_mac(hwaddr)
                 logger.info("Found MAC in KEA lease4: %s", mac_address)
                 return mac_address
-            else:
-                # hosts 테이블에서 MAC 주소 조회 (백업)
-                query = """
-                    SELECT HEX(dhcp_identifier) as mac_address
-                    FROM hosts 
-                    WHERE ipv4_address = INET_ATON(%s)
-                      AND dhcp_identifier_type = 0
-                """
-                
-                cursor.execute(query, (ip_address,))
-                result = cursor.fetchone()
-                logger.info("KEA hosts query result: %s", result)
-                
-                if result and result['mac_address']:
-                    # MAC 주소 형식 변환 (콜론 추가)
-                    mac_address = ':'.join(result['mac_address'][i:i+2].lower() for i in range(0, 12, 2))
-                    logger.info("Found MAC in KEA hosts: %s", mac_address)
-                    return mac_address
+            
+            # hosts 테이블에서 MAC 주소 조회 (백업)
+            identifier = await (
+                KeaHost.objects.filter(ipv4_address=address, dhcp_identifier_type=0)
+                .values_list('dhcp_identifier', flat=True).afirst()
+            )
+            if identifier:
+                mac_address = cls.bytes_to_mac(identifier)
+                logger.info("Found MAC in KEA hosts: %s", mac_address)
+                return mac_address
             
             return None
         except Exception as e:
@@ -485,64 +503,39 @@ class KeaClient:
                 logger.error(f"기존 IP 할당 제거 실패: {mac_address}")
                 return None
             
-            # 임시 IP 생성을 위해 lease4 테이블에서 현재 사용 중인 임시 IP 확인
-            try:
-                conn = mysql.connector.connect(**cls.get_kea_db_config())
-                cursor = conn.cursor(dictionary=True)
-                
-                # 이미 사용 중인 10.250.*.* 대역의 IP 검색
-                cursor.execute("""
-                    SELECT INET_NTOA(address) as ip_address 
-                    FROM lease4 
-                    WHERE address >= INET_ATON('10.250.0.0') 
-                    AND address <= INET_ATON('10.250.255.255')
-                    AND state = 0
-                    AND expire > NOW()
-                """)
-                
-                used_temp_ips = [row['ip_address'] for row in cursor.fetchall()]
-                logger.info(f"사용 중인 임시 IP 수: {len(used_temp_ips)}")
-                
-                # 임시 IP 생성 - 장치 ID를 활용하여 고유한 임시 IP 생성
-                temp_ip_last_octet = (device_id % 240) + 10  # 10~249 범위 사용
-                temp_ip = f"{temp_subnet}{temp_ip_last_octet}"
-                
-                # 임시 IP가 이미 사용 중이면 다른 IP 찾기
-                if temp_ip in used_temp_ips:
-                    found_ip = False
-                    for i in range(10, 250):
-                        candidate_ip = f"{temp_subnet}{i}"
-                        if candidate_ip not in used_temp_ips:
-                            temp_ip = candidate_ip
-                            found_ip = True
-                            break
-                    
-                    if not found_ip:
-                        logger.error(f"사용 가능한 임시 IP를 찾을 수 없습니다.")
-                        return None
-                
-                logger.info(f"할당할 임시 IP: {temp_ip}")
-                
-                # 커서 및 연결 종료
-                cursor.close()
-                conn.close()
-                
-                # KEA에 임시 IP 등록
-                register_result = cls.register_ip_to_kea(mac_address, temp_ip, f"{device_name} (비활성화)")
-                
-                if register_result:
-                    logger.info(f"임시 IP {temp_ip}가 MAC {mac_address}에 성공적으로 할당되었습니다.")
-                    return temp_ip
-                else:
-                    logger.error(f"임시 IP {temp_ip} 등록 실패: MAC {mac_address}")
+            # 이미 사용 중인 10.250.*.* 대역의 IP 검색
+            temp_start, temp_end = cls.temporary_range()
+            used_temp_ips = {
+                cls.int_to_ip(address)
+                for address in KeaLease4.objects.filter(
+                    address__gte=temp_start, address__lte=temp_end, state=0, expire__gt=timezone.now()
+                ).values_list('address', flat=True)
+            }
+            logger.info(f"사용 중인 임시 IP 수: {len(used_temp_ips)}")
+            
+            # 임시 IP 생성 - 장치 ID를 활용하여 고유한 임시 IP 생성
+            temp_ip_last_octet = (device_id % 240) + 10  # 10~249 범위 사용
+            temp_ip = f"{temp_subnet}{temp_ip_last_octet}"
+            
+            # 임시 IP가 이미 사용 중이면 다른 IP 찾기
+            if temp_ip in used_temp_ips:
+                temp_ip = next(
+                    (f"{temp_subnet}{i}" for i in range(10, 250) if f"{temp_subnet}{i}" not in used_temp_ips),
+                    None
+                )
+                if temp_ip is None:
+                    logger.error(f"사용 가능한 임시 IP를 찾을 수 없습니다.")
                     return None
-                
-            except Exception as e:
-                logger.error(f"임시 IP 할당 중 데이터베이스 오류 발생: {e}")
-                if 'conn' in locals() and conn.is_connected():
-                    cursor.close()
-                    conn.close()
-                return None
+            
+            logger.info(f"할당할 임시 IP: {temp_ip}")
+            
+            # KEA에 임시 IP 등록
+            if cls.register_ip_to_kea(mac_address, temp_ip, f"{device_name} (비활성화)"):
+                logger.info(f"임시 IP {temp_ip}가 MAC {mac_address}에 성공적으로 할당되었습니다.")
+                return temp_ip
+            
+            logger.error(f"임시 IP {temp_ip} 등록 실패: MAC {mac_address}")
+            return None
                 
         except Exception as e:
             logger.error(f"임시 IP 할당 처리 중 예외 발생: {e}")
@@ -550,34 +543,12 @@ class KeaClient:
     
     @classmethod
     def cleanup_expired_temporary_leases(cls):
-        """만료된 임시 IP 리스 정리"""
+        """만료된 임시 IP 리스 정리 (10.250.*.* 대역)"""
         try:
-            conn = mysql.connector.connect(**cls.get_kea_db_config())
-            cursor = conn.cursor()
-            
-            # 만료된 임시 IP 리스 삭제 (10.250.*.* 대역)
-            cursor.execute("""
-                DELETE FROM lease4 
-                WHERE address >= INET_ATON('10.250.0.0')
-                AND address <= INET_ATON('10.250.255.255')
-                AND expire < NOW()
-            """)
-            
-            deleted_count = cursor.rowcount
-            
-            # 임시 상태인 리스 중 오래된 것들도 삭제 (5분 이상 지난 것)
-            cursor.execute("""
-                DELETE FROM lease4 
-                WHERE address >= INET_ATON('10.250.0.0')
-                AND address <= INET_ATON('10.250.255.255')
-                AND user_context LIKE '%TEMPORARY%'
-                AND TIMESTAMPDIFF(MINUTE, expire, NOW()) > 5
-            """)
-            
-            deleted_count += cursor.rowcount
-            conn.commit()
-            cursor.close()
-            conn.close()
+            temp_start, temp_end = cls.temporary_range()
+            deleted_count, _ = KeaLease4.objects.filter(
+                address__gte=temp_start, address__lte=temp_end, expire__lt=timezone.now()
+            ).delete()
             
             logger.info(f"만료된 임시 IP 리스 {deleted_count}개가 삭제되었습니다.")
             return deleted_count
@@ -587,18 +558,21 @@ class KeaClient:
     
     @classmethod
     def add_to_blacklist(cls, ip_address, reason=None):
-        """IP 주소를 블랙리스트에 추가하고, 현재 할당된 경우 해제"""
+        """IP 주소, CIDR 또는 범위(시작-끝)를 블랙리스트에 추가 (할당된 장치 재배정은 devices.blacklist.blacklist_ranges)"""
         try:
-            if not ip_address or not re.match(r'^(\d{1,3}\.){3}\d{1,3}$', ip_address):
-                logger.error(f"유효하지 않은 IP 주소 형식: {ip_address}")
-                return False
-            obj, created = BlacklistedIP.objects.get_or_create(ip_address=ip_address, defaults={'reason': reason})
+            start, end = parse_ip_range(ip_address)
+        except ValueError as e:
+            logger.error(str(e))
+            return False
+        try:
+            obj, created = BlacklistedIP.objects.get_or_create(
+                start_int=start, end_int=end,
+                defaults={'ip_address': format_ip_range(start, start), 'reason': reason},
+            )
             if not created:
-                logger.info(f"IP 주소 {ip_address}는 이미 블랙리스트에 있습니다.")
+                logger.info(f"{obj.label}는 이미 블랙리스트에 있습니다.")
                 return True
-            logger.info(f"IP 주소 {ip_address}가 블랙리스트에 추가되었습니다.")
-            # 이하 기존 KEA 할당 해제 로직 동일
-            # ...
+            logger.info(f"{obj.label}가 블랙리스트에 추가되었습니다.")
             return True
         except Exception as e:
             logger.error(f"IP 블랙리스트 추가 중 오류 발생: {e}")
@@ -606,14 +580,19 @@ class KeaClient:
     
     @classmethod
     def remove_from_blacklist(cls, ip_address):
-        """IP 주소를 블랙리스트에서 제거"""
+        """블랙리스트 항목(IP 주소, CIDR 또는 범위) 제거 - 추가할 때와 같은 구간이어야 함"""
+        try:
+            start, end = parse_ip_range(ip_address)
+        except ValueError as e:
+            logger.error(str(e))
+            return False
         try:
-            deleted, _ = BlacklistedIP.objects.filter(ip_address=ip_address).delete()
+            deleted, _ = BlacklistedIP.objects.filter(start_int=start, end_int=end).delete()
             if deleted:
-                logger.info(f"IP 주소 {ip_address}가 블랙리스트에서 제거되었습니다.")
+                logger.info(f"{ip_address}가 블랙리스트에서 제거되었습니다.")
                 return True
             else:
-                logger.info(f"IP 주소 {ip_address}는 블랙리스트에 없습니다.")
+                logger.info(f"{ip_address}는 블랙리스트에 없습니다.")
                 return False
         except Exception as e:
             logger.error(f"IP 블랙리스트 제거 중 오류 발생: {e}")
@@ -621,10 +600,13 @@ class KeaClient:
     
     @classmethod
     def get_blacklisted_ips(cls):
-        """블랙리스트된 IP 주소 목록 가져오기"""
-        return list(BlacklistedIP.objects.values_list('ip_address', flat=True))
+        """블랙리스트 항목 목록 (단일 IP, CIDR 또는 범위 문자열)"""
+        return [
+            format_ip_range(start, end)
+            for start, end in BlacklistedIP.objects.order_by('start_int', 'end_int').values_list('start_int', 'end_int')
+        ]
     
     @classmethod
     def is_ip_blacklisted(cls, ip_address):
-        """IP 주소가 블랙리스트에 있는지 확인"""
-        return BlacklistedIP.objects.filter(ip_address=ip_address).exists() 
\ No newline at end of file
+        """IP 주소가 블랙리스트 구간 안에 있는지 확인"""
+        return blacklist_index().contains(ip_address)
@@ -1,4 +1,6 @@
-from .device_views import DeviceViewSet, get_ip_rentals, get_device_rentals
+from .device_views import DeviceViewSet, CurrentDeviceMacView, get_ip_rentals, get_device_rentals
 from .history_views import DeviceHistoryViewSet
+from .pool_views import ip_pool_utilization, reclaim_ips
+from .reconcile_views import reconcile_kea
 
-__all__ = ['DeviceViewSet', 'DeviceHistoryViewSet', 'get_ip_rentals', 'get_device_rentals']
+__all__ = ['DeviceViewSet', 'CurrentDeviceMacView', 'DeviceHistoryViewSet', 'get_ip_rentals', 'get_device_rentals', 'ip_pool_utilization', 'reclaim_ips', 'reconcile_kea']
@@ -4,21 +4,30 @@ from rest_framework.decorators import action, api_view, permission_classes
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, IsAdminUser
 from rest_framework.exceptions import ValidationError
+from django.core.exceptions import ValidationError as DjangoValidationError
 import re
 import logging
 import subprocess
 import re
-from django.db.models import Q
+from django.db.models import F, Q
+from django.conf import settings
 from rest_framework.pagination import PageNumberPagination
 from django.contrib.auth.models import User
 from django.utils import timezone
 from datetime import datetime, timedelta
 
-from ..models import Device, DeviceHistory
+from core.async_views import AsyncAPIView
+from core.pagination import HistoryCursorPagination, get_history_paginator
+from core.mac import normalize_mac
+from core.response_cache import cached_response
+from ..blacklist import blacklist_ranges
+from ..models import Device, DeviceHistory, DevicePresence
+from ..search import device_search_index
 from rentals.models import Equipment, Rental
-from rentals.serializers import EquipmentSerializer, RentalSerializer
+from rentals.serializers import EquipmentSerializer, RentalSerializer, RentalValuesSerializer
 from ..serializers import (
-    DeviceSerializer, DeviceDetailSerializer, DeviceHistorySerializer
+    DeviceSerializer, DeviceDetailSerializer, DeviceHistorySerializer, DevicePresenceSerializer,
+    DeviceRentalValuesSerializer,
 )
 from ..utils.kea_client import KeaClient
 
@@ -69,19 +78,32 @@ class DeviceViewSet(viewsets.ModelViewSet):
         search = request.query_params.get('search', '')
         page_size = request.query_params.get('page_size', 10)
         
-        # 기본 쿼리셋
-        queryset = Device.objects.all().order_by('-created_at')
+        # 기본 쿼리셋 (ordering: created_at, -created_at, last_access, -last_access)
+        ordering = request.query_params.get('ordering', '-created_at')
+        order_field = ordering.lstrip('-')
+        if order_field not in ('created_at', 'last_access'):
+            ordering, order_field = '-created_at', 'created_at'
+        order_by = F(order_field).desc(nulls_last=True) if ordering.startswith('-') else F(order_field).asc(nulls_first=True)
+        queryset = Device.objects.all().order_by(order_by, '-id')
+        
+        # 실제 접속 기준 필터 (last_access는 KEA 리스 갱신 시각에서 적재)
+        online = request.query_params.get('online')
+        if online in ('true', 'false'):
+            online_since = timezone.now() - timedelta(seconds=settings.LEASE_ACTIVITY['ONLINE_WINDOW'])
+            online_filter = Q(last_access__gte=online_since)
+            queryset = queryset.filter(online_filter) if online == 'true' else queryset.exclude(online_filter)
+        inactive_days = request.query_params.get('inactive_days')
+        if inactive_days:
+            try:
+                inactive_since = timezone.now() - timedelta(days=int(inactive_days))
+            except ValueError:
+                return Response({'detail': 'inactive_days는 정수여야 합니다.'}, status=status.HTTP_400_BAD_REQUEST)
+            queryset = queryset.filter(Q(last_access__lt=inactive_since) | Q(last_access__isnull=True))
         
         # 검색어가 있는 경우 필터링
         if search:
-            queryset = queryset.filter(
-                Q(mac_address__icontains=search) |
-                Q(device_name__icontains=search) |
-                Q(assigned_ip__icontains=search) |
-                Q(user__username__icontains=search) |
-                Q(user__first_name__icontains=search) |
-                Q(user__last_name__icontains=search)
-            )
+            # MAC/장치 이름/IP/소유자 검색 인덱스 (조인 없이 PK로 거름)
+            queryset = queryset.filter(pk__in=device_search_index.search(search))
         
         # 페이지네이션 적용
         paginator = PageNumberPagination()
@@ -248,6 +270,11 @@ class DeviceViewSet(viewsets.ModelViewSet):
     @action(detail=True, methods=['post'])
     def toggle_active(self, request, pk=None):
         device = self.get_object()
+        # KEA를 바꾸기 전에 저장 가능한지 확인 (표준 형식 MAC이 다른 장치와 겹치면 저장 불가)
+        try:
+            device.validate_unique_mac()
+        except DjangoValidationError as e:
+            return Response({"error": e.message_dict['mac_address'][0]}, status=status.HTTP_409_CONFLICT)
         old_status = device.is_active
         device.is_active = not device.is_active
         
@@ -354,6 +381,8 @@ class DeviceViewSet(viewsets.ModelViewSet):
                 'message': '유효하지 않은 MAC 주소 형식입니다.',
                 'error_code': 'INVALID_MAC_FORMAT'
             }, status=status.HTTP_400_BAD_REQUEST)
+        # 대소문자/구분자가 달라도 같은 장치로 판단하도록 표준 형식으로 변환
+        mac_address = normalize_mac(mac_address)
             
         # 장치 이름 검증
         if not device_name:
@@ -446,6 +475,26 @@ class DeviceViewSet(viewsets.ModelViewSet):
             'device': DeviceSerializer(device).data
         }, status=status.HTTP_201_CREATED)
 
+    @action(detail=True, methods=['get'])
+    def presence(self, request, pk=None):
+        """장치 접속 기록 조회 (?days=14, 최대 보관 기간)"""
+        device = self.get_object()
+        retention_days = settings.LEASE_ACTIVITY['RETENTION_DAYS']
+        try:
+            days = max(1, min(int(request.query_params.get('days', 14)), retention_days))
+        except ValueError:
+            return Response({'detail': 'days는 정수여야 합니다.'}, status=status.HTTP_400_BAD_REQUEST)
+        
+        since = timezone.localdate() - timedelta(days=days - 1)
+        records = DevicePresence.objects.filter(device=device, date__gte=since).order_by('date')
+        return Response({
+            'device_id': device.id,
+            'last_access': device.last_access,
+            'is_online': device.is_online,
+            'days': days,
+            'presence': DevicePresenceSerializer(records, many=True).data,
+        })
+
     @action(detail=False, methods=['get'])
     def statistics(self, request):
         total_devices = Device.objects.count()
@@ -456,117 +505,46 @@ class DeviceViewSet(viewsets.ModelViewSet):
             'total_devices': total_devices,
             'active_devices': active_devices,
             'user_devices': user_devices
-        }) 
+        })
     
-    @action(detail=False, methods=['get'], url_path='current-mac')
-    def get_current_mac(self, request):
-        """현재 IP 주소의 MAC 주소를 가져옵니다."""
-        try:
-            # 요청 헤더 로깅
-            logger.info("Request headers: %s", request.META)
-            
-            # X-Real-IP 또는 X-Forwarded-For 헤더에서 실제 클라이언트 IP 가져오기
-            client_ip = request.META.get('HTTP_X_REAL_IP') or request.META.get('HTTP_X_FORWARDED_FOR', '').split(',')[0].strip()
-            if not client_ip:
-                client_ip = request.META.get('REMOTE_ADDR')
-                
-            logger.info("Client IP: %s", client_ip)
-
-            # ARP 명령어 사용 부분 삭제 - Docker 컨테이너에 arp 명령이 없어서 오류 발생
-            
-            # KEA DHCP 서버에서 MAC 주소 조회
-            logger.info("Trying to get MAC from KEA DHCP server...")
-            mac_address = KeaClient.get_mac_from_ip(client_ip)
-            logger.info("MAC address from KEA DHCP: %s", mac_address)
-
-            if mac_address:
-                logger.info("Returning MAC address: %s for IP: %s", mac_address, client_ip)
-                # 중첩된 구조 제거: 'data' 객체 안에 데이터를 넣지 않고 직접 반환
-                return Response({
-                    'success': True,
-                    'ip_address': client_ip,
-                    'mac_address': mac_address
-                })
-            else:
-                logger.warning("MAC address not found for IP: %s", client_ip)
-                # 중첩된 구조 제거: 'data' 객체 안에 데이터를 넣지 않고 직접 반환
-                return Response({
-                    'success': False,
-                    'message': 'MAC 주소를 찾을 수 없습니다.',
-                    'ip_address': client_ip,
-                    'mac_address': '00:00:00:00:00:00'
-                })
-
-        except Exception as e:
-            logger.error("Error in get_current_mac: %s", str(e), exc_info=True)
-            # 중첩된 구조 제거: 'data' 객체 안에 데이터를 넣지 않고 직접 반환
-            return Response({
-                'success': False,
-                'message': str(e),
-                'ip_address': client_ip if 'client_ip' in locals() else 'unknown',
-                'mac_address': '00:00:00:00:00:00'
-            }, status=500) 
-        
     @action(detail=False, methods=['post'])
     def blacklist_ip(self, request):
-        """IP 주소를 블랙리스트에 추가합니다. (관리자 전용)"""
-        ip_address = request.data.get('ip_address')
-        if not ip_address:
+        """
+        IP 주소를 블랙리스트에 추가합니다. (관리자 전용)
+
+        ip_address(단일 IP, CIDR 10.129.57.32/28, 범위 10.129.57.40-10.129.57.60) 또는
+        ip_addresses(목록)를 받아 한 번에 추가하고, 해당 IP를 쓰던 장치는 한 번의 배정으로 재할당합니다.
+        """
+        values = request.data.get('ip_addresses') or []
+        if not isinstance(values, list):
+            return Response({"error": "ip_addresses는 목록이어야 합니다."}, status=status.HTTP_400_BAD_REQUEST)
+        if request.data.get('ip_address'):
+            values = [request.data.get('ip_address')] + values
+        if not values:
             return Response({"error": "IP 주소가 제공되지 않았습니다."}, status=status.HTTP_400_BAD_REQUEST)
-            
-        # IP 주소 형식 검증
-        if not re.match(r'^(\d{1,3}\.){3}\d{1,3}$', ip_address):
-            return Response({"error": "유효하지 않은 IP 주소 형식입니다."}, status=status.HTTP_400_BAD_REQUEST)
-            
-        # 블랙리스트에 추가
-        result = KeaClient.add_to_blacklist(ip_address)
         
-        if result:
-            # 이 IP를 사용 중인 장치 찾기
-            devices = Device.objects.filter(assigned_ip=ip_address)
-            
-            # 찾은 장치의 IP 재할당
-            for device in devices:
-                old_ip = device.assigned_ip
-                
-                # 현재 사용 중인 IP 목록 (해당 장치 제외)
-                used_ips = list(Device.objects.exclude(id=device.id).values_list('assigned_ip', flat=True))
-                
-                # 사용자 유형에 따라 IP 대역 결정
-                is_student = not device.user.is_staff
-                
-                # 새 IP 할당
-                new_ip = KeaClient.find_available_ip(existing_ips=used_ips, is_student=is_student)
-                
-                if new_ip:
-                    # 새 IP 등록
-                    KeaClient.register_ip_to_kea(device.mac_address, new_ip, device.device_name)
-                    
-                    # 장치 업데이트
-                    device.assigned_ip = new_ip
-                    device.save()
-                    
-                    # 이력 기록
-                    DeviceHistory.objects.create(
-                        user=request.user,
-                        mac_address=device.mac_address,
-                        device_name=device.device_name,
-                        assigned_ip=new_ip,
-                        action='REASSIGN_IP_BLACKLIST'
-                    )
-                    
-                    logger.info(f"블랙리스트로 인해 장치 {device.mac_address}의 IP가 {old_ip}에서 {new_ip}로 변경되었습니다.")
-            
-            return Response({
-                "message": f"IP 주소 {ip_address}가 블랙리스트에 추가되었습니다.",
-                "affected_devices": devices.count()
-            })
-        else:
+        try:
+            result = blacklist_ranges(values, reason=request.data.get('reason'), user=request.user)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            logger.error(f"IP 블랙리스트 추가 중 오류 발생: {e}")
             return Response({"error": "IP 주소를 블랙리스트에 추가하는데 실패했습니다."}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        
+        entries = result['added'] + result['existing']
+        return Response({
+            "message": f"{', '.join(entries[:5])}{' 등' if len(entries) > 5 else ''}이(가) 블랙리스트에 추가되었습니다.",
+            "added": result['added'],
+            "existing": result['existing'],
+            "affected_devices": len(result['reassigned']) + len(result['failed']),
+            "reassigned": result['reassigned'],
+            "failed": result['failed'],
+            "kea_synced": result['kea_synced'],
+        })
     
     @action(detail=False, methods=['post'])
     def unblacklist_ip(self, request):
-        """IP 주소를 블랙리스트에서 제거합니다. (관리자 전용)"""
+        """블랙리스트 항목(IP 주소, CIDR, 범위)을 제거합니다. (관리자 전용)"""
         ip_address = request.data.get('ip_address')
         if not ip_address:
             return Response({"error": "IP 주소가 제공되지 않았습니다."}, status=status.HTTP_400_BAD_REQUEST)
@@ -582,6 +560,7 @@ class DeviceViewSet(viewsets.ModelViewSet):
             return Response({"error": "IP 주소가 블랙리스트에 없거나 제거하는데 실패했습니다."}, status=status.HTTP_400_BAD_REQUEST)
     
     @action(detail=False, methods=['get'])
+    @cached_response('blacklist')
     def blacklisted_ips(self, request):
         """블랙리스트된 IP 주소 목록을 가져옵니다. (관리자 전용)"""
         blacklisted_ips = KeaClient.get_blacklisted_ips()
@@ -593,13 +572,13 @@ class DeviceViewSet(viewsets.ModelViewSet):
 
     @action(detail=False, methods=['get'])
     def history(self, request):
-        """IP 할당 이력 조회 (관리자용)"""
+        """IP 할당 이력 조회 (관리자용, ?pagination=cursor 커서 모드, ?approximate_count=true 근사 개수)"""
         # 페이지네이션 설정
         page = request.query_params.get('page', 1)
         search = request.query_params.get('search', '')
         
         # 기본 쿼리셋
-        queryset = DeviceHistory.objects.all().order_by('-created_at')
+        queryset = DeviceHistory.objects.select_related('user').order_by('-created_at', '-id')
         
         # 검색어가 있는 경우 필터링
         if search:
@@ -611,13 +590,20 @@ class DeviceViewSet(viewsets.ModelViewSet):
             )
         
         # 페이지네이션 적용
-        paginator = PageNumberPagination()
-        paginator.page_size = 10
-        paginated_queryset = paginator.paginate_queryset(queryset, request)
+        paginator = get_history_paginator(request, page_size=10)
+        paginated_queryset = paginator.paginate_queryset(queryset, request, view=self)
         
         # 시리얼라이저로 데이터 변환
         serializer = DeviceHistorySerializer(paginated_queryset, many=True)
         
+        # 커서 모드: 전체 개수 없이 이전/다음 커서만 반환
+        if isinstance(paginator, HistoryCursorPagination):
+            return Response({
+                'results': serializer.data,
+                'next': paginator.get_next_link(),
+                'previous': paginator.get_previous_link()
+            })
+        
         # 응답 데이터 구성
         response_data = {
             'results': serializer.data,
@@ -680,6 +666,58 @@ class DeviceViewSet(viewsets.ModelViewSet):
                 'message': '대여 내역 조회 중 오류가 발생했습니다.'
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
+
+class CurrentDeviceMacView(AsyncAPIView):
+    """현재 IP 주소의 MAC 주소 조회 (캡티브 포털 첫 화면, 비동기 뷰)"""
+    action = 'get_current_mac'
+
+    async def get(self, request):
+        """현재 IP 주소의 MAC 주소를 가져옵니다."""
+        try:
+            # 요청 헤더 로깅
+            logger.info("Request headers: %s", request.META)
+            
+            # X-Real-IP 또는 X-Forwarded-For 헤더에서 실제 클라이언트 IP 가져오기
+            client_ip = request.META.get('HTTP_X_REAL_IP') or request.META.get('HTTP_X_FORWARDED_FOR', '').split(',')[0].strip()
+            if not client_ip:
+                client_ip = request.META.get('REMOTE_ADDR')
+                
+            logger.info("Client IP: %s", client_ip)
+
+            # KEA DHCP 서버에서 MAC 주소 조회
+            logger.info("Trying to get MAC from KEA DHCP server...")
+            mac_address = await KeaClient.aget_mac_from_ip(client_ip)
+            logger.info("MAC address from KEA DHCP: %s", mac_address)
+
+            if mac_address:
+                logger.info("Returning MAC address: %s for IP: %s", mac_address, client_ip)
+                # 중첩된 구조 제거: 'data' 객체 안에 데이터를 넣지 않고 직접 반환
+                return Response({
+                    'success': True,
+                    'ip_address': client_ip,
+                    'mac_address': mac_address
+                })
+            else:
+                logger.warning("MAC address not found for IP: %s", client_ip)
+                # 중첩된 구조 제거: 'data' 객체 안에 데이터를 넣지 않고 직접 반환
+                return Response({
+                    'success': False,
+                    'message': 'MAC 주소를 찾을 수 없습니다.',
+                    'ip_address': client_ip,
+                    'mac_address': '00:00:00:00:00:00'
+                })
+
+        except Exception as e:
+            logger.error("Error in get_current_mac: %s", str(e), exc_info=True)
+            # 중첩된 구조 제거: 'data' 객체 안에 데이터를 넣지 않고 직접 반환
+            return Response({
+                'success': False,
+                'message': str(e),
+                'ip_address': client_ip if 'client_ip' in locals() else 'unknown',
+                'mac_address': '00:00:00:00:00:00'
+            }, status=500)
+
+
 @api_view(['GET'])
 @permission_classes([IsAdminUser])
 def get_rental_stats(request):
@@ -715,20 +753,8 @@ def get_ip_rentals(request):
     else:
         devices = Device.objects.all()
     
-    rentals = []
-    for device in devices:
-        rentals.append({
-            'id': device.id,
-            'device_name': device.device_name,
-            'mac_address': device.mac_address,
-            'assigned_ip': device.assigned_ip,
-            'username': device.user.username,
-            'created_at': device.created_at,
-            'last_access': device.last_access,
-            'is_active': device.is_active
-        })
-    
-    return Response(rentals)
+    # 모델 인스턴스 없이 values_list 행으로 직렬화
+    return Response(DeviceRentalValuesSerializer(devices).data)
 
 @api_view(['GET'])
 @permission_classes([IsAdminUser])
@@ -752,6 +778,6 @@ def get_device_rentals(request):
         rentals = rentals.filter(status=status_param)
 
     rentals = rentals.order_by('-created_at')
-    serializer = RentalSerializer(rentals, many=True)
-    return Response(serializer.data)
+    # RentalSerializer와 같은 출력 (사용자/장비/진행 중 요청을 행마다 조회하지 않음)
+    return Response(RentalValuesSerializer(rentals).data)
         
\ No newline at end of file
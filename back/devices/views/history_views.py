@@ -8,6 +8,7 @@ import logging
 from django.db.models import Q
 from rest_framework.pagination import PageNumberPagination
 
+from core.pagination import HistoryPageNumberPagination, get_history_paginator
 from ..models import DeviceHistory
 from ..serializers import DeviceHistorySerializer
 
@@ -24,17 +25,17 @@ class DeviceHistoryViewSet(viewsets.ReadOnlyModelViewSet):
     search_fields = ['device_name', 'device_mac', 'details', 'user__username']
     ordering_fields = ['created_at', 'user__username', 'device_name', 'action']
     ordering = ['-created_at']
-    pagination_class = PageNumberPagination
+    pagination_class = HistoryPageNumberPagination
     
     def get_queryset(self):
         # 관리자는 모든 이력 조회 가능
         if self.request.user.is_superuser:
-            return DeviceHistory.objects.all().order_by('-created_at')
+            return DeviceHistory.objects.select_related('user').order_by('-created_at', '-id')
         # 일반 사용자는 자신의 이력만 조회 가능
-        return DeviceHistory.objects.filter(user=self.request.user).order_by('-created_at')
+        return DeviceHistory.objects.select_related('user').filter(user=self.request.user).order_by('-created_at', '-id')
 
     def list(self, request, *args, **kwargs):
-        """IP 할당 이력 목록 조회"""
+        """IP 할당 이력 목록 조회 (?pagination=cursor 커서 모드, ?approximate_count=true 근사 개수)"""
         # 검색어가 있는 경우 필터링
         search = request.query_params.get('search', '')
         queryset = self.get_queryset()
@@ -48,10 +49,11 @@ class DeviceHistoryViewSet(viewsets.ReadOnlyModelViewSet):
             )
         
         # 페이지네이션 적용
-        page = self.paginate_queryset(queryset)
+        paginator = get_history_paginator(request)
+        page = paginator.paginate_queryset(queryset, request, view=self)
         if page is not None:
             serializer = self.get_serializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
+            return paginator.get_paginated_response(serializer.data)
             
         serializer = self.get_serializer(queryset, many=True)
         return Response(serializer.data)
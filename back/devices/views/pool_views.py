@@ -0,0 +1,74 @@
+import logging
+
+from django.http import HttpResponse
+from django.utils import timezone
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.response import Response
+
+from core.permissions import IsAdminUser
+from ..reclamation import pool_utilization, run_reclamation
+
+logger = logging.getLogger(__name__)
+
+# 요청 파라미터 → 회수 정책 키
+POLICY_PARAMS = {
+    'inactive_days': ('INACTIVE_DAYS', int),
+    'never_seen_days': ('NEVER_SEEN_DAYS', int),
+    'inactive_user_days': ('INACTIVE_USER_DAYS', int),
+    'min_band_utilization': ('MIN_BAND_UTILIZATION', float),
+    'limit': ('MAX_PER_RUN', int),
+}
+
+
+def _policy_overrides(params):
+    overrides = {}
+    for param, (key, cast) in POLICY_PARAMS.items():
+        value = params.get(param)
+        if value in (None, ''):
+            continue
+        overrides[key] = cast(value)
+    exempt_staff = params.get('exempt_staff')
+    if exempt_staff not in (None, ''):
+        overrides['EXEMPT_STAFF'] = str(exempt_staff).lower() in ('1', 'true', 'yes')
+    return overrides
+
+
+@api_view(['GET'])
+@permission_classes([IsAdminUser])
+def ip_pool_utilization(request):
+    """대역별 IP 풀 사용량"""
+    try:
+        return Response({'success': True, 'bands': pool_utilization()})
+    except Exception as e:
+        logger.error(f"IP 풀 사용량 조회 실패: {str(e)}")
+        return Response({'success': False, 'message': f'IP 풀 사용량 조회 중 오류가 발생했습니다: {str(e)}'}, status=500)
+
+
+@api_view(['GET', 'POST'])
+@permission_classes([IsAdminUser])
+def reclaim_ips(request):
+    """
+    장기 미사용 IP 예약 회수
+
+    GET: 드라이런 보고서 (?inactive_days=, ?never_seen_days=, ?limit=, ?export=csv)
+    POST: 회수 실행 (본문에 같은 정책 값 지정 가능)
+    """
+    params = request.query_params if request.method == 'GET' else request.data
+    try:
+        overrides = _policy_overrides(params)
+    except (TypeError, ValueError):
+        return Response({'success': False, 'message': '정책 값은 숫자여야 합니다.'}, status=400)
+
+    try:
+        report = run_reclamation(apply=request.method == 'POST', **overrides)
+    except Exception as e:
+        logger.error(f"IP 예약 회수 실패: {str(e)}")
+        return Response({'success': False, 'message': f'IP 예약 회수 중 오류가 발생했습니다: {str(e)}'}, status=500)
+
+    if request.method == 'GET' and request.query_params.get('export') == 'csv':
+        response = HttpResponse(report.to_csv(), content_type='text/csv; charset=utf-8')
+        filename = f"ip_reclaim_{timezone.localtime(report.generated_at):%Y%m%d_%H%M%S}.csv"
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        return response
+
+    return Response({'success': True, 'report': report.to_dict()})
@@ -0,0 +1,74 @@
+import logging
+
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.response import Response
+
+from core.permissions import IsAdminUser
+from ..reconciliation import CATEGORIES, LAST_REPORT_CACHE_KEY, run_reconciliation
+
+logger = logging.getLogger(__name__)
+
+
+def _parse_options(params):
+    """요청 파라미터에서 증분 여부, 기준 시각, 카테고리 추출"""
+    incremental = str(params.get('incremental', '')).lower() in ('1', 'true', 'yes')
+
+    since = params.get('since')
+    if since:
+        since = parse_datetime(str(since))
+        if since is None:
+            raise ValueError('since는 ISO 8601 형식이어야 합니다.')
+        if timezone.is_naive(since):
+            since = timezone.make_aware(since)
+
+    categories = params.get('categories')
+    if isinstance(categories, str):
+        categories = [c.strip() for c in categories.split(',') if c.strip()]
+    if categories:
+        unknown = set(categories) - set(CATEGORIES)
+        if unknown:
+            raise ValueError(f"알 수 없는 카테고리: {', '.join(sorted(unknown))}")
+
+    return incremental, since, categories or None
+
+
+@api_view(['GET', 'POST'])
+@permission_classes([IsAdminUser])
+def reconcile_kea(request):
+    """
+    Device ↔ KEA 정합성 점검
+
+    GET: 드라이런 (?incremental=true, ?since=..., ?export=csv, ?last=true)
+    POST: 점검 후 수정 적용 ({"incremental": bool, "since": "...", "categories": [...]})
+    """
+    if request.method == 'GET' and request.query_params.get('last') == 'true':
+        return Response({'success': True, 'report': cache.get(LAST_REPORT_CACHE_KEY)})
+
+    params = request.query_params if request.method == 'GET' else request.data
+    try:
+        incremental, since, categories = _parse_options(params)
+    except ValueError as e:
+        return Response({'success': False, 'message': str(e)}, status=400)
+
+    try:
+        report = run_reconciliation(
+            apply=request.method == 'POST',
+            incremental=incremental,
+            categories=categories,
+            since=since,
+        )
+    except Exception as e:
+        logger.error(f"KEA 정합성 점검 실패: {str(e)}")
+        return Response({'success': False, 'message': f'정합성 점검 중 오류가 발생했습니다: {str(e)}'}, status=500)
+
+    if request.method == 'GET' and request.query_params.get('export') == 'csv':
+        response = HttpResponse(report.to_csv(), content_type='text/csv; charset=utf-8')
+        filename = f"kea_drift_{timezone.localtime(report.generated_at):%Y%m%d_%H%M%S}.csv"
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        return response
+
+    return Response({'success': True, 'report': report.to_dict()})
@@ -1,5 +1,8 @@
 from django.db import models
 from django.conf import settings
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 
 # Create your models here.
 
@@ -74,6 +77,18 @@ class SslCertificate(models.Model):
     def is_revoked(self):
         """인증서가 폐기되었는지 확인"""
         return self.status == '폐기'
+    
+    @staticmethod
+    def ocsp_cache_key(serial_number):
+        """서명된 OCSP 응답 캐시 키"""
+        return f'ocsp:response:{serial_number}'
+
+
+@receiver([post_save, post_delete], sender=SslCertificate)
+def invalidate_ocsp_response(sender, instance, **kwargs):
+    """인증서가 변경/삭제(CASCADE 포함)되면 캐시된 OCSP 응답 삭제"""
+    if instance.serial_number:
+        cache.delete(SslCertificate.ocsp_cache_key(instance.serial_number))
 
 class CertificateAuthority(models.Model):
     """내부 CA 정보"""
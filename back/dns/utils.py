@@ -6,6 +6,7 @@ import json
 import requests
 from typing import List, Tuple
 from .models import CustomDnsRecord
+from system.performance import track_external
 import idna
 
 # EXTERNAL_PIHOLE_API 환경변수에서 주소를 받아 ws://[주소]:8000/ws/pihole/ 형태로 사용
@@ -117,7 +118,8 @@ def ensure_default_dns_record():
 def check_external_service():
     """외부 Pi-hole 서비스 연결 상태 확인"""
     try:
-        response = requests.get(f"{API_HOST}/health", timeout=5)
+        with track_external('pihole'):
+            response = requests.get(f"{API_HOST}/health", timeout=5)
         return response.status_code == 200
     except:
         return False
@@ -127,7 +129,8 @@ def add_domain_via_api(domain: str, ip: str) -> dict:
     try:
         url = f"{PIHOLE_API_SYNC}/add_domain"
         payload = {"domain": domain, "ip": ip}
-        resp = requests.post(url, json=payload, timeout=5)
+        with track_external('pihole'):
+            resp = requests.post(url, json=payload, timeout=5)
         return resp.json() if resp.ok else {"success": False, "message": resp.text}
     except Exception as e:
         print(f"API 오류: {e}")
@@ -138,7 +141,8 @@ def remove_domain_via_api(domain: str) -> dict:
     try:
         url = f"{PIHOLE_API_SYNC}/remove_domain"
         payload = {"domain": domain}
-        resp = requests.post(url, json=payload, timeout=5)
+        with track_external('pihole'):
+            resp = requests.post(url, json=payload, timeout=5)
         return resp.json() if resp.ok else {"success": False, "message": resp.text}
     except Exception as e:
         print(f"API 오류: {e}")
@@ -148,7 +152,8 @@ def remove_domain_via_api(domain: str) -> dict:
 def get_pihole_status_via_api() -> dict:
     try:
         url = f"{PIHOLE_API_SYNC}/status"
-        resp = requests.get(url, timeout=5)
+        with track_external('pihole'):
+            resp = requests.get(url, timeout=5)
         return resp.json() if resp.ok else {"status": "error", "message": resp.text}
     except Exception as e:
         print(f"API 오류: {e}")
@@ -212,7 +217,8 @@ def apply_dns_records():
     for rec in record_list:
         print(f"  - {rec['domain']} -> {rec['ip']}")
     try:
-        resp = requests.post(PIHOLE_API_SYNC, json={"records": record_list}, timeout=10)
+        with track_external('pihole'):
+            resp = requests.post(PIHOLE_API_SYNC, json={"records": record_list}, timeout=10)
         if resp.ok:
             return resp.json()
         else:
@@ -221,6 +227,26 @@ def apply_dns_records():
         print(f"Pi-hole API 동기화 오류: {e}")
         return {'result': f'Pi-hole API 동기화 오류: {str(e)}'}
 
+async def aapply_dns_records():
+    """apply_dns_records의 비동기 버전 (비동기 뷰용, Pi-hole 동시 요청 수는 core.async_http 한도를 따름)"""
+    from core import async_http
+    await CustomDnsRecord.objects.aupdate_or_create(
+        domain=to_punycode('정보포털.com'), defaults={'ip': '10.129.55.253'}
+    )
+    record_list = [{"domain": rec.domain, "ip": rec.ip} async for rec in CustomDnsRecord.objects.all()]
+    print("[동기화 요청] FastAPI로 보낼 레코드 목록:")
+    for rec in record_list:
+        print(f"  - {rec['domain']} -> {rec['ip']}")
+    try:
+        resp = await async_http.request('pihole', 'POST', PIHOLE_API_SYNC, json={"records": record_list}, timeout=10)
+        if resp.is_success:
+            return resp.json()
+        else:
+            return {'result': f'Pi-hole API 동기화 실패: {resp.text}'}
+    except Exception as e:
+        print(f"Pi-hole API 동기화 오류: {e}")
+        return {'result': f'Pi-hole API 동기화 오류: {str(e)}'}
+
 # Pi-hole 상태 조회
 def get_pihole_status():
     if not check_external_service():
@@ -6,15 +6,18 @@ from .serializers import (
     CustomDnsRequestSerializer, CustomDnsRecordSerializer, SslCertificateSerializer, 
     CertificateAuthoritySerializer, CertificateGenerationRequestSerializer, CertificateFileSerializer
 )
-from .utils import apply_dns_records, to_punycode, validate_domain
+from .utils import apply_dns_records, aapply_dns_records, to_punycode, validate_domain
 from .ssl_utils import generate_ssl_certificate, revoke_ssl_certificate, check_expiring_certificates, renew_ssl_certificate, create_ssl_package
 from django.utils import timezone
 from django.db import models
 import logging
 import os
 from django.conf import settings
+from django.core.cache import cache
 from django.http import FileResponse, Http404, HttpResponse
+from core.async_views import AsyncAPIView
 from core.permissions import IsAdminUser, IsAuthenticatedUser
+from system.performance import increment
 
 # OCSP 관련 import 추가
 from cryptography import x509
@@ -248,11 +251,11 @@ class MyDnsRecordDeleteView(generics.DestroyAPIView):
         
         return Response({'message': '도메인이 삭제되고 DNS에 반영되었습니다.'}, status=status.HTTP_200_OK)
 
-class ApplyDnsRecordsView(views.APIView):
+class ApplyDnsRecordsView(AsyncAPIView):
     # permission_classes 제거 - 기본 권한 클래스 사용
 
-    def post(self, request):
-        result = apply_dns_records()
+    async def post(self, request):
+        result = await aapply_dns_records()
         return Response(result)
 
 # SSL 관련 뷰들
@@ -597,6 +600,15 @@ class OCSPView(views.APIView):
             
             logger.info(f"OCSP 요청 수신: 시리얼 번호 {serial_number}")
             
+            # 캐시된 서명 응답이 있으면 재사용 (CA 키 로드/서명 생략)
+            cache_key = SslCertificate.ocsp_cache_key(serial_number)
+            cached_der = cache.get(cache_key) if settings.OCSP_RESPONSE_CACHE_TTL > 0 else None
+            if cached_der is not None:
+                increment('ocsp_cache', result='hit')
+                return self._der_response(cached_der)
+            increment('ocsp_cache', result='miss')
+            cache_timeout = settings.OCSP_RESPONSE_CACHE_TTL
+            
             # 2. 인증서 상태 확인
             try:
                 cert = SslCertificate.objects.get(serial_number=str(serial_number))
@@ -615,6 +627,9 @@ class OCSPView(views.APIView):
                     cert_status = OCSPCertStatus.GOOD
                     revocation_time = None
                     revocation_reason = None
+                    # 만료 시점 이후까지 GOOD 응답이 캐시되지 않도록 제한
+                    remaining = int((cert.expires_at - timezone.now()).total_seconds())
+                    cache_timeout = min(cache_timeout, max(remaining, 0))
                     logger.info(f"인증서 정상: {cert.domain}")
                     
             except SslCertificate.DoesNotExist:
@@ -649,25 +664,28 @@ class OCSPView(views.APIView):
             )
             
             ocsp_response = builder.sign(private_key=ca_key, algorithm=hashes.SHA256())
-            
-            # 5. 바이너리 응답 반환
-            response = HttpResponse(
-                ocsp_response.public_bytes(serialization.Encoding.DER),
-                content_type='application/ocsp-response'
-            )
-            
-            # OCSP 응답 헤더 설정
-            response['Cache-Control'] = 'no-cache, no-store, must-revalidate'
-            response['Pragma'] = 'no-cache'
-            response['Expires'] = '0'
+            der = ocsp_response.public_bytes(serialization.Encoding.DER)
+            if cache_timeout > 0:
+                cache.set(cache_key, der, cache_timeout)
             
             logger.info(f"OCSP 응답 전송: 상태 {cert_status}")
-            return response
+            # 5. 바이너리 응답 반환
+            return self._der_response(der)
             
         except Exception as e:
             logger.error(f"OCSP 요청 처리 실패: {e}")
             return Response({'error': 'OCSP request failed'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
     
+    @staticmethod
+    def _der_response(der):
+        response = HttpResponse(der, content_type='application/ocsp-response')
+        
+        # OCSP 응답 헤더 설정
+        response['Cache-Control'] = 'no-cache, no-store, must-revalidate'
+        response['Pragma'] = 'no-cache'
+        response['Expires'] = '0'
+        return response
+    
     def get(self, request):
         """OCSP 상태 확인 (헬스체크용)"""
         return Response({
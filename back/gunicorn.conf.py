@@ -1,4 +1,5 @@
 # Gunicorn 설정 파일
+import os
 
 # 바인딩할 서버 주소와 포트
 bind = "0.0.0.0:8000"
@@ -7,9 +8,18 @@ bind = "0.0.0.0:8000"
 # 일반적으로 CPU 코어 수의 2-4배가 권장됨
 workers = 4
 
-# 워커 클래스 설정
-# 'sync'는 기본값, 'gevent' 또는 'uvicorn.workers.UvicornWorker'로 변경 가능
-worker_class = 'sync'
+# 서버 모드 (SERVER_MODE 환경변수)
+# - wsgi: sync 워커, 요청 하나가 워커 하나를 점유
+# - asgi: uvicorn 워커 (config.workers.AsgiWorker), 비동기 뷰(방송 프록시, MAC 조회, DNS 동기화, 시스템 상태)는
+#   외부 서버 응답을 기다리는 동안 같은 워커가 다른 요청을 처리하고, 나머지 동기 뷰는 스레드에서 실행됨
+SERVER_MODE = os.environ.get('SERVER_MODE', 'wsgi')
+
+if SERVER_MODE == 'asgi':
+    worker_class = 'config.workers.AsgiWorker'
+    wsgi_app = 'config.asgi:application'
+else:
+    worker_class = 'sync'
+    wsgi_app = 'config.wsgi:application'
 
 # 워커 타임아웃 (초)
 timeout = 120
@@ -18,6 +28,12 @@ timeout = 120
 max_requests = 1000
 max_requests_jitter = 50
 
+# 앱 미리 불러오기
+# 마스터가 Django와 뷰 모듈을 한 번 불러온 뒤 fork하므로 워커끼리 메모리를 copy-on-write로 공유하고
+# max_requests로 재시작되는 워커도 import 없이 바로 요청을 받음
+# 주의: HUP으로는 코드 변경이 반영되지 않으므로 배포 시 마스터 프로세스를 재시작해야 함
+preload_app = os.environ.get('GUNICORN_PRELOAD_APP', 'True') == 'True'
+
 # 로깅 설정
 accesslog = '-'
 errorlog = '-'
@@ -40,4 +56,41 @@ daemon = False
 # keyfile = '/path/to/keyfile'
 # certfile = '/path/to/certfile'
 
-# Django의 WSGI 애플리케이션은 이제 Dockerfile에서 직접 지정됨
\ No newline at end of file
+# Django 애플리케이션은 위의 SERVER_MODE에 따라 wsgi_app으로 지정됨
+
+# 백그라운드 스레드(헬스체크 갱신, 스케줄러)는 WSGI 모듈 import 시점이 아니라 아래 훅에서 워커마다 시작
+# (마스터에서 시작한 스레드는 fork된 워커로 이어지지 않음, core.startup 참고)
+os.environ['BACKGROUND_SERVICES_POST_FORK'] = 'True'
+
+
+# 마스터 훅(when_ready, child_exit)은 preload_app이 꺼져 있으면 Django 설정 없이 실행되므로 지정
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+
+
+def when_ready(server):
+    """마스터 준비 완료 (워커 fork 전) - 공유 캐시 확인, 이전 실행의 성능 집계 정리, preload 시 뷰 모듈을 불러오고 DB 연결 정리"""
+    from core.checks import warn_if_cache_not_shared
+    from system.performance import clear_snapshots
+    warn_if_cache_not_shared(server.cfg.workers)
+    clear_snapshots()
+    if server.cfg.preload_app:
+        from core.startup import preload_application
+        preload_application()
+
+
+def post_worker_init(worker):
+    """워커가 앱을 불러온 뒤 - 워커 프로세스의 백그라운드 스레드 시작"""
+    from core.startup import start_background_services
+    start_background_services()
+
+
+def worker_exit(server, worker):
+    """워커 종료 직전 (워커 프로세스) - 마지막 기록 이후의 성능 집계를 파일에 남김"""
+    from system.performance import registry
+    registry.flush()
+
+
+def child_exit(server, worker):
+    """워커 종료 후 (마스터) - 종료된 워커의 집계를 누적값에 합쳐 카운터가 줄어들지 않도록 함"""
+    from system.performance import mark_process_dead
+    mark_process_dead(worker.pid)
@@ -0,0 +1,66 @@
+"""
+대여 관련 주기 작업 (core.scheduler에서 실행)
+"""
+import logging
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.utils import timezone
+
+from core.response_cache import mark_changed
+from .models import EquipmentHistory, Rental
+
+logger = logging.getLogger(__name__)
+User = get_user_model()
+
+BATCH_SIZE = 500
+
+
+def mark_overdue_rentals():
+    """반납 예정일이 지난 대여(RENTED)를 연체(OVERDUE)로 일괄 변경하고 장비 이력 기록"""
+    now = timezone.now()
+    with transaction.atomic():
+        # 처리 중 반납되는 대여와 겹치지 않도록 대상 행을 잠금
+        overdue = list(
+            Rental.objects.select_for_update()
+            .filter(status='RENTED', due_date__lt=now)
+            .values_list('id', 'equipment_id', 'user_id', 'approved_by_id', 'due_date')
+        )
+        if not overdue:
+            return 0
+
+        usernames = dict(
+            User.objects.filter(id__in={row[2] for row in overdue}).values_list('id', 'username')
+        )
+        updated = 0
+        for start in range(0, len(overdue), BATCH_SIZE):
+            chunk = overdue[start:start + BATCH_SIZE]
+            updated += Rental.objects.filter(id__in=[row[0] for row in chunk]).update(
+                status='OVERDUE', updated_at=now
+            )
+        # queryset.update()는 시그널이 없으므로 장비 조회 응답 캐시를 직접 무효화
+        mark_changed('equipment')
+
+        # 작업자는 기존 이력 마이그레이션과 같이 승인자, 없으면 대여자로 기록
+        EquipmentHistory.objects.bulk_create([
+            EquipmentHistory(
+                equipment_id=equipment_id,
+                action='STATUS_CHANGED',
+                user_id=approved_by_id or user_id,
+                old_value={
+                    'rental_id': rental_id,
+                    'user_id': user_id,
+                    'username': usernames.get(user_id),
+                    'status': 'RENTED',
+                },
+                new_value={'rental_id': rental_id, 'status': 'OVERDUE', 'due_date': due_date.isoformat()},
+                details=(
+                    f"연체 처리: Rental #{rental_id} ({usernames.get(user_id)}) "
+                    f"반납 예정일 {timezone.localtime(due_date):%Y-%m-%d %H:%M} 경과"
+                ),
+            )
+            for rental_id, equipment_id, user_id, approved_by_id, due_date in overdue
+        ], batch_size=BATCH_SIZE)
+
+    logger.info(f"연체 대여 {updated}건 처리 완료")
+    return updated
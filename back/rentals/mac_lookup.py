@@ -0,0 +1,74 @@
+"""
+MAC 주소로 장비/사용자 일괄 조회
+
+PXE 설치 장비는 부팅 시 여러 NIC의 MAC을 한꺼번에 보내므로,
+입력 MAC을 표준 형식(core.mac)으로 바꾼 뒤 인덱스 컬럼에 IN 쿼리 한 번으로 조회하고
+결과는 입력 순서를 유지한 채 장비 ID 집합으로 중복을 제거합니다.
+"""
+from django.db.models import Prefetch, prefetch_related_objects
+
+from core.mac import normalize_macs
+from devices.models import Device
+from .models import EquipmentMacAddress, Rental
+
+
+def extract_mac_addresses(*values):
+    """
+    요청 값에서 MAC 목록 추출 (표준 형식, 입력 순서 유지, 중복 제거)
+
+    각 값은 MAC 문자열, {'mac_address': ...} 객체, 또는 그 둘이 섞인 목록일 수 있습니다.
+    """
+    macs = []
+    for value in values:
+        for item in value if isinstance(value, (list, tuple)) else [value]:
+            mac_address = item.get('mac_address') if isinstance(item, dict) else item
+            if isinstance(mac_address, str) and mac_address.strip():
+                macs.append(mac_address)
+    return normalize_macs(macs)
+
+
+def find_equipment_by_macs(mac_addresses):
+    """
+    표준 형식 MAC 목록에 해당하는 장비를 [(MAC, 장비)]로 반환
+
+    입력 순서상 처음 일치한 MAC 기준으로 장비당 한 번만 포함하며,
+    직렬화에 쓰는 mac_addresses와 현재 대여(current_rentals)를 미리 불러옵니다.
+    """
+    if not mac_addresses:
+        return []
+    rows = EquipmentMacAddress.objects.filter(mac_canonical__in=mac_addresses).select_related('equipment')
+    equipment_by_mac = {row.mac_canonical: row.equipment for row in rows}
+
+    found = []
+    seen = set()
+    for mac_address in mac_addresses:
+        equipment = equipment_by_mac.get(mac_address)
+        if equipment is not None and equipment.pk not in seen:
+            seen.add(equipment.pk)
+            found.append((mac_address, equipment))
+
+    prefetch_related_objects(
+        [equipment for _, equipment in found],
+        'mac_addresses',
+        Prefetch(
+            'rentals',
+            queryset=Rental.objects.filter(status__in=['RENTED', 'OVERDUE']).select_related('user').order_by('-rental_date'),
+            to_attr='current_rentals'
+        ),
+    )
+    return found
+
+
+def find_device_owner_by_macs(mac_addresses):
+    """입력 순서상 처음으로 사용자가 있는 등록 장치의 사용자 (없으면 None)"""
+    if not mac_addresses:
+        return None
+    devices = {
+        device.mac_address: device
+        for device in Device.objects.filter(mac_address__in=mac_addresses).select_related('user')
+    }
+    for mac_address in mac_addresses:
+        device = devices.get(mac_address)
+        if device is not None and device.user:
+            return device.user
+    return None
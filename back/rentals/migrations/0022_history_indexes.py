@@ -0,0 +1,23 @@
+# Generated by Django 5.1.6 on 2026-10-19 01:20
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('rentals', '0021_alter_equipment_acquisition_date'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='equipmenthistory',
+            index=models.Index(fields=['equipment', 'created_at'], name='equip_hist_equip_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='equipmenthistory',
+            index=models.Index(fields=['created_at'], name='equip_hist_created_idx'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.1.6 on 2026-10-19 01:40
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('rentals', '0022_history_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='rental',
+            index=models.Index(fields=['status', 'due_date'], name='rental_status_due_idx'),
+        ),
+    ]
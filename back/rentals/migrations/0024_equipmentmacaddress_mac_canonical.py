@@ -0,0 +1,29 @@
+# Generated by Django 5.1.6 on 2026-10-19 01:52
+
+from django.db import migrations, models
+
+from core.mac import normalize_mac
+
+
+def fill_mac_canonical(apps, schema_editor):
+    EquipmentMacAddress = apps.get_model('rentals', 'EquipmentMacAddress')
+    rows = list(EquipmentMacAddress.objects.only('id', 'mac_address'))
+    for row in rows:
+        row.mac_canonical = normalize_mac(row.mac_address) if row.mac_address else ''
+    EquipmentMacAddress.objects.bulk_update(rows, ['mac_canonical'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('rentals', '0023_rental_rental_status_due_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='equipmentmacaddress',
+            name='mac_canonical',
+            field=models.CharField(db_index=True, default='', editable=False, max_length=17, verbose_name='표준 MAC 주소'),
+        ),
+        migrations.RunPython(fill_mac_canonical, migrations.RunPython.noop),
+    ]
@@ -2,6 +2,8 @@ from django.db import models
 from django.conf import settings
 from django.utils import timezone
 
+from core.mac import normalize_mac
+
 def get_default_due_date():
     return timezone.now().replace(month=12, day=31)
 
@@ -11,6 +13,8 @@ class EquipmentMacAddress(models.Model):
     """
     equipment = models.ForeignKey('Equipment', on_delete=models.CASCADE, related_name='mac_addresses', verbose_name='장비')
     mac_address = models.CharField(max_length=17, verbose_name='MAC 주소')
+    # 조회용 표준 형식 (소문자 콜론 구분, save()에서 채움)
+    mac_canonical = models.CharField(max_length=17, db_index=True, editable=False, default='', verbose_name='표준 MAC 주소')
     interface_type = models.CharField(max_length=20, choices=(
         ('ETHERNET', '이더넷'),
         ('WIFI', '와이파이'),
@@ -23,6 +27,13 @@ class EquipmentMacAddress(models.Model):
     
     def __str__(self):
         return f"{self.equipment.asset_number} - {self.mac_address} ({self.get_interface_type_display()})"
+
+    def save(self, *args, **kwargs):
+        self.mac_canonical = normalize_mac(self.mac_address) if self.mac_address else ''
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'mac_address' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'mac_canonical'}
+        super().save(*args, **kwargs)
     
     class Meta:
         verbose_name = '장비 MAC 주소'
@@ -371,6 +382,10 @@ class Rental(models.Model):
     class Meta:
         verbose_name = '대여'
         verbose_name_plural = '대여 내역'
+        indexes = [
+            # 연체 처리 작업 (status='RENTED', due_date < now)
+            models.Index(fields=['status', 'due_date'], name='rental_status_due_idx'),
+        ]
 
 
 class RentalRequest(models.Model):
@@ -441,3 +456,7 @@ class EquipmentHistory(models.Model):
         verbose_name = '장비 이력'
         verbose_name_plural = '장비 이력들'
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['equipment', 'created_at'], name='equip_hist_equip_created_idx'),
+            models.Index(fields=['created_at'], name='equip_hist_created_idx'),
+        ]
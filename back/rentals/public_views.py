@@ -4,6 +4,7 @@ from rest_framework import status
 from rest_framework.permissions import AllowAny
 from django.shortcuts import get_object_or_404
 from django.db.models import Prefetch
+from core.response_cache import cached_response
 from .models import Equipment, Rental, EquipmentHistory
 from .serializers import PublicEquipmentSerializer, PublicRentalSerializer, PublicEquipmentHistorySerializer
 import logging
@@ -18,6 +19,7 @@ class PublicEquipmentView(APIView):
     """
     permission_classes = [AllowAny]
     
+    @cached_response('equipment')
     def get(self, request, serial_number):
         """
         일련번호로 장비 정보와 대여이력 조회
@@ -96,6 +98,7 @@ class PublicEquipmentStatusView(APIView):
     """
     permission_classes = [AllowAny]
     
+    @cached_response('equipment')
     def get(self, request, serial_number):
         """
         일련번호로 장비의 기본 상태 정보만 조회
@@ -115,7 +118,7 @@ class PublicEquipmentStatusView(APIView):
             # 현재 대여 중인지 확인
             current_rental = Rental.objects.filter(
                 equipment=equipment,
-                status='RENTED'
+                status__in=['RENTED', 'OVERDUE']
             ).select_related('user').first()
             
             response_data = {
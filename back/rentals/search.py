@@ -0,0 +1,43 @@
+"""
+장비 검색 인덱스 (core.search)
+
+자산번호, 시리얼, 관리번호, 모델명, 제조사, 설명, MAC 주소와
+해당 장비를 대여한 사용자의 아이디/이름에서 부분 문자열로 찾습니다.
+"""
+from collections import defaultdict
+
+from core.mac import mac_digits
+from core.search import SearchIndex
+
+from .models import Equipment, EquipmentMacAddress, Rental
+
+EQUIPMENT_FIELDS = (
+    'asset_number', 'serial_number', 'management_number', 'model_name', 'manufacturer', 'description',
+)
+
+
+def load_equipment(ids):
+    queryset = Equipment.objects.all() if ids is None else Equipment.objects.filter(pk__in=ids)
+    macs = EquipmentMacAddress.objects.all() if ids is None else EquipmentMacAddress.objects.filter(equipment_id__in=ids)
+    rentals = Rental.objects.all() if ids is None else Rental.objects.filter(equipment_id__in=ids)
+
+    mac_map = defaultdict(list)
+    for equipment_id, mac_canonical in macs.values_list('equipment_id', 'mac_canonical').iterator(chunk_size=2000):
+        mac_map[equipment_id].append(mac_canonical)
+    renter_map = defaultdict(set)
+    for equipment_id, username, first_name, last_name in (
+        rentals.values_list('equipment_id', 'user__username', 'user__first_name', 'user__last_name')
+        .distinct().iterator(chunk_size=2000)
+    ):
+        renter_map[equipment_id].update((username, f"{last_name}{first_name}"))
+
+    for pk, *values in queryset.values_list('id', *EQUIPMENT_FIELDS).iterator(chunk_size=2000):
+        yield pk, pk, (
+            *values,
+            ' '.join(mac_map.get(pk, ())),
+            ' '.join(mac_digits(mac) or '' for mac in mac_map.get(pk, ())),
+            ' '.join(sorted(renter_map.get(pk, ()))),
+        )
+
+
+equipment_search_index = SearchIndex('equipment', load_equipment, weights=(3, 3, 3, 2, 1, 1, 3, 3, 1))
@@ -1,6 +1,9 @@
+from collections import defaultdict
+
 from rest_framework import serializers
 from .models import Equipment, Rental, RentalRequest, EquipmentMacAddress, EquipmentHistory
 from django.contrib.auth import get_user_model
+from core.serializers import ValuesSerializer, choice_labels
 import logging
 
 User = get_user_model()
@@ -423,4 +426,156 @@ class RentalRequestSerializer(serializers.ModelSerializer):
             'requested_date', 'expected_return_date', 'status', 'status_display',
             'request_reason', 'reject_reason', 'processed_by', 'processed_date', 'created_at'
         ]
-        read_only_fields = ['user', 'processed_by', 'processed_date', 'created_at'] 
\ No newline at end of file
+        read_only_fields = ['user', 'processed_by', 'processed_date', 'created_at'] 
+
+def _short_user(row):
+    """rentals UserSerializer와 같은 사용자 요약 (row: id, username, email, first_name, last_name, is_staff)"""
+    user_id, username, email, first_name, last_name, is_staff = row
+    if last_name and first_name:
+        name = f"{last_name} {first_name}"
+    else:
+        name = last_name or first_name or username
+    return {
+        'id': user_id, 'username': username, 'email': email,
+        'first_name': first_name, 'last_name': last_name, 'is_staff': is_staff, 'name': name,
+    }
+
+
+class EquipmentValuesSerializer(ValuesSerializer):
+    """
+    EquipmentSerializer와 같은 출력의 values-mode 직렬화 (목록용)
+
+    context['current_rental']가 True면 get_queryset의 current_rentals 프리페치처럼 현재 대여 정보를 채우고,
+    아니면 프리페치 없이 직렬화한 것처럼 rental은 None입니다.
+    """
+    model = Equipment
+    columns = (
+        'id', 'asset_number', 'manufacturer', 'model_name', 'equipment_type', 'serial_number', 'description',
+        'status', 'acquisition_date', 'manufacture_year', 'purchase_date', 'management_number', 'purchase_price',
+        'created_at',
+    )
+
+    def prepare(self, rows):
+        equipment_ids = [row['id'] for row in rows]
+        interface_labels = choice_labels(EquipmentMacAddress, 'interface_type')
+        self.mac_addresses = defaultdict(list)
+        for mac_id, equipment_id, mac_address, interface_type, is_primary in (
+            EquipmentMacAddress.objects.filter(equipment_id__in=equipment_ids).order_by('equipment_id', 'id')
+            .values_list('id', 'equipment_id', 'mac_address', 'interface_type', 'is_primary')
+        ):
+            self.mac_addresses[equipment_id].append({
+                'id': mac_id,
+                'mac_address': mac_address,
+                'interface_type': interface_type,
+                'interface_type_display': interface_labels.get(interface_type, interface_type),
+                'is_primary': is_primary,
+            })
+
+        self.rentals = {}
+        if self.context.get('current_rental'):
+            # get_rental()은 날짜를 변환 없이 반환하므로 원래 값 그대로 사용
+            for equipment_id, rental_id, due_date, rental_date, *user in (
+                Rental.objects.filter(equipment_id__in=equipment_ids, status__in=['RENTED', 'OVERDUE'])
+                .order_by('-rental_date')
+                .values_list('equipment_id', 'id', 'due_date', 'rental_date',
+                             'user_id', 'user__username', 'user__first_name', 'user__last_name')
+            ):
+                if equipment_id in self.rentals:
+                    continue
+                user_id, username, first_name, last_name = user
+                full_name = f"{str(last_name or '').strip()} {str(first_name or '').strip()}".strip()
+                self.rentals[equipment_id] = {
+                    'user': {'id': user_id, 'username': username, 'name': full_name or username},
+                    'due_date': due_date,
+                    'rental_date': rental_date,
+                    'id': rental_id,
+                }
+
+    def to_representation(self, row):
+        return {
+            'id': row['id'],
+            'asset_number': row['asset_number'],
+            'manufacturer': row['manufacturer'],
+            'model_name': row['model_name'],
+            'equipment_type': row['equipment_type'],
+            'equipment_type_display': self.display('equipment_type', row['equipment_type']),
+            'serial_number': row['serial_number'],
+            'mac_addresses': self.mac_addresses.get(row['id'], []),
+            'description': row['description'],
+            'status': row['status'],
+            'status_display': self.display('status', row['status']),
+            'acquisition_date': row['acquisition_date'],
+            'manufacture_year': row['manufacture_year'],
+            'purchase_date': row['purchase_date'],
+            'rental': self.rentals.get(row['id']),
+            'management_number': row['management_number'],
+            'purchase_price': row['purchase_price'],
+            'created_at': row['created_at'],
+        }
+
+
+class RentalValuesSerializer(ValuesSerializer):
+    """RentalSerializer와 같은 출력의 values-mode 직렬화 (대여 내역 목록용)"""
+    model = Rental
+    columns = (
+        'id', 'user_id', 'equipment_id', 'rental_date', 'due_date', 'return_date', 'status', 'notes',
+        'approved_by_id', 'returned_to_id', 'created_at', 'updated_at',
+    )
+    user_columns = ('id', 'username', 'email', 'first_name', 'last_name', 'is_staff')
+
+    def prepare(self, rows):
+        user_ids = {row[key] for row in rows for key in ('user_id', 'approved_by_id', 'returned_to_id')}
+        user_ids.discard(None)
+        self.users = {
+            values[0]: _short_user(values)
+            for values in User.objects.filter(pk__in=user_ids).values_list(*self.user_columns)
+        }
+
+        equipment_ids = {row['equipment_id'] for row in rows}
+        self.equipment = {
+            item['id']: item
+            for item in EquipmentValuesSerializer(Equipment.objects.filter(pk__in=equipment_ids)).data
+        }
+
+        # 장비/사용자별 가장 최근의 진행 중인 요청 (get_pending_request와 같은 기준)
+        request_type_labels = choice_labels(RentalRequest, 'request_type')
+        request_status_labels = choice_labels(RentalRequest, 'status')
+        pairs = {(row['equipment_id'], row['user_id']) for row in rows}
+        self.pending_requests = {}
+        for request_id, equipment_id, user_id, request_type, request_status, requested_date, reason in (
+            RentalRequest.objects.filter(equipment_id__in=equipment_ids, status='PENDING')
+            .order_by('-requested_date')
+            .values_list('id', 'equipment_id', 'user_id', 'request_type', 'status', 'requested_date', 'request_reason')
+        ):
+            key = (equipment_id, user_id)
+            if key not in pairs or key in self.pending_requests:
+                continue
+            self.pending_requests[key] = {
+                'id': request_id,
+                'request_type': request_type,
+                'request_type_display': request_type_labels.get(request_type, request_type),
+                'status': request_status,
+                'status_display': request_status_labels.get(request_status, request_status),
+                'requested_date': requested_date,
+                'request_reason': reason,
+            }
+
+    def to_representation(self, row):
+        return {
+            'id': row['id'],
+            'user': row['user_id'],
+            'user_detail': self.users.get(row['user_id']),
+            'equipment': row['equipment_id'],
+            'equipment_detail': self.equipment.get(row['equipment_id']),
+            'rental_date': row['rental_date'],
+            'due_date': row['due_date'],
+            'return_date': row['return_date'],
+            'status': row['status'],
+            'status_display': self.display('status', row['status']),
+            'notes': row['notes'],
+            'approved_by': self.users.get(row['approved_by_id']),
+            'returned_to': self.users.get(row['returned_to_id']),
+            'created_at': row['created_at'],
+            'updated_at': row['updated_at'],
+            'pending_request': self.pending_requests.get((row['equipment_id'], row['user_id'])),
+        }
@@ -6,7 +6,9 @@ from django.utils import timezone
 from django.db import transaction
 from django.utils.dateparse import parse_date, parse_datetime
 
+from core.response_cache import mark_changed
 from rentals.models import Equipment, Rental, EquipmentHistory
+from rentals.search import equipment_search_index
 
 
 def get_user_active_rental_count(user) -> int:
@@ -290,5 +292,158 @@ def return_rental(rental: Rental, actor, record_history: bool = True) -> None:
             )
 
 
+# 일괄 상태 변경 이력에 쓰는 상태 표시명 (장비 모델 선택지와 일부 다름, 기존 이력과 같은 문구 유지)
+STATUS_DISPLAY = {
+    'AVAILABLE': '사용 가능',
+    'RENTED': '대여 중',
+    'MAINTENANCE': '유지보수',
+    'BROKEN': '파손',
+    'LOST': '분실',
+    'DISPOSED': '폐기',
+}
 
 
+def _display_name(user) -> str:
+    if user.last_name and user.first_name:
+        return f"{user.last_name} {user.first_name}"
+    return user.last_name or user.first_name or user.username
+
+
+def batch_change_equipment_status(
+    equipment_ids,
+    new_status: str,
+    actor,
+    reason: str = "",
+    renter=None,
+) -> dict:
+    """여러 장비의 상태를 한 번에 변경 (EquipmentViewSet.batch_change_status)
+
+    장비와 활성 대여를 각각 한 번에 읽어 메모리에서 전환을 계산한 뒤
+    bulk_update / bulk_create로 반영하므로 장비 수와 관계없이 쿼리 수가 일정합니다.
+
+    - 이미 같은 상태인 장비는 실패로 집계
+    - AVAILABLE: 활성 대여(RENTED/OVERDUE)를 반납 처리하고 RETURNED 이력 기록
+    - RENTED: renter에게 30일 대여 생성
+    - 장비마다 STATUS_CHANGED 이력 기록
+
+    bulk 작업은 save() 시그널이 없으므로 검색 인덱스와 응답 캐시 갱신을 직접 알립니다.
+    관리번호가 비어 있어 save()에서 새로 만들어야 하는 장비만 개별 저장합니다.
+
+    반환: {'success_count', 'failed_count', 'errors', 'equipment_ids'(변경된 장비)}
+    """
+    now = timezone.now()
+    new_status_display = STATUS_DISPLAY.get(new_status, new_status)
+    returned_to = actor if getattr(actor, "is_staff", False) else None
+    errors = []
+
+    with transaction.atomic():
+        equipments = list(Equipment.objects.select_for_update().filter(id__in=equipment_ids))
+        changing = []
+        for equipment in equipments:
+            if equipment.status == new_status:
+                errors.append(f"장비 {equipment.asset_number or equipment.model_name}: 이미 {new_status_display} 상태입니다.")
+            else:
+                changing.append(equipment)
+
+        active_rentals = {}
+        if new_status == "AVAILABLE" and changing:
+            for rental in (
+                Rental.objects.select_related("user")
+                .filter(equipment__in=changing, status__in=["RENTED", "OVERDUE"])
+                .order_by("id")
+            ):
+                active_rentals.setdefault(rental.equipment_id, []).append(rental)
+
+        returned = []
+        created = []
+        histories = []
+        saved_individually = []
+        for equipment in changing:
+            old_status = equipment.status
+            label = equipment.asset_number or equipment.model_name or equipment.serial_number
+
+            rentals = active_rentals.get(equipment.id, [])
+            for rental in rentals:
+                rental.status = "RETURNED"
+                rental.return_date = now
+                rental.returned_to = returned_to
+                rental.updated_at = now
+                returned.append(rental)
+                histories.append(EquipmentHistory(
+                    equipment=equipment,
+                    action="RETURNED",
+                    user=actor,
+                    old_value={
+                        "rental_id": rental.id,
+                        "user_id": rental.user.id,
+                        "username": rental.user.username,
+                        "status": "RENTED",
+                    },
+                    new_value={
+                        "status": "AVAILABLE",
+                        "return_date": now.isoformat(),
+                        "returned_to": actor.username if returned_to else None,
+                    },
+                    details=f"장비 '{label}' 반납 from {_display_name(rental.user)} ({rental.user.username})",
+                ))
+
+            equipment.status = new_status
+            equipment.updated_at = now
+            if equipment.management_number is None and equipment.purchase_date:
+                saved_individually.append(equipment)
+
+            if new_status == "RENTED" and renter:
+                created.append(Rental(
+                    equipment=equipment,
+                    user=renter,
+                    approved_by=actor,
+                    rental_date=now,
+                    due_date=now + timezone.timedelta(days=30),  # 기본 30일
+                    status="RENTED",
+                    notes=reason or "일괄 상태 변경으로 대여",
+                ))
+
+            details = f"장비 상태 변경: {STATUS_DISPLAY.get(old_status, old_status)} → {new_status_display}"
+            if rentals:
+                details += f" (자동 반납 {len(rentals)}건)"
+            if new_status == "RENTED" and renter:
+                details += f" (대여자: {_display_name(renter)} ({renter.username}))"
+            if reason:
+                details += f" (사유: {reason})"
+            histories.append(EquipmentHistory(
+                equipment=equipment,
+                action="STATUS_CHANGED",
+                user=actor,
+                old_value={"status": old_status},
+                new_value={
+                    "status": new_status,
+                    "reason": reason,
+                    "user_id": renter.id if renter else None,
+                    "username": renter.username if renter else None,
+                },
+                details=details,
+            ))
+
+        if returned:
+            Rental.objects.bulk_update(returned, ["status", "return_date", "returned_to", "updated_at"], batch_size=500)
+        if changing:
+            Equipment.objects.bulk_update(changing, ["status", "updated_at"], batch_size=500)
+        for equipment in saved_individually:
+            # 관리번호 자동 생성
+            equipment.save()
+        if created:
+            Rental.objects.bulk_create(created, batch_size=500)
+        if histories:
+            EquipmentHistory.objects.bulk_create(histories, batch_size=500)
+
+        changed_ids = [equipment.id for equipment in changing]
+        if changed_ids:
+            equipment_search_index.mark_changed(changed_ids)
+            mark_changed("equipment")
+
+    return {
+        "success_count": len(changing),
+        "failed_count": len(errors),
+        "errors": errors,
+        "equipment_ids": changed_ids,
+    }
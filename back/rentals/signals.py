@@ -1,10 +1,18 @@
 """
 장비 대여 관련 시그널
 - 사용자 삭제 시 미반납 장비가 있으면 삭제 차단
+- 장비, MAC 주소, 대여, 대여자 정보가 바뀌면 장비 검색 인덱스 갱신
+- 장비 관련 정보(이력 포함)가 바뀌면 장비 조회 응답 캐시 무효화
 """
-from django.db.models.signals import pre_delete
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save, pre_delete
 from django.dispatch import receiver
 
+from core.response_cache import mark_changed
+from users.search import indexed_fields_updated
+from .models import Equipment, EquipmentHistory, EquipmentMacAddress, Rental
+from .search import equipment_search_index
+
 
 @receiver(pre_delete)
 def prevent_user_delete_with_active_rentals(sender, instance, **kwargs):
@@ -25,3 +33,38 @@ def prevent_user_delete_with_active_rentals(sender, instance, **kwargs):
             f"사용자 '{instance.username}'은(는) 현재 {cnt}개의 장비를 대여 중입니다. "
             "모든 장비를 반납한 후 삭제할 수 있습니다."
         )
+
+
+@receiver(post_save, sender=Equipment)
+@receiver(post_delete, sender=Equipment)
+def equipment_changed(sender, instance, **kwargs):
+    equipment_search_index.mark_changed([instance.pk])
+    mark_changed('equipment')
+
+
+@receiver(post_save, sender=EquipmentMacAddress)
+@receiver(post_delete, sender=EquipmentMacAddress)
+@receiver(post_save, sender=Rental)
+@receiver(post_delete, sender=Rental)
+def equipment_related_changed(sender, instance, **kwargs):
+    """MAC 주소나 대여자가 바뀌면 해당 장비 문서 갱신"""
+    equipment_search_index.mark_changed([instance.equipment_id])
+    mark_changed('equipment')
+
+
+@receiver(post_save, sender=EquipmentHistory)
+@receiver(post_delete, sender=EquipmentHistory)
+def equipment_history_changed(sender, instance, **kwargs):
+    mark_changed('equipment')
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def renter_changed(sender, instance, created, update_fields=None, **kwargs):
+    if created or not indexed_fields_updated(update_fields):
+        return
+    equipment_ids = list(
+        Rental.objects.filter(user_id=instance.pk).values_list('equipment_id', flat=True).distinct()
+    )
+    if equipment_ids:
+        equipment_search_index.mark_changed(equipment_ids)
+        mark_changed('equipment')
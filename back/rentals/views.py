@@ -7,24 +7,25 @@ from django.utils import timezone
 from django.db.models import Q
 from django.http import HttpResponse
 import csv
-from openpyxl import Workbook
-from openpyxl.styles import Font, Alignment
-import pandas as pd
 from io import BytesIO
 from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
 from django.contrib.auth import get_user_model, login
 from rest_framework.permissions import AllowAny
 import logging
 from rest_framework.pagination import PageNumberPagination
+from core.pagination import HistoryCursorPagination
+from core.search import IndexedSearchFilter
+from core.response_cache import cached_response
 from django.db.models import Prefetch
 from django.db import transaction
 from datetime import datetime
 from core.permissions import IsAdminUser, IsAuthenticatedUser, IsOwnerOrAdmin
 
 from .models import Equipment, Rental, RentalRequest, EquipmentMacAddress, EquipmentHistory
-from .serializers import EquipmentSerializer, RentalSerializer, RentalRequestSerializer, EquipmentMacAddressSerializer, EquipmentLiteSerializer, EquipmentHistorySerializer
+from .serializers import EquipmentSerializer, EquipmentValuesSerializer, RentalSerializer, RentalRequestSerializer, EquipmentMacAddressSerializer, EquipmentLiteSerializer, EquipmentHistorySerializer
 from django.contrib.auth import get_user_model
-from devices.models import Device
+from .mac_lookup import extract_mac_addresses, find_device_owner_by_macs, find_equipment_by_macs
+from .search import equipment_search_index
 
 User = get_user_model()
 
@@ -68,7 +69,9 @@ class EquipmentViewSet(viewsets.ModelViewSet):
     queryset = Equipment.objects.all()
     serializer_class = EquipmentSerializer
     # permission_classes 제거 - 기본 권한 클래스 사용
-    filter_backends = [filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [IndexedSearchFilter, filters.OrderingFilter]
+    search_index = equipment_search_index
+    # 검색 인덱스를 쓸 수 없을 때의 기본 검색 필드
     search_fields = [
         'asset_number', 
         'serial_number', 
@@ -120,12 +123,31 @@ class EquipmentViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
     
+    def list(self, request, *args, **kwargs):
+        """
+        장비 목록 (values-mode)
+
+        필터/정렬/페이지네이션은 그대로 적용해 현재 페이지의 ID만 구한 뒤
+        EquipmentSerializer와 같은 출력을 values_list 행으로 만듭니다.
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset.values_list('pk', flat=True))
+        ids = list(page if page is not None else queryset.values_list('pk', flat=True))
+        rows = EquipmentValuesSerializer(
+            Equipment.objects.filter(pk__in=ids), context={'current_rental': True}
+        ).data
+        position = {pk: index for index, pk in enumerate(ids)}
+        rows.sort(key=lambda row: position[row['id']])
+        if page is not None:
+            return self.get_paginated_response(rows)
+        return Response(rows)
+
     def get_queryset(self):
         """관리자용 장비 목록 조회 시 대여 정보도 함께 로드"""
         queryset = Equipment.objects.prefetch_related(
             Prefetch(
                 'rentals',
-                queryset=Rental.objects.filter(status='RENTED').select_related('user').order_by('-rental_date'),
+                queryset=Rental.objects.filter(status__in=['RENTED', 'OVERDUE']).select_related('user').order_by('-rental_date'),
                 to_attr='current_rentals'
             )
         )
@@ -609,6 +631,7 @@ class EquipmentViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['post'], url_path='import')
     def import_excel(self, request):
         """엑셀 파일로부터 장비를 일괄 추가하는 API (관리자 전용)"""
+        import pandas as pd
         if not request.user.is_superuser:
             return Response({"detail": "관리자 권한이 필요합니다."}, status=status.HTTP_403_FORBIDDEN)
         
@@ -700,7 +723,7 @@ class EquipmentViewSet(viewsets.ModelViewSet):
         if serial_number:
             try:
                 existing_equipment = Equipment.objects.get(serial_number=serial_number)
-                current_rental = existing_equipment.rentals.filter(status='RENTED').first()
+                current_rental = existing_equipment.rentals.filter(status__in=['RENTED', 'OVERDUE']).first()
                 rental_info = None
                 if current_rental and current_rental.user:
                     rental_info = {
@@ -731,21 +754,8 @@ class EquipmentViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        # MAC 주소로 사용자 찾기
-        user = None
-        for mac_item in mac_addresses:
-            mac_address = mac_item.get('mac_address') if isinstance(mac_item, dict) else mac_item
-            if not mac_address:
-                continue
-                
-            try:
-                # Device 모델에서 MAC 주소로 사용자 찾기
-                device = Device.objects.get(mac_address=mac_address)
-                if device.user:
-                    user = device.user
-                    break
-            except Device.DoesNotExist:
-                continue
+        # MAC 주소로 사용자 찾기 (등록 장치 한 번에 조회)
+        user = find_device_owner_by_macs(extract_mac_addresses(mac_addresses))
         
         if not user:
             return Response(
@@ -979,6 +989,12 @@ class EquipmentViewSet(viewsets.ModelViewSet):
                     logger.error(f"자동 이력 생성 실패: {e}")
                     return Response({"detail": f"이력을 생성할 수 없습니다: {str(e)}"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
             
+            # 커서(keyset) 페이지네이션 요청 시 (?pagination=cursor)
+            if request.query_params.get('pagination') == 'cursor':
+                paginator = HistoryCursorPagination()
+                page = paginator.paginate_queryset(history.select_related('user'), request, view=self)
+                return paginator.get_paginated_response(EquipmentHistorySerializer(page, many=True).data)
+            
             # 시리얼라이저 처리
             try:
                 serializer = EquipmentHistorySerializer(history, many=True)
@@ -1180,120 +1196,25 @@ class EquipmentViewSet(viewsets.ModelViewSet):
                 except User.DoesNotExist:
                     return Response({"detail": "지정된 사용자를 찾을 수 없습니다."}, status=status.HTTP_404_NOT_FOUND)
             
-            # 상태 표시명 매핑
-            status_display_map = {
-                'AVAILABLE': '사용 가능',
-                'RENTED': '대여 중',
-                'MAINTENANCE': '유지보수',
-                'BROKEN': '파손',
-                'LOST': '분실',
-                'DISPOSED': '폐기'
-            }
-            new_status_display = status_display_map.get(new_status, new_status)
+            from .services.rental_logic import STATUS_DISPLAY, batch_change_equipment_status
+            new_status_display = STATUS_DISPLAY.get(new_status, new_status)
             
             # 장비 조회
             equipments = Equipment.objects.filter(id__in=equipment_ids)
             if not equipments.exists():
                 return Response({"detail": "지정된 장비를 찾을 수 없습니다."}, status=status.HTTP_404_NOT_FOUND)
             
-            success_count = 0
-            failed_count = 0
-            errors = []
-            
-            with transaction.atomic():
-                for equipment in equipments:
-                    try:
-                        old_status = equipment.status
-                        if old_status == new_status:
-                            errors.append(f"장비 {equipment.asset_number or equipment.model_name}: 이미 {new_status_display} 상태입니다.")
-                            failed_count += 1
-                            continue
-                        
-                        # AVAILABLE로 변경 시 활성 대여 자동 반납 처리
-                        if new_status == 'AVAILABLE':
-                            auto_returned_count = 0
-                            active_rentals = Rental.objects.filter(
-                                equipment=equipment,
-                                status__in=['RENTED', 'OVERDUE']
-                            )
-                            for rental in active_rentals:
-                                rental.status = 'RETURNED'
-                                rental.return_date = timezone.now()
-                                rental.returned_to = request.user if request.user.is_staff else None
-                                rental.save()
-                                auto_returned_count += 1
-                                # 반납 이력 기록
-                                EquipmentHistory.objects.create(
-                                    equipment=equipment,
-                                    action='RETURNED',
-                                    user=request.user,
-                                    old_value={
-                                        'rental_id': rental.id,
-                                        'user_id': rental.user.id,
-                                        'username': rental.user.username,
-                                        'status': 'RENTED'
-                                    },
-                                    new_value={
-                                        'status': 'AVAILABLE',
-                                        'return_date': rental.return_date.isoformat(),
-                                        'returned_to': request.user.username if request.user.is_staff else None
-                                    },
-                                    details=f"장비 '{equipment.asset_number or equipment.model_name or equipment.serial_number}' 반납 from {f'{rental.user.last_name} {rental.user.first_name}' if rental.user.last_name and rental.user.first_name else (rental.user.last_name or rental.user.first_name or rental.user.username)} ({rental.user.username})"
-                                )
-
-                        # 상태 변경 저장
-                        equipment.status = new_status
-                        equipment.save()
-                        
-                        # 대여중 상태일 때 Rental 레코드 생성
-                        if new_status == 'RENTED' and user:
-                            from .models import Rental
-                            rental = Rental.objects.create(
-                                equipment=equipment,
-                                user=user,
-                                approved_by=request.user,
-                                rental_date=timezone.now(),
-                                due_date=timezone.now() + timezone.timedelta(days=30),  # 기본 30일
-                                status='RENTED',
-                                notes=reason or f"일괄 상태 변경으로 대여"
-                            )
-                            logger.info(f"대여 레코드 생성: 장비 {equipment.asset_number} → 사용자 {user.username}")
-                        
-                        # 이력 기록
-                        old_status_display = status_display_map.get(old_status, old_status)
-                        details = f"장비 상태 변경: {old_status_display} → {new_status_display}"
-                        if new_status == 'AVAILABLE':
-                            # 자동 반납 건 수 표시
-                            auto_count = locals().get('auto_returned_count', 0)
-                            if auto_count and auto_count > 0:
-                                details += f" (자동 반납 {auto_count}건)"
-                        if new_status == 'RENTED' and user:
-                            details += f" (대여자: {f'{user.last_name} {user.first_name}' if user.last_name and user.first_name else (user.last_name or user.first_name or user.username)} ({user.username}))"
-                        if reason:
-                            details += f" (사유: {reason})"
-                        
-                        EquipmentHistory.objects.create(
-                            equipment=equipment,
-                            action='STATUS_CHANGED',
-                            user=request.user,
-                            old_value={'status': old_status},
-                            new_value={
-                                'status': new_status, 
-                                'reason': reason,
-                                'user_id': user.id if user else None,
-                                'username': user.username if user else None
-                            },
-                            details=details
-                        )
-                        
-                        success_count += 1
-                        logger.info(f"장비 상태 변경 성공: {equipment.asset_number} {old_status} → {new_status}")
-                        
-                    except Exception as e:
-                        error_msg = f"장비 {equipment.asset_number or equipment.model_name}: {str(e)}"
-                        errors.append(error_msg)
-                        failed_count += 1
-                        logger.error(f"장비 상태 변경 실패: {equipment.asset_number} - {e}")
+            # 장비/활성 대여를 한 번에 읽어 bulk 반영 (장비 수와 관계없이 쿼리 수 일정)
+            batch = batch_change_equipment_status(
+                equipment_ids, new_status, request.user, reason=reason, renter=user
+            )
+            success_count = batch['success_count']
+            failed_count = batch['failed_count']
+            errors = batch['errors']
+            logger.info(
+                f"장비 일괄 상태 변경: {success_count}개 → {new_status} (실패 {failed_count}개)"
+                + (f", 대여자 {user.username}" if user else "")
+            )
             
             # 결과 반환
             result = {
@@ -1321,6 +1242,7 @@ class EquipmentViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['get'], url_path='export-excel')
     def export_excel(self, request):
         """장비목록 엑셀 출력 (관리자 전용)"""
+        import pandas as pd
         if not request.user.is_staff:
             return Response({"detail": "권한이 없습니다."}, status=status.HTTP_403_FORBIDDEN)
             
@@ -1337,7 +1259,7 @@ class EquipmentViewSet(viewsets.ModelViewSet):
             for idx, equipment in enumerate(equipment_list, 1):
                 try:
                     # 현재 대여 중인 정보 찾기
-                    current_rental = equipment.rentals.filter(status='RENTED').first()
+                    current_rental = equipment.rentals.filter(status__in=['RENTED', 'OVERDUE']).first()
                     logger.debug(f"장비 {equipment.asset_number}의 현재 대여 정보: {current_rental}")
                     
                     # 사용자 이름 생성
@@ -1395,6 +1317,7 @@ class EquipmentViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['post'], url_path='bulk-update-excel')
     def bulk_update_excel(self, request):
         """엑셀 파일을 통한 장비 정보 일괄 등록/업데이트 (관리자 전용)"""
+        import pandas as pd
         if not request.user.is_staff:
             return Response({"detail": "권한이 없습니다."}, status=status.HTTP_403_FORBIDDEN)
             
@@ -1651,7 +1574,7 @@ class EquipmentReadOnlyViewSet(viewsets.ReadOnlyModelViewSet):
         queryset = Equipment.objects.prefetch_related(
             Prefetch(
                 'rentals',
-                queryset=Rental.objects.filter(status='RENTED').select_related('user').order_by('-rental_date'),
+                queryset=Rental.objects.filter(status__in=['RENTED', 'OVERDUE']).select_related('user').order_by('-rental_date'),
                 to_attr='current_rentals'
             )
         )
@@ -1671,13 +1594,14 @@ class EquipmentReadOnlyViewSet(viewsets.ReadOnlyModelViewSet):
     # get_permissions 메서드 제거 - 중앙화된 권한 관리 사용
     
     @action(detail=False, methods=['get'])
+    @cached_response('equipment')
     def available(self, request):
         """대여 가능한 장비 목록 조회 (인증된 사용자 접근 가능)"""
         # 대여 가능한 장비만 필터링하되 대여 정보도 함께 로드
         available_equipment = Equipment.objects.filter(status='AVAILABLE').prefetch_related(
             Prefetch(
                 'rentals',
-                queryset=Rental.objects.filter(status='RENTED').select_related('user').order_by('-rental_date'),
+                queryset=Rental.objects.filter(status__in=['RENTED', 'OVERDUE']).select_related('user').order_by('-rental_date'),
                 to_attr='current_rentals'
             )
         ).order_by('management_number')
@@ -1700,7 +1624,7 @@ class EquipmentReadOnlyViewSet(viewsets.ReadOnlyModelViewSet):
                     status=status.HTTP_400_BAD_REQUEST
                 )
                 
-            mac_addresses = [mac_address]
+            mac_addresses = []
         
         # POST 요청 처리 (요청 본문에서 MAC 주소 목록 추출)
         else:
@@ -1713,23 +1637,9 @@ class EquipmentReadOnlyViewSet(viewsets.ReadOnlyModelViewSet):
                     status=status.HTTP_400_BAD_REQUEST
                 )
                 
-            # 단일 MAC 주소가 있으면 목록에 추가
-            if mac_address:
-                mac_addresses.append({'mac_address': mac_address})
-            elif isinstance(mac_addresses, list) and all(isinstance(item, dict) for item in mac_addresses):
-                # mac_addresses가 객체 배열인 경우 MAC 주소만 추출
-                mac_addresses = [item.get('mac_address') for item in mac_addresses if item.get('mac_address')]
-        
-        # MAC 주소 목록 순회하며 장비 찾기
-        found_equipment = []
-        for current_mac in mac_addresses:
-            try:
-                mac_obj = EquipmentMacAddress.objects.get(mac_address=current_mac)
-                equipment = mac_obj.equipment
-                if equipment not in found_equipment:  # 중복 제거
-                    found_equipment.append(equipment)
-            except EquipmentMacAddress.DoesNotExist:
-                continue
+        # 단일 MAC과 목록을 합쳐 표준 형식으로 변환한 뒤 한 번에 조회
+        mac_addresses = extract_mac_addresses(mac_addresses, mac_address)
+        found_equipment = [equipment for _, equipment in find_equipment_by_macs(mac_addresses)]
         
         if not found_equipment:
             return Response(
@@ -1830,7 +1740,7 @@ class RentalViewSet(viewsets.ModelViewSet):
         """내 대여 목록 조회 (현재 대여 중인 것만)"""
         my_rentals = Rental.objects.filter(
             user=request.user, 
-            status='RENTED'
+            status__in=['RENTED', 'OVERDUE']
         ).select_related('equipment', 'user').prefetch_related(
             'equipment__rental_requests'
         ).order_by('-rental_date')
@@ -2389,6 +2299,8 @@ class RentalRequestViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['get'])
     def export_excel(self, request):
         """요청 목록 엑셀 출력"""
+        from openpyxl import Workbook
+        from openpyxl.styles import Font, Alignment
         if not request.user.is_staff:
             return Response({"detail": "권한이 없습니다."}, status=status.HTTP_403_FORBIDDEN)
             
@@ -2468,84 +2380,69 @@ class EquipmentMacAddressViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        # 단일 MAC 주소가 있으면 목록에 추가
-        if mac_address:
-            mac_addresses.append({'mac_address': mac_address})
-        
-        # MAC 주소 목록 순회하며 사용자 찾기
-        for mac_item in mac_addresses:
-            current_mac = mac_item.get('mac_address') if isinstance(mac_item, dict) else mac_item
-            if not current_mac:
-                continue
+        # 단일 MAC과 목록을 합쳐 한 번에 조회한 뒤 입력 순서대로 확인
+        mac_addresses = extract_mac_addresses(mac_addresses, mac_address)
+        for current_mac, equipment in find_equipment_by_macs(mac_addresses):
+            # 현재 대여 중인 사용자 찾기
+            current_rental = equipment.current_rentals[0] if equipment.current_rentals else None
+            if current_rental:
+                return Response({
+                    'message': '이미 등록된 장비입니다.',
+                    'equipment': EquipmentSerializer(equipment).data,
+                    'current_user': {
+                        'username': current_rental.user.username,
+                        'full_name': current_rental.user.get_full_name()
+                    }
+                }, status=status.HTTP_200_OK)
+            
+            # 사용자 정보 확인
+            if hasattr(equipment, 'user') and equipment.user:
+                user = equipment.user
+                login(request, user)
                 
-            try:
-                # MAC 주소로 장비 찾기
-                mac_obj = EquipmentMacAddress.objects.get(mac_address=current_mac)
-                equipment = mac_obj.equipment
+                # 대여 정보 생성
+                rental = Rental.objects.create(
+                    user=user,
+                    equipment=equipment,
+                    rental_date=timezone.now(),
+                    due_date=timezone.now() + timezone.timedelta(days=30),  # 30일 후 반납 예정
+                    status='RENTED',
+                    notes=f'MAC 주소({current_mac})를 통한 자동 대여'
+                )
                 
-                # 현재 대여 중인 사용자 찾기
-                current_rental = equipment.rentals.filter(status='RENTED').first()
-                if current_rental:
-                    return Response({
-                        'message': '이미 등록된 장비입니다.',
-                        'equipment': EquipmentSerializer(equipment).data,
-                        'current_user': {
-                            'username': current_rental.user.username,
-                            'full_name': current_rental.user.get_full_name()
-                        }
-                    }, status=status.HTTP_200_OK)
+                # 장비 상태 업데이트
+                equipment.status = 'RENTED'
+                equipment.save()
                 
-                # 사용자 정보 확인
-                if hasattr(equipment, 'user') and equipment.user:
-                    user = equipment.user
-                    login(request, user)
-                    
-                    # 대여 정보 생성
-                    rental = Rental.objects.create(
-                        user=user,
-                        equipment=equipment,
-                        rental_date=timezone.now(),
-                        due_date=timezone.now() + timezone.timedelta(days=30),  # 30일 후 반납 예정
-                        status='RENTED',
-                        notes=f'MAC 주소({current_mac})를 통한 자동 대여'
-                    )
-                    
-                    # 장비 상태 업데이트
-                    equipment.status = 'RENTED'
-                    equipment.save()
-                    
-                    # 장비 대여 이력 기록
-                    EquipmentHistory.objects.create(
-                        equipment=equipment,
-                        action='RENTED',
-                        user=request.user,
-                        new_value={
-                            'rental_id': rental.id,
-                            'user_id': rental.user.id,
-                            'username': rental.user.username,
-                            'rental_date': rental.rental_date.isoformat(),
-                            'due_date': rental.due_date.isoformat(),
-                            'status': 'RENTED'
-                        },
-                        details=f"장비 '{equipment.asset_number or equipment.model_name or equipment.serial_number}' 대여 승인 to {f'{rental.user.last_name} {rental.user.first_name}' if rental.user.last_name and rental.user.first_name else (rental.user.last_name or rental.user.first_name or rental.user.username)} ({rental.user.username})"
-                    )
-                    
-                    return Response({
-                        'message': '로그인 및 장비 대여가 완료되었습니다.',
-                        'user': {
-                            'id': user.id,
-                            'username': user.username,
-                            'first_name': user.first_name,
-                            'last_name': user.last_name,
-                            'email': user.email
-                        },
-                        'rental': RentalSerializer(rental).data,
-                        'equipment': EquipmentSerializer(equipment).data
-                    })
-            except EquipmentMacAddress.DoesNotExist:
-                # 이 MAC 주소로 장비를 찾지 못했으므로 다음 MAC 주소 시도
-                continue
-        
+                # 장비 대여 이력 기록
+                EquipmentHistory.objects.create(
+                    equipment=equipment,
+                    action='RENTED',
+                    user=request.user,
+                    new_value={
+                        'rental_id': rental.id,
+                        'user_id': rental.user.id,
+                        'username': rental.user.username,
+                        'rental_date': rental.rental_date.isoformat(),
+                        'due_date': rental.due_date.isoformat(),
+                        'status': 'RENTED'
+                    },
+                    details=f"장비 '{equipment.asset_number or equipment.model_name or equipment.serial_number}' 대여 승인 to {f'{rental.user.last_name} {rental.user.first_name}' if rental.user.last_name and rental.user.first_name else (rental.user.last_name or rental.user.first_name or rental.user.username)} ({rental.user.username})"
+                )
+                
+                return Response({
+                    'message': '로그인 및 장비 대여가 완료되었습니다.',
+                    'user': {
+                        'id': user.id,
+                        'username': user.username,
+                        'first_name': user.first_name,
+                        'last_name': user.last_name,
+                        'email': user.email
+                    },
+                    'rental': RentalSerializer(rental).data,
+                    'equipment': EquipmentSerializer(equipment).data
+                })
+
         # 모든 MAC 주소를 시도해도 장비를 찾지 못한 경우
         return Response(
             {'error': '등록된 MAC 주소를 가진 장비가 없습니다.'},
@@ -0,0 +1,152 @@
+#!/usr/bin/env python
+"""
+이력 테이블 페이지네이션 벤치마크
+
+임시 테스트 DB에 DeviceHistory 행을 대량 생성한 뒤
+페이지 번호(COUNT + OFFSET), 근사 개수, 커서(keyset) 방식의 조회 시간을 비교합니다.
+운영 DB는 건드리지 않습니다.
+
+사용법:
+    python scripts/benchmark_history_pagination.py [--rows 1000000] [--page-size 100]
+"""
+import argparse
+import os
+import sys
+import time
+from datetime import timedelta
+from urllib.parse import parse_qs, urlparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+
+import django
+from django.conf import settings
+
+django.setup()
+
+from django.db import connection
+from django.test.utils import setup_test_environment, teardown_test_environment
+from django.utils import timezone
+from rest_framework.pagination import Cursor
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from core.pagination import (
+    HistoryCursorPagination, HistoryPageNumberPagination, approximate_count
+)
+from devices.models import DeviceHistory
+from users.models import User
+
+
+def timed(label, func, repeat=3):
+    """func를 repeat회 실행하여 최소 시간 출력"""
+    best = None
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    print(f"  {label:<44} {best * 1000:10.2f} ms")
+    return result
+
+
+def populate(rows, batch_size=10000):
+    """테스트용 사용자와 이력 행 생성"""
+    users = User.objects.bulk_create([
+        User(username=f'bench{i:04d}', email=f'bench{i:04d}@bssm.hs.kr')
+        for i in range(200)
+    ])
+    base = timezone.now() - timedelta(seconds=rows)
+    started = time.perf_counter()
+    # auto_now_add가 created_at을 덮어쓰지 않도록 생성 중에만 해제
+    created_at = DeviceHistory._meta.get_field('created_at')
+    created_at.auto_now_add = False
+    for offset in range(0, rows, batch_size):
+        DeviceHistory.objects.bulk_create([
+            DeviceHistory(
+                user=users[i % len(users)],
+                mac_address=f'02:00:{(i >> 24) & 0xff:02X}:{(i >> 16) & 0xff:02X}:{(i >> 8) & 0xff:02X}:{i & 0xff:02X}',
+                device_name=f'device-{i}',
+                assigned_ip=f'10.129.{50 + (i % 8)}.{20 + (i % 230)}',
+                action='REGISTER',
+                created_at=base + timedelta(seconds=i),
+            )
+            for i in range(offset, min(offset + batch_size, rows))
+        ], batch_size=batch_size)
+    created_at.auto_now_add = True
+    print(f"  {rows:,}행 생성: {time.perf_counter() - started:.1f}s")
+    return users
+
+
+def run(args):
+    factory = APIRequestFactory()
+    queryset = DeviceHistory.objects.order_by('-created_at', '-id')
+    deep_page = max(1, (args.rows // args.page_size) - 1)
+
+    print(f"\n[전체 목록, 페이지 크기 {args.page_size}]")
+    timed("COUNT(*)", lambda: queryset.count())
+    timed("approximate_count()", lambda: approximate_count(queryset))
+
+    def page_number(page, approximate=False):
+        params = {'page': page, 'page_size': args.page_size}
+        if approximate:
+            params['approximate_count'] = 'true'
+        request = Request(factory.get('/', params))
+        paginator = HistoryPageNumberPagination()
+        return list(paginator.paginate_queryset(queryset, request))
+
+    timed("page-number, 첫 페이지", lambda: page_number(1))
+    timed(f"page-number, 깊은 페이지 ({deep_page})", lambda: page_number(deep_page))
+
+    # 깊은 페이지와 같은 위치의 커서 생성
+    anchor = queryset.values_list('created_at', flat=True)[(deep_page - 1) * args.page_size]
+    encoder = HistoryCursorPagination()
+    encoder.base_url = 'http://benchmark/'
+    deep_cursor = parse_qs(urlparse(
+        encoder.encode_cursor(Cursor(offset=0, reverse=False, position=str(anchor)))
+    ).query)['cursor'][0]
+
+    def cursor_page(cursor=None):
+        params = {'page_size': args.page_size}
+        if cursor:
+            params['cursor'] = cursor
+        request = Request(factory.get('/', params))
+        return list(HistoryCursorPagination().paginate_queryset(queryset, request))
+
+    timed("cursor, 첫 페이지", lambda: cursor_page())
+    timed("cursor, 깊은 위치", lambda: cursor_page(deep_cursor))
+
+    user = User.objects.filter(username='bench0100').first()
+    user_queryset = queryset.filter(user=user)
+    print(f"\n[사용자별 목록 (user_id={user.id})]")
+    timed("COUNT(*)", lambda: user_queryset.count())
+    timed("approximate_count() (상한 10,000)", lambda: approximate_count(user_queryset))
+    timed("첫 페이지", lambda: list(user_queryset[:args.page_size]))
+
+    print("\n[MAC / IP 정확 일치 조회]")
+    timed("mac_address =", lambda: list(DeviceHistory.objects.filter(mac_address='02:00:00:00:10:00')))
+    timed("assigned_ip =", lambda: list(DeviceHistory.objects.filter(assigned_ip='10.129.52.30')[:args.page_size]))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='이력 테이블 페이지네이션 벤치마크')
+    parser.add_argument('--rows', type=int, default=1000000)
+    parser.add_argument('--page-size', type=int, default=100)
+    args = parser.parse_args()
+
+    # 마이그레이션 없이 현재 모델(인덱스 포함)로 임시 DB 생성
+    settings.DATABASES['default'].setdefault('TEST', {})['MIGRATE'] = False
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+    try:
+        print(f"DB: {connection.vendor} ({connection.settings_dict['NAME']})")
+        populate(args.rows)
+        run(args)
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        teardown_test_environment()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,183 @@
+#!/usr/bin/env python
+"""
+읽기 전용 목록 직렬화/렌더링 벤치마크
+
+임시 테스트 DB에 사용자, 장치, 장비(MAC 2개), 대여 행을 생성한 뒤
+목록별로 다음 두 방식의 시간을 비교하고 두 응답 본문이 같은지 확인합니다.
+- 기존: ModelSerializer(many=True) + DRF JSONRenderer
+- 변경: values-mode 직렬화(core.serializers) + ORJSONRenderer
+운영 DB는 건드리지 않습니다.
+
+사용법:
+    python scripts/benchmark_json_rendering.py [--rows 10000]
+"""
+import argparse
+import os
+import sys
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+
+import django
+from django.conf import settings
+
+django.setup()
+
+from django.db import connection
+from django.db.models import Prefetch
+from django.test.utils import setup_test_environment, teardown_test_environment
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from core.renderers import ORJSONRenderer
+from devices.models import Device
+from devices.serializers import DeviceRentalValuesSerializer
+from rentals.models import Equipment, EquipmentMacAddress, Rental
+from rentals.serializers import (
+    EquipmentSerializer, EquipmentValuesSerializer, RentalSerializer, RentalValuesSerializer
+)
+from users.models import User
+from users.serializers import UserSerializer, UserValuesSerializer
+
+
+def timed(label, func, repeat=3):
+    """func를 repeat회 실행하여 최소 시간 출력"""
+    best = None
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    print(f"  {label:<44} {best * 1000:10.2f} ms")
+    return result, best
+
+
+def populate(rows, batch_size=2000):
+    """테스트용 사용자/장치/장비/대여 행 생성"""
+    started = time.perf_counter()
+    User.objects.bulk_create([
+        User(username=f'bench{i:05d}', email=f'bench{i:05d}@bssm.hs.kr',
+             last_name='김' if i % 3 else '', first_name=f'민서{i % 10}')
+        for i in range(rows)
+    ], batch_size=batch_size)
+    users = list(User.objects.order_by('id'))
+    Device.objects.bulk_create([
+        Device(
+            user=users[i], device_name=f'device-{i}',
+            mac_address=f'02:00:00:{(i >> 16) & 0xff:02x}:{(i >> 8) & 0xff:02x}:{i & 0xff:02x}',
+            assigned_ip=f'10.129.{50 + (i >> 8) % 8}.{i & 0xff}', is_active=i % 4 != 0,
+            last_access=timezone.now() if i % 2 else None,
+        )
+        for i in range(rows)
+    ], batch_size=batch_size)
+    Equipment.objects.bulk_create([
+        Equipment(
+            asset_number=f'BSSM-{i:05d}', serial_number=f'SN{i:08d}', model_name='Galaxy Book',
+            manufacturer='Samsung', equipment_type='LAPTOP', status='RENTED' if i % 2 else 'AVAILABLE',
+            acquisition_date=date(2024, 1, 1) + timedelta(days=i % 365),
+            purchase_price=Decimal('1250000.00') if i % 3 else None, description='벤치마크 장비',
+        )
+        for i in range(rows)
+    ], batch_size=batch_size)
+    equipment = list(Equipment.objects.order_by('id'))
+    mac_rows = []
+    for i, item in enumerate(equipment):
+        for n, interface_type in enumerate(('WIFI', 'ETHERNET')):
+            mac_address = f'04:{n:02x}:00:{(i >> 16) & 0xff:02x}:{(i >> 8) & 0xff:02x}:{i & 0xff:02x}'
+            mac_rows.append(EquipmentMacAddress(
+                equipment=item, mac_address=mac_address, mac_canonical=mac_address,
+                interface_type=interface_type, is_primary=n == 0,
+            ))
+    EquipmentMacAddress.objects.bulk_create(mac_rows, batch_size=batch_size)
+    Rental.objects.bulk_create([
+        Rental(user=users[i], equipment=equipment[i], due_date=timezone.now() + timedelta(days=30),
+               status='RENTED', approved_by=users[0])
+        for i in range(1, rows, 2)
+    ], batch_size=batch_size)
+    print(f"  {rows:,}행씩 생성: {time.perf_counter() - started:.1f}s")
+
+
+def compare(title, old, new):
+    """두 방식의 직렬화+렌더링 시간 비교 후 본문 일치 여부 출력"""
+    print(f"\n[{title}]")
+    json_renderer, orjson_renderer = JSONRenderer(), ORJSONRenderer()
+    old_body, old_time = timed("ModelSerializer + JSONRenderer", lambda: json_renderer.render(old()))
+    new_body, new_time = timed("values-mode + ORJSONRenderer", lambda: orjson_renderer.render(new()))
+    print(f"  {'속도 향상':<44} {old_time / new_time:10.1f} x")
+    print(f"  응답 {len(new_body):,} bytes, 본문 일치: {'예' if old_body == new_body else '아니오'}")
+
+
+def run(args):
+    users = User.objects.all()
+    compare(
+        f"사용자 전체 목록 ({args.rows:,}명)",
+        lambda: UserSerializer(users, many=True).data,
+        lambda: UserValuesSerializer(users).data,
+    )
+
+    equipment = Equipment.objects.order_by('id')
+    current_rentals = Prefetch(
+        'rentals',
+        queryset=Rental.objects.filter(status__in=['RENTED', 'OVERDUE']).select_related('user').order_by('-rental_date'),
+        to_attr='current_rentals'
+    )
+    compare(
+        f"장비 목록 ({args.rows:,}대)",
+        lambda: EquipmentSerializer(equipment.prefetch_related('mac_addresses', current_rentals), many=True).data,
+        lambda: EquipmentValuesSerializer(equipment, context={'current_rental': True}).data,
+    )
+
+    rentals = Rental.objects.order_by('-created_at')
+    compare(
+        f"대여 목록 ({rentals.count():,}건)",
+        lambda: RentalSerializer(
+            rentals.select_related('user', 'equipment', 'approved_by', 'returned_to')
+            .prefetch_related('equipment__mac_addresses'), many=True
+        ).data,
+        lambda: RentalValuesSerializer(rentals).data,
+    )
+
+    devices = Device.objects.order_by('id')
+    compare(
+        f"IP 대여 목록 ({args.rows:,}건)",
+        lambda: [
+            {
+                'id': device.id,
+                'device_name': device.device_name,
+                'mac_address': device.mac_address,
+                'assigned_ip': device.assigned_ip,
+                'username': device.user.username,
+                'created_at': device.created_at,
+                'last_access': device.last_access,
+                'is_active': device.is_active,
+            }
+            for device in devices.select_related('user')
+        ],
+        lambda: DeviceRentalValuesSerializer(devices).data,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description='읽기 전용 목록 직렬화/렌더링 벤치마크')
+    parser.add_argument('--rows', type=int, default=10000)
+    args = parser.parse_args()
+
+    # 마이그레이션 없이 현재 모델로 임시 DB 생성
+    settings.DATABASES['default'].setdefault('TEST', {})['MIGRATE'] = False
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+    try:
+        print(f"DB: {connection.vendor} ({connection.settings_dict['NAME']})")
+        populate(args.rows)
+        run(args)
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        teardown_test_environment()
+
+
+if __name__ == '__main__':
+    main()
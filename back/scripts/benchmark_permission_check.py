@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+"""
+기본 권한 클래스(DefaultAppPermissions) 검사 비용 벤치마크
+
+대표 URL마다 DRF가 만드는 것과 같은 요청/뷰 객체를 준비한 뒤 다음 세 방식의 검사 시간을 비교합니다.
+- 이전 방식: 요청마다 get_queryset()을 두 번 호출해 앱/모델을 감지하고 URL 이름/경로를 파싱
+- 테이블 없이 계산: 뷰 클래스 속성으로 감지하지만 요청마다 다시 계산
+- 권한 테이블: PermissionTable 딕셔너리 조회
+
+DB는 조회하지 않습니다.
+
+사용법:
+    python scripts/benchmark_permission_check.py [--iterations 20000]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+
+import django
+
+django.setup()
+
+from django.urls import resolve
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from core.permissions import (
+    DefaultAppPermissions, PermissionMatrix, detect_app_name, detect_model_name,
+    permission_table, resolve_action,
+)
+from users.models import User
+
+ROUTES = [
+    ('GET', '/api/admin/users/'),
+    ('GET', '/api/ip/my/'),
+    ('POST', '/api/ip/register_manual/'),
+    ('GET', '/api/admin/ip/all/'),
+    ('GET', '/api/admin/equipment/1/'),
+    ('POST', '/api/admin/equipment/register_maintenance/'),
+    ('GET', '/api/ip/history/my/'),
+    ('GET', '/api/security/api-keys/'),
+]
+
+
+def build_view(method, path, user):
+    """DRF as_view()가 dispatch 전에 만드는 것과 같은 요청/뷰 객체"""
+    factory = APIRequestFactory()
+    request = factory.generic(method, path)
+    request.resolver_match = match = resolve(path)
+    request.user = user
+    func = match.func
+    view = func.cls(**getattr(func, 'initkwargs', {}))
+    actions = getattr(func, 'actions', None)
+    if actions is not None:
+        view.action_map = actions
+        view.action = actions.get(method.lower())
+    view.args, view.kwargs, view.format_kwarg = (), match.kwargs, None
+    drf_request = Request(request)
+    drf_request.user = user
+    view.request = drf_request
+    return drf_request, view
+
+
+def legacy_required_permissions(request, view):
+    """이전 구현과 같은 순서의 요청별 계산 (get_queryset 두 번 호출)"""
+    names = []
+    for attr, fallback in (('app_label', detect_app_name), ('model_name', detect_model_name)):
+        try:
+            names.append(getattr(view.get_queryset().model._meta, attr))
+        except Exception:
+            names.append(fallback(type(view)))
+    match = request.resolver_match
+    lookup_url_kwarg = getattr(view, 'lookup_url_kwarg', None)
+    action = resolve_action(
+        getattr(view, 'action', None), request.method, match.url_name, request.path,
+        bool(lookup_url_kwarg) and lookup_url_kwarg in view.kwargs,
+    )
+    return PermissionMatrix.get_required_permissions(names[0], names[1], action)
+
+
+def timed(label, func, iterations):
+    started = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    elapsed = time.perf_counter() - started
+    print(f"  {label:<28} {elapsed / iterations * 1e6:10.2f} us/검사")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='권한 검사 비용 벤치마크')
+    parser.add_argument('--iterations', type=int, default=20000)
+    args = parser.parse_args()
+
+    user = User(username='bench', is_superuser=True, is_staff=True)
+    cases = [build_view(method, path, user) for method, path in ROUTES]
+    permission = DefaultAppPermissions()
+
+    started = time.perf_counter()
+    table = permission_table.build()
+    print(f"권한 테이블 생성: {len(table)}개 항목, {(time.perf_counter() - started) * 1000:.1f} ms")
+
+    for (method, path), (request, view) in zip(ROUTES, cases):
+        print(f"\n[{method} {path}] ({type(view).__name__}.{getattr(view, 'action', None)})")
+        timed("이전 방식", lambda: legacy_required_permissions(request, view), args.iterations)
+        timed("테이블 없이 계산", lambda: permission.required_permissions(
+            type(view), view.action, request.method, request.resolver_match.url_name, request.resolver_match.route,
+        ), args.iterations)
+        timed("권한 테이블 (has_permission)", lambda: DefaultAppPermissions().has_permission(request, view),
+              args.iterations)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+"""
+사용자 검색(자동완성) 비용 벤치마크
+
+가상 사용자 N명(한글 이름, 학번 아이디, 이메일)으로 core.search 인덱스를 만든 뒤
+자동완성 검색어별로 다음 두 방식의 응답 시간을 비교합니다.
+- 전체 스캔: 기존 icontains OR 조건과 같은 부분 문자열 비교를 모든 사용자에 대해 수행
+- 검색 인덱스: SearchIndex.search(limit=20)
+
+DB와 캐시는 사용하지 않습니다.
+
+사용법:
+    python scripts/benchmark_search_index.py [--users 10000] [--iterations 200]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+
+import django
+
+django.setup()
+
+from django.test import override_settings
+
+from core.search import SearchIndex, normalize_text
+
+LAST_NAMES = '김이박최정강조윤장임한오서신권황안송류홍'
+FIRST_SYLLABLES = '민서지현우준예도하윤수아시연유진은재영성태'
+QUERIES = ['김', '민서', '김민', '2024', 's2024001', '이지현', 'example', '홍길동', 'zzz']
+
+
+def make_users(count, seed=42):
+    rng = random.Random(seed)
+    users = []
+    for pk in range(1, count + 1):
+        username = f"s{2020 + pk % 6}{pk:05d}"
+        last_name = rng.choice(LAST_NAMES)
+        first_name = ''.join(rng.choice(FIRST_SYLLABLES) for _ in range(2))
+        users.append((pk, username, first_name, last_name, f"{username}@example.com"))
+    return users
+
+
+def full_scan(users, query, limit=20):
+    """기존 icontains OR 조건과 같은 비교 후 username 순 정렬"""
+    term = normalize_text(query)
+    matched = [
+        user for user in users
+        if any(term in normalize_text(value) for value in user[1:])
+    ]
+    return sorted(matched, key=lambda user: user[1])[:limit]
+
+
+def timed(label, func, iterations):
+    started = time.perf_counter()
+    for _ in range(iterations):
+        result = func()
+    elapsed = time.perf_counter() - started
+    print(f"  {label:<12} {elapsed / iterations * 1000:8.3f} ms/검색  (결과 {len(result)}건)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='사용자 검색 비용 벤치마크')
+    parser.add_argument('--users', type=int, default=10000)
+    parser.add_argument('--iterations', type=int, default=200)
+    args = parser.parse_args()
+
+    users = make_users(args.users)
+
+    def load(ids):
+        for pk, username, first_name, last_name, email in users:
+            if ids is None or pk in ids:
+                yield pk, username, (username, f"{last_name}{first_name}", last_name, first_name, email)
+
+    index = SearchIndex('benchmark_users', load, weights=(3, 3, 2, 2, 1))
+    started = time.perf_counter()
+    index.rebuild(version=0)
+    stats = index.stats()
+    print(f"인덱스 생성: 사용자 {stats['documents']}명, 바이그램 {stats['bigrams']}개, "
+          f"{(time.perf_counter() - started) * 1000:.1f} ms")
+
+    # 버전 확인(캐시 조회) 없이 검색 비용만 측정
+    with override_settings(SEARCH_INDEX={'VERSION_CHECK_INTERVAL': 3600, 'REFRESH_INTERVAL': 3600}):
+        for query in QUERIES:
+            print(f"\n[{query}]")
+            timed("전체 스캔", lambda: full_scan(users, query), max(1, args.iterations // 20))
+            timed("검색 인덱스", lambda: index.search(query, limit=20), args.iterations)
+
+
+if __name__ == '__main__':
+    main()
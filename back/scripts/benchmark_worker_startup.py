@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+"""
+gunicorn 워커 기동 시간/메모리 벤치마크
+
+1. 앱 import 비용: 새 프로세스에서 Django 설정 + WSGI 앱 + 전체 URLconf(뷰 모듈)를 불러오는 시간과 최대 RSS
+   - eager: pandas/openpyxl을 모듈 최상단에서 불러오던 기존 방식 재현
+   - lazy: 현재 코드 (엑셀 처리 시에만 불러옴)
+2. gunicorn 워커: gunicorn.conf.py로 워커를 띄워 fork부터 앱 로드 완료(post_worker_init)까지 걸린 시간과
+   워커별 RSS/USS/PSS 비교 (preload_app 끔/켬)
+   USS는 워커 고유 메모리, PSS는 공유 페이지를 나눠 계산한 값이라 preload의 copy-on-write 공유 효과가 보입니다.
+
+현재 DJANGO_SETTINGS_MODULE 설정으로 실행합니다 (워커는 요청을 받지 않으므로 DB에 접속하지 않음).
+
+사용법:
+    python scripts/benchmark_worker_startup.py [--runs 5] [--workers 4]
+"""
+import argparse
+import os
+import signal
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import psutil
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IMPORT_PROBE = """
+import os, resource, sys, time
+started = time.perf_counter()
+if {eager}:
+    import pandas, openpyxl, openpyxl.styles
+import django
+django.setup()
+from django.core.wsgi import get_wsgi_application
+get_wsgi_application()
+from django.urls import get_resolver
+get_resolver().url_patterns
+print(time.perf_counter() - started, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+# gunicorn.conf.py를 그대로 불러온 뒤 fork/앱 로드 시각만 기록하는 훅을 덧씌움
+GUNICORN_CONFIG = """
+import os, time
+exec(open({config!r}).read())
+_post_worker_init = post_worker_init
+
+def post_fork(server, worker):
+    worker.forked_at = time.perf_counter()
+
+def post_worker_init(worker):
+    _post_worker_init(worker)
+    with open({report!r}, 'a') as f:
+        f.write(f"{{os.getpid()}} {{time.perf_counter() - worker.forked_at}}\\n")
+"""
+
+
+def probe_imports(eager, runs):
+    env = {**os.environ, 'DJANGO_SETTINGS_MODULE': os.environ.get('DJANGO_SETTINGS_MODULE', 'config.settings')}
+    times, peaks = [], []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, '-c', IMPORT_PROBE.format(eager=eager)],
+            cwd=BASE_DIR, env=env, capture_output=True, text=True, check=True,
+        ).stdout.split()
+        times.append(float(output[-2]))
+        peaks.append(int(output[-1]) / 1024)  # ru_maxrss: KB (Linux)
+    return statistics.median(times), statistics.median(peaks)
+
+
+def run_gunicorn(preload, workers, timeout=60):
+    """워커를 띄우고 모두 앱 로드를 마치면 워커별 (기동 시간, RSS, USS, PSS) 반환"""
+    with tempfile.TemporaryDirectory() as tmp:
+        report = os.path.join(tmp, 'workers.txt')
+        config = os.path.join(tmp, 'gunicorn_bench.conf.py')
+        with open(config, 'w') as f:
+            f.write(GUNICORN_CONFIG.format(config=os.path.join(BASE_DIR, 'gunicorn.conf.py'), report=report))
+
+        env = {
+            **os.environ,
+            'DJANGO_SETTINGS_MODULE': os.environ.get('DJANGO_SETTINGS_MODULE', 'config.settings'),
+            'GUNICORN_PRELOAD_APP': str(preload),
+            'SCHEDULER_ENABLED': 'False',
+        }
+        master = subprocess.Popen(
+            [sys.executable, '-m', 'gunicorn', '-c', config, '--workers', str(workers),
+             '--bind', '127.0.0.1:0', '--log-level', 'warning', 'config.wsgi:application'],
+            cwd=BASE_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        try:
+            deadline = time.monotonic() + timeout
+            lines = []
+            while time.monotonic() < deadline:
+                if os.path.exists(report):
+                    with open(report) as f:
+                        lines = f.read().split('\n')[:-1]
+                if len(lines) >= workers:
+                    break
+                if master.poll() is not None:
+                    raise RuntimeError('gunicorn이 종료되었습니다.')
+                time.sleep(0.1)
+            else:
+                raise RuntimeError('워커 기동 시간 초과')
+
+            time.sleep(1)  # 백그라운드 스레드 시작 후 메모리 안정화
+            results = []
+            for line in lines:
+                pid, boot = line.split()
+                memory = psutil.Process(int(pid)).memory_full_info()
+                results.append((float(boot), memory.rss, memory.uss, memory.pss))
+            master_rss = psutil.Process(master.pid).memory_info().rss
+            return results, master_rss
+        finally:
+            master.send_signal(signal.SIGTERM)
+            master.wait(timeout=30)
+
+
+def mb(value):
+    return f"{value / 1024 / 1024:8.1f} MB"
+
+
+def main():
+    parser = argparse.ArgumentParser(description='gunicorn 워커 기동 시간/메모리 벤치마크')
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--workers', type=int, default=4)
+    args = parser.parse_args()
+
+    print(f"[앱 import 비용 - 새 프로세스 {args.runs}회 중앙값]")
+    for label, eager in (('eager (pandas/openpyxl 최상단 import)', True), ('lazy (현재)', False)):
+        elapsed, peak = probe_imports(eager, args.runs)
+        print(f"  {label:<40} {elapsed * 1000:8.1f} ms {peak:8.1f} MB")
+
+    print(f"\n[gunicorn 워커 {args.workers}개]")
+    for preload in (False, True):
+        results, master_rss = run_gunicorn(preload, args.workers)
+        boots = [boot for boot, *_ in results]
+        print(f"  preload_app={preload}")
+        print(f"    워커 기동 (fork → 앱 로드 완료) 중앙값 {statistics.median(boots) * 1000:8.1f} ms")
+        print(f"    마스터 RSS                       {mb(master_rss)}")
+        print(f"    워커당 RSS                       {mb(statistics.mean(r[1] for r in results))}")
+        print(f"    워커당 USS (고유)                {mb(statistics.mean(r[2] for r in results))}")
+        print(f"    워커당 PSS (공유분 배분)         {mb(statistics.mean(r[3] for r in results))}")
+        print(f"    전체 PSS (마스터 제외)           {mb(sum(r[3] for r in results))}")
+
+
+if __name__ == '__main__':
+    main()
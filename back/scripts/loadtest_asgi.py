@@ -0,0 +1,215 @@
+#!/usr/bin/env python
+"""
+WSGI(sync 워커) / ASGI(uvicorn 워커) 모드 혼합 트래픽 부하 테스트
+
+느린 방송 서버를 흉내 내는 가짜 서버를 띄우고 gunicorn.conf.py로 두 모드의 서버를 차례로 실행해
+같은 트래픽을 보냅니다.
+- 느린 요청: 교사 계정으로 텍스트 방송 프리뷰 생성 (POST /api/broadcast/text/, 방송 서버 응답 --delay초)
+- 빠른 요청: 캡티브 포털 MAC 조회 (GET /api/ip/current-mac/, 비로그인)
+
+sync 워커는 느린 요청이 워커를 모두 차지하면 빠른 요청도 뒤에서 기다리고,
+uvicorn 워커는 방송 서버 응답을 기다리는 동안 다른 요청을 처리하므로 빠른 요청의 지연이 유지되어야 합니다.
+모드별로 종류마다 처리량(req/s), 지연 시간(p50/p95/p99), 응답 코드 분포를 출력합니다.
+
+현재 DJANGO_SETTINGS_MODULE 설정으로 실행합니다 (migrate된 DB 필요, 부하 테스트용 교사 계정을 만듦).
+SQLite에서는 여러 워커가 동시에 쓰면 잠금 오류가 날 수 있으므로 --workers 1로 비교하세요.
+
+사용법:
+    python scripts/loadtest_asgi.py [--duration 10] [--delay 2] [--workers 2] [--slow-clients 16] [--fast-clients 4]
+"""
+import argparse
+import asyncio
+import collections
+import os
+import signal
+import socket
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+
+LOADTEST_USERNAME = 'loadtest_teacher'
+FAKE_AUDIO = b'ID3' + b'\0' * 4096
+
+
+def fake_broadcast_server(delay):
+    """요청마다 delay초 뒤 응답하는 방송 서버 (텍스트 프리뷰 생성, 프리뷰 오디오)"""
+    counter = iter(range(1, 10 ** 9))
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def log_message(self, *args):
+            pass
+
+        def _send(self, body, content_type):
+            self.send_response(200)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_POST(self):
+            self.rfile.read(int(self.headers.get('Content-Length', 0)))
+            time.sleep(delay)
+            preview_id = f"lt{os.getpid()}-{next(counter)}"
+            self._send(
+                b'{"success": true, "preview_info": {"preview_id": "%s"}}' % preview_id.encode(),
+                'application/json',
+            )
+
+        def do_GET(self):
+            self._send(FAKE_AUDIO, 'audio/mpeg')
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def issue_teacher_token():
+    import django
+
+    django.setup()
+    from users.models import User
+    from users.tokens import issue_tokens
+
+    user = User.objects.filter(username=LOADTEST_USERNAME).first()
+    if user is None:
+        user = User.objects.create_user(
+            username=LOADTEST_USERNAME, email=f'{LOADTEST_USERNAME}@example.com',
+            password=None, is_staff=True,
+        )
+    return issue_tokens(user)['access']
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def start_server(mode, port, workers, broadcast_url):
+    env = {
+        **os.environ,
+        'SERVER_MODE': mode,
+        'BROADCAST_API_BASE_URL': broadcast_url,
+        'SCHEDULER_ENABLED': 'False',
+    }
+    return subprocess.Popen(
+        [sys.executable, '-m', 'gunicorn', '-c', os.path.join(BASE_DIR, 'gunicorn.conf.py'),
+         '--workers', str(workers), '--bind', f'127.0.0.1:{port}', '--log-level', 'warning',
+         '--access-logfile', '/dev/null'],
+        cwd=BASE_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+
+
+def wait_ready(base_url, process, timeout=60):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError('gunicorn이 종료되었습니다.')
+        try:
+            httpx.get(f'{base_url}/api/ip/current-mac/', timeout=2)
+            return
+        except httpx.HTTPError:
+            time.sleep(0.2)
+    raise RuntimeError('서버 기동 시간 초과')
+
+
+async def client_loop(kind, send, deadline, results):
+    while time.monotonic() < deadline:
+        started = time.perf_counter()
+        try:
+            response = await send()
+            outcome = response.status_code
+        except httpx.HTTPError as e:
+            outcome = type(e).__name__
+        results[kind].append((time.perf_counter() - started, outcome))
+
+
+async def run_traffic(base_url, token, args):
+    results = collections.defaultdict(list)
+    limits = httpx.Limits(max_connections=args.slow_clients + args.fast_clients)
+    timeout = httpx.Timeout(args.delay * 10 + 30)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=timeout) as client:
+        def slow():
+            return client.post(
+                '/api/broadcast/text/', json={'text': '부하 테스트', 'target_rooms': ['101']},
+                headers={'Authorization': f'Bearer {token}'},
+            )
+
+        def fast():
+            return client.get('/api/ip/current-mac/')
+
+        deadline = time.monotonic() + args.duration
+        started = time.monotonic()
+        await asyncio.gather(
+            *(client_loop('slow (방송 프리뷰)', slow, deadline, results) for _ in range(args.slow_clients)),
+            *(client_loop('fast (MAC 조회)', fast, deadline, results) for _ in range(args.fast_clients)),
+        )
+        elapsed = time.monotonic() - started
+    return results, elapsed
+
+
+def percentile(values, pct):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct / 100))]
+
+
+def report(mode, results, elapsed):
+    print(f"  SERVER_MODE={mode}")
+    for kind, samples in sorted(results.items(), reverse=True):
+        latencies = [latency * 1000 for latency, _ in samples]
+        outcomes = collections.Counter(str(outcome) for _, outcome in samples)
+        print(
+            f"    {kind:<18} {len(samples) / elapsed:8.1f} req/s"
+            f"  p50 {statistics.median(latencies):8.1f} ms"
+            f"  p95 {percentile(latencies, 95):8.1f} ms"
+            f"  p99 {percentile(latencies, 99):8.1f} ms"
+            f"  {dict(outcomes)}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description='WSGI/ASGI 모드 혼합 트래픽 부하 테스트')
+    parser.add_argument('--duration', type=float, default=10, help='모드별 부하 시간 (초)')
+    parser.add_argument('--delay', type=float, default=2, help='가짜 방송 서버 응답 지연 (초)')
+    parser.add_argument('--workers', type=int, default=2)
+    parser.add_argument('--slow-clients', type=int, default=16)
+    parser.add_argument('--fast-clients', type=int, default=4)
+    parser.add_argument('--modes', default='wsgi,asgi')
+    args = parser.parse_args()
+
+    broadcast = fake_broadcast_server(args.delay)
+    broadcast_url = f'http://127.0.0.1:{broadcast.server_port}'
+    token = issue_teacher_token()
+
+    print(
+        f"[워커 {args.workers}개, 느린 클라이언트 {args.slow_clients}개 (방송 서버 지연 {args.delay}초), "
+        f"빠른 클라이언트 {args.fast_clients}개, {args.duration}초]"
+    )
+    for mode in args.modes.split(','):
+        port = free_port()
+        base_url = f'http://127.0.0.1:{port}'
+        process = start_server(mode, port, args.workers, broadcast_url)
+        try:
+            wait_ready(base_url, process)
+            results, elapsed = asyncio.run(run_traffic(base_url, token, args))
+            report(mode, results, elapsed)
+        finally:
+            process.send_signal(signal.SIGTERM)
+            process.wait(timeout=30)
+    broadcast.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,316 @@
+"""
+이력 테이블 월 단위 보관 (archival)
+
+DeviceHistory, EquipmentHistory, APIKeyUsageLog, BroadcastHistory는 쌓이기만 하고
+JSON 컬럼(old_value/new_value/external_response) 때문에 행이 커서 목록과 내보내기가 계속 느려집니다.
+보관 기간(RETENTION_DAYS)이 지난 달의 행을 테이블·월 단위 gzip JSONL 파일로 옮기고 원본 행은 삭제합니다.
+
+- 보관 기준 시각은 '보관 기간이 지난 시점이 속한 달의 1일'이므로 한 달치 행이 한 파일에 담깁니다.
+  (기준 시각 이전 시각으로 나중에 들어온 행은 같은 달의 다음 part 파일로 보관)
+- 파일을 임시 이름으로 쓰고 fsync 후 이름을 바꾼 다음, 한 트랜잭션에서 ArchiveSegment/ArchiveKey를 기록하고
+  원본 행을 삭제합니다. 트랜잭션이 실패하면 파일을 지우므로 행은 DB나 파일 중 한 곳에만 남습니다.
+- ArchiveKey는 파일별로 등장한 사용자/MAC/장비 등의 값 목록입니다. iter_archived()는 조건에 맞는 키가 있는
+  파일만 열고 한 줄씩 읽어 조건에 맞는 행을 제너레이터로 돌려줍니다.
+"""
+import gzip
+import hashlib
+import logging
+import os
+from datetime import datetime, timedelta
+
+import orjson
+from django.apps import apps
+from django.conf import settings
+from django.db import connections, router, transaction
+from django.db.models import Max, Min
+from django.utils import timezone
+
+from core.mac import normalize_mac
+from core.renderers import dumps
+from core.response_cache import mark_changed
+from .models import ArchiveKey, ArchiveSegment
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONFIG = {
+    'DIRECTORY': '/var/lib/bssm_captive/archive',  # 보관 파일 디렉터리 (소스 트리 밖)
+    'RETENTION_DAYS': {          # 테이블별 DB 보관 기간 (일)
+        'device_history': 365,
+        'equipment_history': 730,
+        'api_key_usage': 90,
+        'broadcast_history': 365,
+    },
+    'BATCH_SIZE': 5000,          # 한 번에 읽고 삭제할 행 수
+    'COMPRESS_LEVEL': 6,
+}
+
+# 보관 대상 테이블 -> 모델, 기준 시각 필드, 조회 키(키 종류 -> 필드)
+ARCHIVE_TABLES = {
+    'device_history': {
+        'model': 'devices.DeviceHistory',
+        'time_field': 'created_at',
+        'keys': {'user': 'user_id', 'mac': 'mac_address'},
+    },
+    'equipment_history': {
+        'model': 'rentals.EquipmentHistory',
+        'time_field': 'created_at',
+        'keys': {'equipment': 'equipment_id', 'user': 'user_id'},
+        'response_cache': 'equipment',  # 공개 장비 조회 응답에 장비 이력이 포함됨
+    },
+    'api_key_usage': {
+        'model': 'api_security.APIKeyUsageLog',
+        'time_field': 'timestamp',
+        'keys': {'api_key': 'api_key_id', 'ip': 'ip_address'},
+    },
+    'broadcast_history': {
+        'model': 'broadcast.BroadcastHistory',
+        'time_field': 'created_at',
+        'keys': {'user': 'broadcasted_by_id'},
+    },
+}
+
+
+def get_config():
+    config = {**DEFAULT_CONFIG, **getattr(settings, 'HISTORY_ARCHIVE', {})}
+    config['RETENTION_DAYS'] = {**DEFAULT_CONFIG['RETENTION_DAYS'], **config['RETENTION_DAYS']}
+    return config
+
+
+def get_spec(table):
+    try:
+        return ARCHIVE_TABLES[table]
+    except KeyError:
+        raise ValueError(f"보관 대상이 아닌 테이블: {table}")
+
+
+def key_value(key_type, value):
+    """ArchiveKey에 저장/비교하는 문자열 (MAC은 표준 형식)"""
+    if value is None:
+        return None
+    if key_type == 'mac':
+        return normalize_mac(value)
+    return str(value)
+
+
+def month_start(value):
+    """TIME_ZONE 기준 해당 월 1일 0시"""
+    local = timezone.localtime(value)
+    return timezone.make_aware(datetime(local.year, local.month, 1), local.tzinfo)
+
+
+def next_month(start):
+    return timezone.make_aware(
+        datetime(start.year + start.month // 12, start.month % 12 + 1, 1), start.tzinfo
+    )
+
+
+def archive_cutoff(table, now=None, retention_days=None):
+    """이 시각 이전 행을 보관 (보관 기간이 지난 시점이 속한 달의 1일)"""
+    days = retention_days if retention_days is not None else get_config()['RETENTION_DAYS'][table]
+    return month_start((now or timezone.now()) - timedelta(days=days))
+
+
+def pending_months(table, cutoff):
+    """기준 시각 이전 행이 있는 월 [(시작, 끝, 행 수)]"""
+    spec = get_spec(table)
+    model = apps.get_model(spec['model'])
+    time_field = spec['time_field']
+    queryset = model._base_manager.filter(**{f'{time_field}__lt': cutoff})
+    oldest = queryset.aggregate(oldest=Min(time_field))['oldest']
+    months = []
+    if oldest is None:
+        return months
+    start = month_start(oldest)
+    while start < cutoff:
+        end = next_month(start)
+        count = queryset.filter(**{f'{time_field}__gte': start, f'{time_field}__lt': end}).count()
+        if count:
+            months.append((start, end, count))
+        start = end
+    return months
+
+
+def _write_segment(model, spec, queryset, path, config):
+    """
+    행을 pk 순서로 나눠 읽어 gzip JSONL 파일에 쓰기
+
+    (pk 목록, 키 종류별 값 집합, 첫 시각, 마지막 시각) 반환
+    """
+    fields = [field.attname for field in model._meta.concrete_fields]
+    pk_name = model._meta.pk.attname
+    time_field = spec['time_field']
+    pks = []
+    keys = {key_type: set() for key_type in spec['keys']}
+    first_at = last_at = None
+
+    with open(path, 'wb') as raw, gzip.GzipFile(fileobj=raw, mode='wb', compresslevel=config['COMPRESS_LEVEL']) as out:
+        last_pk = None
+        while True:
+            batch = queryset.order_by(pk_name)
+            if last_pk is not None:
+                batch = batch.filter(pk__gt=last_pk)
+            rows = list(batch.values(*fields)[:config['BATCH_SIZE']])
+            if not rows:
+                break
+            for row in rows:
+                out.write(dumps(row))
+                out.write(b'\n')
+                pks.append(row[pk_name])
+                for key_type, field in spec['keys'].items():
+                    value = key_value(key_type, row[field])
+                    if value:
+                        keys[key_type].add(value)
+                at = row[time_field]
+                first_at = at if first_at is None or at < first_at else first_at
+                last_at = at if last_at is None or at > last_at else last_at
+            last_pk = rows[-1][pk_name]
+        out.close()
+        raw.flush()
+        os.fsync(raw.fileno())
+    return pks, keys, first_at, last_at
+
+
+def _file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _delete_rows(model, pks, batch_size):
+    """
+    pk 목록 삭제
+
+    보관 대상 테이블은 다른 테이블이 참조하지 않으므로 객체 수집과 행별 시그널 없이 바로 삭제합니다.
+    """
+    connection = connections[router.db_for_write(model)]
+    table = connection.ops.quote_name(model._meta.db_table)
+    column = connection.ops.quote_name(model._meta.pk.column)
+    with connection.cursor() as cursor:
+        for start in range(0, len(pks), batch_size):
+            chunk = pks[start:start + batch_size]
+            cursor.execute(f"DELETE FROM {table} WHERE {column} IN ({', '.join(['%s'] * len(chunk))})", chunk)
+
+
+def archive_month(table, start, end, config=None):
+    """한 달치 행을 보관 파일로 옮기고 ArchiveSegment 반환 (옮길 행이 없으면 None)"""
+    config = config or get_config()
+    spec = get_spec(table)
+    model = apps.get_model(spec['model'])
+    time_field = spec['time_field']
+    queryset = model._base_manager.filter(**{f'{time_field}__gte': start, f'{time_field}__lt': end})
+
+    part = (ArchiveSegment.objects.filter(table=table, period=start.date())
+            .aggregate(part=Max('part'))['part'] or 0) + 1
+    name = f"{table}-{start:%Y-%m}" + (f"-{part}" if part > 1 else '') + '.jsonl.gz'
+    relative_path = os.path.join(table, f"{start:%Y}", name)
+    path = os.path.join(config['DIRECTORY'], relative_path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    temporary_path = f"{path}.tmp"
+    try:
+        pks, keys, first_at, last_at = _write_segment(model, spec, queryset, temporary_path, config)
+        if not pks:
+            os.remove(temporary_path)
+            return None
+        os.replace(temporary_path, path)
+    except Exception:
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
+        raise
+
+    try:
+        with transaction.atomic(using=router.db_for_write(model)):
+            segment = ArchiveSegment.objects.create(
+                table=table, period=start.date(), part=part, path=relative_path,
+                row_count=len(pks), first_at=first_at, last_at=last_at,
+                size_bytes=os.path.getsize(path), sha256=_file_digest(path),
+            )
+            ArchiveKey.objects.bulk_create([
+                ArchiveKey(segment=segment, key_type=key_type, value=value[:255])
+                for key_type, values in keys.items() for value in sorted(values)
+            ], batch_size=config['BATCH_SIZE'])
+            _delete_rows(model, pks, config['BATCH_SIZE'])
+            if spec.get('response_cache'):
+                mark_changed(spec['response_cache'])
+    except Exception:
+        os.remove(path)
+        raise
+
+    logger.info(f"이력 보관: {segment} -> {relative_path} ({segment.size_bytes} bytes)")
+    return segment
+
+
+def run_archival(apply=False, tables=None, retention_days=None, now=None):
+    """
+    보관 기간이 지난 달의 이력을 파일로 옮김 (주기 작업, archive_history 명령)
+
+    apply=False면 옮길 월과 행 수만 계산합니다. 테이블 하나가 실패해도 나머지 테이블은 계속 처리합니다.
+    """
+    config = get_config()
+    result = {'apply': apply, 'tables': {}}
+    for table in tables or ARCHIVE_TABLES:
+        cutoff = archive_cutoff(table, now, retention_days)
+        summary = {'cutoff': cutoff.isoformat(), 'months': [], 'rows': 0}
+        result['tables'][table] = summary
+        try:
+            for start, end, count in pending_months(table, cutoff):
+                if apply:
+                    segment = archive_month(table, start, end, config)
+                    count = segment.row_count if segment else 0
+                summary['months'].append({'period': f"{start:%Y-%m}", 'rows': count})
+                summary['rows'] += count
+        except Exception as e:
+            logger.error(f"이력 보관 실패 ({table}): {e}", exc_info=True)
+            summary['error'] = str(e)
+    return result
+
+
+def read_segment(segment, directory=None):
+    """보관 파일의 행을 한 줄씩 읽어 반환"""
+    path = os.path.join(directory or get_config()['DIRECTORY'], segment.path)
+    with gzip.open(path, 'rb') as f:
+        for line in f:
+            if line.strip():
+                yield orjson.loads(line)
+
+
+def iter_archived(table, since=None, until=None, **filters):
+    """
+    보관된 행을 오래된 순서로 하나씩 반환 (필요한 파일만 열어 지연 읽기)
+
+    filters: ARCHIVE_TABLES[table]['keys']의 키 종류별 값 (예: user=3, mac='AA-BB-CC-DD-EE-FF')
+    since/until: 기준 시각 범위 [since, until)
+    행의 시각 값은 ISO 8601 문자열입니다.
+    """
+    spec = get_spec(table)
+    unknown = set(filters) - set(spec['keys'])
+    if unknown:
+        raise ValueError(f"{table}에서 지원하지 않는 조회 키: {', '.join(sorted(unknown))}")
+    wanted = {
+        key_type: key_value(key_type, value)
+        for key_type, value in filters.items() if value not in (None, '')
+    }
+
+    segments = ArchiveSegment.objects.filter(table=table)
+    for key_type, value in wanted.items():
+        segments = segments.filter(
+            id__in=ArchiveKey.objects.filter(key_type=key_type, value=value).values('segment_id')
+        )
+    if since is not None:
+        segments = segments.filter(last_at__gte=since)
+    if until is not None:
+        segments = segments.filter(first_at__lt=until)
+
+    directory = get_config()['DIRECTORY']
+    time_field = spec['time_field']
+    for segment in list(segments.order_by('period', 'part')):
+        for row in read_segment(segment, directory):
+            if any(key_value(key_type, row.get(spec['keys'][key_type])) != value for key_type, value in wanted.items()):
+                continue
+            if since is not None or until is not None:
+                at = datetime.fromisoformat(row[time_field])
+                if (since is not None and at < since) or (until is not None and at >= until):
+                    continue
+            yield row
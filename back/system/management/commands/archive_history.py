@@ -0,0 +1,90 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from core.renderers import dumps
+from system.archive import ARCHIVE_TABLES, iter_archived, run_archival
+
+
+class Command(BaseCommand):
+    help = '보관 기간이 지난 이력(장치/장비/API 키 사용/방송)을 월 단위 보관 파일로 이동하거나 보관된 이력 조회'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--apply',
+            action='store_true',
+            help='실제로 보관 파일로 옮기고 원본 행 삭제 (기본값: 드라이런)'
+        )
+        parser.add_argument(
+            '--table',
+            action='append',
+            choices=sorted(ARCHIVE_TABLES),
+            help='대상 테이블 (여러 번 지정 가능, 기본값: 전체)'
+        )
+        parser.add_argument(
+            '--retention-days',
+            type=int,
+            help='DB 보관 기간 (기본값: HISTORY_ARCHIVE 설정)'
+        )
+        parser.add_argument(
+            '--query',
+            action='store_true',
+            help='보관된 이력을 JSON Lines로 출력 (--table 하나 필요, --key로 조건 지정)'
+        )
+        parser.add_argument(
+            '--key',
+            action='append',
+            default=[],
+            metavar='종류=값',
+            help='조회 키 (예: user=3, mac=aa:bb:cc:dd:ee:ff, equipment=12)'
+        )
+        parser.add_argument('--since', help='조회 시작 시각 (ISO 8601)')
+        parser.add_argument('--until', help='조회 종료 시각 (ISO 8601)')
+
+    def handle(self, *args, **options):
+        if options['query']:
+            return self.query(options)
+
+        result = run_archival(
+            apply=options['apply'],
+            tables=options['table'],
+            retention_days=options['retention_days'],
+        )
+        total = 0
+        for table, summary in result['tables'].items():
+            self.stdout.write(f"{table}: 기준 시각 {summary['cutoff']} 이전 {summary['rows']}행")
+            for month in summary['months']:
+                self.stdout.write(f"  {month['period']}: {month['rows']}행")
+            if summary.get('error'):
+                self.stdout.write(self.style.ERROR(f"  실패: {summary['error']}"))
+            total += summary['rows']
+
+        if options['apply']:
+            self.stdout.write(self.style.SUCCESS(f'보관 완료: {total}행'))
+        elif total:
+            self.stdout.write(self.style.WARNING('보관하려면 --apply 옵션을 사용하세요.'))
+
+    def query(self, options):
+        if not options['table'] or len(options['table']) != 1:
+            raise CommandError('--query에는 --table을 하나 지정해야 합니다.')
+        filters = {}
+        for item in options['key']:
+            key_type, sep, value = item.partition('=')
+            if not sep or not value:
+                raise CommandError(f'--key는 종류=값 형식이어야 합니다: {item}')
+            filters[key_type] = value
+
+        bounds = {}
+        for name in ('since', 'until'):
+            if options[name]:
+                parsed = parse_datetime(options[name])
+                if parsed is None:
+                    raise CommandError(f'--{name}는 ISO 8601 형식이어야 합니다.')
+                bounds[name] = timezone.make_aware(parsed) if timezone.is_naive(parsed) else parsed
+
+        try:
+            rows = iter_archived(options['table'][0], **bounds, **filters)
+            for row in rows:
+                self.stdout.write(dumps(row).decode())
+        except ValueError as e:
+            raise CommandError(str(e))
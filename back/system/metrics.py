@@ -0,0 +1,353 @@
+"""
+Prometheus 텍스트 형식 메트릭
+
+- 요청 지연 히스토그램, 카운터, 작업 시간 히스토그램: system.performance 집계를 모든 워커에서 병합
+  (워커별 집계 파일 + 종료된 워커 누적 파일, PERFORMANCE_MONITOR['DIRECTORY'] 참고)
+- 호스트 메트릭: 헬스체크 백그라운드 수집기가 캐시에 넣어 둔 값
+- KEA 풀/리스 메트릭: 주기적으로 갱신되는 스냅샷 (같은 디렉터리의 파일, 스크레이프 시 DB를 조회하지 않음)
+"""
+import ipaddress
+import logging
+import math
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse, HttpResponseForbidden
+
+from .performance import collect_metrics, observe, registry, snapshot_store
+
+logger = logging.getLogger(__name__)
+
+PREFIX = 'captive'
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+POOL_SNAPSHOT_FILE = 'pool_snapshot.json'
+POOL_SNAPSHOT_LOCK_FILE = 'pool_snapshot.lock'
+
+DEFAULT_CONFIG = {
+    'TOKEN': '',                                  # 설정 시 Authorization: Bearer <TOKEN> 필요
+    'ALLOWED_NETWORKS': ['127.0.0.1/32', '::1/128'],  # 토큰이 없을 때 허용할 스크레이퍼 주소
+    'POOL_SNAPSHOT_INTERVAL': 30,                 # KEA 풀 스냅샷 갱신 주기 (초)
+    'LATENCY_BUCKETS': [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10],
+    'JOB_BUCKETS': [0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60],
+}
+
+# performance.observe/increment 이름 -> (메트릭 이름, 도움말, 버킷 설정 키)
+HISTOGRAMS = {
+    'broadcast_job': ('broadcast_job_duration_seconds', '방송 작업 소요 시간', 'JOB_BUCKETS'),
+    'kea_query': ('kea_query_duration_seconds', 'KEA DB 조회 소요 시간', 'LATENCY_BUCKETS'),
+    'scheduler_job': ('scheduler_job_duration_seconds', '주기 작업 소요 시간', 'JOB_BUCKETS'),
+}
+COUNTERS = {
+    'rate_limit_rejections': ('rate_limit_rejections_total', 'API 키 요청 제한 거부 수'),
+    'ocsp_cache': ('ocsp_cache_requests_total', 'OCSP 응답 캐시 조회 수'),
+    'response_cache': ('response_cache_requests_total', 'API 응답 캐시 조회 수 (hit/miss/not_modified)'),
+}
+
+
+def get_config():
+    return {**DEFAULT_CONFIG, **getattr(settings, 'METRICS', {})}
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(labels):
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{key}="{_escape(value)}"' for key, value in labels) + '}'
+
+
+def _format_value(value):
+    if isinstance(value, float):
+        if math.isinf(value):
+            return '+Inf' if value > 0 else '-Inf'
+        return repr(value)
+    return str(value)
+
+
+class MetricWriter:
+    """Prometheus 텍스트 형식(0.0.4) 작성기"""
+
+    def __init__(self):
+        self.lines = []
+
+    def header(self, name, kind, help_text):
+        self.lines.append(f'# HELP {PREFIX}_{name} {help_text}')
+        self.lines.append(f'# TYPE {PREFIX}_{name} {kind}')
+
+    def sample(self, name, value, labels=()):
+        self.lines.append(f'{PREFIX}_{name}{_format_labels(labels)} {_format_value(value)}')
+
+    def metric(self, name, kind, help_text, samples):
+        """samples: [(라벨 튜플, 값)] - 값이 없으면 생략"""
+        samples = [(labels, value) for labels, value in samples if value is not None]
+        if not samples:
+            return
+        self.header(name, kind, help_text)
+        for labels, value in samples:
+            self.sample(name, value, labels)
+
+    def histogram(self, name, help_text, series, bounds):
+        """series: [(라벨 튜플, LatencyHistogram)]"""
+        if not series:
+            return
+        self.header(name, 'histogram', help_text)
+        for labels, histogram in series:
+            for bound, count in zip(bounds, histogram.cumulative(bounds)):
+                self.sample(f'{name}_bucket', count, labels + (('le', _format_value(float(bound))),))
+            self.sample(f'{name}_bucket', histogram.count, labels + (('le', '+Inf'),))
+            self.sample(f'{name}_sum', histogram.total, labels)
+            self.sample(f'{name}_count', histogram.count, labels)
+
+    def render(self):
+        return '\n'.join(self.lines) + '\n'
+
+
+def build_pool_snapshot():
+    """KEA 예약/리스와 장치 테이블로 대역별 풀 사용량 계산 (갱신 스레드에서만 호출)"""
+    from devices.models import Device
+    from devices.utils.kea_client import KeaClient
+
+    started = time.perf_counter()
+    kea_ips = KeaClient.get_kea_used_ips()
+    observe('kea_query', time.perf_counter() - started, query='reserved_hosts')
+
+    started = time.perf_counter()
+    leases = KeaClient.count_active_leases()
+    observe('kea_query', time.perf_counter() - started, query='active_leases')
+
+    used = set(kea_ips)
+    used.update(ip for ip in Device.objects.exclude(assigned_ip=None).values_list('assigned_ip', flat=True))
+    used.update(KeaClient.blacklisted_pool_ips())
+
+    return {
+        'timestamp': time.time(),
+        'bands': KeaClient.band_usage(used),
+        'reserved_hosts': len(kea_ips),
+        'active_leases': {str(subnet_id): count for subnet_id, count in leases.items()},
+    }
+
+
+def refresh_pool_snapshot(interval=None):
+    """
+    KEA 풀 스냅샷 갱신
+
+    파일 잠금을 잡은 워커 하나만, 스냅샷이 interval보다 오래된 경우에만 DB를 조회합니다
+    (캐시 백엔드와 관계없이 워커 간에 공유됨).
+    """
+    interval = interval or get_config()['POOL_SNAPSHOT_INTERVAL']
+    try:
+        with snapshot_store.locked(POOL_SNAPSHOT_LOCK_FILE, blocking=False) as acquired:
+            if not acquired:
+                return False
+            snapshot = snapshot_store.read(POOL_SNAPSHOT_FILE)
+            if snapshot and time.time() - snapshot['timestamp'] < interval:
+                return False
+            snapshot_store.write(POOL_SNAPSHOT_FILE, build_pool_snapshot())
+            return True
+    except Exception as e:
+        logger.error(f"KEA 풀 스냅샷 갱신 실패: {e}")
+        return False
+
+
+class PoolSnapshotUpdater:
+    """KEA 풀 스냅샷 백그라운드 갱신 스레드 (첫 스크레이프 시 시작)"""
+
+    def __init__(self):
+        self.thread = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        with self._lock:
+            if self.thread and self.thread.is_alive():
+                return
+            self.thread = threading.Thread(target=self._update_loop, daemon=True)
+            self.thread.start()
+            logger.info("KEA 풀 스냅샷 갱신 스레드 시작됨")
+
+    def _update_loop(self):
+        interval = get_config()['POOL_SNAPSHOT_INTERVAL']
+        while True:
+            try:
+                refresh_pool_snapshot(interval)
+                registry.flush()
+            except Exception as e:
+                logger.error(f"KEA 풀 스냅샷 갱신 루프 오류: {e}")
+            time.sleep(interval)
+
+
+pool_snapshot_updater = PoolSnapshotUpdater()
+
+
+def _write_host_metrics(writer):
+    from .views import HEALTH_CHECK_CACHE_KEY
+
+    health = cache.get(HEALTH_CHECK_CACHE_KEY) or {}
+    if not health or 'error' in health:
+        return
+    cpu = health.get('cpu', {})
+    memory = health.get('memory', {})
+    disk = health.get('disk', {})
+    network = (health.get('network') or {}).get('io') or {}
+    system = health.get('system', {})
+
+    writer.metric('host_cpu_usage_percent', 'gauge', 'CPU 사용률', [((), cpu.get('usage_percent'))])
+    writer.metric('host_load_average', 'gauge', '시스템 부하 평균', [
+        ((('period', period),), value) for period, value in (cpu.get('load_avg') or {}).items()
+    ])
+    writer.metric('host_memory_bytes', 'gauge', '메모리 사용량', [
+        ((('state', state),), memory.get(state)) for state in ('total', 'available', 'used', 'free')
+    ])
+    writer.metric('host_swap_bytes', 'gauge', '스왑 사용량', [
+        ((('state', state),), (memory.get('swap') or {}).get(state)) for state in ('total', 'used', 'free')
+    ])
+    writer.metric('host_disk_bytes', 'gauge', '루트 디스크 사용량', [
+        ((('state', state),), disk.get(state)) for state in ('total', 'used', 'free')
+    ])
+    writer.metric('host_disk_io_bytes_total', 'counter', '디스크 I/O 누적 바이트', [
+        ((('direction', 'read'),), (disk.get('io') or {}).get('read_bytes')),
+        ((('direction', 'write'),), (disk.get('io') or {}).get('write_bytes')),
+    ])
+    writer.metric('host_network_bytes_total', 'counter', '네트워크 누적 바이트', [
+        ((('direction', 'sent'),), network.get('bytes_sent')),
+        ((('direction', 'recv'),), network.get('bytes_recv')),
+    ])
+    writer.metric('host_network_errors_total', 'counter', '네트워크 오류/드롭 패킷 수', [
+        ((('type', key),), network.get(key)) for key in ('errin', 'errout', 'dropin', 'dropout')
+    ])
+    writer.metric('host_processes', 'gauge', '프로세스 수', [((), system.get('processes'))])
+    writer.metric('host_uptime_seconds', 'gauge', '시스템 가동 시간', [
+        ((), (system.get('uptime') or {}).get('total_seconds'))
+    ])
+
+
+def _write_pool_metrics(writer):
+    snapshot = snapshot_store.read(POOL_SNAPSHOT_FILE)
+    if not snapshot:
+        return
+    bands = sorted(snapshot['bands'].items())
+    for name, key, help_text in (
+        ('ip_pool_size', 'size', '대역별 할당 가능 IP 수'),
+        ('ip_pool_used', 'used', '대역별 사용 중 IP 수 (KEA 예약, 장치, 블랙리스트)'),
+        ('ip_pool_free', 'free', '대역별 남은 IP 수'),
+    ):
+        writer.metric(name, 'gauge', help_text, [
+            ((('band', band), ('role', data['role'])), data[key]) for band, data in bands
+        ])
+    writer.metric('kea_reserved_hosts', 'gauge', 'KEA hosts 예약 수', [((), snapshot['reserved_hosts'])])
+    writer.metric('kea_active_leases', 'gauge', '서브넷별 유효 리스 수', [
+        ((('subnet_id', subnet_id),), count) for subnet_id, count in sorted(snapshot['active_leases'].items())
+    ])
+    writer.metric('kea_snapshot_age_seconds', 'gauge', 'KEA 풀 스냅샷 경과 시간', [
+        ((), round(time.time() - snapshot['timestamp'], 3))
+    ])
+
+
+def _write_scheduler_metrics(writer):
+    from core.scheduler import STATUS_CACHE_KEY
+
+    statuses = sorted((cache.get(STATUS_CACHE_KEY) or {}).items())
+    writer.metric('scheduler_job_last_success_timestamp_seconds', 'gauge', '주기 작업 마지막 성공 시각', [
+        ((('job', job),), status['last_success']) for job, status in statuses if status.get('last_success')
+    ])
+    writer.metric('scheduler_job_last_run_failed', 'gauge', '주기 작업 마지막 실행 실패 여부', [
+        ((('job', job),), int(status.get('status') == 'failed')) for job, status in statuses
+    ])
+
+
+def render_metrics():
+    """Prometheus 텍스트 형식 메트릭 생성 (캐시만 조회)"""
+    config = get_config()
+    views, counters, histograms = collect_metrics()
+    writer = MetricWriter()
+
+    _write_host_metrics(writer)
+
+    latency_bounds = config['LATENCY_BUCKETS']
+    writer.histogram('http_request_duration_seconds', '뷰/액션별 응답 시간', [
+        ((('view', view),), stats.latency) for view, stats in sorted(views.items())
+    ], latency_bounds)
+    writer.metric('http_request_errors_total', 'counter', '뷰/액션별 5xx 응답 수', [
+        ((('view', view),), stats.errors) for view, stats in sorted(views.items())
+    ])
+
+    db = {}
+    external = {}
+    for stats in views.values():
+        for target, source in ((db, stats.queries), (external, stats.external)):
+            for key, (count, elapsed) in source.items():
+                entry = target.setdefault(key, [0, 0.0])
+                entry[0] += count
+                entry[1] += elapsed
+    writer.metric('db_queries_total', 'counter', 'DB alias별 쿼리 수', [
+        ((('alias', alias),), count) for alias, (count, _) in sorted(db.items())
+    ])
+    writer.metric('db_query_seconds_total', 'counter', 'DB alias별 쿼리 누적 시간', [
+        ((('alias', alias),), elapsed) for alias, (_, elapsed) in sorted(db.items())
+    ])
+    writer.metric('external_requests_total', 'counter', '외부 서비스별 HTTP 호출 수', [
+        ((('service', service),), count) for service, (count, _) in sorted(external.items())
+    ])
+    writer.metric('external_request_seconds_total', 'counter', '외부 서비스별 HTTP 호출 누적 시간', [
+        ((('service', service),), elapsed) for service, (_, elapsed) in sorted(external.items())
+    ])
+
+    _write_pool_metrics(writer)
+    _write_scheduler_metrics(writer)
+
+    for key, (name, help_text, buckets) in HISTOGRAMS.items():
+        writer.histogram(name, help_text, sorted(
+            ((labels, histogram) for (metric, labels), histogram in histograms.items() if metric == key),
+            key=lambda item: item[0]
+        ), config[buckets])
+    for key, (name, help_text) in COUNTERS.items():
+        writer.metric(name, 'counter', help_text, sorted(
+            (labels, value) for (metric, labels), value in counters.items() if metric == key
+        ))
+
+    hits = counters.get(('ocsp_cache', (('result', 'hit'),)), 0)
+    misses = counters.get(('ocsp_cache', (('result', 'miss'),)), 0)
+    if hits + misses:
+        writer.metric('ocsp_cache_hit_ratio', 'gauge', 'OCSP 응답 캐시 적중률', [((), round(hits / (hits + misses), 4))])
+
+    # 엔드포인트별 응답 캐시 적중률 (304 포함)
+    response_cache = {}
+    for (metric, labels), value in counters.items():
+        if metric == 'response_cache':
+            labels = dict(labels)
+            totals = response_cache.setdefault(labels.get('view', ''), [0, 0])
+            totals[0 if labels.get('result') == 'miss' else 1] += value
+    if response_cache:
+        writer.metric('response_cache_hit_ratio', 'gauge', 'API 응답 캐시 적중률 (304 포함)', sorted(
+            ((('view', view),), round(served / (misses + served), 4))
+            for view, (misses, served) in response_cache.items() if misses + served
+        ))
+
+    return writer.render()
+
+
+def _client_allowed(request, config):
+    token = config['TOKEN']
+    if token:
+        return request.headers.get('Authorization', '') == f'Bearer {token}'
+    try:
+        address = ipaddress.ip_address(request.META.get('REMOTE_ADDR', ''))
+    except ValueError:
+        return False
+    return any(address in ipaddress.ip_network(network) for network in config['ALLOWED_NETWORKS'])
+
+
+def metrics_view(request):
+    """GET /metrics - Prometheus 스크레이프 엔드포인트"""
+    config = get_config()
+    if not _client_allowed(request, config):
+        return HttpResponseForbidden('forbidden\n', content_type=CONTENT_TYPE)
+    pool_snapshot_updater.start()
+    try:
+        return HttpResponse(render_metrics(), content_type=CONTENT_TYPE)
+    except Exception as e:
+        logger.error(f"메트릭 생성 실패: {e}")
+        return HttpResponse(f'# error: {e}\n', status=500, content_type=CONTENT_TYPE)
@@ -0,0 +1,52 @@
+# Generated by Django 5.1.6 on 2026-10-19 02:09
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchiveSegment',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('table', models.CharField(max_length=30, verbose_name='테이블')),
+                ('period', models.DateField(verbose_name='보관 월')),
+                ('part', models.PositiveSmallIntegerField(default=1, verbose_name='파일 번호')),
+                ('path', models.CharField(max_length=255, verbose_name='파일 경로')),
+                ('row_count', models.PositiveIntegerField(verbose_name='행 수')),
+                ('first_at', models.DateTimeField(verbose_name='첫 행 시각')),
+                ('last_at', models.DateTimeField(verbose_name='마지막 행 시각')),
+                ('size_bytes', models.PositiveBigIntegerField(verbose_name='파일 크기')),
+                ('sha256', models.CharField(max_length=64, verbose_name='파일 해시')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='보관 시각')),
+            ],
+            options={
+                'verbose_name': '이력 보관 파일',
+                'verbose_name_plural': '이력 보관 파일',
+                'db_table': 'history_archive_segments',
+                'ordering': ['table', 'period', 'part'],
+                'constraints': [models.UniqueConstraint(fields=('table', 'period', 'part'), name='archive_segment_unique')],
+            },
+        ),
+        migrations.CreateModel(
+            name='ArchiveKey',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key_type', models.CharField(max_length=20, verbose_name='키 종류')),
+                ('value', models.CharField(max_length=255, verbose_name='키 값')),
+                ('segment', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='keys', to='system.archivesegment')),
+            ],
+            options={
+                'db_table': 'history_archive_keys',
+                'indexes': [models.Index(fields=['key_type', 'value'], name='archive_key_lookup_idx')],
+                'constraints': [models.UniqueConstraint(fields=('segment', 'key_type', 'value'), name='archive_key_unique')],
+            },
+        ),
+    ]
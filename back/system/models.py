@@ -1,3 +1,47 @@
 from django.db import models
 
-# Create your models here.
+
+class ArchiveSegment(models.Model):
+    """
+    이력 테이블 보관 파일 (테이블·월 단위 gzip JSONL, system.archive)
+
+    같은 달의 행이 나중에 다시 보관되면 part를 늘려 별도 파일로 둡니다.
+    """
+    table = models.CharField('테이블', max_length=30)
+    period = models.DateField('보관 월')  # 해당 월 1일 (TIME_ZONE 기준)
+    part = models.PositiveSmallIntegerField('파일 번호', default=1)
+    path = models.CharField('파일 경로', max_length=255)  # HISTORY_ARCHIVE['DIRECTORY'] 기준 상대 경로
+    row_count = models.PositiveIntegerField('행 수')
+    first_at = models.DateTimeField('첫 행 시각')
+    last_at = models.DateTimeField('마지막 행 시각')
+    size_bytes = models.PositiveBigIntegerField('파일 크기')
+    sha256 = models.CharField('파일 해시', max_length=64)
+    created_at = models.DateTimeField('보관 시각', auto_now_add=True)
+
+    class Meta:
+        db_table = 'history_archive_segments'
+        verbose_name = '이력 보관 파일'
+        verbose_name_plural = '이력 보관 파일'
+        ordering = ['table', 'period', 'part']
+        constraints = [
+            models.UniqueConstraint(fields=['table', 'period', 'part'], name='archive_segment_unique'),
+        ]
+
+    def __str__(self):
+        return f"{self.table} {self.period:%Y-%m} #{self.part} ({self.row_count}행)"
+
+
+class ArchiveKey(models.Model):
+    """보관 파일별 조회 키 (사용자, MAC, 장비 등) - 보관 이력 조회 시 열어 볼 파일만 고르는 색인"""
+    segment = models.ForeignKey(ArchiveSegment, on_delete=models.CASCADE, related_name='keys')
+    key_type = models.CharField('키 종류', max_length=20)
+    value = models.CharField('키 값', max_length=255)
+
+    class Meta:
+        db_table = 'history_archive_keys'
+        constraints = [
+            models.UniqueConstraint(fields=['segment', 'key_type', 'value'], name='archive_key_unique'),
+        ]
+        indexes = [
+            models.Index(fields=['key_type', 'value'], name='archive_key_lookup_idx'),
+        ]
@@ -0,0 +1,660 @@
+"""
+요청 단위 성능 계측
+
+- 뷰/액션별 응답 시간 히스토그램, DB 쿼리 수·시간(alias별), 외부 HTTP 시간, 응답 크기를 집계합니다.
+- 각 워커는 주기적으로 자신의 집계를 집계 디렉터리(DIRECTORY)에 파일로 기록하고, 조회 시 모든 워커의 값을 합칩니다.
+  종료된 워커의 집계는 gunicorn child_exit 훅에서 누적 파일로 옮기므로 max_requests로 워커가
+  재시작되어도 카운터가 줄어들지 않고, 캐시 백엔드(LocMem 포함)와 관계없이 모든 워커가 같은 값을 읽습니다.
+- 가장 느린 요청은 실행된 SQL과 함께 샘플로 보관합니다.
+- 요청 외 이벤트(요청 제한 거부, 방송 작업 시간 등)는 increment/observe로 이름·라벨별로 집계합니다.
+"""
+import fcntl
+import heapq
+import itertools
+import json
+import logging
+import math
+import os
+import socket
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONFIG = {
+    'ENABLED': True,
+    'DIRECTORY': os.path.join(tempfile.gettempdir(), 'bssm_captive_metrics'),  # 워커 집계 디렉터리
+    'FLUSH_INTERVAL': 10,         # 집계 파일 기록 주기 (초)
+    'SLOW_SAMPLE_SIZE': 20,       # 워커당 보관할 느린 요청 수
+    'SLOW_THRESHOLD_MS': 200,     # 이 시간 이상 걸린 요청만 샘플 후보
+    'MAX_SQL_PER_REQUEST': 100,   # 느린 요청 샘플에 보관할 SQL 수
+    'MAX_SQL_LENGTH': 2000,
+}
+
+
+def get_config():
+    return {**DEFAULT_CONFIG, **getattr(settings, 'PERFORMANCE_MONITOR', {})}
+
+
+class LatencyHistogram:
+    """
+    로그-선형 버킷 지연 시간 히스토그램 (HDR 히스토그램 방식)
+
+    값은 마이크로초 단위로 기록하며, 2배 구간마다 SUB_BUCKETS개 버킷을 둡니다
+    (상대 오차 약 4%). 버킷 개수만 더하면 되므로 워커 간 병합이 간단합니다.
+    """
+    SUB_BUCKETS = 16
+
+    def __init__(self, counts=None, count=0, total=0.0, maximum=0.0):
+        self.counts = counts if counts is not None else {}
+        self.count = count
+        self.total = total
+        self.maximum = maximum
+
+    def record(self, seconds):
+        micros = max(seconds * 1_000_000, 1.0)
+        index = int(math.log2(micros) * self.SUB_BUCKETS)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.maximum:
+            self.maximum = seconds
+
+    def merge(self, other):
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.count += other.count
+        self.total += other.total
+        self.maximum = max(self.maximum, other.maximum)
+
+    def percentile(self, percent):
+        """백분위수 (초)"""
+        if not self.count:
+            return 0.0
+        threshold = self.count * percent / 100
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= threshold:
+                # 버킷 상한값 반환 (최댓값을 넘지 않도록)
+                return min(2 ** ((index + 1) / self.SUB_BUCKETS) / 1_000_000, self.maximum)
+        return self.maximum
+
+    def cumulative(self, bounds):
+        """
+        bounds(초, 오름차순) 이하 누적 개수 목록 (Prometheus le 버킷)
+
+        버킷 상한값 기준으로 배정하므로 경계 근처 값은 한 단계 큰 버킷에 들어갈 수 있습니다.
+        """
+        totals = [0] * len(bounds)
+        for index, count in self.counts.items():
+            upper = 2 ** ((index + 1) / self.SUB_BUCKETS) / 1_000_000
+            for position, bound in enumerate(bounds):
+                if upper <= bound:
+                    totals[position] += count
+                    break
+        for position in range(1, len(totals)):
+            totals[position] += totals[position - 1]
+        return totals
+
+    def to_dict(self):
+        return {
+            'counts': {str(index): count for index, count in self.counts.items()},
+            'count': self.count,
+            'total': self.total,
+            'max': self.maximum,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(
+            counts={int(index): count for index, count in data.get('counts', {}).items()},
+            count=data.get('count', 0),
+            total=data.get('total', 0.0),
+            maximum=data.get('max', 0.0),
+        )
+
+
+class ViewStats:
+    """뷰/액션 하나의 누적 통계"""
+
+    def __init__(self):
+        self.latency = LatencyHistogram()
+        self.errors = 0
+        self.queries = {}    # alias -> [쿼리 수, 시간(초)]
+        self.max_queries = 0
+        self.external = {}   # 서비스 -> [호출 수, 시간(초)]
+        self.response_bytes = 0
+        self.max_response_bytes = 0
+
+    def add_request(self, request_stats, duration, status_code, response_bytes):
+        self.latency.record(duration)
+        if status_code >= 500:
+            self.errors += 1
+        total_queries = 0
+        for alias, (count, elapsed) in request_stats.queries.items():
+            entry = self.queries.setdefault(alias, [0, 0.0])
+            entry[0] += count
+            entry[1] += elapsed
+            total_queries += count
+        self.max_queries = max(self.max_queries, total_queries)
+        for service, (count, elapsed) in request_stats.external.items():
+            entry = self.external.setdefault(service, [0, 0.0])
+            entry[0] += count
+            entry[1] += elapsed
+        self.response_bytes += response_bytes
+        self.max_response_bytes = max(self.max_response_bytes, response_bytes)
+
+    def merge(self, other):
+        self.latency.merge(other.latency)
+        self.errors += other.errors
+        for target, source in ((self.queries, other.queries), (self.external, other.external)):
+            for key, (count, elapsed) in source.items():
+                entry = target.setdefault(key, [0, 0.0])
+                entry[0] += count
+                entry[1] += elapsed
+        self.max_queries = max(self.max_queries, other.max_queries)
+        self.response_bytes += other.response_bytes
+        self.max_response_bytes = max(self.max_response_bytes, other.max_response_bytes)
+
+    def to_dict(self):
+        return {
+            'latency': self.latency.to_dict(),
+            'errors': self.errors,
+            'queries': self.queries,
+            'max_queries': self.max_queries,
+            'external': self.external,
+            'response_bytes': self.response_bytes,
+            'max_response_bytes': self.max_response_bytes,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        stats = cls()
+        stats.latency = LatencyHistogram.from_dict(data.get('latency', {}))
+        stats.errors = data.get('errors', 0)
+        stats.queries = {alias: list(entry) for alias, entry in data.get('queries', {}).items()}
+        stats.max_queries = data.get('max_queries', 0)
+        stats.external = {service: list(entry) for service, entry in data.get('external', {}).items()}
+        stats.response_bytes = data.get('response_bytes', 0)
+        stats.max_response_bytes = data.get('max_response_bytes', 0)
+        return stats
+
+    def summary(self, view):
+        count = self.latency.count or 1
+        return {
+            'view': view,
+            'count': self.latency.count,
+            'errors': self.errors,
+            'total_ms': round(self.latency.total * 1000, 1),
+            'mean_ms': round(self.latency.total / count * 1000, 2),
+            'p50_ms': round(self.latency.percentile(50) * 1000, 2),
+            'p90_ms': round(self.latency.percentile(90) * 1000, 2),
+            'p99_ms': round(self.latency.percentile(99) * 1000, 2),
+            'max_ms': round(self.latency.maximum * 1000, 2),
+            'db': {
+                alias: {
+                    'queries_per_request': round(queries / count, 2),
+                    'time_ms_per_request': round(elapsed / count * 1000, 2),
+                }
+                for alias, (queries, elapsed) in self.queries.items()
+            },
+            'max_queries': self.max_queries,
+            'external': {
+                service: {
+                    'calls_per_request': round(calls / count, 2),
+                    'time_ms_per_request': round(elapsed / count * 1000, 2),
+                }
+                for service, (calls, elapsed) in self.external.items()
+            },
+            'response_bytes_avg': int(self.response_bytes / count),
+            'response_bytes_max': self.max_response_bytes,
+        }
+
+
+class RequestStats:
+    """요청 하나를 처리하는 동안의 측정값"""
+    __slots__ = ('queries', 'external', 'sql', 'max_sql')
+
+    def __init__(self, max_sql):
+        self.queries = {}
+        self.external = {}
+        self.sql = []
+        self.max_sql = max_sql
+
+    def record_query(self, alias, sql, elapsed):
+        entry = self.queries.get(alias)
+        if entry is None:
+            self.queries[alias] = [1, elapsed]
+        else:
+            entry[0] += 1
+            entry[1] += elapsed
+        if len(self.sql) < self.max_sql:
+            self.sql.append((alias, sql, elapsed))
+
+    def record_external(self, service, elapsed):
+        entry = self.external.setdefault(service, [0, 0.0])
+        entry[0] += 1
+        entry[1] += elapsed
+
+
+_current_request = ContextVar('perf_request_stats', default=None)
+
+
+@contextmanager
+def track_external(service):
+    """외부 HTTP 호출 시간을 현재 요청 통계에 기록"""
+    request_stats = _current_request.get()
+    if request_stats is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        request_stats.record_external(service, time.perf_counter() - started)
+
+
+def _query_wrapper(execute, sql, params, many, context):
+    request_stats = _current_request.get()
+    if request_stats is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        request_stats.record_query(context['connection'].alias, sql, time.perf_counter() - started)
+
+
+def _install_query_wrapper(sender=None, connection=None, **kwargs):
+    """
+    연결에 쿼리 계측 래퍼를 상시 설치 (요청 밖에서는 ContextVar가 비어 있어 그대로 실행)
+
+    ASGI에서는 동기 뷰와 ORM 호출이 요청마다 다른 스레드의 연결에서 실행되므로
+    요청 시작 시 현재 스레드 연결에만 래퍼를 거는 대신 연결이 만들어질 때 설치합니다.
+    """
+    if _query_wrapper not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_query_wrapper)
+
+
+class PerformanceRegistry:
+    """워커 프로세스 단위 집계 저장소"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._views = {}
+        self._slow = []  # (소요 시간, 순번, 샘플) 최소 힙
+        self._counters = {}    # (이름, 라벨) -> 값
+        self._histograms = {}  # (이름, 라벨) -> LatencyHistogram
+        self._sequence = itertools.count()
+        self._last_flush = time.monotonic()
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+
+    def record(self, view, request_stats, duration, status_code, response_bytes, sample, config):
+        with self._lock:
+            stats = self._views.get(view)
+            if stats is None:
+                stats = self._views[view] = ViewStats()
+            stats.add_request(request_stats, duration, status_code, response_bytes)
+
+            if duration * 1000 >= config['SLOW_THRESHOLD_MS']:
+                size = config['SLOW_SAMPLE_SIZE']
+                if len(self._slow) < size or duration > self._slow[0][0]:
+                    entry = (duration, next(self._sequence), sample())
+                    if len(self._slow) < size:
+                        heapq.heappush(self._slow, entry)
+                    else:
+                        heapq.heapreplace(self._slow, entry)
+
+            flush_due = time.monotonic() - self._last_flush >= config['FLUSH_INTERVAL']
+            if flush_due:
+                self._last_flush = time.monotonic()
+        if flush_due:
+            self.flush(config)
+
+    def increment(self, name, labels=(), amount=1):
+        with self._lock:
+            key = (name, labels)
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+    def observe(self, name, seconds, labels=()):
+        with self._lock:
+            histogram = self._histograms.get((name, labels))
+            if histogram is None:
+                histogram = self._histograms[(name, labels)] = LatencyHistogram()
+            histogram.record(seconds)
+
+    def snapshot(self):
+        with self._lock:
+            return build_snapshot(
+                self._views, self._counters, self._histograms,
+                slow_requests=[sample for _, _, sample in self._slow], worker=self.worker_id,
+            )
+
+    def flush(self, config=None):
+        """현재 집계를 집계 디렉터리의 워커 파일에 기록"""
+        try:
+            snapshot_store.save_worker(os.getpid(), self.snapshot())
+        except OSError as e:
+            logger.warning(f"성능 집계 기록 실패: {e}")
+
+    def reset(self):
+        with self._lock:
+            self._views.clear()
+            self._slow.clear()
+            self._counters.clear()
+            self._histograms.clear()
+
+    def after_fork(self):
+        """fork된 자식 프로세스에서 호출 - 부모의 집계와 워커 ID를 물려받지 않도록 초기화"""
+        self._lock = threading.Lock()
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self._last_flush = time.monotonic()
+        self.reset()
+
+
+def build_snapshot(views, counters, histograms, slow_requests=(), worker=None):
+    """집계를 JSON으로 기록할 수 있는 스냅샷 dict로 변환"""
+    return {
+        'worker': worker,
+        'views': {view: stats.to_dict() for view, stats in views.items()},
+        'slow_requests': list(slow_requests),
+        'counters': [[name, dict(labels), value] for (name, labels), value in counters.items()],
+        'histograms': [
+            [name, dict(labels), histogram.to_dict()] for (name, labels), histogram in histograms.items()
+        ],
+    }
+
+
+class SnapshotStore:
+    """
+    워커 집계 파일 저장소 (prometheus_client multiprocess 디렉터리와 같은 방식)
+
+    - worker_<pid>.json: 살아 있는 워커의 누적 집계 (워커가 통째로 덮어씀)
+    - archive.json: 종료된 워커 집계의 합 (mark_process_dead가 합친 뒤 워커 파일 삭제)
+    읽기는 공유 잠금, 합치기/초기화는 배타 잠금을 잡아 같은 값을 두 번 세거나 빠뜨리지 않습니다.
+    """
+    ARCHIVE = 'archive.json'
+    WORKER_FILE = 'worker_{}.json'
+
+    def __init__(self, directory=None):
+        self._directory = directory
+
+    @property
+    def directory(self):
+        return self._directory or get_config()['DIRECTORY']
+
+    def _path(self, name):
+        return os.path.join(self.directory, name)
+
+    @contextmanager
+    def locked(self, name='.lock', shared=False, blocking=True):
+        """디렉터리 파일 잠금 (flock) - 잠금을 잡으면 True, 비차단 모드에서 못 잡으면 False를 yield"""
+        os.makedirs(self.directory, exist_ok=True)
+        mode = fcntl.LOCK_SH if shared else fcntl.LOCK_EX
+        with open(self._path(name), 'a') as lock_file:
+            try:
+                fcntl.flock(lock_file, mode if blocking else mode | fcntl.LOCK_NB)
+            except BlockingIOError:
+                yield False
+                return
+            try:
+                yield True
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def read(self, name):
+        try:
+            with open(self._path(name)) as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return None
+
+    def write(self, name, data):
+        """임시 파일에 쓴 뒤 교체 (읽는 쪽이 쓰다 만 파일을 보지 않음)"""
+        os.makedirs(self.directory, exist_ok=True)
+        temp_path = self._path(f'.{name}.{os.getpid()}.tmp')
+        with open(temp_path, 'w') as file:
+            json.dump(data, file)
+        os.replace(temp_path, self._path(name))
+
+    def _remove(self, name):
+        try:
+            os.remove(self._path(name))
+        except FileNotFoundError:
+            pass
+
+    def _worker_names(self):
+        return sorted(
+            name for name in os.listdir(self.directory)
+            if name.startswith('worker_') and name.endswith('.json')
+        )
+
+    def save_worker(self, pid, snapshot):
+        self.write(self.WORKER_FILE.format(pid), snapshot)
+
+    def load(self):
+        """(살아 있는 워커 스냅샷 목록, 종료된 워커 누적 스냅샷 또는 None)"""
+        with self.locked(shared=True):
+            workers = [snapshot for snapshot in map(self.read, self._worker_names()) if snapshot]
+            return workers, self.read(self.ARCHIVE)
+
+    def mark_process_dead(self, pid):
+        """종료된 워커의 집계를 누적 파일에 합치고 워커 파일 삭제 (gunicorn child_exit 훅에서 호출)"""
+        name = self.WORKER_FILE.format(pid)
+        with self.locked():
+            snapshot = self.read(name)
+            if snapshot:
+                archive = self.read(self.ARCHIVE)
+                views, counters, histograms = merge_snapshots([s for s in (archive, snapshot) if s])
+                self.write(self.ARCHIVE, build_snapshot(views, counters, histograms))
+            self._remove(name)
+
+    def clear(self):
+        """모든 집계 파일 삭제"""
+        with self.locked():
+            for name in self._worker_names() + [self.ARCHIVE]:
+                self._remove(name)
+
+
+snapshot_store = SnapshotStore()
+registry = PerformanceRegistry()
+# gunicorn preload_app: 마스터에서 만든 인스턴스를 워커가 그대로 물려받음
+os.register_at_fork(after_in_child=registry.after_fork)
+
+
+def _labels(labels):
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def increment(name, amount=1, **labels):
+    """이름·라벨별 카운터 증가 (예: increment('rate_limit_rejections', window='minute'))"""
+    registry.increment(name, _labels(labels), amount)
+
+
+def observe(name, seconds, **labels):
+    """이름·라벨별 소요 시간 히스토그램에 기록"""
+    registry.observe(name, seconds, _labels(labels))
+
+
+def _worker_snapshots():
+    """(살아 있는 워커 스냅샷 목록, 종료된 워커 누적 스냅샷 또는 None) - 현재 워커는 먼저 기록"""
+    registry.flush()
+    try:
+        return snapshot_store.load()
+    except OSError as e:
+        logger.warning(f"성능 집계 읽기 실패: {e}")
+        return [registry.snapshot()], None
+
+
+def merge_snapshots(snapshots):
+    """
+    워커 스냅샷 병합
+
+    Returns:
+        (뷰별 ViewStats, (이름, 라벨) -> 카운터 값, (이름, 라벨) -> LatencyHistogram)
+    """
+    views = {}
+    counters = {}
+    histograms = {}
+    for snapshot in snapshots:
+        for view, data in snapshot.get('views', {}).items():
+            stats = ViewStats.from_dict(data)
+            if view in views:
+                views[view].merge(stats)
+            else:
+                views[view] = stats
+        for name, labels, value in snapshot.get('counters', []):
+            key = (name, _labels(labels))
+            counters[key] = counters.get(key, 0) + value
+        for name, labels, data in snapshot.get('histograms', []):
+            key = (name, _labels(labels))
+            histogram = LatencyHistogram.from_dict(data)
+            if key in histograms:
+                histograms[key].merge(histogram)
+            else:
+                histograms[key] = histogram
+    return views, counters, histograms
+
+
+def collect_metrics():
+    """종료된 워커를 포함한 모든 워커의 뷰 통계, 카운터, 히스토그램 병합 결과 (단조 증가)"""
+    snapshots, archive = _worker_snapshots()
+    return merge_snapshots(snapshots + ([archive] if archive else []))
+
+
+def collect_stats(limit=None):
+    """모든 워커의 집계를 병합하여 반환"""
+    snapshots, archive = _worker_snapshots()
+    merged, _, _ = merge_snapshots(snapshots + ([archive] if archive else []))
+    slow_requests = []
+    for snapshot in snapshots:
+        slow_requests.extend(snapshot.get('slow_requests', []))
+
+    views = sorted(
+        (stats.summary(view) for view, stats in merged.items()),
+        key=lambda summary: summary['total_ms'],
+        reverse=True
+    )
+    slow_requests.sort(key=lambda sample: sample['duration_ms'], reverse=True)
+    size = get_config()['SLOW_SAMPLE_SIZE']
+    return {
+        'workers': len(snapshots),
+        'views': views[:limit] if limit else views,
+        'slow_requests': slow_requests[:size],
+    }
+
+
+def reset_stats():
+    """모든 워커의 집계 초기화 (다른 워커는 다음 기록 시 새 집계로 다시 등록)"""
+    registry.reset()
+    snapshot_store.clear()
+
+
+def mark_process_dead(pid):
+    """종료된 워커의 집계를 누적값으로 옮김 (gunicorn child_exit 훅)"""
+    try:
+        snapshot_store.mark_process_dead(pid)
+    except OSError as e:
+        logger.warning(f"워커 {pid} 성능 집계 정리 실패: {e}")
+
+
+def clear_snapshots():
+    """서버 시작 시 이전 실행의 집계 파일 삭제 (gunicorn when_ready 훅, 단독 실행 서버 진입점)"""
+    try:
+        snapshot_store.clear()
+    except OSError as e:
+        logger.warning(f"성능 집계 디렉터리 초기화 실패: {e}")
+
+
+def resolve_view_name(request):
+    """요청을 처리한 뷰/액션 이름 (예: UserViewSet.list, DeviceMatrixView.get)"""
+    match = getattr(request, 'resolver_match', None)
+    if match is None:
+        return 'unresolved'
+    view_class = getattr(match.func, 'cls', None) or getattr(match.func, 'view_class', None)
+    if view_class is None:
+        return match.view_name or match._func_path
+    method = request.method.lower()
+    actions = getattr(match.func, 'actions', None)
+    action = actions.get(method, method) if actions else method
+    return f"{view_class.__name__}.{action}"
+
+
+class PerformanceMiddleware:
+    """요청별 응답 시간, DB 쿼리, 외부 HTTP 시간, 응답 크기 계측 미들웨어 (WSGI/ASGI 모두 지원)"""
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.config = get_config()
+        self.enabled = self.config['ENABLED']
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+        if self.enabled:
+            connection_created.connect(_install_query_wrapper, dispatch_uid='performance_query_wrapper')
+            for connection in connections.all(initialized_only=True):
+                _install_query_wrapper(connection=connection)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        if not self.enabled:
+            return self.get_response(request)
+
+        request_stats = RequestStats(self.config['MAX_SQL_PER_REQUEST'])
+        token = _current_request.set(request_stats)
+        started = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            _current_request.reset(token)
+        self.record(request, response, request_stats, time.perf_counter() - started)
+        return response
+
+    async def __acall__(self, request):
+        if not self.enabled:
+            return await self.get_response(request)
+
+        request_stats = RequestStats(self.config['MAX_SQL_PER_REQUEST'])
+        token = _current_request.set(request_stats)
+        started = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current_request.reset(token)
+        self.record(request, response, request_stats, time.perf_counter() - started)
+        return response
+
+    def record(self, request, response, request_stats, duration):
+        response_bytes = 0 if response.streaming else len(response.content)
+        view = resolve_view_name(request)
+        max_length = self.config['MAX_SQL_LENGTH']
+
+        def sample():
+            return {
+                'view': view,
+                'method': request.method,
+                'path': request.get_full_path(),
+                'status': response.status_code,
+                'duration_ms': round(duration * 1000, 2),
+                'timestamp': time.time(),
+                'queries': {alias: count for alias, (count, _) in request_stats.queries.items()},
+                'external': {service: round(elapsed * 1000, 2) for service, (_, elapsed) in request_stats.external.items()},
+                'sql': [
+                    {'alias': alias, 'time_ms': round(elapsed * 1000, 3), 'sql': sql[:max_length]}
+                    for alias, sql, elapsed in request_stats.sql
+                ],
+            }
+
+        registry.record(view, request_stats, duration, response.status_code, response_bytes, sample, self.config)
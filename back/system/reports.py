@@ -0,0 +1,125 @@
+"""
+관리자용 집계 보고서 (MCP 에이전트 도구와 관리 화면에서 한 번에 조회)
+
+여러 엔드포인트를 차례로 호출해 클라이언트에서 합치던 값을 SQL에서 계산합니다.
+- 사용자 요약: 사용자별 장치/대여/신청 개수를 상관 서브쿼리(COUNT)로 붙여 한 번의 쿼리로 조회
+  (여러 테이블을 JOIN + GROUP BY 하면 행이 곱해지므로 서브쿼리를 사용)
+- 대역 보고서: 대역별 장치 수를 조건부 집계 한 번으로 계산하고 풀 사용량(KEA 예약 포함)과 합침
+"""
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db.models import Count, F, IntegerField, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from devices.models import Device
+from devices.utils.kea_client import KeaClient
+from rentals.models import Rental, RentalRequest
+
+USER_SUMMARY_COLUMNS = (
+    'id', 'username', 'name', 'email', 'role', 'grade', 'class_number',
+    'device_count', 'active_device_count', 'active_rental_count',
+    'overdue_rental_count', 'pending_request_count', 'last_login',
+)
+
+
+def _count_subquery(queryset, user_field='user'):
+    """사용자별 행 수를 세는 상관 서브쿼리 (행이 없으면 0)"""
+    counted = (
+        queryset.filter(**{user_field: OuterRef('pk')})
+        .order_by()
+        .values(user_field)
+        .annotate(n=Count('pk'))
+        .values('n')
+    )
+    return Coalesce(Subquery(counted, output_field=IntegerField()), Value(0))
+
+
+def overdue_rental_filter(now=None):
+    """연체 대여 조건 (연체 처리된 대여 + 반납 예정일이 지났지만 아직 대여중인 대여)"""
+    now = now or timezone.now()
+    return Q(status='OVERDUE') | Q(status='RENTED', due_date__lt=now)
+
+
+def user_summary_queryset(role=None, grade=None, class_number=None, search=None, overdue_only=False):
+    """사용자 요약 쿼리셋 (USER_SUMMARY_COLUMNS의 값을 annotate, 사용자명 순)"""
+    overdue = Rental.objects.filter(overdue_rental_filter())
+    users = get_user_model().objects.filter(is_active=True).annotate(
+        grade=F('student_info__current_class__grade'),
+        class_number=F('student_info__current_class__class_number'),
+        device_count=_count_subquery(Device.objects.all()),
+        active_device_count=_count_subquery(Device.objects.filter(is_active=True)),
+        active_rental_count=_count_subquery(Rental.objects.filter(status__in=['RENTED', 'OVERDUE'])),
+        overdue_rental_count=_count_subquery(overdue),
+        pending_request_count=_count_subquery(RentalRequest.objects.filter(status='PENDING')),
+    )
+    if role == 'student':
+        users = users.filter(is_staff=False)
+    elif role == 'teacher':
+        users = users.filter(is_staff=True)
+    if grade:
+        users = users.filter(student_info__current_class__grade=grade)
+    if class_number:
+        users = users.filter(student_info__current_class__class_number=class_number)
+    if search:
+        users = users.filter(
+            Q(username__icontains=search) | Q(first_name__icontains=search)
+            | Q(last_name__icontains=search) | Q(email__icontains=search)
+        )
+    if overdue_only:
+        users = users.filter(overdue_rental_count__gt=0)
+    return users.order_by('username')
+
+
+def user_summary_row(user):
+    """annotate된 사용자를 USER_SUMMARY_COLUMNS 순서의 행(list)으로 변환"""
+    name = f"{user.last_name or ''} {user.first_name or ''}".strip() or user.username
+    return [
+        user.id, user.username, name, user.email,
+        'teacher' if user.is_staff else 'student',
+        user.grade, user.class_number,
+        user.device_count, user.active_device_count, user.active_rental_count,
+        user.overdue_rental_count, user.pending_request_count,
+        user.last_login.isoformat() if user.last_login else None,
+    ]
+
+
+def user_summary_totals(users):
+    """필터된 사용자 전체 합계 (쿼리 한 번)"""
+    return users.order_by().aggregate(
+        users=Count('pk'),
+        students=Count('pk', filter=Q(is_staff=False)),
+        teachers=Count('pk', filter=Q(is_staff=True)),
+        users_with_overdue=Count('pk', filter=Q(overdue_rental_count__gt=0)),
+        users_with_pending_requests=Count('pk', filter=Q(pending_request_count__gt=0)),
+    )
+
+
+def band_report():
+    """
+    대역별 풀 사용량 + 장치 현황
+
+    장치 수는 assigned_ip의 대역 접두사로 조건부 집계하며 (쿼리 한 번),
+    online은 LEASE_ACTIVITY['ONLINE_WINDOW'] 안에 접속한 장치, never_seen은 접속 기록이 없는 장치입니다.
+    """
+    online_since = timezone.now() - timedelta(seconds=settings.LEASE_ACTIVITY['ONLINE_WINDOW'])
+    aggregates = {}
+    for band in KeaClient.STUDENT_BANDS + KeaClient.TEACHER_BANDS:
+        key = band.rstrip('.').replace('.', '_')
+        in_band = Q(assigned_ip__startswith=band)
+        aggregates[f'{key}__devices'] = Count('pk', filter=in_band)
+        aggregates[f'{key}__active'] = Count('pk', filter=in_band & Q(is_active=True))
+        aggregates[f'{key}__online'] = Count('pk', filter=in_band & Q(last_access__gte=online_since))
+        aggregates[f'{key}__never_seen'] = Count('pk', filter=in_band & Q(last_access__isnull=True))
+    counts = Device.objects.exclude(assigned_ip=None).aggregate(**aggregates)
+
+    bands = KeaClient.band_usage(KeaClient.get_used_ips())
+    for band, usage in bands.items():
+        key = band.replace('.', '_')
+        usage.update({
+            metric: counts[f'{key}__{metric}']
+            for metric in ('devices', 'active', 'online', 'never_seen')
+        })
+    return bands
@@ -2,7 +2,15 @@ from django.urls import path
 from . import views
 
 urlpatterns = [
-    path('status/', views.system_status, name='system_status'),
+    path('status/', views.SystemStatusView.as_view(), name='system_status'),
     path('health/refresh/', views.refresh_health_data, name='refresh_health_data'),
     path('pihole/stats/', views.pihole_detailed_stats, name='pihole_detailed_stats'),
+    path('performance/', views.performance_stats, name='performance_stats'),
+    path('performance/reset/', views.reset_performance_stats, name='reset_performance_stats'),
+    path('scheduler/', views.scheduler_status, name='scheduler_status'),
+    path('scheduler/<str:job_name>/run/', views.run_scheduler_job, name='run_scheduler_job'),
+    path('reports/users/', views.user_summary_report, name='user_summary_report'),
+    path('reports/bands/', views.band_utilization_report, name='band_utilization_report'),
+    path('archive/', views.archive_segments, name='archive_segments'),
+    path('archive/<str:table>/', views.archived_history, name='archived_history'),
 ] 
\ No newline at end of file
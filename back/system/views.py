@@ -10,10 +10,22 @@ import json
 import socket
 import time
 import requests
+import orjson
 from urllib.request import urlopen
 from urllib.error import URLError
+from core.async_views import AsyncAPIView
+from core.pagination import TRUE_VALUES, ReportPageNumberPagination
 from core.permissions import IsAdminUser
+from core.scheduler import get_status as get_scheduler_status, run_job
+from .archive import ARCHIVE_TABLES, iter_archived
+from .models import ArchiveSegment
+from .performance import collect_stats, reset_stats
+from .reports import USER_SUMMARY_COLUMNS, band_report, user_summary_queryset, user_summary_row, user_summary_totals
+from asgiref.sync import sync_to_async
 from django.core.cache import cache
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
 from functools import lru_cache
 import threading
 import logging
@@ -258,62 +270,60 @@ class HealthCheckUpdater:
                 logger.error(f"헬스체크 업데이트 루프 오류: {e}")
                 time.sleep(1)  # 오류 시 1초 대기
 
-# 글로벌 업데이터 인스턴스
+# 글로벌 업데이터 인스턴스 (워커 프로세스가 만들어진 뒤 core.startup에서 시작)
 health_updater = HealthCheckUpdater()
 
-# 서버 시작 시 백그라운드 업데이터 시작
-health_updater.start()
-
-@api_view(['GET'])
-@permission_classes([IsAdminUser])
-def system_status(request):
+class SystemStatusView(AsyncAPIView):
     """
     실시간 시스템 상태 정보를 반환하는 API (관리자 전용)
     0.5초마다 업데이트되는 헬스체크 데이터 제공
     """
-    try:
-        # 캐시에서 데이터 가져오기
-        system_health = cache.get(HEALTH_CHECK_CACHE_KEY)
-        pihole_stats = cache.get(PIHOLE_STATS_CACHE_KEY)
-        
-        # 캐시가 없으면 즉시 생성
-        if system_health is None or pihole_stats is None:
-            update_health_cache()
-            system_health = cache.get(HEALTH_CHECK_CACHE_KEY, {})
-            pihole_stats = cache.get(PIHOLE_STATS_CACHE_KEY, {})
+    permission_classes = [IsAdminUser]
+
+    async def get(self, request):
+        try:
+            # 캐시에서 데이터 가져오기
+            system_health = await cache.aget(HEALTH_CHECK_CACHE_KEY)
+            pihole_stats = await cache.aget(PIHOLE_STATS_CACHE_KEY)
+            
+            # 캐시가 없으면 즉시 생성 (psutil/Pi-hole 조회는 블로킹이라 스레드 풀에서 실행)
+            if system_health is None or pihole_stats is None:
+                await sync_to_async(update_health_cache, thread_sensitive=False)()
+                system_health = await cache.aget(HEALTH_CHECK_CACHE_KEY, {})
+                pihole_stats = await cache.aget(PIHOLE_STATS_CACHE_KEY, {})
         
-        # 전체 상태 결정
-        overall_status = 'healthy'
-        if system_health.get('error') or pihole_stats.get('status') == 'offline':
-            overall_status = 'warning'
-        elif pihole_stats.get('status') == 'error':
-            overall_status = 'error'
+            # 전체 상태 결정
+            overall_status = 'healthy'
+            if system_health.get('error') or pihole_stats.get('status') == 'offline':
+                overall_status = 'warning'
+            elif pihole_stats.get('status') == 'error':
+                overall_status = 'error'
         
-        return Response({
-            'success': True,
-            'status': overall_status,
-            'timestamp': datetime.datetime.now().isoformat(),
-            'update_interval': '0.5초',
-            'system': system_health,
-            'pihole': pihole_stats,
-            'metadata': {
-                'cache_keys': {
-                    'system': HEALTH_CHECK_CACHE_KEY,
-                    'pihole': PIHOLE_STATS_CACHE_KEY
-                },
-                'cache_timeout': CACHE_TIMEOUT,
-                'updater_running': health_updater.running
-            }
-        })
+            return Response({
+                'success': True,
+                'status': overall_status,
+                'timestamp': datetime.datetime.now().isoformat(),
+                'update_interval': '0.5초',
+                'system': system_health,
+                'pihole': pihole_stats,
+                'metadata': {
+                    'cache_keys': {
+                        'system': HEALTH_CHECK_CACHE_KEY,
+                        'pihole': PIHOLE_STATS_CACHE_KEY
+                    },
+                    'cache_timeout': CACHE_TIMEOUT,
+                    'updater_running': health_updater.running
+                }
+            })
     
-    except Exception as e:
-        logger.error(f"시스템 상태 API 오류: {e}")
-        return Response({
-            'success': False,
-            'status': 'error',
-            'error': f'시스템 상태 조회 실패: {str(e)}',
-            'timestamp': datetime.datetime.now().isoformat()
-        }, status=500)
+        except Exception as e:
+            logger.error(f"시스템 상태 API 오류: {e}")
+            return Response({
+                'success': False,
+                'status': 'error',
+                'error': f'시스템 상태 조회 실패: {str(e)}',
+                'timestamp': datetime.datetime.now().isoformat()
+            }, status=500)
 
 @api_view(['POST'])
 @permission_classes([IsAdminUser])
@@ -357,3 +367,173 @@ def pihole_detailed_stats(request):
             'error': str(e),
             'timestamp': datetime.datetime.now().isoformat()
         }, status=500)
+
+@api_view(['GET'])
+@permission_classes([IsAdminUser])
+def performance_stats(request):
+    """뷰/액션별 성능 통계 (모든 워커 병합, 느린 요청 SQL 샘플 포함)"""
+    try:
+        limit = request.query_params.get('limit')
+        stats = collect_stats(limit=int(limit) if limit else None)
+        return Response({
+            'success': True,
+            'timestamp': datetime.datetime.now().isoformat(),
+            **stats
+        })
+    except Exception as e:
+        logger.error(f"성능 통계 조회 실패: {e}")
+        return Response({
+            'success': False,
+            'error': str(e),
+            'timestamp': datetime.datetime.now().isoformat()
+        }, status=500)
+
+@api_view(['POST'])
+@permission_classes([IsAdminUser])
+def reset_performance_stats(request):
+    """성능 통계를 초기화합니다."""
+    reset_stats()
+    return Response({
+        'success': True,
+        'message': '성능 통계가 초기화되었습니다.',
+        'timestamp': datetime.datetime.now().isoformat()
+    })
+
+@api_view(['GET'])
+@permission_classes([IsAdminUser])
+def scheduler_status(request):
+    """주기 작업 스케줄러 상태 (리더 워커, 작업별 마지막 실행 결과)"""
+    return Response({
+        'success': True,
+        'timestamp': datetime.datetime.now().isoformat(),
+        **get_scheduler_status()
+    })
+
+@api_view(['POST'])
+@permission_classes([IsAdminUser])
+def run_scheduler_job(request, job_name):
+    """주기 작업 즉시 실행"""
+    status = get_scheduler_status()
+    if job_name not in status['jobs']:
+        return Response({'success': False, 'error': f'알 수 없는 작업: {job_name}'}, status=404)
+    try:
+        run_job(job_name)
+    except Exception as e:
+        return Response({'success': False, 'error': str(e)}, status=500)
+    return Response({
+        'success': True,
+        'job': get_scheduler_status()['jobs'][job_name],
+        'timestamp': datetime.datetime.now().isoformat()
+    })
+
+@api_view(['GET'])
+@permission_classes([IsAdminUser])
+def archive_segments(request):
+    """이력 보관 파일 목록 (?table=device_history 처럼 테이블 지정 가능)"""
+    segments = ArchiveSegment.objects.all()
+    table = request.query_params.get('table')
+    if table:
+        segments = segments.filter(table=table)
+    return Response({
+        'success': True,
+        'tables': sorted(ARCHIVE_TABLES),
+        'segments': [
+            {
+                'table': segment.table,
+                'period': f"{segment.period:%Y-%m}",
+                'part': segment.part,
+                'row_count': segment.row_count,
+                'first_at': segment.first_at,
+                'last_at': segment.last_at,
+                'size_bytes': segment.size_bytes,
+                'created_at': segment.created_at,
+            }
+            for segment in segments
+        ],
+    })
+
+@api_view(['GET'])
+@permission_classes([IsAdminUser])
+def archived_history(request, table):
+    """
+    보관된 이력 조회 - NDJSON(한 줄에 행 하나)으로 오래된 순서대로 스트리밍
+
+    쿼리 파라미터: 테이블별 조회 키(user, mac, equipment, api_key, ip), since/until(ISO 8601)
+    """
+    if table not in ARCHIVE_TABLES:
+        return Response({'success': False, 'error': f'보관 대상이 아닌 테이블: {table}'}, status=404)
+    filters = {
+        key_type: request.query_params[key_type]
+        for key_type in ARCHIVE_TABLES[table]['keys'] if request.query_params.get(key_type)
+    }
+    bounds = {}
+    for name in ('since', 'until'):
+        value = request.query_params.get(name)
+        if not value:
+            continue
+        try:
+            parsed = parse_datetime(value)
+        except ValueError:
+            parsed = None
+        if parsed is None or timezone.is_naive(parsed):
+            return Response({'success': False, 'error': f'{name}은 시간대가 포함된 ISO 8601 형식이어야 합니다.'}, status=400)
+        bounds[name] = parsed
+
+    rows = iter_archived(table, **bounds, **filters)
+    response = StreamingHttpResponse((orjson.dumps(row) + b'\n' for row in rows), content_type='application/x-ndjson')
+    response['Content-Disposition'] = f'inline; filename="{table}-archive.ndjson"'
+    return response
+
+
+@api_view(['GET'])
+@permission_classes([IsAdminUser])
+def user_summary_report(request):
+    """
+    사용자별 장치/대여/신청 현황 요약 (SQL 집계, columns + rows 형식)
+
+    쿼리 파라미터: role(student|teacher), grade, class_number, search, overdue=true(연체자만),
+    page, page_size(최대 500). 합계(totals)는 필터된 전체 사용자 기준입니다.
+    """
+    params = request.query_params
+    try:
+        grade = int(params['grade']) if params.get('grade') else None
+        class_number = int(params['class_number']) if params.get('class_number') else None
+    except ValueError:
+        return Response({'success': False, 'error': 'grade와 class_number는 숫자여야 합니다.'}, status=400)
+    role = params.get('role')
+    if role not in (None, '', 'student', 'teacher'):
+        return Response({'success': False, 'error': 'role은 student 또는 teacher여야 합니다.'}, status=400)
+
+    users = user_summary_queryset(
+        role=role or None, grade=grade, class_number=class_number,
+        search=params.get('search') or None, overdue_only=params.get('overdue') in TRUE_VALUES,
+    )
+    paginator = ReportPageNumberPagination()
+    page = paginator.paginate_queryset(users, request)
+    return Response({
+        'success': True,
+        'count': paginator.page.paginator.count,
+        'page': paginator.page.number,
+        'num_pages': paginator.page.paginator.num_pages,
+        'page_size': paginator.get_page_size(request),
+        'totals': user_summary_totals(users) if paginator.page.number == 1 else None,
+        'columns': USER_SUMMARY_COLUMNS,
+        'rows': [user_summary_row(user) for user in page],
+    })
+
+
+@api_view(['GET'])
+@permission_classes([IsAdminUser])
+def band_utilization_report(request):
+    """대역별 IP 풀 사용량과 장치 현황 (장치/활성/온라인/미접속 수)"""
+    try:
+        bands = band_report()
+    except Exception as e:
+        logger.error(f"대역 보고서 생성 실패: {str(e)}")
+        return Response({'success': False, 'error': f'대역 보고서 생성 중 오류가 발생했습니다: {str(e)}'}, status=500)
+    totals = {
+        metric: sum(usage[metric] for usage in bands.values())
+        for metric in ('size', 'used', 'free', 'devices', 'active', 'online', 'never_seen')
+    }
+    totals['utilization'] = round(totals['used'] / totals['size'], 4) if totals['size'] else 0
+    return Response({'success': True, 'generated_at': timezone.now(), 'bands': bands, 'totals': totals})
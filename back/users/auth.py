@@ -5,6 +5,7 @@ from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework_simplejwt.tokens import RefreshToken
 from django.contrib.auth import authenticate
 from .serializers import UserSerializer
+from .tokens import is_token_revoked, issue_tokens, revoke_token
 
 @api_view(['POST'])
 @permission_classes([AllowAny])
@@ -27,11 +28,8 @@ def login(request):
 
     print(f"[DEBUG] 인증 성공: username={username}, is_staff={user.is_staff}, is_superuser={user.is_superuser}")
 
-    refresh = RefreshToken.for_user(user)
-    
     response_data = {
-        'access': str(refresh.access_token),
-        'refresh': str(refresh),
+        **issue_tokens(user),
         'user': UserSerializer(user).data
     }
     
@@ -43,10 +41,11 @@ def login(request):
 @permission_classes([IsAuthenticated])
 def logout(request):
     try:
+        # 현재 액세스 토큰과 (전달된 경우) 리프레시 토큰을 만료 시각까지 폐기
+        revoke_token(request.auth)
         refresh_token = request.data.get('refresh')
         if refresh_token:
-            token = RefreshToken(refresh_token)
-            token.blacklist()
+            revoke_token(RefreshToken(refresh_token))
         return Response({'success': True, 'message': '로그아웃되었습니다.'})
     except Exception as e:
         return Response({'success': False, 'message': str(e)}, status=status.HTTP_400_BAD_REQUEST)
@@ -61,6 +60,8 @@ def refresh_token(request):
     
     try:
         refresh = RefreshToken(refresh_token)
+        if is_token_revoked(refresh):
+            raise ValueError('revoked refresh token')
         return Response({
             'access': str(refresh.access_token),
         })
@@ -0,0 +1,72 @@
+import logging
+
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from django.core.cache import cache
+
+from core.locks import is_shared_cache
+from .tokens import (
+    REVOKED_CACHE_KEY, SNAPSHOT_CACHE_KEY, VERSION_CACHE_KEY, VERSION_CLAIM,
+    cache_user, is_jti_revoked_in_db, user_from_snapshot,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    사용자 스냅샷을 캐시하는 JWT 인증
+
+    토큰 버전, 스냅샷, 로그아웃 폐기 여부를 캐시 한 번으로 확인하고,
+    스냅샷이 없을 때만 기본 구현처럼 DB에서 사용자를 읽어 캐시합니다.
+
+    캐시가 워커 간에 공유되지 않으면(LocMem) 다른 워커의 폐기를 볼 수 없으므로
+    캐시를 쓰지 않고 요청마다 DB에서 사용자와 로그아웃 폐기 여부를 확인합니다.
+    """
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken('토큰에 사용자 식별 정보가 없습니다.')
+
+        # 'ver' 클레임 도입 전에 발급된 토큰은 버전 0으로 취급
+        version = validated_token.get(VERSION_CLAIM, 0)
+        if not is_shared_cache():
+            return self._get_user_from_db(validated_token, version)
+
+        version_key = VERSION_CACHE_KEY.format(user_id)
+        snapshot_key = SNAPSHOT_CACHE_KEY.format(user_id, version)
+        revoked_key = REVOKED_CACHE_KEY.format(validated_token.get(api_settings.JTI_CLAIM))
+        try:
+            cached = cache.get_many([version_key, snapshot_key, revoked_key])
+        except Exception as e:
+            logger.warning(f"인증 캐시 조회 실패, DB로 확인: {e}")
+            cached = {}
+
+        if revoked_key in cached:
+            raise AuthenticationFailed('로그아웃한 토큰입니다.', code='token_revoked')
+        current = cached.get(version_key)
+        if current is not None and current != version:
+            raise AuthenticationFailed('폐기된 토큰입니다. 다시 로그인해주세요.', code='token_revoked')
+
+        snapshot = cached.get(snapshot_key)
+        if current is None or snapshot is None:
+            user = super().get_user(validated_token)
+            if user.token_version != version:
+                raise AuthenticationFailed('폐기된 토큰입니다. 다시 로그인해주세요.', code='token_revoked')
+            cache_user(user)
+            return user
+
+        if api_settings.CHECK_USER_IS_ACTIVE and not snapshot['fields']['is_active']:
+            raise AuthenticationFailed('비활성화된 사용자입니다.', code='user_inactive')
+        return user_from_snapshot(snapshot)
+
+    def _get_user_from_db(self, validated_token, version):
+        if is_jti_revoked_in_db(validated_token.get(api_settings.JTI_CLAIM)):
+            raise AuthenticationFailed('로그아웃한 토큰입니다.', code='token_revoked')
+        user = super().get_user(validated_token)
+        if user.token_version != version:
+            raise AuthenticationFailed('폐기된 토큰입니다. 다시 로그인해주세요.', code='token_revoked')
+        return user
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.6 on 2026-10-19 01:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0004_user_device_limit'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='token_version',
+            field=models.PositiveIntegerField(default=0, help_text='올리면 이전에 발급한 토큰이 모두 폐기됨'),
+        ),
+    ]
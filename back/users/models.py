@@ -27,6 +27,7 @@ class User(AbstractUser):
     is_initial_password = models.BooleanField(default=True)
     created_at = models.DateTimeField(auto_now_add=True)
     device_limit = models.IntegerField(default=3, help_text='최대 등록 가능한 장치 수')
+    token_version = models.PositiveIntegerField(default=0, help_text='올리면 이전에 발급한 토큰이 모두 폐기됨')
     
     # 커스텀 매니저 설정
     objects = CustomUserManager()
@@ -34,6 +35,15 @@ class User(AbstractUser):
     class Meta:
         db_table = 'users'
 
+
+class RevokedToken(models.Model):
+    """로그아웃으로 폐기한 토큰 (공유 캐시가 없을 때 워커 간 폐기 목록, users.tokens)"""
+    jti = models.CharField(max_length=255, unique=True)
+    expires_at = models.DateTimeField(db_index=True)
+
+    class Meta:
+        db_table = 'revoked_tokens'
+
 class Class(models.Model):
     GRADE_CHOICES = [
         (1, '1학년'),
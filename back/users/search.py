@@ -0,0 +1,27 @@
+"""
+사용자 검색 인덱스 (core.search)
+
+아이디, 이름(성+이름, 성, 이름), 이메일에서 부분 문자열로 찾습니다.
+"""
+from core.search import SearchIndex
+
+from .models import User
+
+# 바뀌면 인덱스를 갱신해야 하는 필드
+INDEXED_FIELDS = frozenset({'username', 'first_name', 'last_name', 'email'})
+
+
+def indexed_fields_updated(update_fields):
+    """save(update_fields=...)로 저장된 경우 검색에 쓰는 필드가 포함됐는지 (로그인 시각 갱신 등은 제외)"""
+    return update_fields is None or not INDEXED_FIELDS.isdisjoint(update_fields)
+
+
+def load_users(ids):
+    queryset = User.objects.all() if ids is None else User.objects.filter(pk__in=ids)
+    for pk, username, first_name, last_name, email in (
+        queryset.values_list('id', 'username', 'first_name', 'last_name', 'email').iterator(chunk_size=2000)
+    ):
+        yield pk, username, (username, f"{last_name}{first_name}", last_name, first_name, email)
+
+
+user_search_index = SearchIndex('users', load_users, weights=(3, 3, 2, 2, 1))
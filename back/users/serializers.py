@@ -1,7 +1,8 @@
 from rest_framework import serializers
 from .models import User, Class, Student
 from django.db.models import Count
-from rentals.services.rental_logic import get_user_active_rental_count
+from core.serializers import ValuesSerializer
+from rentals.services.rental_logic import get_user_active_rental_count, get_users_active_rental_counts
 
 class UserSerializer(serializers.ModelSerializer):
     email = serializers.SerializerMethodField()
@@ -49,6 +50,43 @@ class UserSerializer(serializers.ModelSerializer):
         fields = ['id', 'username', 'email', 'user_name', 'is_staff', 'is_superuser', 'is_initial_password', 'created_at', 'is_active', 'ip_count', 'rental_count', 'device_limit']
         read_only_fields = ['id', 'username', 'created_at', 'is_initial_password', 'ip_count', 'rental_count']
 
+class UserValuesSerializer(ValuesSerializer):
+    """UserSerializer와 같은 출력의 values-mode 직렬화 (전체 목록용)"""
+    model = User
+    columns = (
+        'id', 'username', 'email', 'first_name', 'last_name', 'is_staff', 'is_superuser',
+        'is_initial_password', 'created_at', 'is_active', 'device_limit',
+    )
+
+    def prepare(self, rows):
+        from devices.models import Device
+
+        user_ids = [row['id'] for row in rows]
+        self.ip_counts = dict(
+            Device.objects.filter(user_id__in=user_ids, is_active=True)
+            .values_list('user_id').annotate(count=Count('id')).order_by()
+        )
+        self.rental_counts = get_users_active_rental_counts(user_ids)
+
+    def to_representation(self, row):
+        first_name = str(row['first_name'] or '').strip()
+        last_name = str(row['last_name'] or '').strip()
+        return {
+            'id': row['id'],
+            'username': row['username'],
+            'email': '' if row['email'] is None else row['email'],
+            'is_staff': row['is_staff'],
+            'is_superuser': row['is_superuser'],
+            'is_initial_password': row['is_initial_password'],
+            'created_at': row['created_at'],
+            'is_active': row['is_active'],
+            'ip_count': self.ip_counts.get(row['id'], 0),
+            'rental_count': self.rental_counts.get(row['id'], 0),
+            'device_limit': row['device_limit'],
+            # UserSerializer는 user_name을 to_representation에서 마지막에 추가함
+            'user_name': f"{last_name} {first_name}".strip() if first_name or last_name else row['username'],
+        }
+
 class UserCreateSerializer(serializers.ModelSerializer):
     user_name = serializers.CharField(required=False, write_only=True)
     
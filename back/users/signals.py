@@ -0,0 +1,64 @@
+"""
+사용자 관련 시그널
+- 비밀번호/역할/활성 상태 변경 시 기존 토큰 폐기
+- 그 밖의 사용자 정보나 그룹 변경 시 인증 스냅샷 캐시 삭제
+- 아이디/이름/이메일 변경 시 검색 인덱스 갱신
+- 학반/학생 변경 시 학반 목록 응답 캐시 무효화
+"""
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from core.response_cache import mark_changed
+from .models import Class, Student, User
+from .search import indexed_fields_updated, user_search_index
+from .tokens import invalidate_user_cache, mark_user_deleted, revoke_user_tokens
+
+# 바뀌면 기존 토큰을 모두 폐기해야 하는 필드
+REVOKING_FIELDS = ('password', 'is_active', 'is_staff', 'is_superuser')
+
+
+@receiver(pre_save, sender=User)
+def remember_auth_fields(sender, instance, update_fields=None, **kwargs):
+    if instance.pk is None:
+        return
+    fields = [field for field in REVOKING_FIELDS if update_fields is None or field in update_fields]
+    if fields:
+        previous = sender.objects.filter(pk=instance.pk).values(*fields).first()
+        instance._previous_auth_fields = previous or {}
+
+
+@receiver(post_save, sender=User)
+def user_saved(sender, instance, created, update_fields=None, **kwargs):
+    if indexed_fields_updated(update_fields):
+        user_search_index.mark_changed([instance.pk])
+    if created:
+        return
+    previous = instance.__dict__.pop('_previous_auth_fields', {})
+    if any(getattr(instance, field) != value for field, value in previous.items()):
+        instance.token_version = revoke_user_tokens(instance.pk)
+    else:
+        invalidate_user_cache(instance.pk, instance.__dict__.get('token_version'))
+
+
+@receiver(post_delete, sender=User)
+def user_deleted(sender, instance, **kwargs):
+    mark_user_deleted(instance.pk)
+    user_search_index.mark_changed([instance.pk])
+
+
+@receiver(m2m_changed, sender=User.groups.through)
+def user_groups_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if not action.startswith('post_'):
+        return
+    user_ids = (pk_set or []) if reverse else [instance.pk]
+    for user_id in user_ids:
+        invalidate_user_cache(user_id)
+
+
+@receiver(post_save, sender=Class)
+@receiver(post_delete, sender=Class)
+@receiver(post_save, sender=Student)
+@receiver(post_delete, sender=Student)
+def class_changed(sender, instance, **kwargs):
+    """학반 목록의 학생 수도 바뀌므로 학생 변경도 포함"""
+    mark_changed('classes')
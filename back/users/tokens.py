@@ -0,0 +1,174 @@
+"""
+JWT 발급/폐기와 인증 사용자 스냅샷 캐시
+
+토큰에는 발급 시점의 User.token_version을 'ver' 클레임으로 넣습니다.
+비밀번호/역할/활성 상태가 바뀌면 token_version을 올려 그 사용자의 기존 토큰을 모두 폐기하고,
+로그아웃한 토큰은 jti를 만료 시각까지 캐시에 폐기 목록으로 둡니다.
+
+인증 시에는 (사용자 ID, 토큰 버전) 키로 캐시한 사용자 스냅샷을 사용하므로
+캐시 조회 한 번(get_many)으로 DB를 거치지 않고 request.user를 만듭니다.
+
+폐기가 모든 워커에 바로 보이려면 캐시가 워커 간에 공유되어야 합니다 (REDIS_CACHE_URL).
+공유 캐시가 없으면(LocMem) 스냅샷 캐시를 쓰지 않고 요청마다 DB의 token_version을 확인하며,
+로그아웃한 토큰은 RevokedToken 테이블에 기록합니다.
+"""
+import logging
+import time
+
+from datetime import datetime, timezone as dt_timezone
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.core.cache import cache
+from django.db import router, transaction
+from django.db.models import F
+from django.utils import timezone
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from core.locks import is_shared_cache
+
+logger = logging.getLogger(__name__)
+
+VERSION_CLAIM = 'ver'
+SNAPSHOT_CACHE_KEY = 'auth:user:{}:{}'
+VERSION_CACHE_KEY = 'auth:token_version:{}'
+REVOKED_CACHE_KEY = 'auth:revoked:{}'
+DELETED_VERSION = -1
+
+# 스냅샷에 담는 필드 (password 등 나머지 필드는 접근 시 DB에서 지연 로드)
+SNAPSHOT_FIELDS = (
+    'id', 'username', 'first_name', 'last_name', 'email',
+    'is_active', 'is_staff', 'is_superuser', 'is_initial_password', 'device_limit', 'token_version', 'created_at',
+)
+
+DEFAULT_CONFIG = {
+    'TIMEOUT': 300,  # 스냅샷/토큰 버전 캐시 유지 시간 (초)
+}
+
+
+def get_config():
+    return {**DEFAULT_CONFIG, **getattr(settings, 'AUTH_USER_CACHE', {})}
+
+
+def issue_tokens(user):
+    """현재 token_version을 담은 액세스/리프레시 토큰 발급"""
+    refresh = RefreshToken.for_user(user)
+    refresh[VERSION_CLAIM] = user.token_version  # access_token에도 복사됨
+    return {'access': str(refresh.access_token), 'refresh': str(refresh)}
+
+
+def make_snapshot(user):
+    return {
+        'fields': {name: getattr(user, name) for name in SNAPSHOT_FIELDS},
+        'groups': list(user.groups.values_list('id', 'name')),
+    }
+
+
+def user_from_snapshot(snapshot):
+    """
+    스냅샷으로 DB 조회 없이 User 인스턴스 구성
+
+    스냅샷에 없는 필드는 지연(deferred) 필드로 남아 접근 시 한 번 조회되고,
+    save()도 로드된 필드만 저장하므로 다른 필드를 덮어쓰지 않습니다.
+    groups.all()은 스냅샷의 그룹 목록을 그대로 반환합니다.
+    """
+    User = get_user_model()
+    fields = snapshot['fields']
+    # from_db는 값이 모델 필드 순서라고 가정함
+    names = [field.attname for field in User._meta.concrete_fields if field.attname in fields]
+    user = User.from_db(router.db_for_read(User), names, [fields[name] for name in names])
+    groups = user.groups.get_queryset()
+    groups._result_cache = [
+        Group.from_db(groups.db, ['id', 'name'], [group_id, name]) for group_id, name in snapshot['groups']
+    ]
+    groups._prefetch_done = True
+    user._prefetched_objects_cache = {'groups': groups}
+    return user
+
+
+def cache_user(user):
+    """DB에서 읽은 사용자를 스냅샷으로 캐시"""
+    timeout = get_config()['TIMEOUT']
+    try:
+        # 버전은 add로만 기록해 동시에 일어난 폐기(set)를 덮어쓰지 않음
+        cache.add(VERSION_CACHE_KEY.format(user.pk), user.token_version, timeout)
+        cache.set(SNAPSHOT_CACHE_KEY.format(user.pk, user.token_version), make_snapshot(user), timeout)
+    except Exception as e:
+        logger.warning(f"사용자 스냅샷 캐시 실패: {e}")
+
+
+def invalidate_user_cache(user_id, version=None):
+    """사용자 정보가 바뀐 뒤 스냅샷 삭제 (토큰은 유지)"""
+    if version is None:
+        version = get_user_model().objects.filter(pk=user_id).values_list('token_version', flat=True).first()
+    cache.delete_many([VERSION_CACHE_KEY.format(user_id), SNAPSHOT_CACHE_KEY.format(user_id, version)])
+
+
+def revoke_user_tokens(user_id):
+    """token_version을 올려 사용자의 기존 토큰을 모두 폐기하고 새 버전을 반환"""
+    User = get_user_model()
+    User.objects.filter(pk=user_id).update(token_version=F('token_version') + 1)
+    version = User.objects.filter(pk=user_id).values_list('token_version', flat=True).first()
+
+    def publish():
+        cache.set(VERSION_CACHE_KEY.format(user_id), version, get_config()['TIMEOUT'])
+        cache.delete(SNAPSHOT_CACHE_KEY.format(user_id, version - 1))
+
+    transaction.on_commit(publish)
+    logger.info(f"사용자 {user_id}의 토큰 폐기 (token_version={version})")
+    return version
+
+
+def mark_user_deleted(user_id):
+    cache.set(VERSION_CACHE_KEY.format(user_id), DELETED_VERSION, get_config()['TIMEOUT'])
+
+
+def revoke_token(token):
+    """토큰 하나를 만료 시각까지 폐기 (로그아웃)"""
+    from .models import RevokedToken
+
+    jti = token.get(api_settings.JTI_CLAIM)
+    if not jti:
+        return
+    remaining = int(token.get('exp', 0) - time.time())
+    if remaining <= 0:
+        return
+    if is_shared_cache():
+        cache.set(REVOKED_CACHE_KEY.format(jti), True, remaining)
+        return
+    RevokedToken.objects.filter(expires_at__lt=timezone.now()).delete()
+    RevokedToken.objects.get_or_create(
+        jti=jti, defaults={'expires_at': datetime.fromtimestamp(token['exp'], tz=dt_timezone.utc)}
+    )
+
+
+def is_jti_revoked_in_db(jti):
+    """RevokedToken 테이블의 폐기 여부 (공유 캐시가 없을 때)"""
+    from .models import RevokedToken
+
+    return bool(jti) and RevokedToken.objects.filter(jti=jti, expires_at__gte=timezone.now()).exists()
+
+
+def is_token_revoked(token):
+    """로그아웃했거나 발급 이후 token_version이 바뀐 토큰인지 확인 (리프레시용)"""
+    user_id = token.get(api_settings.USER_ID_CLAIM)
+    jti = token.get(api_settings.JTI_CLAIM)
+    if not is_shared_cache():
+        if is_jti_revoked_in_db(jti):
+            return True
+        current = get_user_model().objects.filter(pk=user_id).values_list('token_version', flat=True).first()
+        return current is None or current != token.get(VERSION_CLAIM, 0)
+
+    version_key = VERSION_CACHE_KEY.format(user_id)
+    revoked_key = REVOKED_CACHE_KEY.format(jti)
+    cached = cache.get_many([version_key, revoked_key])
+    if revoked_key in cached:
+        return True
+    current = cached.get(version_key)
+    if current is None:
+        current = get_user_model().objects.filter(pk=user_id).values_list('token_version', flat=True).first()
+        if current is None:
+            return True
+    return current != token.get(VERSION_CLAIM, 0)
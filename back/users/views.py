@@ -4,9 +4,10 @@ from rest_framework.decorators import action, api_view, permission_classes
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, BasePermission
 from .models import User, Class, Student
-from .serializers import UserSerializer, UserCreateSerializer, ClassSerializer, StudentSerializer, TeacherSerializer
+from .serializers import UserSerializer, UserCreateSerializer, UserValuesSerializer, ClassSerializer, StudentSerializer, TeacherSerializer
+from .search import user_search_index
+from .tokens import issue_tokens
 import bcrypt
-import pandas as pd
 import io
 from django.http import HttpResponse
 from django.contrib.auth.hashers import check_password, make_password
@@ -21,6 +22,8 @@ from rest_framework import filters
 from django.contrib.auth import get_user_model
 from rest_framework.pagination import PageNumberPagination
 from core.permissions import IsAdminUser, IsAuthenticatedUser
+from core.response_cache import cached_response
+from core.search import in_rank_order
 from django.db import models
 from rentals.services.rental_logic import get_user_active_rental_count, get_users_active_rental_counts
 
@@ -71,15 +74,8 @@ class UserViewSet(viewsets.ModelViewSet):
         # 검색어가 있는 경우 추가 필터링
         search = request.query_params.get('search', '')
         if search:
-            # 이름으로 검색 (성+이름 조합)
-            queryset = queryset.filter(
-                models.Q(username__icontains=search) |
-                models.Q(email__icontains=search) |
-                models.Q(first_name__icontains=search) |
-                models.Q(last_name__icontains=search) |
-                models.Q(first_name__icontains=search, last_name__icontains=search) |
-                models.Q(last_name__icontains=search, first_name__icontains=search)
-            )
+            # 아이디/이름(성+이름 조합)/이메일 검색 인덱스
+            queryset = queryset.filter(pk__in=user_search_index.search(search))
         
         # 페이지네이션
         page = self.paginate_queryset(queryset)
@@ -117,15 +113,8 @@ class UserViewSet(viewsets.ModelViewSet):
         if not search_term:
             return Response([])
         
-        # 검색 쿼리 구성
-        queryset = User.objects.filter(
-            models.Q(username__icontains=search_term) |
-            models.Q(email__icontains=search_term) |
-            models.Q(first_name__icontains=search_term) |
-            models.Q(last_name__icontains=search_term) |
-            models.Q(first_name__icontains=search_term, last_name__icontains=search_term) |
-            models.Q(last_name__icontains=search_term, first_name__icontains=search_term)
-        ).order_by('username')[:limit]
+        # 검색 인덱스에서 순위순 ID를 찾은 뒤 PK로 조회
+        queryset = in_rank_order(User.objects.all(), user_search_index.search(search_term, limit=limit))
         
         # 간소화된 사용자 정보 반환
         results = []
@@ -165,9 +154,8 @@ class UserViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_403_FORBIDDEN
             )
         
-        queryset = self.get_queryset()
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
+        # UserSerializer와 같은 출력을 사용자별 개수 조회 없이 생성
+        return Response(UserValuesSerializer(self.get_queryset()).data)
 
     @action(detail=False, methods=['get'])
     def me(self, request):
@@ -183,6 +171,7 @@ class UserViewSet(viewsets.ModelViewSet):
         사용자 목록을 엑셀 파일로 내보내는 API
         페이지네이션 없이 모든 사용자 정보와 대여 IP, 장비 정보를 포함
         """
+        import pandas as pd
         # 페이지네이션 없이 모든 사용자 조회
         users = User.objects.all()
         
@@ -211,7 +200,7 @@ class UserViewSet(viewsets.ModelViewSet):
         # 장비 대여가 0인 사용자 필터링
         no_rental_data = []
         for user in users:
-            rental_count = user.rentals.filter(status='RENTED').count() if hasattr(user, 'rentals') else 0
+            rental_count = user.rentals.filter(status__in=['RENTED', 'OVERDUE']).count() if hasattr(user, 'rentals') else 0
             if rental_count == 0:
                 ip_count = user.devices.filter(is_active=True).count() if hasattr(user, 'devices') else 0
                 no_rental_data.append({
@@ -250,6 +239,7 @@ class UserViewSet(viewsets.ModelViewSet):
         """
         엑셀 파일로부터 사용자를 일괄 추가하는 API
         """
+        import pandas as pd
         # 디버깅: 요청 데이터 및 파일 확인
         print(f"[DEBUG] import_users 요청 받음: {request.method}")
         print(f"[DEBUG] 요청 헤더: {request.headers}")
@@ -421,6 +411,7 @@ class UserViewSet(viewsets.ModelViewSet):
         학반 업데이트 파일 파싱 (3블록 또는 1블록 지원).
         반환: [(row_num, grade, class_num, number, name, email), ...]
         """
+        import pandas as pd
         df.columns = [str(c).strip() for c in df.columns]
         rows_out = []
         seen_emails = set()
@@ -509,6 +500,7 @@ class UserViewSet(viewsets.ModelViewSet):
         - 누락된 학생(자퇴생): 장비 미반납 시 실패, 없으면 계정 삭제
         - 전체 트랜잭션 처리
         """
+        import pandas as pd
         if 'file' not in request.FILES:
             return Response({
                 'success': False,
@@ -740,6 +732,7 @@ class UserViewSet(viewsets.ModelViewSet):
         엑셀/CSV 파일로 학생 학반을 일괄 할당합니다.
         필수 열: 아이디(또는 이메일), 학년, 반
         """
+        import pandas as pd
         if 'file' not in request.FILES:
             return Response({'error': '파일이 제공되지 않았습니다.'}, status=status.HTTP_400_BAD_REQUEST)
         
@@ -1098,9 +1091,11 @@ class PasswordViewSet(viewsets.ViewSet):
                 logger.info(f"[DEBUG] 비밀번호 변경 및 상태 업데이트 직후: id={user_for_update.id}, is_initial_password={user_for_update.is_initial_password}")
                 
                 logger.info(f"[DEBUG] 사용자 {user.username}(ID: {user.id})의 비밀번호 변경 성공")
+                # 비밀번호 변경으로 기존 토큰이 폐기되므로 현재 세션용 토큰을 새로 발급
                 return Response({
                     "success": True,
-                    "message": "비밀번호가 성공적으로 변경되었습니다."
+                    "message": "비밀번호가 성공적으로 변경되었습니다.",
+                    **issue_tokens(user_for_update),
                 })
         except Exception as e:
             logger.error(f"[DEBUG] 사용자 {user.username}(ID: {user.id})의 비밀번호 변경 중 오류: {str(e)}")
@@ -1200,9 +1195,11 @@ class PasswordViewSet(viewsets.ViewSet):
                 logger.warning(f"[DEBUG-CRITICAL] <저장 직후> is_initial_password={user_for_update.is_initial_password}")
                 logger.warning(f"[DEBUG-CRITICAL] <초기 비밀번호 변경 완료> 사용자 {user.username}(ID: {user.id})의 초기 비밀번호 변경 성공")
                 
+                # 비밀번호 변경으로 기존 토큰이 폐기되므로 현재 세션용 토큰을 새로 발급
                 return Response({
                     'success': True,
-                    'message': '비밀번호가 성공적으로 변경되었습니다.'
+                    'message': '비밀번호가 성공적으로 변경되었습니다.',
+                    **issue_tokens(user_for_update),
                 })
                 
         except Exception as e:
@@ -1222,6 +1219,14 @@ class ClassViewSet(viewsets.ModelViewSet):
     def get_queryset(self):
         return Class.objects.all().order_by('grade', 'class_number')
 
+    @cached_response('classes')
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
+    @cached_response('classes')
+    def retrieve(self, request, *args, **kwargs):
+        return super().retrieve(request, *args, **kwargs)
+
 class StudentPagination(PageNumberPagination):
     page_size = 500
     page_size_query_param = 'page_size'
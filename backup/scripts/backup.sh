@@ -3,6 +3,7 @@
 # 로그 디렉토리 생성
 mkdir -p /backup/logs
 mkdir -p /backup/data
+mkdir -p /backup/archive
 
 while true; do
     DATE=$(date +%Y%m%d_%H%M%S)
@@ -28,6 +29,15 @@ while true; do
         echo "BSSM 백업 실패" >> "$LOG_FILE"
     fi
     
+    # 이력 보관 파일 백업 (DB에서 삭제된 행은 이 파일에만 남으므로 삭제하지 않고 누적)
+    # 보관 파일은 한 번 쓰면 바뀌지 않으므로 새 파일만 복사 (쓰는 중인 .tmp 파일은 제외)
+    echo "이력 보관 파일 백업 시작..." >> "$LOG_FILE"
+    if (cd /archive && find . -type f -name "*.jsonl.gz" -exec cp -n --parents -t /backup/archive/ {} +); then
+        echo "이력 보관 파일 백업 성공" >> "$LOG_FILE"
+    else
+        echo "이력 보관 파일 백업 실패" >> "$LOG_FILE"
+    fi
+    
     # 30일이 지난 백업 파일 삭제
     echo "오래된 백업 파일 정리 중..." >> "$LOG_FILE"
     find /backup/data -name "kea_db_backup_*.sql.gz" -type f -mtime +30 -delete
@@ -45,6 +45,18 @@ interface LoginRequest {
   password: string;
 }
 
+/**
+ * 응답에 새 토큰이 있으면 저장 (비밀번호 변경 후 재발급)
+ */
+const storeIssuedTokens = (response: any) => {
+  if (response?.success && response.data?.access) {
+    localStorage.setItem('access_token', response.data.access);
+    if (response.data.refresh) {
+      localStorage.setItem('refresh_token', response.data.refresh);
+    }
+  }
+};
+
 /**
  * 인증 관련 서비스 함수들
  */
@@ -94,7 +106,10 @@ const authService = {
    */
   async logout(): Promise<AuthResponse<null>> {
     try {
-      const response = await api.post<null>('/auth/logout/');
+      // 리프레시 토큰도 함께 폐기되도록 전달
+      const response = await api.post<null>('/auth/logout/', {
+        refresh: localStorage.getItem('refresh_token'),
+      });
       return {
         success: response.success,
         status: 200,
@@ -136,10 +151,13 @@ const authService = {
    * @returns 비밀번호 변경 결과
    */
   changePassword: async (oldPassword: string, newPassword: string) => {
-    return api.post('/users/password/change/', {
+    const response = await api.post<any>('/users/password/change/', {
       old_password: oldPassword,
       new_password: newPassword,
     });
+    // 비밀번호 변경 시 기존 토큰이 폐기되므로 새로 발급된 토큰 저장
+    storeIssuedTokens(response);
+    return response;
   },
 
   /**
@@ -160,7 +178,8 @@ const authService = {
       console.log('요청 데이터 구조:', Object.keys(requestData));
       
       // POST 메서드 사용
-      const response = await api.post('/users/password/initial/', requestData);
+      const response = await api.post<any>('/users/password/initial/', requestData);
+      storeIssuedTokens(response);
       
       return response;
     } catch (error: any) {
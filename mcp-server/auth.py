@@ -1,138 +1,409 @@
 """
 Authentication Module
 Django JWT 토큰 관리 및 인증 처리
+
+- 토큰은 세션(Django 계정)별로 따로 보관합니다.
+  기본 세션은 서버 시작 시 로그인한 계정이고, MCP_API_CREDENTIALS_FILE에 등록된 API 키는
+  키마다 자신의 Django 계정으로 로그인합니다. 요청을 처리하는 동안 현재 세션은 ContextVar로 전달됩니다.
+- 만료 시각은 JWT의 exp 클레임에서 읽고, 만료 MCP_TOKEN_REFRESH_MARGIN초 전에 백그라운드에서 미리 갱신합니다.
+  도구 호출은 보관 중인 토큰을 바로 사용하며 로그인/갱신을 기다리지 않습니다.
+- 동시에 여러 갱신 요청이 들어와도 세션당 하나의 Django 요청만 보냅니다 (single-flight).
+- Django 요청은 공유 httpx.AsyncClient(utils.api_client)를 사용합니다.
 """
+import asyncio
+import contextvars
+import hashlib
+import json
+import time
 import jwt
-import httpx
-from datetime import datetime, timedelta
+from contextlib import contextmanager
 from typing import Optional, Dict, Any
 from config import config
 
 
-class AuthManager:
-    """Django JWT 인증 관리자"""
-    
-    def __init__(self):
-        self.access_token: Optional[str] = config.JWT_TOKEN
+DEFAULT_SESSION = "default"
+
+# 현재 요청의 인증 세션 키
+_current_session: contextvars.ContextVar[str] = contextvars.ContextVar("auth_session", default=DEFAULT_SESSION)
+
+
+def hash_api_key(api_key: str) -> str:
+    """API 키 해시 (generate_api_key.py와 동일, 자격 증명 파일의 키)"""
+    return hashlib.sha256(api_key.encode()).hexdigest()
+
+
+def token_expiry(token: Optional[str]) -> Optional[float]:
+    """JWT의 exp 클레임 (epoch 초, 서명은 Django가 검증하므로 여기서는 확인하지 않음)"""
+    if not token:
+        return None
+    try:
+        payload = jwt.decode(token, options={"verify_signature": False})
+    except jwt.PyJWTError:
+        return None
+    exp = payload.get("exp")
+    return float(exp) if exp is not None else None
+
+
+class TokenSession:
+    """Django 계정 하나의 JWT 토큰 (만료 전 백그라운드 갱신, 동시 갱신은 한 번으로 합침)"""
+
+    def __init__(
+        self,
+        key: str,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        access_token: Optional[str] = None
+    ):
+        self.key = key
+        self.username_credential = username
+        self.password = password
+        self.access_token: Optional[str] = None
         self.refresh_token: Optional[str] = None
-        self.token_expiry: Optional[datetime] = None
+        self.access_expiry: Optional[float] = None
+        self.refresh_expiry: Optional[float] = None
         self.user_info: Optional[Dict[str, Any]] = None
-    
+        self._inflight: Optional[asyncio.Future] = None  # 진행 중인 갱신 작업
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self.logins = 0
+        self.refreshes = 0
+        if access_token:
+            self.set_tokens(access_token)
+
+    def set_tokens(self, access: str, refresh: Optional[str] = None, user_info: Optional[Dict[str, Any]] = None) -> None:
+        """새 토큰 저장 후 다음 백그라운드 갱신 예약"""
+        self.access_token = access
+        self.access_expiry = token_expiry(access)
+        if refresh:
+            self.refresh_token = refresh
+            self.refresh_expiry = token_expiry(refresh)
+        if user_info is not None:
+            self.user_info = user_info
+        self._schedule_refresh()
+
+    def remaining(self) -> Optional[float]:
+        """액세스 토큰 남은 시간 (초, exp가 없으면 None)"""
+        if self.access_expiry is None:
+            return None
+        return self.access_expiry - time.time()
+
+    def _can_renew(self) -> bool:
+        refresh_valid = self.refresh_token and (self.refresh_expiry is None or self.refresh_expiry > time.time())
+        return bool(refresh_valid or (self.username_credential and self.password))
+
+    def _schedule_refresh(self, delay: Optional[float] = None) -> None:
+        """만료 MCP_TOKEN_REFRESH_MARGIN초 전에 백그라운드 갱신 (실행 중인 이벤트 루프가 없으면 생략)"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if delay is None:
+            remaining = self.remaining()
+            if remaining is None or not self._can_renew():
+                return
+            delay = max(0.0, remaining - config.MCP_TOKEN_REFRESH_MARGIN)
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._timer = loop.call_later(delay, self._background_refresh)
+
+    def _background_refresh(self) -> None:
+        self._timer = None
+        self._start_refresh()
+
+    def cancel(self) -> None:
+        """예약된 백그라운드 갱신 취소"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    async def get_token(self) -> Optional[str]:
+        """
+        유효한 액세스 토큰 반환
+
+        만료까지 MCP_TOKEN_MIN_VALIDITY초 이상 남았으면 기다리지 않고 바로 반환하고
+        (갱신 시점이 지났다면 백그라운드 갱신만 시작), 그보다 짧으면 갱신이 끝날 때까지 기다립니다.
+        """
+        remaining = self.remaining()
+        if self.access_token and (remaining is None or remaining > config.MCP_TOKEN_REFRESH_MARGIN):
+            return self.access_token
+        if self.access_token and remaining > config.MCP_TOKEN_MIN_VALIDITY:
+            if self._can_renew():
+                self._start_refresh()
+            return self.access_token
+        if await self.refresh():
+            return self.access_token
+        return None
+
+    def _start_refresh(self) -> asyncio.Future:
+        """갱신 작업 시작 (진행 중인 갱신이 있으면 그 작업 반환)"""
+        if self._inflight is None:
+            self._inflight = asyncio.ensure_future(self._run_refresh())
+        return self._inflight
+
+    async def refresh(self) -> bool:
+        """
+        토큰 갱신 (리프레시 토큰 사용, 실패 시 저장된 자격 증명으로 재로그인) - 진행 중인 갱신이 있으면 그 결과를 공유
+
+        갱신은 호출자와 별개의 작업으로 실행하고 호출자는 shield로 기다리므로,
+        한 호출자가 취소되어도(클라이언트 연결 끊김 등) 갱신과 다른 호출자는 영향을 받지 않습니다.
+        """
+        return await asyncio.shield(self._start_refresh())
+
+    async def _run_refresh(self) -> bool:
+        try:
+            renewed = await self._refresh_access_token()
+            if not renewed and self.username_credential and self.password:
+                renewed = await self.login(self.username_credential, self.password)
+        finally:
+            self._inflight = None
+        if not renewed and self.access_token and self._can_renew():
+            # 아직 유효한 토큰이 있으면 잠시 후 다시 시도
+            self._schedule_refresh(config.MCP_TOKEN_RETRY_INTERVAL)
+        return renewed
+
     async def login(self, username: str, password: str) -> bool:
         """
         Django 백엔드에 로그인하여 JWT 토큰 획득
-        
+
         Args:
             username: 사용자명
             password: 비밀번호
-            
+
         Returns:
             성공 여부
         """
-        async with httpx.AsyncClient(timeout=config.DJANGO_API_TIMEOUT) as client:
-            try:
-                response = await client.post(
-                    config.AUTH_LOGIN_URL,
-                    json={"username": username, "password": password}
-                )
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    self.access_token = data.get("access")
-                    self.refresh_token = data.get("refresh")
-                    self.user_info = data.get("user", {})
-                    
-                    # 토큰 만료 시간 계산 (대략 1시간)
-                    self.token_expiry = datetime.now() + timedelta(hours=1)
-                    
-                    return True
-                else:
-                    print(f"로그인 실패: {response.status_code} - {response.text}")
-                    return False
-                    
-            except Exception as e:
-                print(f"로그인 오류: {e}")
+        from utils.api_client import APIClient
+
+        try:
+            response = await APIClient.get_client().post(
+                config.AUTH_LOGIN_URL,
+                json={"username": username, "password": password},
+                timeout=config.DJANGO_API_TIMEOUT
+            )
+
+            if response.status_code == 200:
+                data = response.json()
+                self.username_credential = username
+                self.password = password
+                self.logins += 1
+                self.set_tokens(data.get("access"), data.get("refresh"), data.get("user", {}))
+                return True
+            else:
+                print(f"로그인 실패: {response.status_code} - {response.text}")
                 return False
-    
+
+        except Exception as e:
+            print(f"로그인 오류: {e}")
+            return False
+
+    async def _refresh_access_token(self) -> bool:
+        """Refresh 토큰으로 Access 토큰 갱신"""
+        if not self.refresh_token or (self.refresh_expiry is not None and self.refresh_expiry <= time.time()):
+            return False
+
+        from utils.api_client import APIClient
+
+        try:
+            response = await APIClient.get_client().post(
+                config.AUTH_REFRESH_URL,
+                json={"refresh": self.refresh_token},
+                timeout=config.DJANGO_API_TIMEOUT
+            )
+
+            if response.status_code == 200:
+                data = response.json()
+                self.refreshes += 1
+                self.set_tokens(data.get("access"), data.get("refresh"))
+                return True
+            else:
+                return False
+
+        except Exception as e:
+            print(f"토큰 갱신 오류: {e}")
+            return False
+
+    def stats(self) -> Dict[str, Any]:
+        remaining = self.remaining()
+        return {
+            "user": (self.user_info or {}).get("username"),
+            "authenticated": self.access_token is not None,
+            "expires_in": round(remaining, 1) if remaining is not None else None,
+            "refreshing": self._inflight is not None,
+            "logins": self.logins,
+            "refreshes": self.refreshes,
+        }
+
+
+class TokenManager:
+    """세션 키 -> TokenSession (API 키별 Django 계정 토큰 캐시)"""
+
+    def __init__(self):
+        self.sessions: Dict[str, TokenSession] = {
+            DEFAULT_SESSION: TokenSession(DEFAULT_SESSION, access_token=config.JWT_TOKEN)
+        }
+        self.api_keys: Dict[str, str] = {}  # API 키 해시 -> 세션 키
+        self._credentials_loaded = False
+
+    def load_credentials(self) -> None:
+        """
+        MCP_API_CREDENTIALS_FILE 읽기
+
+        형식: {"<sha256(API 키)>": {"username": "...", "password": "..."}}
+        """
+        if self._credentials_loaded:
+            return
+        self._credentials_loaded = True
+        if not config.MCP_API_CREDENTIALS_FILE:
+            return
+        try:
+            with open(config.MCP_API_CREDENTIALS_FILE) as f:
+                entries = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"API 키 자격 증명 파일을 읽을 수 없습니다: {e}")
+            return
+        for key_hash, credential in entries.items():
+            self.register(key_hash, credential["username"], credential["password"])
+
+    def register(self, key_hash: str, username: str, password: str) -> TokenSession:
+        """API 키(해시)에 Django 계정 연결"""
+        session_key = f"api_key:{key_hash[:12]}"
+        self.api_keys[key_hash] = session_key
+        session = self.sessions.get(session_key)
+        if session is None:
+            session = self.sessions[session_key] = TokenSession(session_key, username, password)
+        return session
+
+    def session_for_api_key(self, api_key: Optional[str]) -> Optional[str]:
+        """API 키에 연결된 세션 키 (연결된 계정이 없으면 None)"""
+        self.load_credentials()
+        if not api_key:
+            return None
+        return self.api_keys.get(hash_api_key(api_key))
+
+    def get(self, session_key: Optional[str] = None) -> TokenSession:
+        return self.sessions[session_key or _current_session.get()]
+
+    async def prewarm(self) -> None:
+        """등록된 모든 계정에 미리 로그인 (첫 도구 호출이 로그인을 기다리지 않도록)"""
+        self.load_credentials()
+        pending = [
+            session.refresh() for session in self.sessions.values()
+            if session.access_token is None and session.username_credential
+        ]
+        if pending:
+            await asyncio.gather(*pending)
+
+    def shutdown(self) -> None:
+        for session in self.sessions.values():
+            session.cancel()
+
+    def stats(self) -> Dict[str, Any]:
+        return {key: session.stats() for key, session in self.sessions.items()}
+
+
+class AuthManager:
+    """Django JWT 인증 관리자 (현재 요청의 세션 토큰을 사용)"""
+
+    def __init__(self):
+        self.tokens = TokenManager()
+
+    @property
+    def session(self) -> TokenSession:
+        return self.tokens.get()
+
+    @staticmethod
+    @contextmanager
+    def use_session(session_key: Optional[str]):
+        """블록 안의 도구 호출이 사용할 인증 세션 지정 (None이면 기본 세션)"""
+        token = _current_session.set(session_key or DEFAULT_SESSION)
+        try:
+            yield
+        finally:
+            _current_session.reset(token)
+
+    async def login(self, username: str, password: str) -> bool:
+        """
+        Django 백엔드에 로그인하여 JWT 토큰 획득
+
+        Args:
+            username: 사용자명
+            password: 비밀번호
+
+        Returns:
+            성공 여부
+        """
+        return await self.session.login(username, password)
+
     async def refresh_access_token(self) -> bool:
         """
-        Refresh 토큰으로 Access 토큰 갱신
-        
+        토큰 갱신 (동시 호출은 하나의 요청으로 합쳐짐)
+
         Returns:
             성공 여부
         """
-        if not self.refresh_token:
-            return False
-        
-        async with httpx.AsyncClient(timeout=config.DJANGO_API_TIMEOUT) as client:
-            try:
-                response = await client.post(
-                    config.AUTH_REFRESH_URL,
-                    json={"refresh": self.refresh_token}
-                )
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    self.access_token = data.get("access")
-                    self.token_expiry = datetime.now() + timedelta(hours=1)
-                    return True
-                else:
-                    return False
-                    
-            except Exception as e:
-                print(f"토큰 갱신 오류: {e}")
-                return False
-    
+        return await self.session.refresh()
+
     async def ensure_valid_token(self) -> bool:
         """
         유효한 토큰이 있는지 확인하고, 필요시 갱신
-        
+
         Returns:
             유효한 토큰 보유 여부
         """
-        # 토큰이 없으면 실패
-        if not self.access_token:
-            return False
-        
-        # 토큰 만료 5분 전에 갱신
-        if self.token_expiry and datetime.now() >= self.token_expiry - timedelta(minutes=5):
-            return await self.refresh_access_token()
-        
-        return True
-    
+        return await self.session.get_token() is not None
+
     def get_auth_headers(self) -> Dict[str, str]:
         """
         API 요청용 인증 헤더 반환
-        
+
         Returns:
             Authorization 헤더 딕셔너리
         """
-        if not self.access_token:
+        access_token = self.session.access_token
+        if not access_token:
             return {}
-        
+
         return {
-            "Authorization": f"Bearer {self.access_token}",
+            "Authorization": f"Bearer {access_token}",
             "Content-Type": "application/json"
         }
-    
+
+    @property
+    def access_token(self) -> Optional[str]:
+        return self.session.access_token
+
+    @access_token.setter
+    def access_token(self, value: Optional[str]) -> None:
+        if value:
+            self.session.set_tokens(value)
+        else:
+            self.session.access_token = None
+
     @property
     def is_authenticated(self) -> bool:
         """인증 여부 확인"""
-        return self.access_token is not None
-    
+        return self.session.access_token is not None
+
     @property
     def is_admin(self) -> bool:
         """관리자 여부 확인"""
-        if not self.user_info:
+        user_info = self.session.user_info
+        if not user_info:
             return False
-        return self.user_info.get("is_staff", False)
-    
+        return user_info.get("is_staff", False)
+
     @property
     def username(self) -> Optional[str]:
         """사용자명 반환"""
-        if not self.user_info:
+        user_info = self.session.user_info
+        if not user_info:
             return None
-        return self.user_info.get("username")
+        return user_info.get("username")
+
+    @property
+    def session_key(self) -> str:
+        """현재 인증 세션 키 (도구 결과 캐시 구분용)"""
+        return _current_session.get()
 
 
 # 전역 인증 관리자 인스턴스
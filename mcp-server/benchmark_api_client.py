@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+API Client Latency Benchmark
+로컬 스텁 Django API를 띄워 호출마다 새 클라이언트를 만드는 방식과
+공유 커넥션 풀 클라이언트, 병렬 분기(api.gather) 방식의 지연 시간을 비교합니다.
+
+사용법:
+    python benchmark_api_client.py [--requests 200] [--delay-ms 5] [--concurrency 8]
+"""
+import argparse
+import asyncio
+import os
+import socket
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import httpx
+import uvicorn
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from config import config
+from auth import auth_manager
+from utils.api_client import APIClient, api
+
+
+def build_stub_app(delay: float) -> Starlette:
+    """Django API를 흉내 내는 스텁 앱 (고정 지연 후 JSON 응답)"""
+    async def statistics_endpoint(request):
+        if delay:
+            await asyncio.sleep(delay)
+        return JSONResponse({"total_devices": 1234, "active_devices": 987})
+
+    return Starlette(routes=[Route("/api/admin/ip/statistics/", statistics_endpoint)])
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def summarize(label: str, samples, total: float) -> None:
+    samples = sorted(samples)
+    p95 = samples[int(len(samples) * 0.95) - 1] if samples else 0
+    print(
+        f"{label:<32} total {total * 1000:8.1f} ms | "
+        f"avg {statistics.mean(samples) * 1000:6.2f} ms | "
+        f"p50 {statistics.median(samples) * 1000:6.2f} ms | "
+        f"p95 {p95 * 1000:6.2f} ms"
+    )
+
+
+async def per_call_client(url: str, count: int):
+    """기존 방식: 요청마다 httpx.AsyncClient 생성"""
+    samples = []
+    for _ in range(count):
+        started = time.perf_counter()
+        async with httpx.AsyncClient(timeout=config.DJANGO_API_TIMEOUT) as client:
+            response = await client.get(url, headers=auth_manager.get_auth_headers())
+            response.json()
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+async def shared_client(url: str, count: int):
+    """공유 커넥션 풀 클라이언트로 순차 호출"""
+    samples = []
+    for _ in range(count):
+        started = time.perf_counter()
+        await api.get(url)
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+async def shared_client_gather(url: str, count: int, concurrency: int):
+    """공유 클라이언트 + api.gather 병렬 분기"""
+    samples = []
+
+    async def timed():
+        started = time.perf_counter()
+        await api.get(url)
+        samples.append(time.perf_counter() - started)
+
+    await api.gather(*(timed() for _ in range(count)), limit=concurrency)
+    return samples
+
+
+async def main(args) -> None:
+    port = free_port()
+    server = uvicorn.Server(uvicorn.Config(
+        build_stub_app(args.delay_ms / 1000), host="127.0.0.1", port=port, log_level="warning"
+    ))
+    server_task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.01)
+
+    # 스텁 API는 인증을 검사하지 않으므로 임의 토큰 사용
+    auth_manager.access_token = "benchmark-token"
+    url = f"http://127.0.0.1:{port}/api/admin/ip/statistics/"
+
+    print(f"스텁 API: {url} (지연 {args.delay_ms} ms, 요청 {args.requests}회)\n")
+
+    await APIClient.startup()
+    try:
+        await per_call_client(url, 5)
+        await shared_client(url, 5)
+
+        started = time.perf_counter()
+        samples = await per_call_client(url, args.requests)
+        summarize("per-call AsyncClient (기존)", samples, time.perf_counter() - started)
+
+        started = time.perf_counter()
+        samples = await shared_client(url, args.requests)
+        summarize("shared pooled client", samples, time.perf_counter() - started)
+
+        started = time.perf_counter()
+        samples = await shared_client_gather(url, args.requests, args.concurrency)
+        summarize(f"shared + gather (x{args.concurrency})", samples, time.perf_counter() - started)
+    finally:
+        await APIClient.shutdown()
+        server.should_exit = True
+        await server_task
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="MCP API 클라이언트 지연 시간 벤치마크")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--delay-ms", type=float, default=5.0)
+    parser.add_argument("--concurrency", type=int, default=config.MCP_TOOL_CONCURRENCY)
+    asyncio.run(main(parser.parse_args()))
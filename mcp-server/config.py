@@ -16,13 +16,30 @@ class Config:
     # Django Backend
     DJANGO_API_URL: str = os.getenv("DJANGO_API_URL", "http://localhost:8000")
     DJANGO_API_TIMEOUT: int = int(os.getenv("DJANGO_API_TIMEOUT", "30"))
+    DJANGO_API_CONNECT_TIMEOUT: float = float(os.getenv("DJANGO_API_CONNECT_TIMEOUT", "5"))
+    
+    # Django API 커넥션 풀 (공유 httpx.AsyncClient)
+    DJANGO_API_MAX_CONNECTIONS: int = int(os.getenv("DJANGO_API_MAX_CONNECTIONS", "50"))
+    DJANGO_API_MAX_KEEPALIVE: int = int(os.getenv("DJANGO_API_MAX_KEEPALIVE", "20"))
+    DJANGO_API_KEEPALIVE_EXPIRY: float = float(os.getenv("DJANGO_API_KEEPALIVE_EXPIRY", "30"))
+    DJANGO_API_HTTP2: bool = os.getenv("DJANGO_API_HTTP2", "false").lower() == "true"
     
     # MCP Server
     MCP_SERVER_NAME: str = os.getenv("MCP_SERVER_NAME", "bssm-captive-mcp")
     MCP_SERVER_VERSION: str = os.getenv("MCP_SERVER_VERSION", "1.0.0")
     
+    # 도구 실행
+    MCP_TOOL_TIMEOUT: float = float(os.getenv("MCP_TOOL_TIMEOUT", "60"))  # 도구 호출당 전체 시간 예산 (초)
+    MCP_TOOL_CONCURRENCY: int = int(os.getenv("MCP_TOOL_CONCURRENCY", "8"))  # 도구 내부 병렬 요청 수 제한
+    MCP_TOOL_CACHE_TTL: float = float(os.getenv("MCP_TOOL_CACHE_TTL", "0"))  # 읽기 도구 결과 캐시 TTL (초, 0이면 비활성화)
+    MCP_BATCH_CONCURRENCY: int = int(os.getenv("MCP_BATCH_CONCURRENCY", "16"))  # JSON-RPC 배치 동시 처리 수
+    
     # Authentication
     JWT_TOKEN: Optional[str] = os.getenv("JWT_TOKEN", None)
+    MCP_API_CREDENTIALS_FILE: str = os.getenv("MCP_API_CREDENTIALS_FILE", "")  # API 키(해시)별 Django 계정 JSON
+    MCP_TOKEN_REFRESH_MARGIN: float = float(os.getenv("MCP_TOKEN_REFRESH_MARGIN", "300"))  # 만료 몇 초 전에 백그라운드 갱신
+    MCP_TOKEN_MIN_VALIDITY: float = float(os.getenv("MCP_TOKEN_MIN_VALIDITY", "30"))  # 남은 시간이 이보다 짧으면 갱신을 기다림
+    MCP_TOKEN_RETRY_INTERVAL: float = float(os.getenv("MCP_TOKEN_RETRY_INTERVAL", "30"))  # 백그라운드 갱신 실패 시 재시도 간격 (초)
     
     # API Endpoints
     @property
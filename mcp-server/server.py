@@ -7,12 +7,14 @@ import asyncio
 import sys
 import os
 import json
+from contextlib import asynccontextmanager
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 # Starlette for HTTP server
 from starlette.applications import Starlette
 from starlette.routing import Route
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, Response
 from starlette.middleware import Middleware
 from starlette.middleware.cors import CORSMiddleware
 from starlette.requests import Request
@@ -22,6 +24,8 @@ import uvicorn
 from config import config
 from auth import auth_manager
 from tools_definition import get_user_tools, get_admin_tools
+from utils.api_client import APIClient
+from utils.tool_cache import tool_cache
 
 # 도구 핸들러 임포트  
 from tools.user.profile_tools import *
@@ -75,14 +79,21 @@ TOOL_HANDLERS = {
     "admin_get_system_status": get_system_status,
     "admin_refresh_health_data": refresh_health_data,
     "admin_get_pihole_stats": get_pihole_stats,
+    "admin_get_system_overview": get_system_overview,
+    
+    # 관리자 도구 - 보고서
+    "admin_get_user_dashboard_summary": get_user_dashboard_summary,
+    "admin_get_band_utilization_report": get_band_utilization_report,
 }
 
 
 def verify_api_key(api_key: Optional[str]) -> bool:
-    """API 키 검증"""
+    """API 키 검증 (MCP_API_KEY 또는 자격 증명 파일에 계정이 등록된 키)"""
+    if auth_manager.tokens.session_for_api_key(api_key) is not None:
+        return True
     env_api_key = os.getenv("MCP_API_KEY", "")
     if not env_api_key:
-        return True  # 개발 모드
+        return not auth_manager.tokens.api_keys  # 개발 모드
     return api_key == env_api_key
 
 
@@ -107,28 +118,74 @@ async def api_key_middleware(request: Request, call_next):
             status_code=401
         )
     
-    return await call_next(request)
+    # 계정이 등록된 API 키는 자신의 Django 토큰으로, 그 외에는 서버 시작 시 로그인한 계정으로 도구 실행
+    with auth_manager.use_session(auth_manager.tokens.session_for_api_key(api_key)):
+        return await call_next(request)
 
 
-# JSON-RPC 핸들러
-async def handle_jsonrpc(request: Request):
-    """JSON-RPC 2.0 요청 처리"""
-    try:
-        body = await request.json()
-    except:
-        return JSONResponse({
-            "jsonrpc": "2.0",
-            "error": {"code": -32700, "message": "Parse error"},
-            "id": None
-        })
+def _compact_json(data: Any) -> str:
+    """도구 결과를 공백 없는 JSON 문자열로 직렬화"""
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
+def _current_role() -> str:
+    """현재 인증 상태에 따른 도구 목록 역할"""
+    if auth_manager.is_admin:
+        return "admin"
+    if auth_manager.is_authenticated:
+        return "user"
+    return "anonymous"
+
+
+@lru_cache(maxsize=None)
+def _tools_list_result(role: str) -> Dict[str, Any]:
+    """역할별 tools/list 결과 (최초 1회만 생성)"""
+    tools = []
+    if role in ("user", "admin"):
+        tools.extend(get_user_tools())
+    if role == "admin":
+        tools.extend(get_admin_tools())
+    
+    # Tool 객체를 dict로 변환
+    return {
+        "tools": [
+            {
+                "name": tool.name,
+                "description": tool.description,
+                "inputSchema": tool.inputSchema
+            }
+            for tool in tools
+        ]
+    }
+
+
+def _error(code: int, message: str, request_id: Any = None) -> Dict[str, Any]:
+    return {"jsonrpc": "2.0", "error": {"code": code, "message": message}, "id": request_id}
+
+
+async def _call_tool(tool_name: str, arguments: Dict[str, Any]) -> Any:
+    """도구 실행 (읽기 캐시 및 도구 호출 단위 시간 예산 적용)"""
+    handler = TOOL_HANDLERS[tool_name]
+    
+    async def execute():
+        # 도구 호출 단위 시간 예산 - 내부에서 병렬로 분기된 요청과 대기 시간까지 포함
+        return await APIClient.run_with_budget(handler(**arguments), config.MCP_TOOL_TIMEOUT, tool_name)
+    
+    return await tool_cache.call(tool_name, arguments, execute)
+
+
+async def dispatch(body: Any) -> Dict[str, Any]:
+    """JSON-RPC 2.0 요청 객체 하나를 처리하여 응답 객체 반환"""
+    if not isinstance(body, dict):
+        return _error(-32600, "Invalid Request")
     
     method = body.get("method")
-    params = body.get("params", {})
+    params = body.get("params") or {}
     request_id = body.get("id")
     
     # MCP 프로토콜 메서드 처리
     if method == "initialize":
-        return JSONResponse({
+        return {
             "jsonrpc": "2.0",
             "result": {
                 "protocolVersion": "2024-11-05",
@@ -141,70 +198,76 @@ async def handle_jsonrpc(request: Request):
                 }
             },
             "id": request_id
-        })
+        }
     
     elif method == "tools/list":
-        tools = []
-        if auth_manager.is_authenticated:
-            tools.extend(get_user_tools())
-        if auth_manager.is_admin:
-            tools.extend(get_admin_tools())
-        
-        # Tool 객체를 dict로 변환
-        tools_dict = [
-            {
-                "name": tool.name,
-                "description": tool.description,
-                "inputSchema": tool.inputSchema
-            }
-            for tool in tools
-        ]
-        
-        return JSONResponse({
+        return {
             "jsonrpc": "2.0",
-            "result": {"tools": tools_dict},
+            "result": _tools_list_result(_current_role()),
             "id": request_id
-        })
+        }
     
     elif method == "tools/call":
         tool_name = params.get("name")
-        arguments = params.get("arguments", {})
+        arguments = params.get("arguments") or {}
         
-        handler = TOOL_HANDLERS.get(tool_name)
-        if not handler:
-            return JSONResponse({
-                "jsonrpc": "2.0",
-                "error": {"code": -32601, "message": f"Tool not found: {tool_name}"},
-                "id": request_id
-            })
+        if tool_name not in TOOL_HANDLERS:
+            return _error(-32601, f"Tool not found: {tool_name}", request_id)
         
         try:
-            result = await handler(**arguments)
-            return JSONResponse({
+            result = await _call_tool(tool_name, arguments)
+            return {
                 "jsonrpc": "2.0",
                 "result": {
                     "content": [
                         {
                             "type": "text",
-                            "text": json.dumps(result, ensure_ascii=False, indent=2)
+                            "text": _compact_json(result)
                         }
                     ]
                 },
                 "id": request_id
-            })
+            }
         except Exception as e:
-            return JSONResponse({
-                "jsonrpc": "2.0",
-                "error": {"code": -32603, "message": str(e)},
-                "id": request_id
-            })
+            return _error(-32603, str(e), request_id)
     
     else:
-        return JSONResponse({
-            "jsonrpc": "2.0",
-            "error": {"code": -32601, "message": f"Method not found: {method}"},
-            "id": request_id
-        })
+        return _error(-32601, f"Method not found: {method}", request_id)
+
+
+async def dispatch_batch(batch: List[Any]) -> List[Dict[str, Any]]:
+    """JSON-RPC 2.0 배치 요청을 동시 처리 (응답 순서는 요청 순서와 동일, 알림은 응답 생략)"""
+    semaphore = asyncio.Semaphore(config.MCP_BATCH_CONCURRENCY)
+    
+    async def run(item: Any) -> Dict[str, Any]:
+        async with semaphore:
+            return await dispatch(item)
+    
+    responses = await asyncio.gather(*(run(item) for item in batch))
+    return [
+        response
+        for item, response in zip(batch, responses)
+        if not (isinstance(item, dict) and "id" not in item)
+    ]
+
+
+# JSON-RPC 핸들러
+async def handle_jsonrpc(request: Request):
+    """JSON-RPC 2.0 요청 처리 (단일 요청 및 배치 배열 지원)"""
+    try:
+        body = await request.json()
+    except:
+        return JSONResponse(_error(-32700, "Parse error"))
+    
+    if isinstance(body, list):
+        if not body:
+            return JSONResponse(_error(-32600, "Invalid Request"))
+        responses = await dispatch_batch(body)
+        if not responses:
+            return Response(status_code=204)
+        return JSONResponse(responses)
+    
+    return JSONResponse(await dispatch(body))
 
 
 # 헬스체크
@@ -217,12 +280,27 @@ async def health(request: Request):
         "authenticated": auth_manager.is_authenticated,
         "user": auth_manager.username if auth_manager.is_authenticated else None,
         "is_admin": auth_manager.is_admin,
-        "tools": len(TOOL_HANDLERS)
+        "tools": len(TOOL_HANDLERS),
+        "tool_cache": tool_cache.stats(),
+        "token_sessions": auth_manager.tokens.stats()
     })
 
 
+@asynccontextmanager
+async def lifespan(app):
+    """Django API 공유 클라이언트와 API 키별 토큰 수명 관리"""
+    await APIClient.startup()
+    await auth_manager.tokens.prewarm()
+    try:
+        yield
+    finally:
+        auth_manager.tokens.shutdown()
+        await APIClient.shutdown()
+
+
 # Starlette 앱
 app = Starlette(
+    lifespan=lifespan,
     routes=[
         Route("/mcp", endpoint=handle_jsonrpc, methods=["POST"]),
         Route("/health", endpoint=health),
@@ -18,6 +18,7 @@ from mcp.types import Tool, TextContent, ImageContent, EmbeddedResource
 # 로컬 모듈
 from config import config
 from auth import auth_manager
+from utils.api_client import APIClient
 
 # 도구 임포트 - 일반 사용자
 from tools.user.profile_tools import (
@@ -44,7 +45,8 @@ from tools.admin.dns_tools import (
     revoke_ssl_certificate, get_expiring_certificates
 )
 from tools.admin.system_tools import (
-    get_system_status, refresh_health_data, get_pihole_stats
+    get_system_status, refresh_health_data, get_pihole_stats, get_system_overview,
+    get_user_dashboard_summary, get_band_utilization_report
 )
 
 # MCP 서버 인스턴스
@@ -106,6 +108,11 @@ TOOL_HANDLERS = {
     "admin_get_system_status": get_system_status,
     "admin_refresh_health_data": refresh_health_data,
     "admin_get_pihole_stats": get_pihole_stats,
+    "admin_get_system_overview": get_system_overview,
+    
+    # 관리자 도구 - 보고서
+    "admin_get_user_dashboard_summary": get_user_dashboard_summary,
+    "admin_get_band_utilization_report": get_band_utilization_report,
 }
 
 
@@ -136,11 +143,10 @@ async def call_tool(name: str, arguments: Any) -> Sequence[TextContent | ImageCo
         if not handler:
             raise ValueError(f"Unknown tool: {name}")
         
-        # 도구 실행
-        if arguments:
-            result = await handler(**arguments)
-        else:
-            result = await handler()
+        # 도구 실행 (도구 호출 단위 시간 예산 적용)
+        result = await APIClient.run_with_budget(
+            handler(**arguments) if arguments else handler(), config.MCP_TOOL_TIMEOUT, name
+        )
         
         # 결과를 JSON 문자열로 변환
         result_text = json.dumps(result, ensure_ascii=False, indent=2)
@@ -172,8 +178,12 @@ async def main():
         print("\nMCP 서버를 시작합니다...\n", file=sys.stderr)
         
         # MCP 서버 실행
-        async with stdio_server() as (read_stream, write_stream):
-            await app.run(read_stream, write_stream, app.create_initialization_options())
+        await APIClient.startup()
+        try:
+            async with stdio_server() as (read_stream, write_stream):
+                await app.run(read_stream, write_stream, app.create_initialization_options())
+        finally:
+            await APIClient.shutdown()
     else:
         print("✗ 로그인 실패", file=sys.stderr)
         sys.exit(1)
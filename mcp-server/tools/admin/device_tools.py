@@ -2,7 +2,7 @@
 Admin Tools - Device (IP) Management
 관리자용 장치 및 IP 관리 도구들
 """
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 import sys
 import os
 
@@ -116,22 +116,31 @@ async def toggle_device_active(device_id: int) -> Dict[str, Any]:
     }
 
 
-async def blacklist_ip(ip_address: str, reason: Optional[str] = None) -> Dict[str, Any]:
+async def blacklist_ip(
+    ip_address: Optional[str] = None,
+    reason: Optional[str] = None,
+    ip_addresses: Optional[List[str]] = None
+) -> Dict[str, Any]:
     """
     IP 주소 블랙리스트 추가 (관리자)
     
     Args:
-        ip_address: IP 주소
+        ip_address: IP 주소, CIDR 또는 범위(시작-끝)
         reason: 블랙리스트 사유
+        ip_addresses: 여러 항목을 한 번에 추가 (장치 재할당도 한 번에 처리)
         
     Returns:
-        블랙리스트 추가 결과
+        블랙리스트 추가 결과 (재할당된 장치 포함)
     """
     if not auth_manager.is_admin:
         return {"success": False, "message": "관리자 권한이 필요합니다."}
     
+    entries = ([ip_address] if ip_address else []) + list(ip_addresses or [])
+    if not entries:
+        return {"success": False, "message": "ip_address 또는 ip_addresses가 필요합니다."}
+    
     url = f"{config.DJANGO_API_URL}/api/ip/admin/ip/blacklist/"
-    blacklist_data = {"ip_address": ip_address}
+    blacklist_data = {"ip_addresses": entries}
     
     if reason:
         blacklist_data["reason"] = reason
@@ -140,7 +149,7 @@ async def blacklist_ip(ip_address: str, reason: Optional[str] = None) -> Dict[st
     
     return {
         "success": True,
-        "message": f"IP 주소 {ip_address}을(를) 블랙리스트에 추가했습니다.",
+        "message": f"{', '.join(entries)}을(를) 블랙리스트에 추가했습니다.",
         "blacklist": data
     }
 
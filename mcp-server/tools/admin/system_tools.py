@@ -67,3 +67,116 @@ async def get_pihole_stats() -> Dict[str, Any]:
         "message": "Pi-hole 통계를 성공적으로 조회했습니다.",
         "stats": data
     }
+
+
+async def get_system_overview() -> Dict[str, Any]:
+    """
+    시스템 개요 조회 (관리자)
+    
+    시스템 상태, 장치 통계, Pi-hole 통계, 대기 중인 대여 요청을
+    동시에 조회하여 한 번에 반환합니다.
+    
+    Returns:
+        시스템 개요 딕셔너리
+    """
+    if not auth_manager.is_admin:
+        return {"success": False, "message": "관리자 권한이 필요합니다."}
+    
+    sections = {
+        "system_status": api.get(f"{config.DJANGO_API_URL}/api/system/status/"),
+        "device_statistics": api.get(f"{config.DJANGO_API_URL}/api/admin/ip/statistics/"),
+        "pihole_stats": api.get(f"{config.DJANGO_API_URL}/api/system/pihole/stats/"),
+        "pending_rental_requests": api.get(
+            f"{config.ADMIN_RENTALS_URL}requests/", params={"status": "PENDING"}
+        ),
+    }
+    results = await api.gather(*sections.values(), return_exceptions=True)
+    
+    overview = {}
+    errors = {}
+    for name, result in zip(sections.keys(), results):
+        if isinstance(result, Exception):
+            errors[name] = str(result)
+        else:
+            overview[name] = result
+    
+    return {
+        "success": not errors,
+        "message": "시스템 개요를 조회했습니다." if not errors else "일부 항목 조회에 실패했습니다.",
+        "overview": overview,
+        "errors": errors
+    }
+
+
+async def get_user_dashboard_summary(
+    role: str = None,
+    grade: int = None,
+    class_number: int = None,
+    search: str = None,
+    overdue_only: bool = False,
+    max_users: int = 1000
+) -> Dict[str, Any]:
+    """
+    사용자별 장치/대여/신청 현황 요약 (관리자)
+
+    Django에서 SQL로 집계한 사용자 요약을 모든 페이지에 걸쳐 동시에 조회하고,
+    사용자 목록·장치 목록·대여 목록을 따로 호출하지 않도록 한 번에 반환합니다.
+    결과는 토큰을 줄이기 위해 columns + rows(리스트) 형식입니다.
+
+    Args:
+        role: student 또는 teacher
+        grade: 학년
+        class_number: 반
+        search: 아이디/이름/이메일 검색어
+        overdue_only: 연체 중인 사용자만
+        max_users: 최대 사용자 수
+
+    Returns:
+        합계(totals), 컬럼 이름, 사용자별 행
+    """
+    if not auth_manager.is_admin:
+        return {"success": False, "message": "관리자 권한이 필요합니다."}
+
+    params = {
+        "role": role,
+        "grade": grade,
+        "class_number": class_number,
+        "search": search,
+        "overdue": "true" if overdue_only else None,
+    }
+    params = {key: value for key, value in params.items() if value not in (None, "")}
+    data = await api.get_all_pages(
+        f"{config.DJANGO_API_URL}/api/system/reports/users/",
+        params=params, items_key="rows", max_items=max_users
+    )
+
+    return {
+        "success": True,
+        "message": f"사용자 {data['count']}명 중 {len(data['rows'])}명의 요약을 조회했습니다.",
+        "totals": data.get("totals"),
+        "count": data["count"],
+        "truncated": data["truncated"],
+        "columns": data["columns"],
+        "rows": data["rows"],
+    }
+
+
+async def get_band_utilization_report() -> Dict[str, Any]:
+    """
+    대역별 IP 풀 사용량과 장치 현황 (관리자)
+
+    Returns:
+        대역별 사용량/여유/장치·활성·온라인·미접속 수와 합계
+    """
+    if not auth_manager.is_admin:
+        return {"success": False, "message": "관리자 권한이 필요합니다."}
+
+    data = await api.get(f"{config.DJANGO_API_URL}/api/system/reports/bands/")
+
+    return {
+        "success": True,
+        "message": "대역 사용 현황을 조회했습니다.",
+        "generated_at": data.get("generated_at"),
+        "bands": data.get("bands"),
+        "totals": data.get("totals"),
+    }
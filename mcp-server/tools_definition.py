@@ -324,19 +324,20 @@ def get_admin_tools():
         ),
         Tool(
             name="admin_blacklist_ip",
-            description="[관리자] IP 주소를 블랙리스트에 추가합니다.",
+            description="[관리자] IP 주소, CIDR(10.129.57.32/28) 또는 범위(10.129.57.40-10.129.57.60)를 블랙리스트에 추가하고 해당 IP를 쓰던 장치를 재할당합니다.",
             inputSchema={
                 "type": "object",
                 "properties": {
-                    "ip_address": {"type": "string"},
+                    "ip_address": {"type": "string", "description": "IP 주소, CIDR 또는 범위"},
+                    "ip_addresses": {"type": "array", "items": {"type": "string"}, "description": "여러 항목을 한 번에 추가"},
                     "reason": {"type": "string"}
                 },
-                "required": ["ip_address"]
+                "required": []
             }
         ),
         Tool(
             name="admin_unblacklist_ip",
-            description="[관리자] IP 주소를 블랙리스트에서 제거합니다.",
+            description="[관리자] 블랙리스트 항목(IP 주소, CIDR 또는 범위)을 제거합니다.",
             inputSchema={
                 "type": "object",
                 "properties": {"ip_address": {"type": "string"}},
@@ -444,7 +445,7 @@ def get_admin_tools():
             }
         ),
         
-        # 시스템 관리 (3개)
+        # 시스템 관리 (4개)
         Tool(
             name="admin_get_system_status",
             description="[관리자] 시스템 상태를 조회합니다.",
@@ -460,4 +461,32 @@ def get_admin_tools():
             description="[관리자] Pi-hole 통계를 조회합니다.",
             inputSchema={"type": "object", "properties": {}, "required": []}
         ),
+        Tool(
+            name="admin_get_system_overview",
+            description="[관리자] 시스템 상태, 장치 통계, Pi-hole 통계, 대기 중인 대여 요청을 한 번에 조회합니다.",
+            inputSchema={"type": "object", "properties": {}, "required": []}
+        ),
+        
+        # 보고서 (2개)
+        Tool(
+            name="admin_get_user_dashboard_summary",
+            description="[관리자] 사용자별 장치 수, 대여·연체 수, 대기 중인 신청 수를 한 번에 조회합니다 (columns + rows 형식, 전체 페이지 자동 조회).",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "role": {"type": "string", "enum": ["student", "teacher"], "description": "사용자 구분"},
+                    "grade": {"type": "integer", "description": "학년"},
+                    "class_number": {"type": "integer", "description": "반"},
+                    "search": {"type": "string", "description": "아이디/이름/이메일 검색어"},
+                    "overdue_only": {"type": "boolean", "default": False, "description": "연체 중인 사용자만"},
+                    "max_users": {"type": "integer", "default": 1000, "description": "최대 사용자 수"}
+                },
+                "required": []
+            }
+        ),
+        Tool(
+            name="admin_get_band_utilization_report",
+            description="[관리자] 대역별 IP 풀 사용률과 장치·활성·온라인·미접속 장치 수를 조회합니다.",
+            inputSchema={"type": "object", "properties": {}, "required": []}
+        ),
     ]
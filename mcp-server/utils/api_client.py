@@ -1,15 +1,147 @@
 """
 Django API Client Utility
 Django REST API와 통신하기 위한 헬퍼 함수들
+
+- 프로세스 전체에서 하나의 httpx.AsyncClient(커넥션 풀, keep-alive)를 공유합니다.
+- 서버 시작/종료 시 startup()/shutdown()으로 수명을 관리합니다.
+- timeout_budget()으로 도구 호출 단위의 전체 시간 예산을 지정할 수 있습니다.
 """
+import asyncio
+import contextvars
 import httpx
-from typing import Optional, Dict, Any, List
+from contextlib import contextmanager
+from typing import Optional, Dict, Any, List, Awaitable
 from config import config
 from auth import auth_manager
 
 
+# 현재 도구 호출의 마감 시각 (event loop 시간 기준, None이면 제한 없음)
+_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar("api_deadline", default=None)
+
+
+def _http2_available() -> bool:
+    """HTTP/2 사용 가능 여부 (h2 패키지 필요)"""
+    if not config.DJANGO_API_HTTP2:
+        return False
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
 class APIClient:
     """Django API 클라이언트"""
+
+    _client: Optional[httpx.AsyncClient] = None
+
+    @classmethod
+    def _build_client(cls) -> httpx.AsyncClient:
+        """커넥션 풀 설정이 적용된 공유 클라이언트 생성"""
+        return httpx.AsyncClient(
+            timeout=httpx.Timeout(config.DJANGO_API_TIMEOUT, connect=config.DJANGO_API_CONNECT_TIMEOUT),
+            limits=httpx.Limits(
+                max_connections=config.DJANGO_API_MAX_CONNECTIONS,
+                max_keepalive_connections=config.DJANGO_API_MAX_KEEPALIVE,
+                keepalive_expiry=config.DJANGO_API_KEEPALIVE_EXPIRY,
+            ),
+            http2=_http2_available(),
+        )
+
+    @classmethod
+    async def startup(cls) -> None:
+        """공유 클라이언트 생성 (서버 시작 시 호출)"""
+        if cls._client is None or cls._client.is_closed:
+            cls._client = cls._build_client()
+
+    @classmethod
+    async def shutdown(cls) -> None:
+        """공유 클라이언트 종료 (서버 종료 시 호출)"""
+        if cls._client is not None:
+            await cls._client.aclose()
+            cls._client = None
+
+    @classmethod
+    def get_client(cls) -> httpx.AsyncClient:
+        """공유 클라이언트 반환 (startup 전이면 지연 생성)"""
+        if cls._client is None or cls._client.is_closed:
+            cls._client = cls._build_client()
+        return cls._client
+
+    @staticmethod
+    @contextmanager
+    def timeout_budget(seconds: Optional[float]):
+        """
+        블록 안에서 실행되는 모든 API 요청의 전체 시간 예산 지정
+
+        asyncio.gather로 분기된 하위 작업에도 예산이 그대로 전파됩니다.
+        """
+        if not seconds:
+            yield
+            return
+        deadline = asyncio.get_running_loop().time() + seconds
+        current = _deadline.get()
+        if current is not None:
+            deadline = min(deadline, current)
+        token = _deadline.set(deadline)
+        try:
+            yield
+        finally:
+            _deadline.reset(token)
+
+    @staticmethod
+    async def run_with_budget(aw: Awaitable, seconds: Optional[float], name: str) -> Any:
+        """
+        전체 시간 예산 안에서 작업 실행 (예산을 넘기면 작업을 취소하고 시간 초과 오류)
+
+        요청별 httpx 타임아웃과 달리 gather 세마포어 대기, 토큰 갱신 대기를 포함한
+        전체 실행 시간에 적용됩니다.
+        """
+        with APIClient.timeout_budget(seconds):
+            deadline = _deadline.get()
+            if deadline is None:
+                return await aw
+            try:
+                return await asyncio.wait_for(aw, max(deadline - asyncio.get_running_loop().time(), 0))
+            except asyncio.TimeoutError:
+                raise Exception(f"API 요청 시간 초과 (시간 예산 소진): {name}")
+
+    @staticmethod
+    def _remaining_timeout(url: str) -> float:
+        """남은 시간 예산을 고려한 요청 타임아웃 계산"""
+        deadline = _deadline.get()
+        if deadline is None:
+            return config.DJANGO_API_TIMEOUT
+        remaining = deadline - asyncio.get_running_loop().time()
+        if remaining <= 0:
+            raise Exception(f"API 요청 시간 초과 (시간 예산 소진): {url}")
+        return min(config.DJANGO_API_TIMEOUT, remaining)
+
+    @staticmethod
+    async def gather(*aws: Awaitable, limit: Optional[int] = None, return_exceptions: bool = False) -> List[Any]:
+        """
+        여러 API 작업을 동시 실행 수를 제한하여 병렬 실행
+
+        Args:
+            aws: 실행할 코루틴들
+            limit: 최대 동시 실행 수 (기본값: MCP_TOOL_CONCURRENCY)
+            return_exceptions: 예외를 결과로 반환할지 여부
+
+        Returns:
+            입력 순서대로 정렬된 결과 리스트
+        """
+        semaphore = asyncio.Semaphore(limit or config.MCP_TOOL_CONCURRENCY)
+
+        async def run(aw: Awaitable) -> Any:
+            try:
+                async with semaphore:
+                    return await aw
+            finally:
+                # 세마포어 대기 중 취소(시간 예산 소진)된 코루틴은 시작되지 않았으므로 닫아 둠
+                if asyncio.iscoroutine(aw):
+                    aw.close()
+
+        return await asyncio.gather(*(run(aw) for aw in aws), return_exceptions=return_exceptions)
     
     @staticmethod
     async def request(
@@ -18,7 +150,8 @@ class APIClient:
         json: Optional[Dict[str, Any]] = None,
         params: Optional[Dict[str, Any]] = None,
         files: Optional[Dict[str, Any]] = None,
-        ensure_auth: bool = True
+        ensure_auth: bool = True,
+        timeout: Optional[float] = None
     ) -> Dict[str, Any]:
         """
         Django API 요청 실행
@@ -30,6 +163,7 @@ class APIClient:
             params: 쿼리 파라미터
             files: 파일 업로드
             ensure_auth: 자동 인증 확인 여부
+            timeout: 이 요청의 타임아웃 (초, 시간 예산보다 길 수 없음)
             
         Returns:
             응답 데이터 (dict)
@@ -43,42 +177,93 @@ class APIClient:
                 raise Exception("인증되지 않았습니다. 로그인이 필요합니다.")
         
         headers = auth_manager.get_auth_headers()
+        request_timeout = APIClient._remaining_timeout(url)
+        if timeout is not None:
+            request_timeout = min(request_timeout, timeout)
         
-        async with httpx.AsyncClient(timeout=config.DJANGO_API_TIMEOUT) as client:
-            try:
-                response = await client.request(
-                    method=method,
-                    url=url,
-                    json=json,
-                    params=params,
-                    files=files,
-                    headers=headers
-                )
+        client = APIClient.get_client()
+        try:
+            response = await client.request(
+                method=method,
+                url=url,
+                json=json,
+                params=params,
+                files=files,
+                headers=headers,
+                timeout=request_timeout
+            )
                 
-                # 응답 확인
-                if response.status_code >= 400:
-                    error_msg = f"API 요청 실패 ({response.status_code})"
-                    try:
-                        error_data = response.json()
-                        if isinstance(error_data, dict):
-                            if "detail" in error_data:
-                                error_msg = f"{error_msg}: {error_data['detail']}"
-                            elif "message" in error_data:
-                                error_msg = f"{error_msg}: {error_data['message']}"
-                            else:
-                                error_msg = f"{error_msg}: {error_data}"
-                    except:
-                        error_msg = f"{error_msg}: {response.text}"
+            # 응답 확인
+            if response.status_code >= 400:
+                error_msg = f"API 요청 실패 ({response.status_code})"
+                try:
+                    error_data = response.json()
+                    if isinstance(error_data, dict):
+                        if "detail" in error_data:
+                            error_msg = f"{error_msg}: {error_data['detail']}"
+                        elif "message" in error_data:
+                            error_msg = f"{error_msg}: {error_data['message']}"
+                        else:
+                            error_msg = f"{error_msg}: {error_data}"
+                except:
+                    error_msg = f"{error_msg}: {response.text}"
                     
-                    raise Exception(error_msg)
+                raise Exception(error_msg)
                 
-                # JSON 응답 반환
-                return response.json()
+            # JSON 응답 반환
+            return response.json()
                 
-            except httpx.TimeoutException:
-                raise Exception(f"API 요청 시간 초과: {url}")
-            except httpx.RequestError as e:
-                raise Exception(f"API 요청 오류: {e}")
+        except httpx.TimeoutException:
+            raise Exception(f"API 요청 시간 초과: {url}")
+        except httpx.RequestError as e:
+            raise Exception(f"API 요청 오류: {e}")
+
+    @staticmethod
+    async def get_all_pages(
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        items_key: str = "results",
+        page_size: int = 500,
+        max_items: Optional[int] = None,
+        limit: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        페이지 번호 페이지네이션 목록 전체 조회 (자동 페이지 순회)
+
+        첫 페이지로 전체 개수를 확인한 뒤 나머지 페이지를 gather로 동시에 요청하고,
+        페이지 순서대로 items_key 항목을 이어 붙입니다.
+
+        Args:
+            url: 목록 URL (?page=, ?page_size= 지원)
+            params: 추가 쿼리 파라미터
+            items_key: 응답에서 항목 리스트가 들어 있는 키
+            page_size: 페이지당 항목 수 (서버 최대값 이하)
+            max_items: 가져올 최대 항목 수 (None이면 전체)
+            limit: 페이지 동시 요청 수 (기본값: MCP_TOOL_CONCURRENCY)
+
+        Returns:
+            첫 페이지 응답에 모든 항목을 합친 dict (truncated: max_items로 잘렸는지 여부)
+        """
+        params = dict(params or {})
+        first = await APIClient.get(url, params={**params, "page": 1, "page_size": page_size})
+        items = list(first.get(items_key) or [])
+        count = first.get("count", len(items))
+        page_size = len(items) or page_size  # 서버가 page_size를 줄였을 수 있음
+
+        wanted = count if max_items is None else min(count, max_items)
+        last_page = -(-wanted // page_size) if wanted else 1
+        if last_page > 1:
+            pages = await APIClient.gather(
+                *(APIClient.get(url, params={**params, "page": page, "page_size": page_size})
+                  for page in range(2, last_page + 1)),
+                limit=limit
+            )
+            for page in pages:
+                items.extend(page.get(items_key) or [])
+
+        first[items_key] = items[:wanted]
+        first["truncated"] = wanted < count
+        return first
     
     @staticmethod
     async def get(url: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
@@ -0,0 +1,161 @@
+"""
+Tool Result Cache
+멱등(읽기 전용) 관리자 도구의 결과를 짧은 TTL 동안 캐시합니다.
+
+- MCP_TOOL_CACHE_TTL > 0 일 때만 동작합니다 (기본값 0 = 비활성화).
+- 관련 쓰기 도구가 실행되면 해당 읽기 도구의 캐시를 즉시 무효화합니다.
+- 같은 키로 동시에 들어온 요청은 하나의 Django 호출을 공유합니다.
+- 캐시는 인증 세션(API 키별 Django 계정)마다 따로 보관하고, 무효화는 모든 세션에 적용합니다.
+"""
+import asyncio
+import json
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+from config import config
+from auth import auth_manager
+
+
+# 캐시 가능한 읽기 도구
+CACHEABLE_TOOLS = frozenset({
+    "admin_get_device_statistics",
+    "admin_list_blacklisted_ips",
+    "admin_list_dns_records",
+    "admin_list_ssl_certificates",
+    "admin_get_expiring_certificates",
+    "admin_get_system_status",
+    "admin_get_pihole_stats",
+    "admin_get_system_overview",
+    "admin_get_user_dashboard_summary",
+    "admin_get_band_utilization_report",
+})
+
+# 쓰기 도구 -> 무효화할 읽기 도구
+INVALIDATES: Dict[str, frozenset] = {
+    # 장치(IP) 관리
+    "admin_reassign_device_ip": frozenset({"admin_get_device_statistics", "admin_get_system_overview", "admin_get_user_dashboard_summary", "admin_get_band_utilization_report"}),
+    "admin_toggle_device_active": frozenset({"admin_get_device_statistics", "admin_get_system_overview", "admin_get_user_dashboard_summary", "admin_get_band_utilization_report"}),
+    "admin_blacklist_ip": frozenset({"admin_list_blacklisted_ips", "admin_get_device_statistics", "admin_get_system_overview", "admin_get_band_utilization_report"}),
+    "admin_unblacklist_ip": frozenset({"admin_list_blacklisted_ips", "admin_get_device_statistics", "admin_get_system_overview", "admin_get_band_utilization_report"}),
+    "register_my_device": frozenset({"admin_get_device_statistics", "admin_get_system_overview", "admin_get_user_dashboard_summary", "admin_get_band_utilization_report"}),
+    "update_my_device": frozenset({"admin_get_device_statistics", "admin_get_system_overview", "admin_get_user_dashboard_summary", "admin_get_band_utilization_report"}),
+    "delete_my_device": frozenset({"admin_get_device_statistics", "admin_get_system_overview", "admin_get_user_dashboard_summary", "admin_get_band_utilization_report"}),
+    # DNS / SSL 관리
+    "admin_create_dns_record": frozenset({"admin_list_dns_records"}),
+    "admin_delete_dns_record": frozenset({"admin_list_dns_records"}),
+    "admin_apply_dns_records": frozenset({"admin_list_dns_records"}),
+    "admin_generate_ssl_certificate": frozenset({"admin_list_ssl_certificates", "admin_get_expiring_certificates"}),
+    "admin_renew_ssl_certificate": frozenset({"admin_list_ssl_certificates", "admin_get_expiring_certificates"}),
+    "admin_revoke_ssl_certificate": frozenset({"admin_list_ssl_certificates", "admin_get_expiring_certificates"}),
+    # 시스템 / 대여
+    "admin_refresh_health_data": frozenset({"admin_get_system_status", "admin_get_pihole_stats", "admin_get_system_overview"}),
+    "admin_approve_rental_request": frozenset({"admin_get_system_overview", "admin_get_user_dashboard_summary"}),
+    "admin_reject_rental_request": frozenset({"admin_get_system_overview", "admin_get_user_dashboard_summary"}),
+    "request_rental": frozenset({"admin_get_system_overview", "admin_get_user_dashboard_summary"}),
+    "request_return": frozenset({"admin_get_system_overview", "admin_get_user_dashboard_summary"}),
+}
+
+
+class ToolResultCache:
+    """읽기 도구 결과 TTL 캐시"""
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._entries: Dict[Tuple[str, str, str], Tuple[float, Any]] = {}
+        self._inflight: Dict[Tuple[str, str, str], asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    @staticmethod
+    def _key(tool_name: str, arguments: Optional[Dict[str, Any]]) -> Tuple[str, str, str]:
+        # 인증 세션(Django 계정)마다 권한이 다르므로 세션별로 캐시
+        return tool_name, auth_manager.session_key, json.dumps(arguments or {}, sort_keys=True, ensure_ascii=False, default=str)
+
+    async def call(
+        self,
+        tool_name: str,
+        arguments: Optional[Dict[str, Any]],
+        execute: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        캐시를 거쳐 도구 실행
+
+        Args:
+            tool_name: 도구 이름
+            arguments: 도구 인자
+            execute: 실제 도구를 실행하는 코루틴 팩토리
+
+        Returns:
+            도구 실행 결과
+        """
+        if not self.enabled or tool_name not in CACHEABLE_TOOLS:
+            try:
+                return await execute()
+            finally:
+                self.invalidate_for(tool_name)
+
+        key = self._key(tool_name, arguments)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            self.hits += 1
+            return entry[1]
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.hits += 1
+            return await asyncio.shield(inflight)
+
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await execute()
+        except Exception as e:
+            future.set_exception(e)
+            # 대기 중인 요청이 없으면 예외 미확인 경고가 나지 않도록 처리
+            future.exception()
+            raise
+        except BaseException:
+            future.cancel()
+            raise
+        else:
+            future.set_result(result)
+            # 조회 도중 무효화되었다면 저장하지 않음
+            if self._inflight.get(key) is future:
+                self._entries[key] = (time.monotonic() + self.ttl, result)
+            return result
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    def invalidate_for(self, tool_name: str) -> None:
+        """쓰기 도구 실행 후 관련 읽기 도구 캐시 무효화"""
+        targets = INVALIDATES.get(tool_name)
+        if not targets:
+            return
+        for key in [key for key in self._entries if key[0] in targets]:
+            del self._entries[key]
+        for key in [key for key in self._inflight if key[0] in targets]:
+            del self._inflight[key]
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._inflight.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "ttl": self.ttl,
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+        }
+
+
+# 전역 캐시 인스턴스
+tool_cache = ToolResultCache(config.MCP_TOOL_CACHE_TTL)